@@ -70,6 +70,23 @@ hiddenimports = [
     'ticker_utils_numba',
     'memory_pool',
     'nyse_calendar',
+    'quote_engine',
+    'rate_limiter',
+    'history_store',
+    'icon_cache',
+    'strip_renderer',
+    'frame_profiler',
+    'trade_buffer',
+    'market_replay',
+    'settings_store',
+    'log_pipeline',
+    'glyph_atlas',
+    'quote_snapshot',
+    'tile_renderer',
+    'pixel_stats',
+    'glow_sprites',
+    'ghost_trail',
+    'housekeeping',
     'numba',
     'numba.cloudpickle.cloudpickle_fast',
     'numba.cloudpickle.cloudpickle',
@@ -88,6 +105,23 @@ datas = [
     ('nyse_calendar.py', '.'),
     ('modern_gui_styles.py', '.'),
     ('memory_pool.py', '.'),
+    ('quote_engine.py', '.'),
+    ('rate_limiter.py', '.'),
+    ('history_store.py', '.'),
+    ('icon_cache.py', '.'),
+    ('strip_renderer.py', '.'),
+    ('frame_profiler.py', '.'),
+    ('trade_buffer.py', '.'),
+    ('market_replay.py', '.'),
+    ('settings_store.py', '.'),
+    ('log_pipeline.py', '.'),
+    ('glyph_atlas.py', '.'),
+    ('quote_snapshot.py', '.'),
+    ('tile_renderer.py', '.'),
+    ('pixel_stats.py', '.'),
+    ('glow_sprites.py', '.'),
+    ('ghost_trail.py', '.'),
+    ('housekeeping.py', '.'),
 ]
 
 # Collect full charset_normalizer bundle so Requests can resolve charset backend.
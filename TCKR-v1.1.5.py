@@ -28,6 +28,8 @@ import ctypes
 from ctypes import wintypes
 import collections
 import concurrent.futures
+import itertools
+import types
 try:
     import winreg as _winreg
 except ImportError:
@@ -36,8 +38,28 @@ import threading
 import argparse
 import shutil
 import signal
+import atexit
 import numpy as np
 from modern_gui_styles import *  # Modern dark theme styling
+from quote_engine import QuoteFetchEngine, QuoteProvider, TokenBucket  # Async quote fetching
+from rate_limiter import ApiKeyPool, mask_api_key  # Per-API-key sliding-window quotas
+from history_store import HistoryStore, HistoryFetchScheduler  # Sparkline price history
+from icon_cache import IconCache  # Two-tier processed icon cache
+from strip_renderer import TickerStripRenderer  # Pre-composited scrolling strips
+from frame_profiler import FrameProfiler  # Per-stage frame timing ring buffers
+from trade_buffer import TradeIngestBuffer  # Lock-free WebSocket trade hand-off
+from market_replay import MarketDataRecorder, MarketDataReplayer  # Quote/WebSocket capture and replay
+from settings_store import SettingsStore  # In-memory settings with change notification
+import log_pipeline  # Leveled, tag-filtered logging written by a background thread
+import housekeeping, quote_engine, settings_store  # For set_logger (see _LOG_PIPELINE)
+from ghost_trail import GhostTrail  # Accumulation buffer for the ghosting trail
+from glyph_atlas import get_glyph_metrics  # Per-font digit advances; tiles draw digits from pre-rendered glyph cells
+from quote_snapshot import QuoteSnapshot  # Last known quotes on disk for instant warm startup
+from pixel_stats import get_pixel_stats_cache, set_sampling_kernel  # Vectorized tile colour statistics with a content-keyed cache
+from housekeeping import get_housekeeping_scheduler  # GC and cache upkeep in frame-budget slack
+from glow_sprites import get_glow_sprite_cache
+from tile_renderer import (HALO_OFFSETS, TileLayout, TileSpec, draw_glow_text, get_tile_render_pool, indicator_width,
+                           patch_tile, tile_key)  # Symbol tiles drawn into QImages on worker threads
 
 class DebugColors:
     # Reset
@@ -116,43 +138,25 @@ DEBUG_TAG_COLORS = {
     'DEFAULT': DebugColors.WHITE,
 }
 
+# All console output goes through one background writer (see log_pipeline.py)
+_LOG_PIPELINE = log_pipeline.LogPipeline(tag_colors=DEBUG_TAG_COLORS, reset_color=DebugColors.RESET)
+atexit.register(_LOG_PIPELINE.close)
+# The quote engine, settings store and housekeeping modules log through it too
+for _module in (quote_engine, settings_store, housekeeping):
+    _module.set_logger(_LOG_PIPELINE.log)
+
+def get_log_pipeline():
+    return _LOG_PIPELINE
+
 def colored_print(message):
     """
-    Print message with colored debug tags.
-    Automatically detects [TAG] patterns and colors them appropriately.
+    Queue a "[TAG] message" line for the log writer thread, which colors the tags.
+    ERROR / WARNING tags log at that level, everything else at INFO.
     """
-    import re
-    import os
-    import sys
+    _LOG_PIPELINE.write(message)
 
-    # Enable ANSI colors on Windows
-    if sys.platform == "win32":
-        try:
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            # Get console handle
-            console_handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
-            # Enable virtual terminal processing
-            mode = ctypes.c_uint32()
-            kernel32.GetConsoleMode(console_handle, ctypes.byref(mode))
-            mode.value |= 0x0004  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
-            kernel32.SetConsoleMode(console_handle, mode)
-        except:
-            pass  # Ignore if we can't enable ANSI colors
-
-    # Find all [TAG] patterns in the message
-    tag_pattern = r'\[([^\]]+)\]'
-
-    def color_tag(match):
-        tag = match.group(1)
-        color = DEBUG_TAG_COLORS.get(tag, DEBUG_TAG_COLORS['DEFAULT'])
-        return f"{color}[{tag}]{DebugColors.RESET}"
-
-    # Apply coloring to tags
-    colored_message = re.sub(tag_pattern, color_tag, message)
-
-    # Print the colored message
-    print(colored_message)
+# Hot-path diagnostics: log_debug(tag, text, *args) only formats text % args if DEBUG is enabled for tag
+log_debug = _LOG_PIPELINE.debug
 
 # Websocket support for real-time data
 try:
@@ -196,7 +200,20 @@ def get_requests_session():
         _REQUEST_SESSION.mount('https://', adapter)
         colored_print("[PERF] Initialized HTTP session with connection pooling")
     return _REQUEST_SESSION
-import atexit
+
+# Market data capture / replay (--record-market / --replay-market); at most one is set
+_MARKET_RECORDER = None
+_MARKET_REPLAYER = None
+
+def market_data_get(source, url, **kwargs):
+    """GET for quote endpoints: answered from the replay log when replaying, recorded
+    when capturing, otherwise a plain pooled-session request"""
+    if _MARKET_REPLAYER is not None:
+        return _MARKET_REPLAYER.http_response(source, url)
+    response = get_requests_session().get(url, **kwargs)
+    if _MARKET_RECORDER is not None:
+        _MARKET_RECORDER.record_http(source, url, response.status_code, response.headers, response.text)
+    return response
 
 # Performance optimization using Numba JIT compilation
 # DEFERRED: Import after splash screen to avoid 3+ second startup delay
@@ -214,6 +231,10 @@ get_pool_stats = None
 APPDATA_DIR = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), "TCKR")
 SETTINGS_FILE = os.path.join(APPDATA_DIR, "TCKR.Settings.json")
 STOCKS_FILE = os.path.join(APPDATA_DIR, "TCKR.Tickers.json")
+HISTORY_FILE = os.path.join(APPDATA_DIR, "TCKR.History.npz")
+QUOTE_SNAPSHOT_FILE = os.path.join(APPDATA_DIR, "TCKR.Quotes.json")
+# Frame profiles are written next to the executable/script, like tckr_visibility.log
+FRAME_PROFILE_DIR = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
 
 # Friendly display names for major market indices
 INDEX_DISPLAY_NAMES = {
@@ -602,6 +623,8 @@ def signal_handler(signum, frame):
     colored_print(f"[SIGNAL] Received signal {signum} - performing emergency cleanup")
     global_cleanup_handler()
     
+    # os._exit skips atexit: write out the queued log records (this one included) first
+    _LOG_PIPELINE.close()
     # Force immediate exit without triggering more signals
     os._exit(0)
 
@@ -615,7 +638,10 @@ def is_market_open():
     - Closed on weekends and federal holidays
 
     Uses nyse_calendar (pure-Python, no pandas dependency).
+    A replayed capture with WebSocket frames counts as open, whatever the real clock says.
     """
+    if _MARKET_REPLAYER is not None and _MARKET_REPLAYER.frames:
+        return True
     try:
         from nyse_calendar import is_nyse_open
         return is_nyse_open()
@@ -740,6 +766,10 @@ def load_performance_modules():
         except ImportError:
             USE_OPT = False
             colored_print("[PERF] No optimized ticker utils found. Build ticker_utils_cython.pyd with setup_cython.py, or place ticker_utils_numba.py here.")
+
+    # Compiled pixel sampling for ghost tints (an older .pyd or numba-less module keeps NumPy)
+    if USE_OPT and (getattr(opt, 'CYTHON_AVAILABLE', False) or getattr(opt, 'NUMBA_AVAILABLE', False)):
+        set_sampling_kernel(getattr(opt, 'dominant_color_argb32', None))
     
     # Load memory pooling module
     try:
@@ -754,13 +784,24 @@ def load_performance_modules():
         USE_MEMORY_POOL = False
         colored_print("[PERF] Memory pool not available (place memory_pool.py in same directory)")
 
+# Process-wide settings: TCKR.Settings.json is parsed once, save_settings() updates it in place
+_SETTINGS_STORE = None
+_SETTINGS_STORE_LOCK = threading.Lock()
+
+def get_settings_store():
+    """Get or create the shared settings store"""
+    global _SETTINGS_STORE
+    with _SETTINGS_STORE_LOCK:
+        if _SETTINGS_STORE is None:
+            _SETTINGS_STORE = SettingsStore(SETTINGS_FILE, default_settings)
+            _SETTINGS_STORE.register_derived("network", derive_network_config)
+        return _SETTINGS_STORE
+
 def get_settings():
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
+    """A private, modifiable copy of the current settings (no disk read)"""
+    return get_settings_store().get()
+
+def default_settings():
     return {
         "transparency": 100,
         "show_change_pct": True,
@@ -773,6 +814,7 @@ def get_settings():
         "led_ghosting_effect": True,  # Enable motion blur/trailing effect
         # Ghost intensity controls both tint opacity and color strength (0-200)
         "led_ghost_intensity": 50,  # 50 = default (so preview/initial blur ~50%)
+        "led_ghost_engine": "layers",  # "layers" = offset ghost copies, "accumulation" = fading trail buffer
         "led_icon_matrix": True,  # Apply LED matrix overlay to icons
         "led_glass_glare": True,  # Enable glass cover with reflections/glare
         "glass_opacity": 60,
@@ -781,6 +823,8 @@ def get_settings():
         "coingecko_api_key": "",
         "finnhub_api_key": "",
         "finnhub_api_key_2": "",  # Optional second API key for load balancing
+        "finnhub_extra_api_keys": [],  # Any further API keys (each gets its own quota)
+        "finnhub_calls_per_minute": 60,  # Per-key plan quota (free tier: 60/min)
         "group_crypto_first": False,
         "use_proxy": False,
         "proxy": "",
@@ -797,29 +841,36 @@ def get_settings():
         "show_sparklines": False,  # Toggle historical mini-sparklines (off by default for performance)
         "sparkline_period": "1d",  # Sparkline history period: "1d" or "5d"
         "sparkline_position": "left",  # Sparkline placement relative to price/change: "left" or "right"
+        "sparkline_fetch_workers": 4,  # Concurrent sparkline history downloads
         "show_market_status": True,  # Show Market Open/Closed status ticker item
+        "strip_renderer": True,  # Draw pre-composited strips instead of one pixmap per symbol
+        "background_tile_rendering": True,  # Render full tile rebuilds on worker threads and swap them in
+        "websocket_price_source": "last",  # Live price shown: "last" trade or "vwap" of each WebSocket batch
+        "websocket_symbols_per_connection": 50,  # Symbols streamed per WebSocket connection (one connection per Finnhub key)
+        "log_level": "INFO",  # Console log level: DEBUG, INFO, WARNING or ERROR
+        "log_tag_levels": {},  # Per-tag overrides, e.g. {"API": "DEBUG", "WEBSOCKET": "WARNING"}
+        "log_jsonl": False,  # Also write log records to TCKR.Log.jsonl (JSON lines)
+        "quote_snapshot_max_age": 120,  # Startup skips fetching symbols whose saved quote is younger (seconds)
+        # Market data endpoints (point at toolsx/mock_market_server.py for offline testing)
+        "finnhub_base_url": DEFAULT_SERVICE_URLS["finnhub_base_url"],
+        "finnhub_websocket_url": DEFAULT_SERVICE_URLS["finnhub_websocket_url"],
+        "yahoo_base_url": DEFAULT_SERVICE_URLS["yahoo_base_url"],
+        "icon_base_url": DEFAULT_SERVICE_URLS["icon_base_url"],
     }
 
 
-# Helper: compute dominant color of a pixmap by sampling pixels (fast and approximate)
-def calculate_pixmap_dominant_color(pixmap, sample_step=6):
+# Helper: compute dominant color of a pixmap (or QImage) by sampling pixels (fast and approximate)
+def calculate_pixmap_dominant_color(pixmap, sample_step=6, cache_key=None):
+    """Dominant colour from pixel_stats; with a cache_key (what the image shows) an
+    image sampled before is not sampled again"""
     try:
-        img = pixmap.toImage().convertToFormat(QtGui.QImage.Format_ARGB32)
+        img = pixmap if isinstance(pixmap, QtGui.QImage) else pixmap.toImage()
+        rgb, _coverage = get_pixel_stats_cache().dominant_color(img, cache_key, sample_step)
     except Exception:
         return QtGui.QColor(200, 200, 200)
-    w = img.width()
-    h = img.height()
-    rsum = gsum = bsum = count = 0
-    for y in range(0, h, sample_step):
-        for x in range(0, w, sample_step):
-            px = img.pixel(x, y)
-            c = QtGui.QColor(px)
-            if c.alpha() <= 16:
-                continue
-            rsum += c.red(); gsum += c.green(); bsum += c.blue(); count += 1
-    if count == 0:
+    if rgb is None:
         return QtGui.QColor(200, 200, 200)
-    return QtGui.QColor(rsum // count, gsum // count, bsum // count)
+    return QtGui.QColor(*rgb)
 
 
 def calculate_bloom_factor(percent):
@@ -1202,9 +1253,8 @@ class EffectsPreviewWidget(QtWidgets.QWidget):
 
 
 def save_settings(settings):
-    os.makedirs(APPDATA_DIR, exist_ok=True)
-    with open(SETTINGS_FILE, "w") as f:
-        json.dump(settings, f, indent=4, sort_keys=True)
+    """Write the settings file and notify settings listeners of the changed keys"""
+    get_settings_store().save(settings)
 
 def load_stocks():
     if os.path.exists(STOCKS_FILE):
@@ -1433,6 +1483,47 @@ def normalize_proxy_url(proxy_value):
     return proxy_value
 
 
+class NetworkConfig(collections.namedtuple("NetworkConfig", "proxy verify websocket_proxy_kwargs")):
+    """Proxy / certificate settings for network calls, derived once per settings change"""
+    __slots__ = ()
+
+    def request_kwargs(self):
+        """proxies/verify kwargs for requests (a fresh proxies dict: requests may add to it)"""
+        proxies = {"http": self.proxy, "https": self.proxy} if self.proxy else None
+        return {"proxies": proxies, "verify": self.verify}
+
+def derive_network_config(settings):
+    proxy_value = normalize_proxy_url(settings.get("proxy", ""))
+    verify = True
+    if settings.get("use_cert") and settings.get("cert_file"):
+        verify = settings["cert_file"]
+    return NetworkConfig(proxy_value if settings.get("use_proxy") and proxy_value else None, verify,
+                         types.MappingProxyType(build_websocket_proxy_kwargs(settings)))
+
+def get_network_config():
+    """Current NetworkConfig (shared, recomputed only when settings change)"""
+    return get_settings_store().derived("network")
+
+
+# Market data service base URLs. A setting of the same name, or an environment variable
+# (TCKR_FINNHUB_BASE_URL, ...), points them elsewhere - e.g. toolsx/mock_market_server.py
+DEFAULT_SERVICE_URLS = {
+    "finnhub_base_url": "https://finnhub.io/api/v1",
+    "finnhub_websocket_url": "wss://ws.finnhub.io",
+    "yahoo_base_url": "https://query1.finance.yahoo.com",
+    "icon_base_url": "https://raw.githubusercontent.com/krypdoh/stock-icons",
+}
+
+def service_url(name, settings=None):
+    """Base URL (no trailing slash) of a market data service: env var, then setting, then default"""
+    url = os.environ.get(f"TCKR_{name.upper()}")
+    if not url:
+        if settings is None:
+            settings = get_settings_store().snapshot()
+        url = settings.get(name) or DEFAULT_SERVICE_URLS[name]
+    return url.rstrip("/")
+
+
 def fetch_yahoo_quote(ticker):
     """
     Fetch quote data from Yahoo Finance for indices.
@@ -1442,27 +1533,15 @@ def fetch_yahoo_quote(ticker):
         # Yahoo Finance uses a different URL structure
         yahoo_symbol = normalize_yahoo_symbol(ticker)
         encoded_ticker = url_quote(yahoo_symbol, safe='')
-        url = f"https://query1.finance.yahoo.com/v8/finance/chart/{encoded_ticker}"
-        
-        settings = get_settings()
-        proxies = None
-        verify = True
-        proxy_value = normalize_proxy_url(settings.get("proxy", ""))
-        if settings.get("use_proxy") and proxy_value:
-            proxies = {
-                "http": proxy_value,
-                "https": proxy_value
-            }
-        if settings.get("use_cert") and settings.get("cert_file"):
-            verify = settings["cert_file"]
-        
+        url = f"{service_url('yahoo_base_url')}/v8/finance/chart/{encoded_ticker}"
+
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        colored_print(f"[YAHOO API CALL] GET {url}")
-        response = get_requests_session().get(url, headers=headers, timeout=10, proxies=proxies, verify=verify)
-        colored_print(f"[YAHOO API RESPONSE] {ticker}: Status {response.status_code}")
+        log_debug("YAHOO API CALL", "GET %s", url)
+        response = market_data_get("yahoo", url, headers=headers, timeout=10, **get_network_config().request_kwargs())
+        log_debug("YAHOO API RESPONSE", "%s: Status %s", ticker, response.status_code)
         response.raise_for_status()
         data = response.json()
         
@@ -1474,7 +1553,7 @@ def fetch_yahoo_quote(ticker):
             price = meta.get('regularMarketPrice')
             prev_close = meta.get('previousClose') or meta.get('chartPreviousClose')
             
-            colored_print(f"[YAHOO API DATA] {ticker}: price={price}, prev_close={prev_close}")
+            log_debug("YAHOO API DATA", "%s: price=%s, prev_close=%s", ticker, price, prev_close)
             return price, prev_close
         else:
             colored_print(f"[YAHOO API ERROR] {ticker}: Unexpected response structure")
@@ -1484,131 +1563,356 @@ def fetch_yahoo_quote(ticker):
         colored_print(f"[YAHOO API ERROR] {ticker}: {e}")
         return None, None
 
-def fetch_finnhub_quote(ticker, api_key):
+YAHOO_BATCH_SIZE = 20  # Symbols per Yahoo spark request
+
+
+def _parse_yahoo_batch_meta(meta):
+    price = meta.get('regularMarketPrice')
+    prev_close = meta.get('previousClose') or meta.get('chartPreviousClose')
+    return price, prev_close
+
+
+def fetch_yahoo_quotes_batch(tickers):
+    """
+    Fetch quotes for several Yahoo symbols (^ indices, $ crypto) in one request.
+    Returns {ticker: (price, prev_close)} for the symbols Yahoo answered; tickers
+    missing from the result should be retried with fetch_yahoo_quote().
+    """
+    if not tickers:
+        return {}
+    yahoo_to_ticker = {normalize_yahoo_symbol(t): t for t in tickers}
+    try:
+        symbols_param = ",".join(url_quote(sym, safe='') for sym in yahoo_to_ticker)
+        url = f"{service_url('yahoo_base_url')}/v8/finance/spark?symbols={symbols_param}&range=1d&interval=1d"
+
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+        log_debug("YAHOO API CALL", "GET %s", url)
+        response = market_data_get("yahoo", url, headers=headers, timeout=10, **get_network_config().request_kwargs())
+        log_debug("YAHOO API RESPONSE", "batch of %d: Status %s", len(yahoo_to_ticker), response.status_code)
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        colored_print(f"[YAHOO API ERROR] batch of {len(yahoo_to_ticker)}: {e}")
+        return {}
+
+    quotes = {}
+    try:
+        if isinstance(data, dict) and 'spark' in data:
+            # {"spark": {"result": [{"symbol": "^GSPC", "response": [{"meta": {...}}]}]}}
+            for item in (data['spark'].get('result') or []):
+                ticker = yahoo_to_ticker.get(item.get('symbol'))
+                responses = item.get('response') or []
+                if ticker is None or not responses:
+                    continue
+                price, prev_close = _parse_yahoo_batch_meta(responses[0].get('meta', {}))
+                if price is not None:
+                    quotes[ticker] = (price, prev_close)
+        elif isinstance(data, dict):
+            # Newer flat shape: {"^GSPC": {"close": [...], "chartPreviousClose": ..., "previousClose": ...}}
+            for yahoo_symbol, item in data.items():
+                ticker = yahoo_to_ticker.get(yahoo_symbol)
+                if ticker is None or not isinstance(item, dict):
+                    continue
+                closes = [c for c in (item.get('close') or []) if c is not None]
+                price = closes[-1] if closes else None
+                prev_close = item.get('previousClose') or item.get('chartPreviousClose')
+                if price is not None:
+                    quotes[ticker] = (price, prev_close)
+    except Exception as e:
+        colored_print(f"[YAHOO API ERROR] batch parse failed: {e}")
+
+    log_debug("YAHOO API DATA", "batch: %d/%d symbols answered", len(quotes), len(yahoo_to_ticker))
+    return quotes
+
+def fetch_finnhub_quote_with_status(ticker, api_key, on_response=None):
+    """
+    Fetch one quote from Finnhub.
+    Returns (ticker, (price, prev_close), status_code); price is None on error.
+    on_response(status_code, headers) is called for every HTTP response, including
+    errors, so rate-limit headers can be fed back to the key pool.
+    """
     # URL-encode the ticker symbol to handle special characters like ^
     encoded_ticker = url_quote(ticker, safe='')
-    url = f"https://finnhub.io/api/v1/quote?symbol={encoded_ticker}&token={api_key}"
-    settings = get_settings()
-    proxies = None
-    verify = True
-    proxy_value = normalize_proxy_url(settings.get("proxy", ""))
-    if settings.get("use_proxy") and proxy_value:
-        proxies = {
-            "http": proxy_value,
-            "https": proxy_value
-        }
-    if settings.get("use_cert") and settings.get("cert_file"):
-        verify = settings["cert_file"]
+    url = f"{service_url('finnhub_base_url')}/quote?symbol={encoded_ticker}&token={api_key}"
     try:
-        colored_print(f"[API CALL] GET {url}")
-        response = get_requests_session().get(url, timeout=10, proxies=proxies, verify=verify)
-        colored_print(f"[API RESPONSE] {ticker}: Status {response.status_code}")
+        log_debug("API CALL", "GET quote %s (key %s)", ticker, mask_api_key(api_key))
+        response = market_data_get("finnhub", url, timeout=10, **get_network_config().request_kwargs())
+        log_debug("API RESPONSE", "%s: Status %s", ticker, response.status_code)
+        if on_response is not None:
+            on_response(response.status_code, response.headers)
         response.raise_for_status()
         data = response.json()
-        colored_print(f"[API DATA] {ticker}: Full response: {data}")
-        print(f"[API DATA] {ticker}: price={data.get('c')}, prev_close={data.get('pc')}")
         price = data.get("c")
         prev_close = data.get("pc")
+        log_debug("API DATA", "%s: price=%s, prev_close=%s, full response: %s", ticker, price, prev_close, data)
         # Check if price is 0 (which might indicate no data)
         if price == 0:
-            print(f"[API WARNING] {ticker}: Price is 0, treating as None")
+            colored_print(f"[API WARNING] {ticker}: Price is 0, treating as None")
             price = None
-        return ticker, (price, prev_close)
+        return ticker, (price, prev_close), response.status_code
+    except requests.exceptions.HTTPError as e:
+        status_code = getattr(e.response, 'status_code', None)
+        colored_print(f"[API ERROR] {ticker}: {e}")
+        return ticker, (None, None), status_code
     except Exception as e:
-        print(f"[API ERROR] {ticker}: {e}")
-        return ticker, (None, None)
+        colored_print(f"[API ERROR] {ticker}: {e}")
+        return ticker, (None, None), None
+
+def fetch_finnhub_quote(ticker, api_key):
+    tkr, quote, _status_code = fetch_finnhub_quote_with_status(ticker, api_key)
+    return tkr, quote
+
+
+class YahooQuoteProvider(QuoteProvider):
+    """Yahoo Finance provider for ^ indices and $ crypto (no API key needed).
+    Symbols are sent in spark batches; the chart endpoint is the per-symbol fallback."""
+    name = "yahoo"
+    max_concurrency = 5
+    batch_size = YAHOO_BATCH_SIZE
 
-def fetch_all_stock_prices(tickers, api_key, api_key_2=None):
+    def __init__(self, requests_per_second=20):
+        super().__init__(TokenBucket(requests_per_second, requests_per_second))
+
+    def handles(self, symbol):
+        return is_yahoo_symbol(symbol)
+
+    def fetch_quote(self, symbol, lease=None):
+        price, prev_close = fetch_yahoo_quote(symbol)
+        return price, prev_close, None
+
+    def fetch_batch(self, symbols, lease=None):
+        quotes = fetch_yahoo_quotes_batch(symbols)
+        return {symbol: (price, prev_close, None) for symbol, (price, prev_close) in quotes.items()}
+
+
+class FinnhubQuoteProvider(QuoteProvider):
+    """Finnhub /quote provider; each request uses the API key with the most remaining quota"""
+    name = "finnhub"
+    max_concurrency = 10
+    rate_limit_pause = 2.0
+
+    def __init__(self, requests_per_second=25, calls_per_minute=60):
+        # Finnhub hard-caps every key at 30 calls/second - stay just below it.
+        # The per-minute plan quota is tracked separately for each key by the pool.
+        super().__init__(TokenBucket(requests_per_second, requests_per_second))
+        self.key_pool = ApiKeyPool(calls_per_window=calls_per_minute, window_seconds=60.0)
+
+    def set_api_keys(self, *api_keys):
+        self.key_pool.set_keys(api_keys)
+
+    def handles(self, symbol):
+        return not is_yahoo_symbol(symbol)
+
+    async def acquire(self):
+        await super().acquire()
+        if not self.key_pool.keys:
+            return ""  # No key configured - request fails fast with 401 as before
+        return await self.key_pool.acquire_async()
+
+    def fetch_quote(self, symbol, lease=None):
+        api_key = lease or ""
+
+        def record(status_code, headers):
+            self.key_pool.record_response(api_key, status_code, headers)
+
+        _tkr, (price, prev_close), status_code = fetch_finnhub_quote_with_status(symbol, api_key, on_response=record)
+        return price, prev_close, status_code
+
+    def on_rate_limited(self, symbol, lease=None):
+        # The key pool already blocked the offending key for its Retry-After period;
+        # only pause the shared bucket when no other key has budget left.
+        if self.key_pool.seconds_until_available() > 0:
+            super().on_rate_limited(symbol, lease)
+
+    def get_quota_status(self):
+        return self.key_pool.get_quota_status()
+
+
+# Shared quote engine: one asyncio loop + worker pool reused by every refresh cycle
+_QUOTE_ENGINE = None
+_QUOTE_ENGINE_LOCK = threading.Lock()
+
+def get_quote_engine():
+    """Get or create the shared quote fetch engine"""
+    global _QUOTE_ENGINE
+    with _QUOTE_ENGINE_LOCK:
+        if _QUOTE_ENGINE is None:
+            settings = get_settings()
+            _QUOTE_ENGINE = QuoteFetchEngine([
+                YahooQuoteProvider(settings.get("yahoo_requests_per_second", 20)),
+                FinnhubQuoteProvider(settings.get("finnhub_requests_per_second", 25),
+                                     settings.get("finnhub_calls_per_minute", 60)),
+            ])
+            colored_print("[PERF] Initialized async quote fetch engine")
+        return _QUOTE_ENGINE
+
+def get_finnhub_api_keys(api_key, api_key_2=None, settings=None):
+    """All configured Finnhub keys: the primary/secondary keys plus any listed in
+    the "finnhub_extra_api_keys" setting."""
+    if settings is None:
+        settings = get_settings_store().snapshot()
+    keys = [api_key, api_key_2]
+    extra = settings.get("finnhub_extra_api_keys", [])
+    if isinstance(extra, str):
+        extra = extra.split(",")
+    keys.extend(k.strip() for k in extra if isinstance(k, str))
+    return [k for k in dict.fromkeys(keys) if k]
+
+# Shared sparkline history: seeded from Yahoo charts, extended by trades and polls
+_HISTORY_STORE = None
+_HISTORY_STORE_LOCK = threading.Lock()
+
+def get_history_store():
+    """Get or create the shared price history store (loaded from HISTORY_FILE)"""
+    global _HISTORY_STORE
+    with _HISTORY_STORE_LOCK:
+        if _HISTORY_STORE is None:
+            _HISTORY_STORE = HistoryStore(HISTORY_FILE)
+            try:
+                loaded = _HISTORY_STORE.load()
+                if loaded:
+                    colored_print(f"[SPARKLINE] Loaded {loaded} cached history series")
+            except Exception as e:
+                colored_print(f"[SPARKLINE] Could not load history cache: {e}")
+        return _HISTORY_STORE
+
+# Last known quote per symbol, shown at startup before the first refresh completes
+_QUOTE_SNAPSHOT = None
+_QUOTE_SNAPSHOT_LOCK = threading.Lock()
+
+def get_quote_snapshot():
+    """Get or create the shared quote snapshot (loaded from QUOTE_SNAPSHOT_FILE)"""
+    global _QUOTE_SNAPSHOT
+    with _QUOTE_SNAPSHOT_LOCK:
+        if _QUOTE_SNAPSHOT is None:
+            _QUOTE_SNAPSHOT = QuoteSnapshot(QUOTE_SNAPSHOT_FILE)
+            try:
+                loaded = _QUOTE_SNAPSHOT.load()
+                if loaded:
+                    colored_print(f"[SNAPSHOT] Loaded {loaded} last known quotes")
+            except Exception as e:
+                colored_print(f"[SNAPSHOT] Could not load quote snapshot: {e}")
+        return _QUOTE_SNAPSHOT
+
+def _sparkline_request_kwargs():
+    """Header/timeout/proxy/verify kwargs for sparkline requests"""
+    return {
+        'headers': {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+        'timeout': 10,
+        **get_network_config().request_kwargs(),
+    }
+
+def parse_yahoo_chart_series(data):
+    """Extract (timestamps, values) from a Yahoo chart response, skipping gaps"""
+    result = data.get("chart", {}).get("result") or []
+    if not result:
+        return [], []
+    timestamps = result[0].get("timestamp") or []
+    indicators = result[0].get("indicators", {})
+
+    def paired(series):
+        return [(float(t), float(v)) for t, v in zip(timestamps, series or []) if v is not None]
+
+    points = []
+    quote_data = indicators.get("quote", [])
+    if quote_data:
+        points = paired(quote_data[0].get("close"))
+        # Fallback to open/high/low if close has insufficient points
+        if len(points) < 2:
+            for fallback_field in ("open", "high", "low"):
+                fallback_points = paired(quote_data[0].get(fallback_field))
+                if len(fallback_points) >= 2:
+                    points = fallback_points
+                    break
+
+    # Extra fallback: adjusted close series
+    if len(points) < 2:
+        adjclose_data = indicators.get("adjclose", [])
+        if adjclose_data:
+            adj_points = paired(adjclose_data[0].get("adjclose"))
+            if len(adj_points) >= 2:
+                points = adj_points
+
+    return [t for t, _ in points], [v for _, v in points]
+
+def fetch_sparkline_history(symbol, period, since=None):
+    """Download sparkline history from Yahoo: the full `period` range, or only the
+    tail after `since`. Returns (timestamps, values); raises on HTTP errors."""
+    interval = HistoryStore.period_config(period)["interval"]
+    encoded_symbol = url_quote(normalize_yahoo_symbol(symbol), safe='')
+    request_kwargs = _sparkline_request_kwargs()
+    base_url = service_url('yahoo_base_url')
+    if since is None:
+        url = f"{base_url}/v8/finance/chart/{encoded_symbol}?range={period}&interval={interval}"
+    else:
+        url = (f"{base_url}/v8/finance/chart/{encoded_symbol}"
+               f"?period1={int(since)}&period2={int(time.time())}&interval={interval}")
+    try:
+        response = get_requests_session().get(url, **request_kwargs)
+        response.raise_for_status()
+        return parse_yahoo_chart_series(response.json())
+    except Exception as e:
+        if not hasattr(fetch_sparkline_history, '_logged_failures'):
+            fetch_sparkline_history._logged_failures = set()
+        if (symbol, period) not in fetch_sparkline_history._logged_failures:
+            fetch_sparkline_history._logged_failures.add((symbol, period))
+            colored_print(f"[SPARKLINE] {symbol} {period}: fetch failed ({e})")
+        raise
+
+# Shared sparkline fetch pool: a few workers, nearest-to-screen symbols first
+_HISTORY_SCHEDULER = None
+
+def get_history_scheduler():
+    """Get or create the shared sparkline history fetch scheduler"""
+    global _HISTORY_SCHEDULER
+    store = get_history_store()
+    with _HISTORY_STORE_LOCK:
+        if _HISTORY_SCHEDULER is None:
+            workers = get_settings_store().snapshot().get("sparkline_fetch_workers", 4)
+            _HISTORY_SCHEDULER = HistoryFetchScheduler(store, fetch_sparkline_history, max_workers=workers)
+        return _HISTORY_SCHEDULER
+
+def record_price_history(prices):
+    """Append polled prices to the history store and quote snapshot; persist both now and then"""
+    store = get_history_store()
+    store.append_quotes(prices)
+    try:
+        store.save_if_dirty()
+    except Exception as e:
+        colored_print(f"[SPARKLINE] Could not save history cache: {e}")
+    snapshot = get_quote_snapshot()
+    snapshot.update(prices, source=lambda symbol: "yahoo" if is_yahoo_symbol(symbol) else "finnhub")
+    try:
+        snapshot.save_if_dirty()
+    except Exception as e:
+        colored_print(f"[SNAPSHOT] Could not save quote snapshot: {e}")
+
+def fetch_all_stock_prices(tickers, api_key, api_key_2=None, on_partial=None):
     """
-    Fetch stock prices using one or two API keys.
-    If api_key_2 is provided, alternates between keys every 30 calls.
-    Uses adaptive delay that starts at 1s and increases if errors occur.
-    Uses Yahoo Finance for index and crypto symbols (starting with ^ or $).
+    Fetch stock prices through the shared quote engine (no result caching).
+    Each Finnhub request uses the configured API key with the most remaining
+    per-minute quota; Yahoo Finance serves index and crypto symbols (^ or $).
+    on_partial(dict) receives results in chunks as they arrive.
     """
-    prices = {}
-    
-    # Separate Yahoo Finance tickers (^ indices, $ crypto) from Finnhub tickers
-    yahoo_tickers = [t for t in tickers if is_yahoo_symbol(t)]
-    finnhub_tickers = [t for t in tickers if not is_yahoo_symbol(t)]
-    
-    colored_print(f"[API] Starting to fetch prices: {len(finnhub_tickers)} from Finnhub, {len(yahoo_tickers)} from Yahoo")
-    
-    # Fetch Yahoo Finance data first (no API key needed, no rate limits)
-    if yahoo_tickers:
-        colored_print(f"[YAHOO API] Fetching {len(yahoo_tickers)} Yahoo symbols from Yahoo Finance")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            yahoo_futures = [executor.submit(fetch_yahoo_quote, ticker) for ticker in yahoo_tickers]
-            for ticker, future in zip(yahoo_tickers, yahoo_futures):
-                price, prev_close = future.result()
-                prices[ticker] = (price, prev_close)
-    
-    # Fetch Finnhub data with rate limiting
-    if finnhub_tickers:
-        batch_size = 10
-        call_count = 0
-        batch_delay = 1.0  # Start with 1 second delay
-        consecutive_errors = 0
-        
-        colored_print(f"[API] Starting to fetch {len(finnhub_tickers)} tickers from Finnhub")
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            for i in range(0, len(finnhub_tickers), batch_size):
-                batch = finnhub_tickers[i:i+batch_size]
-                
-                # Determine which API key to use for this batch
-                # Switch to second key after 30 calls (3 batches of 10)
-                if api_key_2 and call_count >= 30:
-                    current_key = api_key_2
-                    colored_print(f"[API KEY] Using API Key 2 for batch {i//batch_size + 1}")
-                else:
-                    current_key = api_key
-                    if api_key_2:
-                        colored_print(f"[API KEY] Using API Key 1 for batch {i//batch_size + 1}")
-                
-                colored_print(f"[API] Fetching batch {i//batch_size + 1}: {batch}")
-                futures = [executor.submit(fetch_finnhub_quote, ticker, current_key) for ticker in batch]
-                batch_had_error = False
-                for future in concurrent.futures.as_completed(futures):
-                    tkr, (price, prev_close) = future.result()
-                    if price is None:
-                        batch_had_error = True
-                    prices[tkr] = (price, prev_close)
-                    call_count += 1
-                    
-                    # Reset counter after 60 calls to alternate back to first key
-                    if call_count >= 60:
-                        call_count = 0
-                
-                # Adaptive delay adjustment
-                if batch_had_error:
-                    consecutive_errors += 1
-                    if consecutive_errors >= 2 and batch_delay < 5.0:
-                        batch_delay = min(batch_delay + 0.5, 5.0)  # Increase delay, cap at 5s
-                        colored_print(f"[API] Errors detected, increasing delay to {batch_delay:.1f}s")
-                else:
-                    if consecutive_errors > 0:
-                        print(f"[API] No errors in this batch, keeping delay at {batch_delay:.1f}s")
-                    consecutive_errors = 0
-                        
-                if i + batch_size < len(finnhub_tickers):
-                    print(f"[API] Waiting {batch_delay:.1f} seconds before next batch...")
-                    time.sleep(batch_delay)
-    
+    yahoo_count = len([t for t in tickers if is_yahoo_symbol(t)])
+    colored_print(f"[API] Starting to fetch prices: {len(tickers) - yahoo_count} from Finnhub, {yahoo_count} from Yahoo")
+    engine = get_quote_engine()
+    engine.get_provider("finnhub").set_api_keys(*get_finnhub_api_keys(api_key, api_key_2))
+    prices, _had_429 = engine.fetch(tickers, on_partial=on_partial)
     colored_print(f"[API] Completed fetching {len(prices)} prices")
+    record_price_history(prices)
     return prices
 
-def fetch_all_stock_prices_with_429(tickers, api_key, api_key_2=None, force=False):
+def fetch_all_stock_prices_with_429(tickers, api_key, api_key_2=None, force=False, on_partial=None):
     """
-    Fetch stock prices with 429 detection using one or two API keys.
-    If api_key_2 is provided, alternates between keys every 30 calls.
-    Uses adaptive delay that starts at 1s and increases on 429 errors.
-    Uses Yahoo Finance for index and crypto symbols (starting with ^ or $).
-    Includes caching to prevent duplicate fetches within 30 seconds.
+    Fetch stock prices with 429 detection through the shared quote engine.
+    Includes caching to prevent duplicate fetches within 60 seconds.
+    Returns (prices, had_429).
     """
-    prices = {}
-
     # Check cache for recent fetches of the same tickers
-    import time
     current_time = time.time()
     cache_key = tuple(sorted(tickers))  # Sort for consistent key
 
@@ -1628,112 +1932,13 @@ def fetch_all_stock_prices_with_429(tickers, api_key, api_key_2=None, force=Fals
             colored_print(f"[API CACHE] Cache expired for {len(tickers)} tickers (age: {age:.1f}s) - fetching fresh data")
 
     colored_print(f"[API] Starting to fetch prices (with 429 detection) for {len(tickers)} tickers")
-    
-    # Separate Yahoo Finance tickers (^ indices, $ crypto) from Finnhub tickers
-    yahoo_tickers = [t for t in tickers if is_yahoo_symbol(t)]
-    finnhub_tickers = [t for t in tickers if not is_yahoo_symbol(t)]
-    
-    # Fetch Yahoo Finance data first (no API key needed, no rate limits)
-    if yahoo_tickers:
-        colored_print(f"[YAHOO API] Fetching {len(yahoo_tickers)} Yahoo symbols from Yahoo Finance")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            yahoo_futures = [executor.submit(fetch_yahoo_quote, ticker) for ticker in yahoo_tickers]
-            for ticker, future in zip(yahoo_tickers, yahoo_futures):
-                price, prev_close = future.result()
-                prices[ticker] = (price, prev_close)
-    
-    batch_size = 10
-    had_429 = False
-    call_count = 0
-    batch_delay = 1.0  # Start with 1 second delay
-    consecutive_429s = 0
-    
-    def fetch_with_status(ticker, api_key):
-        # URL-encode the ticker symbol to handle special characters like ^
-        encoded_ticker = url_quote(ticker, safe='')
-        url = f"https://finnhub.io/api/v1/quote?symbol={encoded_ticker}&token={api_key}"
-        settings = get_settings()
-        proxies = None
-        verify = True
-        proxy_value = normalize_proxy_url(settings.get("proxy", ""))
-        if settings.get("use_proxy") and proxy_value:
-            proxies = {
-                "http": proxy_value,
-                "https": proxy_value
-            }
-        if settings.get("use_cert") and settings.get("cert_file"):
-            verify = settings["cert_file"]
-        try:
-            colored_print(f"[API CALL] GET {url}")
-            response = get_requests_session().get(url, timeout=10, proxies=proxies, verify=verify)
-            colored_print(f"[API RESPONSE] {ticker}: Status {response.status_code}")
-            response.raise_for_status()
-            data = response.json()
-            colored_print(f"[API DATA] {ticker}: Full response: {data}")
-            print(f"[API DATA] {ticker}: price={data.get('c')}, prev_close={data.get('pc')}")
-            price = data.get("c")
-            prev_close = data.get("pc")
-            # Check if price is 0 (which might indicate no data)
-            if price == 0:
-                print(f"[API WARNING] {ticker}: Price is 0, treating as None")
-                price = None
-            return ticker, (price, prev_close), response.status_code
-        except requests.exceptions.HTTPError as e:
-            status_code = getattr(e.response, 'status_code', None)
-            print(f"[API ERROR] {ticker}: {e}")
-            return ticker, (None, None), status_code
-        except Exception as e:
-            print(f"[API ERROR] {ticker}: {e}")
-            return ticker, (None, None), None
-
-    # Fetch Finnhub data with rate limiting and 429 detection
-    if finnhub_tickers:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            for i in range(0, len(finnhub_tickers), batch_size):
-                batch = finnhub_tickers[i:i+batch_size]
-                
-                # Determine which API key to use for this batch
-                # Switch to second key after 30 calls (3 batches of 10)
-                if api_key_2 and call_count >= 30:
-                    current_key = api_key_2
-                    colored_print(f"[API KEY] Using API Key 2 for batch {i//batch_size + 1}")
-                else:
-                    current_key = api_key
-                    if api_key_2:
-                        colored_print(f"[API KEY] Using API Key 1 for batch {i//batch_size + 1}")
-                
-                colored_print(f"[API] Fetching batch {i//batch_size + 1}: {batch}")
-                futures = [executor.submit(fetch_with_status, ticker, current_key) for ticker in batch]
-                batch_had_429 = False
-                for future in concurrent.futures.as_completed(futures):
-                    tkr, (price, prev_close), status_code = future.result()
-                    prices[tkr] = (price, prev_close)
-                    if status_code == 429:
-                        had_429 = True
-                        batch_had_429 = True
-                        print(f"[API WARNING] Received 429 (rate limit) for {tkr}")
-                    call_count += 1
-                    
-                    # Reset counter after 60 calls to alternate back to first key
-                    if call_count >= 60:
-                        call_count = 0
-                
-                # Adaptive delay adjustment based on 429 errors
-                if batch_had_429:
-                    consecutive_429s += 1
-                    if batch_delay < 10.0:
-                        batch_delay = min(batch_delay + 1.0, 10.0)  # Increase delay by 1s, cap at 10s
-                        print(f"[API] 429 detected, increasing delay to {batch_delay:.1f}s")
-                else:
-                    if consecutive_429s > 0:
-                        print(f"[API] No 429 in this batch, keeping delay at {batch_delay:.1f}s")
-                        consecutive_429s = 0
-                        
-                    if i + batch_size < len(finnhub_tickers):
-                        print(f"[API] Waiting {batch_delay:.1f} seconds before next batch...")
-                        time.sleep(batch_delay)
-    
-    colored_print(f"[API] Completed fetching {len(prices)} prices (429 detected: {had_429})")
+
+    engine = get_quote_engine()
+    engine.get_provider("finnhub").set_api_keys(*get_finnhub_api_keys(api_key, api_key_2))
+    prices, had_429 = engine.fetch(tickers, on_partial=on_partial)
+    record_price_history(prices)
+
+    colored_print(f"[API] Completed fetching {len(prices)} prices in {engine.get_stats()['last_cycle_seconds']:.1f}s (429 detected: {had_429})")
 
     # Cache the results
     fetch_all_stock_prices_with_429._cache[cache_key] = (current_time, prices.copy())
@@ -1747,6 +1952,7 @@ def fetch_all_stock_prices_with_429(tickers, api_key, api_key_2=None, force=Fals
         del fetch_all_stock_prices_with_429._cache[key]
 
     return prices, had_429
+
 def build_websocket_proxy_kwargs(settings):
     proxy_value = normalize_proxy_url(settings.get("proxy", ""))
     if not settings.get("use_proxy") or not proxy_value:
@@ -1780,9 +1986,10 @@ class FinnhubWebSocketClient:
     Provides live price updates during market hours, falls back to polling after hours.
     """
 
-    def __init__(self, api_key, window_instance):
+    def __init__(self, api_key, window_instance, trade_buffer=None, label="Finnhub"):
         self.api_key = api_key
         self.window = window_instance
+        self.label = label
 
         # Debug tracking
         self.messages_received = 0
@@ -1812,17 +2019,20 @@ class FinnhubWebSocketClient:
         self.error_log = []  # Log of {timestamp, error, thread}
         self.connection_attempts_details = []  # {attempt, duration, success, error}
         
-        # PERF: Message batching and throttling to reduce jitter
-        self.price_buffer = {}  # {symbol: (price, timestamp)}
-        self.last_update_time = {}  # {symbol: timestamp} for rate limiting
+        # PERF: Message batching and throttling to reduce jitter. Trades are handed to the
+        # main thread through a swap-on-drain buffer, so the socket thread never blocks on it.
+        # Pooled connections share one buffer, each writing to its own lane
+        self.trade_buffer = trade_buffer if trade_buffer is not None else TradeIngestBuffer()
+        self._trade_lane = self.trade_buffer.lane() if trade_buffer is not None else self.trade_buffer
         
         # Load settings for batching parameters
-        settings = get_settings()
+        settings = get_settings_store().snapshot()
         self.batch_interval_ms = settings.get('websocket_batch_interval', 80)
         self.min_update_interval_ms = settings.get('websocket_min_update_interval', 50)
         self.min_change_threshold = settings.get('websocket_change_threshold', 0.0005)
         self.verbose_update_logs = bool(settings.get('websocket_verbose_logs', False))
-        self.proxy_kwargs = build_websocket_proxy_kwargs(settings)
+        self.proxy_kwargs = dict(get_network_config().websocket_proxy_kwargs)
+        self.websocket_url = service_url("finnhub_websocket_url", settings)
         self.sslopt = None
         if settings.get("use_cert") and settings.get("cert_file"):
             self.sslopt = {"ca_certs": settings["cert_file"]}
@@ -1834,7 +2044,7 @@ class FinnhubWebSocketClient:
 
     def connect(self):
         """Connect to Finnhub websocket for real-time data"""
-        if not WEBSOCKET_AVAILABLE:
+        if not WEBSOCKET_AVAILABLE and _MARKET_REPLAYER is None:
             colored_print("[WEBSOCKET] WebSocket library not available - skipping real-time connection")
             return False
 
@@ -1859,9 +2069,12 @@ class FinnhubWebSocketClient:
             self._connection_attempt_time = time.time()
             self._stop_requested = False
             self.connecting = True
-            colored_print("[WEBSOCKET] 🔌 Attempting to connect to Finnhub websockets...")
+            self.reconnect_attempts = 0
+            colored_print(f"[WEBSOCKET] 🔌 Attempting to connect to Finnhub websockets [{self.label}]...")
             def on_message(ws, message):
                 try:
+                    if _MARKET_RECORDER is not None:
+                        _MARKET_RECORDER.record_frame(self.label, message)
                     if self.messages_received < 3:
                         colored_print(f"[WEBSOCKET] 📨 Received message: {message[:200]}{'...' if len(message) > 200 else ''}")
                     data = json.loads(message)
@@ -1878,17 +2091,19 @@ class FinnhubWebSocketClient:
                 self.reconnect_attempts = 0
                 connection_duration = time.time() - getattr(self, '_connection_attempt_time', time.time())
                 self._log_state(f"Connected via {'proxy' if self.proxy_kwargs else 'direct'}", connection_duration)
-                colored_print(f"[WEBSOCKET] ✅ Connected to Finnhub real-time data (took {connection_duration:.1f}s)")
+                colored_print(f"[WEBSOCKET] ✅ Connected to Finnhub real-time data [{self.label}] (took {connection_duration:.1f}s)")
                 if self.proxy_kwargs:
                     proxy_type = self.proxy_kwargs.get('proxy_type', 'http')
                     host = self.proxy_kwargs.get('http_proxy_host')
                     colored_print(f"[WEBSOCKET]    🌐 Via Proxy: {proxy_type}://{host}:{self.proxy_kwargs.get('http_proxy_port')}")
                 colored_print(f"[WEBSOCKET] 📊 Status: Connected | Messages: {self.messages_received} | Updates: {self.price_updates_processed}")
                 colored_print(f"[WEBSOCKET] 🧵 Thread: {threading.current_thread().name}")
-                # Flush any queued subscriptions now that we're connected
+                # Flush any queued subscriptions now that we're connected. After an automatic
+                # reconnect nothing is queued, but the server forgot the old subscriptions
                 try:
-                    if self.queued_subscriptions:
-                        finnhub_symbols = [s for s in list(self.queued_subscriptions) if not is_yahoo_symbol(s)]
+                    pending = set(self.queued_subscriptions or self.subscribed_symbols)
+                    if pending:
+                        finnhub_symbols = [s for s in pending if not is_yahoo_symbol(s)]
                         if finnhub_symbols:
                             sent = 0
                             for sym in finnhub_symbols:
@@ -1898,7 +2113,7 @@ class FinnhubWebSocketClient:
                                 except Exception as e:
                                     colored_print(f"[WEBSOCKET] ❌ Failed to send queued subscribe for {sym}: {e}")
                             colored_print(f"[WEBSOCKET] 📥 Flushed queued subscriptions: sent {sent}/{len(finnhub_symbols)} messages")
-                            self.subscribed_symbols.update(finnhub_symbols)
+                            self.subscribed_symbols = set(finnhub_symbols)
                         self.queued_subscriptions.clear()
                 except Exception as e:
                     colored_print(f"[WEBSOCKET] ❌ Error flushing queued subscriptions: {e}")
@@ -1913,7 +2128,7 @@ class FinnhubWebSocketClient:
                 if self.connection_start_time:
                     connection_duration = current_time - self.connection_start_time
                     self.total_connection_time += connection_duration
-                    colored_print(f"[WEBSOCKET] 🔌 Connection closed: {close_status_code} - {close_msg}")
+                    colored_print(f"[WEBSOCKET] 🔌 Connection closed [{self.label}]: {close_status_code} - {close_msg}")
                     if lag_since_msg:
                         colored_print(f"[WEBSOCKET]    Last message {lag_since_msg:.1f}s ago, {self.messages_received} total msgs")
                     colored_print(f"[WEBSOCKET] 📊 Session: {connection_duration:.1f}s | Total: {self.total_connection_time:.1f}s | Reconnects: {self.reconnection_count}")
@@ -1945,13 +2160,22 @@ class FinnhubWebSocketClient:
                 self.last_error = error_str
                 self.last_error_time = time.time()
 
-            self.ws = websocket.WebSocketApp(
-                f"wss://ws.finnhub.io?token={self.api_key}",
-                on_message=on_message,
-                on_open=on_open,
-                on_close=on_close,
-                on_error=on_error
-            )
+            if _MARKET_REPLAYER is not None:
+                # Recorded frames instead of the network, through the same callbacks
+                self.ws = _MARKET_REPLAYER.socket(
+                    on_message=on_message,
+                    on_open=on_open,
+                    on_close=on_close,
+                    on_error=on_error
+                )
+            else:
+                self.ws = websocket.WebSocketApp(
+                    f"{self.websocket_url}?token={self.api_key}",
+                    on_message=on_message,
+                    on_open=on_open,
+                    on_close=on_close,
+                    on_error=on_error
+                )
 
             # Start connection in background thread
             self.connection_thread = threading.Thread(target=self._run_websocket, daemon=True)
@@ -1976,6 +2200,7 @@ class FinnhubWebSocketClient:
         import time
         import traceback
         attempt_start = None
+        ws = self.ws  # A later connect() replaces self.ws; this loop must then exit
         while self.reconnect_attempts < self.max_reconnect_attempts:
             attempt_start = time.time()
             try:
@@ -1991,10 +2216,14 @@ class FinnhubWebSocketClient:
                     colored_print(f"[WEBSOCKET] 🔌 Attempt {self.reconnect_attempts + 1}: Connecting via proxy {proxy_info}...")
                 else:
                     colored_print(f"[WEBSOCKET] 🔌 Attempt {self.reconnect_attempts + 1}: Connecting directly to Finnhub...")
-                if self.ws is None or self._stop_requested:
+                if self.ws is None or self.ws is not ws or self._stop_requested:
                     colored_print("[WEBSOCKET] 🛑 Stop requested or ws cleared - exiting reconnect loop")
                     break
-                self.ws.run_forever(**run_kwargs)
+                ws.run_forever(**run_kwargs)
+                if self._stop_requested or self.ws is not ws:
+                    # disconnect() closed the socket: that is not a dropped connection
+                    colored_print("[WEBSOCKET] 🛑 Stop requested - exiting reconnect loop")
+                    break
                 if not self.connected:
                     self.reconnect_attempts += 1
                     self.reconnection_count += 1
@@ -2030,6 +2259,8 @@ class FinnhubWebSocketClient:
                 })
                 self.last_error = str(e)
                 self.last_error_time = time.time()
+                if self._stop_requested:
+                    break
                 self.reconnect_attempts += 1
                 if self.reconnect_attempts < self.max_reconnect_attempts:
                     delay = self._get_reconnect_delay(self.reconnect_attempts)
@@ -2037,7 +2268,8 @@ class FinnhubWebSocketClient:
                     time.sleep(delay)
                 else:
                     break
-        self.connecting = False
+        if self.ws is ws:
+            self.connecting = False
 
     def _handle_message(self, data):
         """Handle incoming websocket messages"""
@@ -2047,23 +2279,24 @@ class FinnhubWebSocketClient:
         msg_type = data.get('type')
 
         if msg_type == 'trade':
-            # PERF: Buffer trades instead of processing immediately
-            trades = data.get('data', [])
-            trades_buffered = 0
-            for trade in trades:
+            # PERF: Buffer trades instead of processing immediately, one column per field,
+            # filled in a single pass over the message
+            symbols, prices, timestamps, volumes = [], [], [], []
+            for trade in data.get('data', ()):
                 symbol = trade.get('s')
                 price = trade.get('p')
-                timestamp = trade.get('t', 0) / 1000  # Convert ms to seconds
-
                 if symbol and price:
-                    # Buffer the update instead of emitting immediately
-                    self.price_buffer[symbol] = (price, timestamp)
-                    trades_buffered += 1
+                    symbols.append(symbol)
+                    prices.append(price)
+                    timestamps.append(trade.get('t', 0))
+                    volumes.append(trade.get('v') or 0.0)
+            # Buffer the message instead of emitting immediately (one atomic append)
+            self._trade_lane.push(symbols, prices, timestamps, volumes)
                     
             # Log buffering (messages accumulate until window processes them)
-            if trades_buffered > 0:
+            if symbols:
                 if self.messages_received <= 5 or self.messages_received % 50 == 0:
-                    colored_print(f"[WEBSOCKET] 📦 Buffered {trades_buffered} trades ({len(self.price_buffer)} symbols total)")
+                    colored_print(f"[WEBSOCKET] 📦 Buffered {len(symbols)} trades ({len(self.trade_buffer)} messages pending)")
         elif msg_type == 'ping':
             # Respond to ping
             if self.ws:
@@ -2076,91 +2309,6 @@ class FinnhubWebSocketClient:
             error_msg = data.get('msg', 'Unknown error')
             colored_print(f"[WEBSOCKET] Error: {error_msg}")
 
-    def process_buffered_updates(self, max_symbols=None):
-        """Process buffered price updates - called from main thread timer
-        
-        Args:
-            max_symbols: Maximum number of symbols to process (None = all)
-        """
-        if not self.price_buffer:
-            return 0  # Return count of processed symbols
-        
-        buffer_size = len(self.price_buffer)
-        # Drain the ENTIRE buffer in one pass — price dict writes are O(1) and take
-        # microseconds total. Only queue a pixmap rebuild when the formatted display
-        # string (e.g. "125.13") actually changes, which avoids work for sub-penny
-        # trades that produce no visible difference.
-        symbols_to_process = list(self.price_buffer.keys())
-        
-        if symbols_to_process and self.verbose_update_logs:
-            colored_print(f"[WEBSOCKET] 🔄 Processing {buffer_size} buffered symbols (full drain)...")
-        
-        import time
-        current_time = time.time()
-        updates_sent = 0
-        symbols_skipped = 0
-        updated_symbols = []
-        
-        # Process each symbol — no per-symbol time gate needed; the visual refresh
-        # timer itself controls how often we drain the buffer.
-        for symbol in symbols_to_process:
-            if symbol not in self.price_buffer:
-                continue  # Already removed
-                
-            price, timestamp = self.price_buffer[symbol]
-            # Update price directly in prices dict (instead of queuing via signal)
-            # This ensures prices are updated BEFORE we rebuild the ticker
-            self.price_updates_processed += 1
-            
-            # Update prices dict directly for all ticker windows
-            if hasattr(self.window, 'tray_icon') and self.window.tray_icon:
-                targets = self.window.tray_icon.ticker_windows if hasattr(self.window.tray_icon, 'ticker_windows') else [self.window]
-                display_changed = False
-                for ticker in targets:
-                    if hasattr(ticker, 'stocks') and symbol in ticker.stocks:
-                        old_price = ticker.prices.get(symbol, (None, None))[0]
-                        prev_close = ticker.prices.get(symbol, (None, None))[1]
-                        fallback_active = getattr(ticker, '_ws_prev_close_fallback_active', None)
-                        if fallback_active is None:
-                            fallback_active = set()
-                            ticker._ws_prev_close_fallback_active = fallback_active
-                        if prev_close is None and old_price is not None and old_price > 0:
-                            prev_close = old_price
-                            if symbol not in fallback_active:
-                                colored_print(f"[WEBSOCKET] 🟨 TEMP-BASELINE {symbol}: using last live price until prev_close backfills")
-                                fallback_active.add(symbol)
-                        elif prev_close is not None and symbol in fallback_active:
-                            fallback_active.discard(symbol)
-                        # Update price immediately
-                        ticker.prices[symbol] = (price, prev_close)
-                        ticker.bloom_cache_valid = False
-                        
-                        # Only flag display change if the formatted price string changed —
-                        # sub-penny trades produce no visible difference, skip the rebuild
-                        if old_price is None or f"{price:.2f}" != f"{old_price:.2f}":
-                            display_changed = True
-                        
-                        # Log significant price changes
-                        if self.verbose_update_logs and old_price and abs(price - old_price) > 0.01:
-                            change = price - old_price
-                            change_pct = (change / old_price) * 100
-                            colored_print(f"[WEBSOCKET] 💰 {symbol}: ${old_price:.2f} → ${price:.2f} ({change:+.2f}, {change_pct:+.2f}%)")
-            
-            self.last_update_time[symbol] = current_time
-            updates_sent += 1
-            # Only queue a pixmap rebuild if the displayed text actually changed
-            if display_changed and symbol not in updated_symbols:
-                updated_symbols.append(symbol)
-            # Remove from buffer after processing
-            del self.price_buffer[symbol]
-        
-        # Always log batch processing for debugging
-        if self.verbose_update_logs and (updates_sent > 0 or symbols_skipped > 0):
-            remaining = len(self.price_buffer)
-            colored_print(f"[WEBSOCKET] 📈 Batch complete: {updates_sent} sent, {symbols_skipped} skipped | {remaining} remain | Total: {self.price_updates_processed} updates")
-        
-        return updates_sent, updated_symbols
-
     def subscribe_symbols(self, symbols):
         """Subscribe to real-time data for given symbols"""
         colored_print(f"[WEBSOCKET] subscribe_symbols called with {len(symbols)} symbols: {symbols[:5]}{'...' if len(symbols) > 5 else ''}")
@@ -2175,8 +2323,9 @@ class FinnhubWebSocketClient:
 
         # If not connected yet, enqueue the requested symbols and ensure connection
         if not self.connected or not self.ws:
-            # Add to queued subscriptions and attempt to establish connection if needed
-            self.queued_subscriptions.update(finnhub_symbols)
+            # Replace the queued subscriptions (the latest request is the full desired set)
+            # and attempt to establish connection if needed
+            self.queued_subscriptions = set(finnhub_symbols)
             colored_print(f"[WEBSOCKET] ⚠️ Not connected - queued {len(self.queued_subscriptions)} symbols for subscribe (will flush on open)")
             if not self.ws:
                 # Attempt to connect in background if we don't have a ws object
@@ -2228,9 +2377,9 @@ class FinnhubWebSocketClient:
         """Disconnect from websocket"""
         # Signal the reconnect loop to stop before clearing self.ws
         self._stop_requested = True
-        # Clear buffers
-        self.price_buffer.clear()
-        self.last_update_time.clear()
+        # Clear buffers (a shared pool buffer is cleared by the pool)
+        if self._trade_lane is self.trade_buffer:
+            self.trade_buffer.clear()
         self.connecting = False
         
         if self.ws:
@@ -2245,6 +2394,7 @@ class FinnhubWebSocketClient:
             self.ws = None
         self.connected = False
         self.subscribed_symbols.clear()
+        self.queued_subscriptions.clear()
 
     def is_real_time_available(self):
         """Check if real-time websocket connection is active"""
@@ -2263,153 +2413,628 @@ class FinnhubWebSocketClient:
             thread_alive = self.connection_thread.is_alive()
 
         return {
-            'connected': self.connected,
-            'connecting': self.connecting,
+            'label': self.label,
+            'connected': self.connected,
+            'connecting': self.connecting,
+            'subscribed_symbols': len(self.subscribed_symbols),
+            'messages_received': self.messages_received,
+            'price_updates_processed': self.price_updates_processed,
+            'connection_duration': connection_duration,
+            'time_since_last_message': time_since_last_msg,
+            'reconnection_count': self.reconnection_count,
+            'reconnect_attempts': self.reconnect_attempts,
+            'total_connection_time': self.total_connection_time,
+            'last_error': self.last_error,
+            'time_since_last_error': time_since_last_error,
+            'thread_alive': thread_alive,
+            'using_proxy': bool(self.proxy_kwargs),
+            'proxy_type': self.proxy_kwargs.get('proxy_type') if self.proxy_kwargs else None,
+            'error_log_count': len(self.error_log),
+            'state_transitions': len(self.connection_state_log),
+            'ingest': self.trade_buffer.get_stats(),
+        }
+
+    def log_status_summary(self):
+        """Log a summary of current websocket status"""
+        status = self.get_debug_status()
+        if status['connected']:
+                lag = status['time_since_last_message']
+                thread_status = "🧵 alive" if status['thread_alive'] else "🧵 DEAD"
+                proxy_status = f" via {status['proxy_type']}" if status['using_proxy'] else " (direct)"
+                colored_print(f"[WEBSOCKET] 📊 Status: ✅ Connected{proxy_status} {thread_status}")
+                colored_print(f"[WEBSOCKET]    {status['subscribed_symbols']} symbols | {status['messages_received']} msgs | {status['price_updates_processed']} updates | {status['connection_duration']:.1f}s | lag {lag:.1f}s")
+        else:
+            thread_status = "🧵 alive" if status['thread_alive'] else "🧵 dead"
+            proxy_status = f" (was via {status['proxy_type']})" if status['using_proxy'] else ""
+            colored_print(f"[WEBSOCKET] 📊 Status: ❌ Disconnected {thread_status}{proxy_status}")
+            colored_print(f"[WEBSOCKET]    {status['messages_received']} total msgs | {status['price_updates_processed']} updates | {status['reconnection_count']} reconnects | attempt {status['reconnect_attempts']}/{self.max_reconnect_attempts}")
+            if status['last_error']:
+                colored_print(f"[WEBSOCKET]    Last error: {status['last_error']}")
+    
+    def _log_state(self, new_state, reason="", duration=0):
+        """Log a state transition with timestamp"""
+        import time
+        self.connection_state_log.append({
+            'timestamp': time.time(),
+            'state': new_state,
+            'reason': reason,
+            'duration': duration
+        })
+        # Keep log size bounded
+        if len(self.connection_state_log) > 50:
+            self.connection_state_log = self.connection_state_log[-50:]
+    
+    def _log_error(self, error_msg):
+        """Log an error with timestamp"""
+        import time
+        self.error_log.append({
+            'timestamp': time.time(),
+            'error': error_msg,
+            'thread': threading.current_thread().name
+        })
+        # Keep log size bounded
+        if len(self.error_log) > 50:
+            self.error_log = self.error_log[-50:]
+    
+    def _log_detailed_stats(self):
+        """Log detailed statistics for diagnostics"""
+        colored_print("[WEBSOCKET] 📋 === Detailed Diagnostics ===")
+        colored_print(f"[WEBSOCKET] State transitions: {len(self.connection_state_log)}")
+        if self.connection_state_log:
+            for i, entry in enumerate(self.connection_state_log[-5:]):
+                colored_print(f"[WEBSOCKET]   {i}: {entry['state']} - {entry['reason']} ({entry['duration']:.1f}s)")
+        colored_print(f"[WEBSOCKET] Errors recorded: {len(self.error_log)}")
+        if self.error_log:
+            for i, entry in enumerate(self.error_log[-5:]):
+                colored_print(f"[WEBSOCKET]   {i}: {entry['error']} (thread: {entry['thread']})")
+        colored_print(f"[WEBSOCKET] Connection attempts: {len(self.connection_attempts_details)}")
+        if self.connection_attempts_details:
+            for attempt in self.connection_attempts_details[-5:]:
+                status = "✅" if attempt['success'] else "❌"
+                colored_print(f"[WEBSOCKET]   {status} Attempt {attempt['attempt']}: {attempt['duration']:.1f}s")
+        colored_print("[WEBSOCKET] === End Diagnostics ===")
+
+
+class FinnhubWebSocketPool:
+    """
+    Shards Finnhub real-time subscriptions across several WebSocket connections.
+    One connection (shard) per API key, each carrying at most
+    "websocket_symbols_per_connection" symbols (the free tier streams 50 per key).
+    Shards open only when the symbol count needs them, trades from all of them land in
+    one shared TradeIngestBuffer, and symbols that fit on no healthy shard keep being
+    polled. Exposes the same interface the windows used on a single client.
+    """
+
+    POOL_BACKOFF_BASE = 60  # seconds before retrying a failed shard, doubled per failure
+    POOL_BACKOFF_MAX = 600
+
+    def __init__(self, api_keys, window_instance):
+        self.api_keys = [k for k in api_keys if k]
+        self.api_key = self.api_keys[0] if self.api_keys else None
+        self.window = window_instance
+
+        settings = get_settings()
+        self.symbols_per_connection = max(1, int(settings.get('websocket_symbols_per_connection', 50)))
+        self.verbose_update_logs = bool(settings.get('websocket_verbose_logs', False))
+        self.use_vwap = settings.get('websocket_price_source', 'last') == 'vwap'
+
+        self.trade_buffer = TradeIngestBuffer()
+        self.shards = []  # FinnhubWebSocketClient per API key, created on demand
+        self.desired_symbols = set()
+        self.assignment = {}  # symbol -> shard index
+        self.price_updates_processed = 0
+        self.last_update_time = {}  # {symbol: timestamp}
+        self._sent = {}  # shard index -> frozenset of symbols last handed to that shard
+        self._backoff = {}  # shard index -> {'failures', 'retry_at'} while the pool holds it back
+        self._health = None  # shard states at the last rebalance
+        self._lock = threading.RLock()
+
+    @property
+    def capacity(self):
+        return self.symbols_per_connection * len(self.api_keys)
+
+    @property
+    def connected(self):
+        return any(shard.connected for shard in self.shards)
+
+    @property
+    def subscribed_symbols(self):
+        """Symbols currently streaming on a connected shard"""
+        symbols = set()
+        for shard in self.shards:
+            if shard.connected:
+                symbols.update(shard.subscribed_symbols)
+        return symbols
+
+    def _shard(self, index):
+        while len(self.shards) <= index:
+            key_index = len(self.shards)
+            self.shards.append(FinnhubWebSocketClient(
+                self.api_keys[key_index], self.window, trade_buffer=self.trade_buffer,
+                label=f"Shard {key_index + 1} {mask_api_key(self.api_keys[key_index])}"))
+        return self.shards[index]
+
+    @staticmethod
+    def _shard_state(shard):
+        if shard.connected:
+            return 'up'
+        if shard.connecting:
+            return 'connecting'
+        if shard._stop_requested or shard.connection_thread is None:
+            return 'idle'
+        # Thread still sleeping between its own retries, or gave up
+        return 'retrying' if shard.connection_thread.is_alive() else 'down'
+
+    def _shard_states(self, now):
+        """State of every key's shard. A shard between its own reconnect attempts keeps its
+        symbols (they are polled meanwhile); one that gave up is stopped and held back by
+        the pool (exponential backoff) while its symbols move to healthy shards."""
+        states = []
+        for index in range(len(self.api_keys)):
+            if index >= len(self.shards):
+                states.append('idle')
+                continue
+            shard = self.shards[index]
+            state = self._shard_state(shard)
+            if state == 'up':
+                self._backoff.pop(index, None)
+            elif state == 'down':
+                failures = self._backoff.get(index, {}).get('failures', 0) + 1
+                delay = min(self.POOL_BACKOFF_MAX, self.POOL_BACKOFF_BASE * 2 ** (failures - 1))
+                self._backoff[index] = {'failures': failures, 'retry_at': now + delay}
+                colored_print(f"[WEBSOCKET] ⚠️ {shard.label} gave up reconnecting ({shard.last_error or 'closed'}) "
+                              f"- moving its symbols, retry in {delay}s")
+                shard.disconnect()
+                self._sent.pop(index, None)
+                state = 'idle'
+            if state == 'idle' and now < self._backoff.get(index, {}).get('retry_at', 0):
+                state = 'backoff'
+            states.append(state)
+        return states
+
+    def rebalance(self, force=False):
+        """Re-shard the desired symbols over the healthy shards. Cheap when no shard changed
+        state, so it runs on every visual refresh; a shard that reconnects rejoins here."""
+        with self._lock:
+            if not self.desired_symbols and not force:
+                return
+            states = self._shard_states(time.time())
+            if not force and tuple(states) == self._health:
+                return
+            self._health = tuple(states)
+
+            per_connection = self.symbols_per_connection
+            needed = -(-len(self.desired_symbols) // per_connection)
+            # Fill shards that are already streaming first, then ones that are opening or
+            # reconnecting on their own (keeps their subscriptions queued), then fresh ones
+            rank = {'up': 0, 'connecting': 1, 'retrying': 2, 'idle': 3}
+            targets = sorted((i for i, state in enumerate(states) if state in rank),
+                             key=lambda i: (rank[states[i]], i))[:needed]
+            load = dict.fromkeys(targets, 0)
+            assignment = {}
+            ordered = sorted(self.desired_symbols)
+            # Keep symbols where they are so a rebalance sends as few (un)subscribes as possible
+            for symbol in ordered:
+                index = self.assignment.get(symbol)
+                if index in load and load[index] < per_connection:
+                    assignment[symbol] = index
+                    load[index] += 1
+            for symbol in ordered:
+                if symbol in assignment:
+                    continue
+                free = [i for i in targets if load[i] < per_connection]
+                if not free:
+                    break  # Over capacity - the rest stay on polling
+                index = min(free, key=lambda i: (load[i], i))
+                assignment[symbol] = index
+                load[index] += 1
+            self.assignment = assignment
+
+            by_shard = {}
+            for symbol, index in assignment.items():
+                by_shard.setdefault(index, set()).add(symbol)
+            for index in range(len(self.api_keys)):
+                symbols = frozenset(by_shard.get(index, ()))
+                if symbols:
+                    if self._sent.get(index) != symbols:
+                        # subscribe_symbols diffs against what the shard already streams
+                        self._shard(index).subscribe_symbols(sorted(symbols))
+                        self._sent[index] = symbols
+                elif index < len(self.shards) and self._sent.pop(index, None):
+                    colored_print(f"[WEBSOCKET] 🔌 {self.shards[index].label} no longer needed - closing")
+                    self.shards[index].disconnect()
+
+            uncovered = len(self.desired_symbols) - len(assignment)
+            colored_print(f"[WEBSOCKET] 🧩 Sharded {len(assignment)} symbols over {len(by_shard)} connection(s) "
+                          f"[{', '.join(states)}]" + (f" | {uncovered} left on polling" if uncovered else ""))
+
+    def connect(self):
+        """Open the first shard (more open as the subscribed symbol count needs them)"""
+        if not self.api_keys:
+            colored_print("[WEBSOCKET] No API key available - skipping real-time connection")
+            return False
+        with self._lock:
+            if self.desired_symbols:
+                self.rebalance(force=True)
+                return any(shard.connected or shard.connecting for shard in self.shards)
+            return self._shard(0).connect()
+
+    def subscribe_symbols(self, symbols):
+        """Stream exactly `symbols` (the full watchlist), spread over as many shards as needed"""
+        finnhub_symbols = {s for s in symbols if not is_yahoo_symbol(s)}
+        with self._lock:
+            self.desired_symbols = finnhub_symbols
+            self.rebalance(force=True)
+
+    def add_symbols(self, symbols):
+        """Add newly added watchlist symbols while streaming"""
+        finnhub_symbols = {s for s in symbols if not is_yahoo_symbol(s)}
+        with self._lock:
+            if not self.desired_symbols or finnhub_symbols <= self.desired_symbols:
+                return
+            self.desired_symbols |= finnhub_symbols
+            self.rebalance(force=True)
+
+    def uncovered_symbols(self, symbols=None):
+        """Finnhub symbols of `symbols` (default: the desired set) not streaming on any shard"""
+        streaming = self.subscribed_symbols
+        if symbols is None:
+            symbols = self.desired_symbols
+        return [s for s in symbols if not is_yahoo_symbol(s) and s not in streaming]
+
+    def disconnect(self):
+        """Close every shard and forget the subscriptions"""
+        with self._lock:
+            for shard in self.shards:
+                shard.disconnect()
+            self.desired_symbols = set()
+            self.assignment = {}
+            self._sent.clear()
+            self._backoff.clear()
+            self._health = None
+            self.trade_buffer.clear()
+            self.trade_buffer.aggregator.reset()  # Session totals start over with the next stream
+            self.last_update_time.clear()
+
+    def is_real_time_available(self):
+        """Check if any shard is streaming"""
+        return any(shard.is_real_time_available() for shard in self.shards)
+
+    def process_buffered_updates(self, max_symbols=None):
+        """Process buffered price updates - called from main thread timer
+        
+        Args:
+            max_symbols: Maximum number of symbols to process (None = all)
+        """
+        # Take the ENTIRE buffer in one O(1) swap — the socket thread keeps appending to a
+        # fresh buffer meanwhile. Only queue a pixmap rebuild when the formatted display
+        # string (e.g. "125.13") actually changes, which avoids work for sub-penny
+        # trades that produce no visible difference.
+        bars = self.trade_buffer.drain()
+        if not bars:
+            return 0, []
+        
+        if self.verbose_update_logs:
+            colored_print(f"[WEBSOCKET] 🔄 Processing {len(bars)} buffered symbols (full drain)...")
+        
+        import time
+        current_time = time.time()
+        updates_sent = 0
+        symbols_skipped = 0
+        updated_symbols = []
+        history_store = get_history_store()
+        snapshot_quotes = {}
+        
+        # Process each symbol — no per-symbol time gate needed; the visual refresh
+        # timer itself controls how often we drain the buffer.
+        for symbol, bar in bars.items():
+            # Each bar aggregates every trade of the symbol since the last drain
+            price = bar.vwap if self.use_vwap else bar.last
+            # Update price directly in prices dict (instead of queuing via signal)
+            # This ensures prices are updated BEFORE we rebuild the ticker
+            self.price_updates_processed += 1
+            shard_index = self.assignment.get(symbol)
+            if shard_index is not None and shard_index < len(self.shards):
+                self.shards[shard_index].price_updates_processed += 1
+            history_store.append(symbol, bar.last, bar.timestamp or current_time,
+                                 high=bar.high, low=bar.low, volume=bar.volume)
+            
+            # Update prices dict directly for all ticker windows
+            if hasattr(self.window, 'tray_icon') and self.window.tray_icon:
+                targets = self.window.tray_icon.ticker_windows if hasattr(self.window.tray_icon, 'ticker_windows') else [self.window]
+                display_changed = False
+                for ticker in targets:
+                    if hasattr(ticker, 'stocks') and symbol in ticker.stocks:
+                        old_price = ticker.prices.get(symbol, (None, None))[0]
+                        prev_close = ticker.prices.get(symbol, (None, None))[1]
+                        fallback_active = getattr(ticker, '_ws_prev_close_fallback_active', None)
+                        if fallback_active is None:
+                            fallback_active = set()
+                            ticker._ws_prev_close_fallback_active = fallback_active
+                        if prev_close is None and old_price is not None and old_price > 0:
+                            prev_close = old_price
+                            if symbol not in fallback_active:
+                                colored_print(f"[WEBSOCKET] 🟨 TEMP-BASELINE {symbol}: using last live price until prev_close backfills")
+                                fallback_active.add(symbol)
+                        elif prev_close is not None and symbol in fallback_active:
+                            fallback_active.discard(symbol)
+                        # Update price immediately
+                        ticker.prices[symbol] = (price, prev_close)
+                        ticker.bloom_cache_valid = False
+                        snapshot_quotes[symbol] = (price, prev_close)
+                        
+                        # Only flag display change if the formatted price string changed —
+                        # sub-penny trades produce no visible difference, skip the rebuild
+                        if old_price is None or f"{price:.2f}" != f"{old_price:.2f}":
+                            display_changed = True
+                        # A quote shown from the startup snapshot is live now (un-fade it)
+                        snapshot_symbols = getattr(ticker, '_snapshot_symbols', None)
+                        if snapshot_symbols and symbol in snapshot_symbols:
+                            snapshot_symbols.discard(symbol)
+                            display_changed = True
+                        
+                        # Log significant price changes
+                        if self.verbose_update_logs and old_price and abs(price - old_price) > 0.01:
+                            change = price - old_price
+                            change_pct = (change / old_price) * 100
+                            colored_print(f"[WEBSOCKET] 💰 {symbol}: ${old_price:.2f} → ${price:.2f} ({change:+.2f}, {change_pct:+.2f}%)")
+            
+            self.last_update_time[symbol] = current_time
+            updates_sent += 1
+            # Only queue a pixmap rebuild if the displayed text actually changed
+            if display_changed and symbol not in updated_symbols:
+                updated_symbols.append(symbol)
+        
+        if snapshot_quotes:
+            get_quote_snapshot().update(snapshot_quotes, source="websocket", timestamp=current_time)
+
+        # Always log batch processing for debugging
+        if self.verbose_update_logs and (updates_sent > 0 or symbols_skipped > 0):
+            remaining = len(self.trade_buffer)
+            colored_print(f"[WEBSOCKET] 📈 Batch complete: {updates_sent} sent, {symbols_skipped} skipped | {remaining} remain | Total: {self.price_updates_processed} updates")
+        
+        return updates_sent, updated_symbols
+
+    def get_debug_status(self):
+        """Aggregated status of all shards, plus one entry per shard"""
+        import time
+        current_time = time.time()
+        with self._lock:
+            states = self._health or ()
+            shard_statuses = []
+            for index, shard in enumerate(self.shards):
+                shard_status = shard.get_debug_status()
+                backoff = self._backoff.get(index)
+                shard_status['state'] = states[index] if index < len(states) else self._shard_state(shard)
+                shard_status['pool_failures'] = backoff['failures'] if backoff else 0
+                shard_status['retry_in'] = max(0.0, backoff['retry_at'] - current_time) if backoff else None
+                shard_status['assigned_symbols'] = len(self._sent.get(index, ()))
+                shard_statuses.append(shard_status)
+            desired = len(self.desired_symbols)
+
+        connected = [s for s in shard_statuses if s['connected']]
+        with_messages = [s for s in shard_statuses if s['messages_received']]
+        errors = [s for s in shard_statuses if s['time_since_last_error'] is not None]
+        last_error = min(errors, key=lambda s: s['time_since_last_error']) if errors else None
+        proxy_type = next((s['proxy_type'] for s in shard_statuses if s['using_proxy']), None)
+        return {
+            'connected': bool(connected),
+            'connecting': any(s['connecting'] for s in shard_statuses),
             'subscribed_symbols': len(self.subscribed_symbols),
-            'messages_received': self.messages_received,
+            'desired_symbols': desired,
+            'uncovered_symbols': len(self.uncovered_symbols()),
+            'capacity': self.capacity,
+            'symbols_per_connection': self.symbols_per_connection,
+            'messages_received': sum(s['messages_received'] for s in shard_statuses),
             'price_updates_processed': self.price_updates_processed,
-            'connection_duration': connection_duration,
-            'time_since_last_message': time_since_last_msg,
-            'reconnection_count': self.reconnection_count,
-            'reconnect_attempts': self.reconnect_attempts,
-            'total_connection_time': self.total_connection_time,
-            'last_error': self.last_error,
-            'time_since_last_error': time_since_last_error,
-            'thread_alive': thread_alive,
-            'using_proxy': bool(self.proxy_kwargs),
-            'proxy_type': self.proxy_kwargs.get('proxy_type') if self.proxy_kwargs else None,
-            'error_log_count': len(self.error_log),
-            'state_transitions': len(self.connection_state_log)
+            'connection_duration': max((s['connection_duration'] for s in connected), default=0),
+            'time_since_last_message': min((s['time_since_last_message'] for s in with_messages), default=0),
+            'reconnection_count': sum(s['reconnection_count'] for s in shard_statuses),
+            'reconnect_attempts': max((s['reconnect_attempts'] for s in shard_statuses), default=0),
+            'total_connection_time': sum(s['total_connection_time'] for s in shard_statuses),
+            'last_error': last_error['last_error'] if last_error else None,
+            'time_since_last_error': last_error['time_since_last_error'] if last_error else None,
+            'thread_alive': any(s['thread_alive'] for s in shard_statuses),
+            'using_proxy': proxy_type is not None,
+            'proxy_type': proxy_type,
+            'error_log_count': sum(s['error_log_count'] for s in shard_statuses),
+            'state_transitions': sum(s['state_transitions'] for s in shard_statuses),
+            'ingest': self.trade_buffer.get_stats(),
+            'sessions': self.trade_buffer.aggregator.top_sessions(),
+            'shards': shard_statuses,
         }
 
     def log_status_summary(self):
-        """Log a summary of current websocket status"""
+        """Log a summary of the pool and of each shard"""
         status = self.get_debug_status()
-        if status['connected']:
-                lag = status['time_since_last_message']
-                thread_status = "🧵 alive" if status['thread_alive'] else "🧵 DEAD"
-                proxy_status = f" via {status['proxy_type']}" if status['using_proxy'] else " (direct)"
-                colored_print(f"[WEBSOCKET] 📊 Status: ✅ Connected{proxy_status} {thread_status}")
-                colored_print(f"[WEBSOCKET]    {status['subscribed_symbols']} symbols | {status['messages_received']} msgs | {status['price_updates_processed']} updates | {status['connection_duration']:.1f}s | lag {lag:.1f}s")
-        else:
-            thread_status = "🧵 alive" if status['thread_alive'] else "🧵 dead"
-            proxy_status = f" (was via {status['proxy_type']})" if status['using_proxy'] else ""
-            colored_print(f"[WEBSOCKET] 📊 Status: ❌ Disconnected {thread_status}{proxy_status}")
-            colored_print(f"[WEBSOCKET]    {status['messages_received']} total msgs | {status['price_updates_processed']} updates | {status['reconnection_count']} reconnects | attempt {status['reconnect_attempts']}/{self.max_reconnect_attempts}")
-            if status['last_error']:
-                colored_print(f"[WEBSOCKET]    Last error: {status['last_error']}")
-    
-    def _log_state(self, new_state, reason="", duration=0):
-        """Log a state transition with timestamp"""
-        import time
-        self.connection_state_log.append({
-            'timestamp': time.time(),
-            'state': new_state,
-            'reason': reason,
-            'duration': duration
-        })
-        # Keep log size bounded
-        if len(self.connection_state_log) > 50:
-            self.connection_state_log = self.connection_state_log[-50:]
-    
-    def _log_error(self, error_msg):
-        """Log an error with timestamp"""
-        import time
-        self.error_log.append({
-            'timestamp': time.time(),
-            'error': error_msg,
-            'thread': threading.current_thread().name
-        })
-        # Keep log size bounded
-        if len(self.error_log) > 50:
-            self.error_log = self.error_log[-50:]
-    
-    def _log_detailed_stats(self):
-        """Log detailed statistics for diagnostics"""
-        colored_print("[WEBSOCKET] 📋 === Detailed Diagnostics ===")
-        colored_print(f"[WEBSOCKET] State transitions: {len(self.connection_state_log)}")
-        if self.connection_state_log:
-            for i, entry in enumerate(self.connection_state_log[-5:]):
-                colored_print(f"[WEBSOCKET]   {i}: {entry['state']} - {entry['reason']} ({entry['duration']:.1f}s)")
-        colored_print(f"[WEBSOCKET] Errors recorded: {len(self.error_log)}")
-        if self.error_log:
-            for i, entry in enumerate(self.error_log[-5:]):
-                colored_print(f"[WEBSOCKET]   {i}: {entry['error']} (thread: {entry['thread']})")
-        colored_print(f"[WEBSOCKET] Connection attempts: {len(self.connection_attempts_details)}")
-        if self.connection_attempts_details:
-            for attempt in self.connection_attempts_details[-5:]:
-                status = "✅" if attempt['success'] else "❌"
-                colored_print(f"[WEBSOCKET]   {status} Attempt {attempt['attempt']}: {attempt['duration']:.1f}s")
-        colored_print("[WEBSOCKET] === End Diagnostics ===")
+        state = "✅ Connected" if status['connected'] else "❌ Disconnected"
+        colored_print(f"[WEBSOCKET] 📊 Status: {state} | {status['subscribed_symbols']}/{status['desired_symbols']} symbols streaming "
+                      f"(capacity {status['capacity']}) | {status['messages_received']} msgs | {status['price_updates_processed']} updates")
+        for shard in status['shards']:
+            line = (f"[WEBSOCKET]    {shard['label']}: {shard['state']} | {shard['subscribed_symbols']} symbols | "
+                    f"{shard['messages_received']} msgs | {shard['reconnection_count']} reconnects")
+            if shard['retry_in'] is not None and shard['state'] == 'backoff':
+                line += f" | retry in {shard['retry_in']:.0f}s"
+            if shard['last_error']:
+                line += f" | last error: {shard['last_error']}"
+            colored_print(line)
+
+
+_ICON_CACHE = None
+_ICON_CACHE_LOCK = threading.Lock()
+
+def get_icon_cache():
+    """Get or create the shared icon cache (memory LRU + processed icons under TCKR.images)"""
+    global _ICON_CACHE
+    with _ICON_CACHE_LOCK:
+        if _ICON_CACHE is None:
+            _ICON_CACHE = IconCache(os.path.join(APPDATA_DIR, "TCKR.images"))
+        return _ICON_CACHE
+
+
+# Frame profiler shared by every ticker window (only recording while enabled)
+_FRAME_PROFILER = FrameProfiler()
+
+def get_frame_profiler():
+    return _FRAME_PROFILER
+
+def export_frame_profile():
+    """Write the recorded frames as Chrome trace + JSON lines; returns the paths written"""
+    profiler = get_frame_profiler()
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    paths = []
+    for suffix, export in ((".trace.json", profiler.export_chrome_trace), (".jsonl", profiler.export_jsonl)):
+        path = os.path.join(FRAME_PROFILE_DIR, f"tckr_frames-{stamp}{suffix}")
+        try:
+            export(path)
+            paths.append(path)
+        except OSError as e:
+            colored_print(f"[PROFILER] Could not write {path}: {e}")
+    return paths
 
 
-def get_ticker_icon(ticker, size=32):
-    # PERF ENHANCEMENT 4: Icon cache with LRU eviction
-    cache_key = f"{ticker.upper()}_{size}"
-    
-    # Check if we have a global window instance for cache access
-    if hasattr(get_ticker_icon, '_window_instance') and get_ticker_icon._window_instance:
-        window = get_ticker_icon._window_instance
-        if cache_key in window.icon_cache:
-            window.icon_cache_hits += 1
-            # Move to end of dict for LRU tracking
-            cached_pixmap = window.icon_cache[cache_key]
-            del window.icon_cache[cache_key]
-            window.icon_cache[cache_key] = cached_pixmap
-            return cached_pixmap
-        else:
-            window.icon_cache_misses += 1
-    
-    images_dir = os.path.join(APPDATA_DIR, "TCKR.images")
-    os.makedirs(images_dir, exist_ok=True)
-    ticker_candidates = get_icon_lookup_candidates(ticker)
-    pixmap = None
-    for candidate in ticker_candidates:
-        local_path = os.path.join(images_dir, f"{candidate}.png")
-        if os.path.exists(local_path):
-            try:
-                pixmap = QtGui.QPixmap(local_path)
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    break
-            except Exception:
-                pass
+def _read_icon_file(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
 
-    if pixmap is None or pixmap.isNull():
-        for candidate in ticker_candidates:
-            local_path = os.path.join(images_dir, f"{candidate}.png")
-            url = f"https://raw.githubusercontent.com/krypdoh/stock-icons/refs/heads/main/ticker_icons/{candidate}.png"
-            try:
-                resp = get_requests_session().get(url, timeout=5)
-                if resp.status_code == 200:
-                    with open(local_path, "wb") as f:
-                        f.write(resp.content)
-                    pixmap = QtGui.QPixmap()
-                    pixmap.loadFromData(resp.content)
-                    pixmap = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    break
-            except Exception:
-                pass
 
+# Icon candidate URLs are probed in parallel; a few threads are plenty for raw.githubusercontent
+_ICON_PROBE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=6, thread_name_prefix="IconProbe")
+
+
+def get_icon_source_urls(ticker):
+    """(candidate, url) pairs in lookup priority order"""
+    base_url = service_url("icon_base_url")
+    sources = [(candidate, f"{base_url}/refs/heads/main/ticker_icons/{candidate}.png")
+               for candidate in get_icon_lookup_candidates(ticker)]
     # Crypto fallback source: stock-icons/crypto_icons (e.g. ETH.png)
-    if pixmap is None or pixmap.isNull():
-        for candidate in get_crypto_icon_candidates(ticker):
+    sources += [(candidate, f"{base_url}/main/crypto_icons/{candidate}.png")
+                for candidate in get_crypto_icon_candidates(ticker)]
+    return sources
+
+
+def _probe_icon_url(url, headers):
+    """GET one candidate. Returns (status_code, content, response_headers); status None on network error."""
+    try:
+        resp = get_requests_session().get(url, headers=headers, timeout=5)
+        return resp.status_code, resp.content, resp.headers
+    except Exception:
+        return None, None, {}
+
+
+def load_ticker_icon_source(ticker, cache):
+    """Raw icon bytes for `ticker`: indexed file, then local candidates, then GitHub.
+    Records the resolved file in the cache index. Returns None if no icon exists."""
+    symbol = ticker.upper()
+    indexed_path = cache.source_path(symbol)
+    if indexed_path:
+        data = _read_icon_file(indexed_path)
+        if data:
+            cache.refresh_source(symbol, data)  # Edited on disk since it was indexed - new digest
+            return data
+        cache.forget_source(symbol)  # File was removed - resolve again
+
+    images_dir = cache.images_dir
+    os.makedirs(images_dir, exist_ok=True)
+    for candidate in get_icon_lookup_candidates(ticker):
+        data = _read_icon_file(os.path.join(images_dir, f"{candidate}.png"))
+        if data:
+            cache.record_source(symbol, f"{candidate}.png", data)
+            return data
+
+    if cache.is_known_missing(symbol):
+        return None  # No icon upstream as of the last check - don't probe again yet
+
+    # Probe every remaining candidate at once; the highest-priority hit wins
+    sources = get_icon_source_urls(ticker)
+    futures = [_ICON_PROBE_EXECUTOR.submit(_probe_icon_url, url, cache.validators(url)) for _, url in sources]
+    definitive_miss = True
+    try:
+        for (candidate, url), future in zip(sources, futures):
+            status_code, content, headers = future.result()
             local_path = os.path.join(images_dir, f"{candidate}.png")
-            url = f"https://raw.githubusercontent.com/krypdoh/stock-icons/main/crypto_icons/{candidate}.png"
-            try:
-                resp = get_requests_session().get(url, timeout=5)
-                if resp.status_code == 200:
-                    with open(local_path, "wb") as f:
-                        f.write(resp.content)
-                    pixmap = QtGui.QPixmap()
-                    pixmap.loadFromData(resp.content)
-                    pixmap = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    break
-            except Exception:
-                pass
+            if status_code == 200 and content:
+                with open(local_path, "wb") as f:
+                    f.write(content)
+                cache.record_source(symbol, f"{candidate}.png", content, url=url, headers=headers)
+                return content
+            if status_code == 304:
+                data = _read_icon_file(local_path)
+                if data:
+                    cache.record_source(symbol, f"{candidate}.png", data, url=url, headers=headers)
+                    return data
+            if status_code not in (403, 404, 410):
+                definitive_miss = False  # Network error or server trouble - not a real miss
+    finally:
+        for future in futures:
+            future.cancel()
+
+    if definitive_miss:
+        cache.record_missing(symbol)
+        colored_print(f"[ICON] No icon for {symbol} - not checking again for {cache.miss_ttl / 86400:.0f} days")
+    return None
+
+
+def revalidate_ticker_icon(ticker, cache):
+    """Conditional re-download of a cached icon (If-None-Match / If-Modified-Since).
+    A 304 costs no body; a changed icon replaces the file and its processed variants."""
+    symbol = ticker.upper()
+    path = cache.source_path(symbol)
+    entry_url = cache.source_url(symbol)
+    if not path or not entry_url:
+        return
+    status_code, content, headers = _probe_icon_url(entry_url, cache.validators(entry_url))
+    if status_code == 304:
+        cache.mark_checked(symbol)
+    elif status_code == 200 and content:
+        with open(path, "wb") as f:
+            f.write(content)
+        cache.record_source(symbol, os.path.basename(path), content, url=entry_url, headers=headers)
+        cache.evict_symbol(symbol)  # New digest -> next lookup reprocesses at each size
+    cache.save_index()
+
+
+def get_ticker_icon(ticker, size=32):
+    # PERF ENHANCEMENT 4: Two-tier icon cache - memory LRU, then processed PNGs on disk.
+    # Only a miss in both tiers decodes the source image and runs the effect pipeline.
+    window = getattr(get_ticker_icon, '_window_instance', None)
+    settings = getattr(window, '_cached_settings', None) or get_settings_store().snapshot()
+    led_matrix = bool(settings.get("led_icon_matrix", True))
+    symbol = ticker.upper()
+    cache_key = (symbol, size, led_matrix)
+    cache = get_icon_cache()
+
+    cached_pixmap = cache.get_memory(cache_key)
+    if cached_pixmap is not None:
+        return cached_pixmap
+
+    if cache.needs_revalidation(symbol):
+        cache.mark_checked(symbol)  # Claim it so only one revalidation is queued
+        _ICON_PROBE_EXECUTOR.submit(revalidate_ticker_icon, ticker, cache)
+
+    processed_path = cache.processed_path(symbol, size, led_matrix)
+    if processed_path:
+        cached_pixmap = QtGui.QPixmap(processed_path)
+        if not cached_pixmap.isNull():
+            cache.put_memory(cache_key, cached_pixmap)
+            return cached_pixmap
+        cache.forget_processed(processed_path)
+
+    cache.record_miss()
+    data = load_ticker_icon_source(ticker, cache)
+    pixmap = None
+    if data:
+        pixmap = QtGui.QPixmap()
+        pixmap.loadFromData(data)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(size, size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
     if pixmap is None or pixmap.isNull():
         pixmap = QtGui.QPixmap(size, size)
         pixmap.fill(QtCore.Qt.transparent)
+        data = None
 
     # Subtle pixelation effect (reduced for better clarity) - optimized calculation
     if USE_OPT:
@@ -2428,7 +3053,7 @@ def get_ticker_icon(ticker, size=32):
     painter.drawPixmap(0, 0, pixmap)
     
     # LED Matrix Overlay (if enabled in settings) - horizontal lines only
-    if get_settings().get("led_icon_matrix", True):
+    if led_matrix:
         led_grid_color = QtGui.QColor(0, 0, 0, 30)  # Lighter for better visibility
         
         if USE_OPT:
@@ -2445,13 +3070,18 @@ def get_ticker_icon(ticker, size=32):
                 painter.fillRect(0, y, pixmap.width(), 1, led_grid_color)
     
     painter.end()
-    
-    # PERF ENHANCEMENT 4: Store in cache with LRU management
-    if hasattr(get_ticker_icon, '_window_instance') and get_ticker_icon._window_instance:
-        window = get_ticker_icon._window_instance
-        window.icon_cache[cache_key] = scanline_pixmap
-        window.manage_icon_cache_lru()
-    
+
+    # Keep the processed result on disk so a height change or restart skips all of the above
+    if data:
+        target = cache.processed_target(symbol, size, led_matrix)
+        try:
+            if target and scanline_pixmap.save(target, "PNG"):
+                cache.record_processed(target)
+                cache.save_index()
+        except Exception as e:
+            log_debug("PERF", "Could not store processed icon for %s: %s", ticker, e)
+
+    cache.put_memory(cache_key, scanline_pixmap)
     return scanline_pixmap
 
 SETTINGS_DIALOG_STYLE = """
@@ -3006,6 +3636,18 @@ class SettingsDialog(QtWidgets.QDialog):
         self.led_ghost_intensity_spin.setFixedHeight(input_height)
         ghost_row.addWidget(self.led_ghost_intensity_spin)
         ghost_row.addWidget(make_unit_label("%"))
+
+        ghost_row.addSpacing(pair_gap)
+        self.led_ghost_engine_combo = QtWidgets.QComboBox()
+        self.led_ghost_engine_combo.addItem("Layers", "layers")
+        self.led_ghost_engine_combo.addItem("Trail Buffer", "accumulation")
+        index = self.led_ghost_engine_combo.findData(self.settings.get("led_ghost_engine", "layers"))
+        if index >= 0:
+            self.led_ghost_engine_combo.setCurrentIndex(index)
+        self.led_ghost_engine_combo.setToolTip("Layers: offset ghost copies (classic look)\n"
+                                               "Trail Buffer: fading history of previous frames, cost independent of watchlist size")
+        self.led_ghost_engine_combo.setFixedHeight(input_height)
+        ghost_row.addWidget(self.led_ghost_engine_combo)
         ghost_row.addStretch()
         ghosting_row = make_effect_field("Ghosting:", ghost_content)
 
@@ -3260,7 +3902,7 @@ class SettingsDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "API Key Test", f"{key_label} API key is empty.")
             return
 
-        url = "https://finnhub.io/api/v1/quote"
+        url = f"{service_url('finnhub_base_url')}/quote"
         params = {"symbol": "AAPL", "token": api_key}
         headers = {"User-Agent": "TCKR/1.0"}
 
@@ -3393,6 +4035,7 @@ class SettingsDialog(QtWidgets.QDialog):
         s["led_ghosting_effect"] = self.led_ghosting_checkbox.isChecked()
         # Store single ghost intensity (controls both color strength & alpha)
         s["led_ghost_intensity"] = self.led_ghost_intensity_spin.value()
+        s["led_ghost_engine"] = self.led_ghost_engine_combo.currentData()
         s["led_icon_matrix"] = self.led_icon_matrix_checkbox.isChecked()
         s["led_glass_glare"] = self.led_glass_glare_checkbox.isChecked()
         s["global_text_glow"] = self.global_text_glow_checkbox.isChecked()
@@ -3438,6 +4081,7 @@ class SettingsDialog(QtWidgets.QDialog):
             self.original_settings.get("led_bloom_intensity") != s["led_bloom_intensity"] or
             self.original_settings.get("led_ghosting_effect") != s["led_ghosting_effect"] or
             self.original_settings.get("led_ghost_intensity") != s.get("led_ghost_intensity") or
+            self.original_settings.get("led_ghost_engine") != s.get("led_ghost_engine") or
             self.original_settings.get("led_icon_matrix") != s["led_icon_matrix"] or
             self.original_settings.get("led_glass_glare") != s["led_glass_glare"] or
             self.original_settings.get("global_text_glow") != s["global_text_glow"] or
@@ -3475,31 +4119,20 @@ class SettingsDialog(QtWidgets.QDialog):
                         pass  # Sound setting doesn't need immediate action
                     
                     # Check if any visual effects changed
+                    # (save_settings already refreshed the widget's cached settings)
                     if visual_or_style_changed:
-                        # Instantly apply visual effect changes by updating cached settings and triggering repaint
-                        new_cached = {
-                            'bloom': s.get("led_bloom_effect", True),
-                            'ghosting': s.get("led_ghosting_effect", True),
-                            'glass': s.get("led_glass_glare", True)
-                        }
-                        widget._cached_effect_settings = new_cached
-
-                        # Reset settings cache time so any other cached helpers will reload
-                        widget._settings_cache_time = 0
-                        widget._cached_settings = s.copy()
-
                         # Rebuild ticker text if global_text_glow changed (affects text rendering)
                         if self.original_settings.get("global_text_glow") != s["global_text_glow"]:
                             widget.build_ticker_text(reset_scroll=False)
 
                         # Rebuild ticker pixmaps if price indicator style changed
                         if self.original_settings.get("price_indicator_style") != s["price_indicator_style"]:
-                            widget.build_ticker_pixmaps()
+                            widget.rebuild_ticker_pixmaps()
 
                     # Rebuild pixmaps if ghost intensity or ghosting toggled (cached ghost pixmaps must be regenerated)
                     if (self.original_settings.get("led_ghost_intensity") != s.get("led_ghost_intensity") or
                         self.original_settings.get("led_ghosting_effect") != s.get("led_ghosting_effect")):
-                        widget.build_ticker_pixmaps()
+                        widget.rebuild_ticker_pixmaps()
 
                     # Apply sparkline settings immediately (no restart required)
                     if (self.original_settings.get("show_sparklines", False) != s.get("show_sparklines", False) or
@@ -3510,9 +4143,8 @@ class SettingsDialog(QtWidgets.QDialog):
                         widget.sparkline_position = s.get("sparkline_position", "left")
                         if hasattr(widget, 'sparkline_cache'):
                             widget.sparkline_cache.clear()
-                        if hasattr(widget, 'sparkline_inflight'):
-                            widget.sparkline_inflight.clear()
-                        widget.build_ticker_pixmaps()
+                        get_history_scheduler().clear()  # Drop queued fetches for the old period
+                        widget.rebuild_ticker_pixmaps()
 
                     # Force immediate repaint to show new visual effects
                     widget.gl_widget.update()
@@ -3537,6 +4169,7 @@ class SettingsDialog(QtWidgets.QDialog):
 
 class PriceFetchWorker(QtCore.QThread):
     prices_fetched = QtCore.pyqtSignal(dict)
+    prices_partial = QtCore.pyqtSignal(dict)  # Streamed chunks while the fetch is running
     def __init__(self, tickers, api_key, api_key_2=None):
         super().__init__()
         self.tickers = tickers
@@ -3544,33 +4177,32 @@ class PriceFetchWorker(QtCore.QThread):
         self.api_key_2 = api_key_2
     def run(self):
         print(f"[WORKER] PriceFetchWorker thread started")
-        prices = fetch_all_stock_prices(self.tickers, self.api_key, self.api_key_2)
+        prices = fetch_all_stock_prices(self.tickers, self.api_key, self.api_key_2,
+                                        on_partial=self.prices_partial.emit)
         print(f"[WORKER] PriceFetchWorker emitting prices signal")
         self.prices_fetched.emit(prices)
 
 class PixmapRebuildWorker(QtCore.QThread):
-    """Background worker to rebuild ticker pixmaps without blocking the main render loop"""
-    pixmaps_ready = QtCore.pyqtSignal(list, list, list)  # pixmaps, widths, area_templates
-    
-    def __init__(self, ticker_window):
+    """Background worker to rebuild ticker pixmaps without blocking the main render loop.
+    Tile specs and layout are captured on the GUI thread; the rendered tiles come back
+    as QImages and the window converts and swaps them in (QPixmaps are GUI-thread only)."""
+    tiles_ready = QtCore.pyqtSignal(int, list)  # generation, RenderedTiles ([] on error)
+
+    def __init__(self, ticker_window, generation, specs, layout):
         super().__init__()
         self.ticker_window = ticker_window
-        
+        self.generation = generation
+        self.specs = specs
+        self.layout = layout
+
     def run(self):
-        """Build ticker pixmaps in background thread"""
+        """Render the tiles in background threads"""
         try:
-            colored_print("[PIXMAP WORKER] Building ticker pixmaps in background...")
-            
-            # Build pixmaps (this is the expensive operation)
-            # We need to call the window's build_ticker_pixmaps_internal method
-            # which does all the work but doesn't set the window's attributes
-            pixmaps, widths, areas = self.ticker_window.build_ticker_pixmaps_background()
-            
-            # Emit the completed pixmaps
-            colored_print(f"[PIXMAP WORKER] Built {len(pixmaps)} pixmaps, emitting signal")
-            self.pixmaps_ready.emit(pixmaps, widths, areas)
+            tiles = self.ticker_window.build_ticker_pixmaps_background(self.specs, self.layout)
         except Exception as e:
             colored_print(f"[PIXMAP WORKER] Error building pixmaps: {e}")
+            tiles = []
+        self.tiles_ready.emit(self.generation, tiles)
 
 class _VSyncThread(QtCore.QThread):
     """
@@ -3771,6 +4403,7 @@ class TickerGLWidget(QtWidgets.QWidget):  # Changed from QOpenGLWidget to QWidge
                 print(f"[PAINT DELAY] Windows delaying paintEvent: {delay:.1f}ms")
 
         self.ticker_window.paint_ticker(self)
+        self.ticker_window.run_frame_housekeeping(call_time)
         self._paint_call_time = call_time
         # _vsync_thread emits vsync → self.update() via queued signal — no sleep here
             
@@ -3819,6 +4452,9 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
         self.fps_overlay_action = menu.addAction("Show FPS")
         self.fps_overlay_action.setCheckable(True)
         self.fps_overlay_action.setChecked(settings.get('show_fps_overlay', False))
+        self.frame_profiler_action = menu.addAction("Record Frame Profile")
+        self.frame_profiler_action.setCheckable(True)
+        self.frame_profiler_action.setChecked(False)
         self.effects_action = menu.addAction("Enable Visual Effects (Bloom/Glow/Glass)")
         self.effects_action.setCheckable(True)
         self.effects_action.setChecked(True)  # Enabled by default
@@ -3839,6 +4475,7 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
         self.effects_action.triggered.connect(self.toggle_effects)
         self.websocket_status_action.triggered.connect(self.show_websocket_status)
         self.fps_overlay_action.triggered.connect(self.toggle_fps_overlay)
+        self.frame_profiler_action.triggered.connect(self.toggle_frame_profiler)
         self.update_countdown_action.triggered.connect(self.toggle_update_countdown)
         self.about_action.triggered.connect(self.show_about)
         self.exit_action.triggered.connect(self.safe_exit)
@@ -3882,6 +4519,31 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
             status = "enabled" if not current_state else "disabled"
             print(f"[FPS OVERLAY] FPS overlay {status}")
 
+    def toggle_frame_profiler(self):
+        """Start recording per-stage frame timings, or stop and export the recording"""
+        profiler = get_frame_profiler()
+        if not profiler.enabled:
+            profiler.start()
+            self.frame_profiler_action.setChecked(True)
+            print(f"[PROFILER] Recording frame stages (last {profiler.capacity} frames are kept)")
+            return
+
+        profiler.stop()
+        self.frame_profiler_action.setChecked(False)
+        stats = profiler.get_stats()
+        if not stats['frames']:
+            print("[PROFILER] Stopped - no frames recorded")
+            return
+        print(f"[PROFILER] {stats['frames']} frames: mean {stats['total_mean_ms']:.2f}ms, "
+              f"p95 {stats['total_p95_ms']:.2f}ms, max {stats['total_max_ms']:.2f}ms, "
+              f"{stats['over_budget']} over budget")
+        for stage, s in stats['stages'].items():
+            print(f"[PROFILER]   {stage:<10} mean {s['mean_ms']:.3f}ms  p95 {s['p95_ms']:.3f}ms  max {s['max_ms']:.3f}ms")
+        if stats.get('over_budget_by_stage'):
+            print(f"[PROFILER] Largest stage in over-budget frames: {stats['over_budget_by_stage']}")
+        for path in export_frame_profile():
+            print(f"[PROFILER] Wrote {path}")
+
     def toggle_update_countdown(self):
         """Toggle update countdown overlay on/off"""
         if hasattr(self.primary_ticker, 'show_update_countdown'):
@@ -4036,7 +4698,26 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
                 connection_label = "❌ Disconnected"
             status_msg += f"Connection: {connection_label}\n"
             status_msg += f"Subscribed Symbols: {status['subscribed_symbols']}\n"
-            status_msg += f"Finnhub Stocks: {finnhub_count} (Free tier: 50 max)\n\n"
+            status_msg += (f"Finnhub Stocks: {finnhub_count} (capacity {status['capacity']}: "
+                           f"{status['symbols_per_connection']} per key × {len(client.api_keys)})\n")
+            if status['uncovered_symbols']:
+                status_msg += f"Polled Instead: {status['uncovered_symbols']} (no healthy connection slot)\n"
+            status_msg += "\n"
+
+            if status['shards']:
+                state_labels = {'up': "✅ up", 'connecting': "⏳ connecting", 'idle': "💤 idle",
+                                'backoff': "⛔ backoff", 'retrying': "🔄 retrying", 'down': "❌ down"}
+                status_msg += "🔌 Connections:\n"
+                for shard in status['shards']:
+                    line = (f"• {shard['label']}: {state_labels.get(shard['state'], shard['state'])} | "
+                            f"{shard['subscribed_symbols']} symbols | {shard['messages_received']} msgs | "
+                            f"{shard['price_updates_processed']} updates | {shard['reconnection_count']} reconnects")
+                    if shard['state'] == 'backoff' and shard['retry_in'] is not None:
+                        line += f" | retry in {shard['retry_in']:.0f}s (failure {shard['pool_failures']})"
+                    if shard['last_error'] and not shard['connected']:
+                        line += f" | {shard['last_error']}"
+                    status_msg += line + "\n"
+                status_msg += "\n"
 
             missing_prev_close = []
             for tkr, (price, prev_close) in self.primary_ticker.prices.items():
@@ -4057,6 +4738,16 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
                     status_msg += f"• Last Message: {status['time_since_last_message']:.1f}s ago\n"
                 else:
                     status_msg += f"• Last Message: {status['time_since_last_message']/60:.1f}min ago ⚠️\n"
+                ingest = status['ingest']
+                status_msg += (f"• Trades: {ingest['trades_received']} received, {ingest['trades_coalesced']} coalesced, "
+                               f"{ingest['trades_dropped']} dropped\n")
+                status_msg += (f"• Drain Latency: {ingest['avg_drain_latency_ms']:.0f}ms avg / "
+                               f"{ingest['max_drain_latency_ms']:.0f}ms max ({ingest['pending_messages']} pending)\n")
+                if status['sessions']:
+                    status_msg += "\n📊 Session Volume (streamed trades):\n"
+                    for symbol, vwap, volume, high, low in status['sessions']:
+                        status_msg += (f"• {symbol}: {volume:,.0f} @ VWAP {vwap:.2f} | "
+                                       f"range {low:.2f} – {high:.2f}\n")
             else:
                 status_msg += "📈 Session Totals:\n"
                 status_msg += f"• Total Messages: {status['messages_received']}\n"
@@ -4072,9 +4763,31 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
                     else:
                         status_msg += f"• Last Error: {status['last_error']} ({error_age/60:.1f}min ago)\n"
 
-            if finnhub_count > 50:
-                status_msg += "\n⚠️ WARNING: Exceeding free tier limits!\n"
-                status_msg += "Consider upgrading to paid plan to avoid rate limiting."
+            quota = get_quote_engine().get_provider("finnhub").get_quota_status()
+            if quota:
+                status_msg += "\n🔑 API Key Quota (per minute):\n"
+                for key_status in quota:
+                    line = f"• {key_status['label']}: {key_status['remaining']}/{key_status['limit']} left"
+                    if key_status['server_remaining'] is not None:
+                        line += f" (server: {key_status['server_remaining']})"
+                    if key_status['blocked_for'] > 0:
+                        line += f" ⛔ rate limited for {key_status['blocked_for']:.0f}s"
+                    line += f" | {key_status['total_calls']} calls, {key_status['total_429']} × 429\n"
+                    status_msg += line
+
+            if get_settings().get("show_sparklines", False):
+                spark = get_history_scheduler().get_stats()
+                status_msg += "\n📈 Sparkline Fetches:\n"
+                status_msg += (f"• Queue: {spark['queue_depth']} waiting (peak {spark['peak_queue_depth']}), "
+                               f"{spark['inflight']}/{spark['workers']} in flight\n")
+                status_msg += (f"• Latency: wait {spark['avg_wait_ms']:.0f}ms avg / {spark['max_wait_seconds'] * 1000:.0f}ms max, "
+                               f"fetch {spark['avg_fetch_ms']:.0f}ms avg\n")
+                status_msg += (f"• {spark['completed']} done, {spark['failed']} failed, "
+                               f"{spark['coalesced']} duplicate requests coalesced\n")
+
+            if finnhub_count > status['capacity']:
+                status_msg += "\n⚠️ WARNING: More symbols than websocket capacity!\n"
+                status_msg += "Add Finnhub API keys or upgrade to a paid plan to stream them all."
 
             return status_msg
 
@@ -4210,7 +4923,7 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
         new_window.ticker_height = settings.get("ticker_height", 60)
         new_window.setFixedHeight(new_window.ticker_height)
         new_window.update_font_and_label()
-        new_window.build_ticker_pixmaps()
+        new_window.rebuild_ticker_pixmaps()
         new_window.gl_widget.setGeometry(0, 0, new_window.width(), new_window.ticker_height)
         new_window.gl_widget.update()
         new_window.update_timer.setInterval(settings.get("update_interval", 300) * 1000)
@@ -4309,7 +5022,6 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
                     print(f"[RESTART] Using same stocks as main ticker ({len(second_ticker_window.stocks)} stocks)")
 
                 # Build ticker display
-                second_ticker_window.build_ticker_pixmaps()
                 second_ticker_window.build_ticker_text(reset_scroll=True)
 
                 # Apply main ticker settings (except speed which is customized)
@@ -4350,11 +5062,6 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
             previous_symbols = list(getattr(self.primary_ticker, 'stocks', []))
             previous_set = set(previous_symbols)
 
-            # Refresh cached settings so changes from Manage Tickers (e.g. show_market_status) take effect
-            fresh_settings = get_settings()
-            for ticker in self.ticker_windows:
-                ticker._cached_settings = fresh_settings
-
             self.primary_ticker.stocks = [s[0] for s in load_stocks()]
             current_symbols = list(self.primary_ticker.stocks)
             current_set = set(current_symbols)
@@ -4387,7 +5094,7 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
             try:
                 finnhub_added = [s for s in added_symbols if not is_yahoo_symbol(s)]
                 if finnhub_added and getattr(self.primary_ticker, 'websocket_client', None):
-                    self.primary_ticker.websocket_client.subscribe_symbols(finnhub_added)
+                    self.primary_ticker.websocket_client.add_symbols(finnhub_added)
             except Exception as e:
                 print(f"[MANAGE STOCKS] Websocket subscribe for new symbols failed: {e}")
 
@@ -4562,6 +5269,11 @@ class TrayIcon(QtWidgets.QSystemTrayIcon):
         """Safely exit the application with proper AppBar cleanup"""
         print("[EXIT] Safe exit initiated - cleaning up AppBar registration")
 
+        # Keep an in-progress frame recording
+        if get_frame_profiler().enabled:
+            get_frame_profiler().stop()
+            export_frame_profile()
+
         # Close all ticker windows to trigger AppBar cleanup
         windows_closed = 0
         for ticker in list(self.ticker_windows):
@@ -4689,10 +5401,18 @@ class SplashScreen(QtWidgets.QWidget):
         painter.setPen(QtGui.QColor(255, 215, 0))  # Gold
         painter.drawText(text_x, text_y, text)
 
+
+# A tile's pixmaps, its ghost tint and the TileSpec they were drawn from, so a price
+# tick can blit just its digits in place (tile_renderer.patch_tile). `key` holds
+# everything else the tile depends on (settings version, font, height, sparklines).
+PriceSlot = collections.namedtuple("PriceSlot", ["pixmap", "ghost", "tint", "key", "spec"])
+
 class TickerWindow(QtWidgets.QWidget):
     FLASH_DURATION_MS = 400
     _instance_counter = 0  # Class variable to track instance numbers
-    sparkline_ready = QtCore.pyqtSignal(str, object, int, int, str)  # symbol, pixmap, w, h, period
+    sparkline_history_ready = QtCore.pyqtSignal(str, str)  # symbol, period
+    partial_prices_ready = QtCore.pyqtSignal(dict)  # streamed chunks from the quote engine
+    incremental_tiles_ready = QtCore.pyqtSignal(int, int, object, list, list)  # generation, request, layout key, symbols, RenderedTiles
 
     def __init__(self, is_secondary=False):
         super().__init__()
@@ -4842,21 +5562,19 @@ class TickerWindow(QtWidgets.QWidget):
         self.show_sparklines = bool(settings.get("show_sparklines", False))
         self.sparkline_period = settings.get("sparkline_period", "1d")
         self.sparkline_position = settings.get("sparkline_position", "left")
-        self.sparkline_cache = {}  # key: (symbol, period, w, h) -> (timestamp, QPixmap)
-        self.sparkline_inflight = set()  # keys currently being fetched
-        self.sparkline_lock = threading.Lock()
+        self.sparkline_cache = {}  # key: (symbol, period, w, h) -> (history version, QPixmap)
         self.sparkline_rebuild_interval_ms = 350  # batch sparkline redraws to avoid stutter
         self.sparkline_rebuild_timer = QtCore.QTimer(self)
         self.sparkline_rebuild_timer.setSingleShot(True)
         self.sparkline_rebuild_timer.timeout.connect(self._process_sparkline_rebuild_tick)
-        self._sparkline_logged_success = set()  # one-time success diagnostics
-        self._sparkline_logged_failures = set()  # one-time failure diagnostics
-        self.sparkline_ready.connect(self._on_sparkline_ready)
-
-        self.icon_cache = {}
-        self.icon_cache_limit = 100  # Limit cache size to prevent memory bloat
-        self.icon_cache_hits = 0
-        self.icon_cache_misses = 0
+        self._sparkline_logged_success = set()  # one-time fetch diagnostics
+        self.sparkline_history_ready.connect(self._on_sparkline_history_ready)
+        self.partial_prices_ready.connect(self._handle_partial_prices)
+        # Always queued: tiles may finish before submit() returns
+        self.incremental_tiles_ready.connect(self._on_incremental_tiles_ready, QtCore.Qt.QueuedConnection)
+        get_settings_store().subscribe(self._on_settings_changed)  # Keeps _cached_settings current
+
+        self.icon_cache = get_icon_cache()  # Shared by all ticker windows; LRU-bounded
         self.current_icon_size = None  # Track current icon size for cache management
         
         # BLOOM CACHE: Cache the bloom layer to avoid redrawing gradients every frame
@@ -4881,6 +5599,9 @@ class TickerWindow(QtWidgets.QWidget):
         self.stocks = [s[0] for s in load_stocks()]
         colored_print(f"[INIT] Loaded stocks in order: {self.stocks}")
         self.prices = {}
+        self._snapshot_symbols = set()  # Prices still showing the saved startup snapshot (drawn faded)
+        self._fresh_snapshot_quotes = {}  # Recent snapshot quotes the first refresh skipped; kept as live prices
+        self.failed_fetch_counts = {}  # Tiles can be built before the startup sequence resets this
         self.prev_prices = {}
         self.price_flash_times = {}
         self.pulse_effects = {}
@@ -4911,6 +5632,38 @@ class TickerWindow(QtWidgets.QWidget):
         # target_frame_interval will be set after refresh rate detection
         self.ticker_pixmaps = []
         self.ticker_pixmap_widths = []
+        self._price_slots = {}  # symbol -> PriceSlot of its current tile
+        # Full rebuilds render tiles on PixmapRebuildWorker and swap them in when done
+        self._tile_symbols = []  # Symbol order of the current tiles
+        self._tile_geometry = None  # (font key, height) the current tiles were drawn for
+        self._tile_images = {}  # Icon / sparkline cacheKey -> QImage handed to the tile renderer
+        self._tile_generation = 0  # Bumped by every full build; older background results are dropped
+        self._pixmap_worker = None
+        self._tile_rebuild_requested = False  # Another rebuild was asked for while one was running
+        self._tiles_touched = set()  # Symbols redrawn in place while a background build was running
+        self._tile_install = None  # Finished background build being converted to pixmaps a slice per frame
+        self._tile_requests = {}  # symbol -> id of its newest incremental tile render still in flight
+        self._tile_request_ids = itertools.count(1)
+        self._glow_pin_owners = set()  # Layout keys this window pinned glow sprites under
+        # Strip renderer: frame cost independent of watchlist size (per-tile path when off)
+        self.use_strip_renderer = bool(settings.get("strip_renderer", True))
+        self._strip_renderer = TickerStripRenderer()
+        # Bloom halos are baked once per tile into their own additive strip that scrolls
+        # with the content; a changed tile keeps its old halo on screen until the new one
+        # is ready (padding = how far a halo may spill past its tile, see _bloom_padding)
+        self._bloom_renderer = TickerStripRenderer(composition_mode=QtGui.QPainter.CompositionMode_Plus,
+                                                   max_builds_per_frame=1)
+        self._bloom_tiles = {}  # tile index -> halo pixmap (-1 = donate)
+        self._bloom_tiles_intensity = None
+        # Accumulation ghosting: the tinted ghost tiles get their own strip, and one
+        # trail buffer carries the previous frames instead of extra ghost layers
+        self._ghost_renderer = TickerStripRenderer(max_builds_per_frame=1)
+        self._ghost_trail = GhostTrail()
+        self._profiler_track = get_frame_profiler().track_id(f"ticker-{id(self) & 0xffff:04x}")
+        # Overlay toggles read by paint_ticker; set here so the first frame never depends
+        # on check_websocket_cost_startup having run (headless benchmark windows skip it)
+        self.show_fps_overlay = get_settings().get('show_fps_overlay', False)
+        self.show_update_countdown = get_settings().get('show_update_countdown', False)
         self.gl_widget = TickerGLWidget(self)
         self.gl_widget.setGeometry(0, 0, self.width(), self.ticker_height)
         self.gl_widget.show()
@@ -4957,35 +5710,39 @@ class TickerWindow(QtWidgets.QWidget):
         self.market_status_timer.timeout.connect(self.update_market_status)
         self.market_status_timer.start(60000)  # Check every 60 seconds
         
-        # DISABLED: Memory cleanup timer - gc.collect() can cause frame drops
-        # Memory will be managed by Python's automatic garbage collector
-        # self.memory_cleanup_timer = QtCore.QTimer(self)
-        # self.memory_cleanup_timer.timeout.connect(self.cleanup_memory_periodically)
-        # self.memory_cleanup_timer.start(600000)  # 10 minutes
-        
-        # DISABLED: Glow cleanup timer was causing scroll stuttering every second
-        # Glow effects will now persist until next price update (every 5 minutes)
-        # This eliminates the periodic pixmap rebuilds that caused stuttering
-        # self.glow_cleanup_timer = QtCore.QTimer(self)
-        # self.glow_cleanup_timer.timeout.connect(self.cleanup_expired_glow_effects)
-        # self.glow_cleanup_timer.start(1000)
+        # Memory and glow cleanup no longer run from their own timers (a gc.collect() or
+        # a full tile rebuild landing mid-frame dropped frames): the housekeeping scheduler
+        # runs them in small slices in the slack after each VSync paint, and from the
+        # idle timer while nothing is painted
+        housekeeping = get_housekeeping_scheduler()
+        self._housekeeping_tasks = [
+            housekeeping.add_task("glow-expiry", self.cleanup_expired_glow_effects, 1.0),
+            housekeeping.add_task("icon-trim", lambda: self.manage_icon_cache_lru(max_evict=16), 30.0),
+            housekeeping.add_task("sparkline-evict", self.evict_stale_sparklines, 60.0),
+        ]
+        self.housekeeping_idle_timer = QtCore.QTimer(self)
+        self.housekeeping_idle_timer.timeout.connect(housekeeping.idle)
+        self.housekeeping_idle_timer.start(1000)
 
         # Initialize websocket client for real-time data during market hours
         self.websocket_client = None
         self.last_websocket_check = 0
-        self.websocket_enabled = WEBSOCKET_AVAILABLE
+        self.websocket_enabled = WEBSOCKET_AVAILABLE or _MARKET_REPLAYER is not None
         colored_print(f"[WEBSOCKET] Websocket enabled: {self.websocket_enabled}")
 
         if self.websocket_enabled:
             api_key = ensure_finnhub_api_key(self)
             colored_print(f"[WEBSOCKET] API key available: {api_key is not None}")
             if api_key:
-                self.websocket_client = FinnhubWebSocketClient(api_key, self)
-                colored_print("[WEBSOCKET] ✅ Initialized websocket client for real-time data")
+                # Shard subscriptions over one connection per configured Finnhub key
+                settings = get_settings()
+                api_keys = get_finnhub_api_keys(api_key, settings.get("finnhub_api_key_2", "").strip() or None, settings)
+                self.websocket_client = FinnhubWebSocketPool(api_keys, self)
+                colored_print(f"[WEBSOCKET] ✅ Initialized websocket pool for real-time data "
+                              f"({len(api_keys)} key(s), capacity {self.websocket_client.capacity} symbols)")
                 
                 # Create batch processing timer in main thread with LOW PRIORITY
                 # This ensures rendering always takes precedence over WebSocket processing
-                settings = get_settings()
                 batch_interval = settings.get('websocket_batch_interval', 150)
                 # ZERO-INTERRUPTION MODE: User choice - smooth vs real-time
                 # Option 1: Never refresh visuals (perfectly smooth, but prices only update via API every 10min)
@@ -5025,9 +5782,13 @@ class TickerWindow(QtWidgets.QWidget):
         # CRITICAL: Skip if we're currently busy rendering (smoothness first!)
         if getattr(self, '_websocket_busy', False):
             return  # Skip this update, try again next time
+
+        # Move symbols off shards that dropped (and back when they reconnect);
+        # returns immediately while every shard keeps its state
+        self.websocket_client.rebalance()
         
         # Check if buffer has data
-        has_buffered_data = bool(self.websocket_client.price_buffer)
+        has_buffered_data = bool(self.websocket_client.trade_buffer)
         if not has_buffered_data:
             return  # Nothing to process
         
@@ -5143,21 +5904,21 @@ class TickerWindow(QtWidgets.QWidget):
     
     def check_websocket_cost_startup(self):
         """Check for websocket cost warnings on startup and connect if market is open"""
-        if not WEBSOCKET_AVAILABLE or not self.websocket_client:
+        if not self.websocket_enabled or not self.websocket_client:
             return
 
         num_stocks = len(self.stocks)
         finnhub_stocks = len([s for s in self.stocks if not is_yahoo_symbol(s)])
 
-        # Free tier limits: 50 websocket symbols, 60 API calls/minute
-        if finnhub_stocks > 50:
-            colored_print(f"[WEBSOCKET] ⚠️ COST WARNING: You have {finnhub_stocks} stocks (free tier limit: 50)")
-            colored_print("[WEBSOCKET] You may incur charges during market hours:")
-            colored_print("[WEBSOCKET] • $0.01/minute connection time")
-            colored_print("[WEBSOCKET] • $0.02 per 1,000 trade messages")
-            colored_print("[WEBSOCKET] Consider upgrading to Finnhub paid plan or reducing stocks")
-        elif finnhub_stocks > 40:
-            colored_print(f"[WEBSOCKET] Note: You have {finnhub_stocks} stocks. Free tier supports up to 50 symbols.")
+        # Free tier limits: 50 websocket symbols per key, 60 API calls/minute
+        capacity = self.websocket_client.capacity
+        if finnhub_stocks > capacity:
+            colored_print(f"[WEBSOCKET] ⚠️ COST WARNING: You have {finnhub_stocks} stocks (websocket capacity: {capacity} "
+                          f"over {len(self.websocket_client.api_keys)} key(s))")
+            colored_print(f"[WEBSOCKET] {finnhub_stocks - capacity} symbols will be polled during market hours")
+            colored_print("[WEBSOCKET] Add Finnhub API keys, upgrade to a paid plan or reduce stocks")
+        elif finnhub_stocks > capacity * 0.8:
+            colored_print(f"[WEBSOCKET] Note: You have {finnhub_stocks} stocks. Websocket capacity is {capacity} symbols.")
 
         # Force a market hours check at startup to ensure _market_is_open is set
         self.get_smart_update_interval()
@@ -5410,20 +6171,54 @@ class TickerWindow(QtWidgets.QWidget):
 
     # ========== PERFORMANCE ENHANCEMENT FUNCTIONS ==========
     
-    def manage_icon_cache_lru(self):
-        """Manage icon cache with LRU eviction to prevent memory bloat"""
-        if len(self.icon_cache) > self.icon_cache_limit:
+    def manage_icon_cache_lru(self, max_evict=None):
+        """Manage icon cache with LRU eviction to prevent memory bloat.
+        At most max_evict entries go per call; returns True if more should go."""
+        if len(self.icon_cache) > self.icon_cache.memory_limit:
             # Remove oldest 20% of cache entries
-            items_to_remove = len(self.icon_cache) - int(self.icon_cache_limit * 0.8)
-            oldest_keys = list(self.icon_cache.keys())[:items_to_remove]
-            for key in oldest_keys:
-                del self.icon_cache[key]
-            print(f"[PERF] Icon cache evicted {items_to_remove} entries (total: {len(self.icon_cache)})")
+            excess = len(self.icon_cache) - int(self.icon_cache.memory_limit * 0.8)
+            items_to_remove = self.icon_cache.evict_memory(excess if max_evict is None else min(excess, max_evict))
+            log_debug("PERF", "Icon cache evicted %d entries (total: %d)", items_to_remove, len(self.icon_cache))
+            return items_to_remove < excess
+        return False
+
+    def evict_stale_sparklines(self, max_evict=32):
+        """Drop cached sparklines of removed symbols or another period, a few per call.
+        Returns True if more are left."""
+        shown = {symbol.upper() for symbol in self.stocks}
+        stale = [key for key in self.sparkline_cache
+                 if key[0] not in shown or key[1] != self.sparkline_period]
+        for key in stale[:max_evict]:
+            del self.sparkline_cache[key]
+        return len(stale) > max_evict
+
+    def run_frame_housekeeping(self, paint_start):
+        """Hand the rest of this frame's budget to the housekeeping scheduler"""
+        vsync_time = getattr(self, '_frame_vsync_time', None)
+        if vsync_time is None:
+            return  # Not a VSync paint (resize, expose): no frame deadline to work against
+        self._frame_vsync_time = None
+        # The budget runs to the VBlank after the newest one seen, even if paints lag the queue
+        queue = self.gl_widget._vsync_queue
+        if queue:
+            vsync_time = max(vsync_time, queue[-1])
+        get_housekeeping_scheduler().frame_done(self._profiler_track, vsync_time,
+                                                self.target_frame_interval, paint_start)
     
+    def _on_settings_changed(self, settings, changed_keys):
+        """Settings store listener: swap in the new settings for the per-frame caches"""
+        self._cached_settings = settings
+        self._cached_effect_settings = {
+            'bloom': settings.get("led_bloom_effect", True),
+            'ghosting': settings.get("led_ghosting_effect", True),
+            'glass': settings.get("led_glass_glare", True)
+        }
+        self._settings_cache_time = 0
+
     def get_cached_settings(self):
         """Return render settings from in-memory cache (no periodic disk I/O)."""
         if not hasattr(self, '_cached_settings'):
-            self._cached_settings = get_settings()
+            self._cached_settings = get_settings_store().snapshot()
 
         settings = self._cached_settings
         return {
@@ -5576,10 +6371,7 @@ class TickerWindow(QtWidgets.QWidget):
             # If memory usage is very high, force more aggressive cleanup
             if memory_mb > 500:
                 # Clear half the icon cache
-                items_to_remove = len(self.icon_cache) // 2
-                oldest_keys = list(self.icon_cache.keys())[:items_to_remove]
-                for key in oldest_keys:
-                    del self.icon_cache[key]
+                items_to_remove = self.icon_cache.evict_memory(len(self.icon_cache) // 2)
                 print(f"[PERF] Emergency memory cleanup: removed {items_to_remove} cached icons")
         except ImportError:
             pass  # psutil not available
@@ -5597,6 +6389,9 @@ class TickerWindow(QtWidgets.QWidget):
         # Pre-cache settings
         self.get_cached_settings()
         print("[STARTUP] Phase 2: Settings cached")
+
+        # Scroll the last known quotes while the first refresh runs
+        self.show_quote_snapshot()
         
         # Phase 3: Start API calls (500ms delay)
         QtCore.QTimer.singleShot(500, self.startup_phase3)
@@ -5619,6 +6414,14 @@ class TickerWindow(QtWidgets.QWidget):
         self.preload_icons_async()
         print("[STARTUP] Phase 4: Background optimizations started")
 
+        # Once startup garbage is gone, freeze what is left so later full collections skip it
+        QtCore.QTimer.singleShot(5000, self._freeze_startup_heap)
+
+    def _freeze_startup_heap(self):
+        frozen = get_housekeeping_scheduler().freeze_after_startup()
+        if frozen:
+            print(f"[PERF] Froze {frozen} startup objects out of garbage collection")
+
 
     def ensure_top_position(self):
         """Ensure the ticker is positioned correctly (top for primary, target position for secondary)"""
@@ -6303,6 +7106,30 @@ class TickerWindow(QtWidgets.QWidget):
                 self.ticker_font = QtGui.QFont("Arial", font_size)
         else:
             self.ticker_font = QtGui.QFont("Arial", font_size)
+    def show_quote_snapshot(self):
+        """Replace the loading screen with the saved quote snapshot, drawn faded as stale.
+        The first refresh (or a WebSocket trade) swaps in live quotes symbol by symbol."""
+        if not self.loading:
+            return
+        quotes = get_quote_snapshot().prices(self.stocks)
+        if not quotes:
+            return
+        self.prices.update(quotes)
+        self._snapshot_symbols.update(quotes)
+        self.loading = False
+        self._initial_prices_streamed = True  # The refresh updates in place, no scroll reset
+        colored_print(f"[SNAPSHOT] Showing {len(quotes)} saved quotes until the first refresh completes")
+        self.build_ticker_text(reset_scroll=True)
+
+    def _mark_live(self, prices):
+        """Quotes in `prices` that have a price are live now: stop fading them.
+        Returns the symbols that were still showing snapshot values."""
+        if not self._snapshot_symbols:
+            return []
+        live = [tkr for tkr, (price, _prev_close) in prices.items() if price is not None and tkr in self._snapshot_symbols]
+        self._snapshot_symbols.difference_update(live)
+        return live
+
     def update_prices_full(self):
         # Keep loading screen visible while fetching first batch
         colored_print("[TCKR] update_prices_full() called - preparing to fetch stock prices")
@@ -6316,11 +7143,31 @@ class TickerWindow(QtWidgets.QWidget):
                 if _win is not self and getattr(_win, '_custom_stocks', None):
                     all_stocks.update(_win._custom_stocks)
         all_stocks = list(all_stocks)
+
+        # Symbols whose snapshot quote is recent enough skip this first fetch
+        settings = get_settings()
+        if self._snapshot_symbols:
+            fresh = get_quote_snapshot().fresh_symbols(all_stocks, settings.get("quote_snapshot_max_age", 120))
+            if fresh:
+                all_stocks = [t for t in all_stocks if t not in fresh]
+                colored_print(f"[SNAPSHOT] {len(fresh)} saved quotes are recent - fetching the other {len(all_stocks)}")
+                # Recent enough to count as live: stop fading them now, and keep them
+                # when the refresh's result replaces the price table
+                self._fresh_snapshot_quotes = get_quote_snapshot().prices(fresh)
+                windows = [self]
+                if hasattr(self, 'tray_icon') and self.tray_icon and hasattr(self.tray_icon, 'ticker_windows'):
+                    windows += [w for w in self.tray_icon.ticker_windows if w is not self]
+                for window in windows:
+                    live = window._mark_live(self._fresh_snapshot_quotes)
+                    if live and not window.loading:
+                        window.queue_incremental_pixmap_updates([tkr for tkr in window.stocks if tkr in live])
+                if not all_stocks:
+                    self.on_prices_fetched({})
+                    return
         yahoo_tickers = [t for t in all_stocks if is_yahoo_symbol(t)]
         finnhub_tickers = [t for t in all_stocks if not is_yahoo_symbol(t)]
         
         # Check if API key is available
-        settings = get_settings()
         api_key = settings.get("finnhub_api_key", "").strip()
         
         if not api_key and finnhub_tickers:
@@ -6330,6 +7177,7 @@ class TickerWindow(QtWidgets.QWidget):
             colored_print(f"[TCKR] {len(finnhub_tickers)} stocks will show as N/A until API key is configured in Settings")
             if yahoo_tickers:
                 self.worker = PriceFetchWorker(yahoo_tickers, "", None)
+                self.worker.prices_partial.connect(self.on_prices_partial)
                 self.worker.prices_fetched.connect(self.on_prices_fetched)
                 self.worker.start()
             else:
@@ -6346,19 +7194,54 @@ class TickerWindow(QtWidgets.QWidget):
         
         colored_print("[TCKR] Starting worker thread to fetch prices...")
         self.worker = PriceFetchWorker(all_stocks, api_key if api_key else "", api_key_2)
+        self.worker.prices_partial.connect(self.on_prices_partial)
         self.worker.prices_fetched.connect(self.on_prices_fetched)
         self.worker.start()
+    def on_prices_partial(self, partial_prices):
+        """Show streamed prices while the initial fetch is still running"""
+        if self._snapshot_symbols:
+            # A failed fetch keeps showing its snapshot quote rather than N/A
+            partial_prices = {tkr: quote for tkr, quote in partial_prices.items()
+                              if quote[0] is not None or tkr not in self._snapshot_symbols}
+            self._mark_live(partial_prices)
+        self.prices.update(partial_prices)
+        self.bloom_cache_valid = False
+        if self.loading:
+            # First chunk: leave the loading screen and start scrolling right away;
+            # symbols still in flight render as N/A until their chunk arrives
+            self.stocks = [s[0] for s in load_stocks()]
+            self.loading = False
+            self._initial_prices_streamed = True
+            colored_print(f"[TCKR] First {len(partial_prices)} prices arrived - building ticker display")
+            self.build_ticker_text(reset_scroll=True)
+        else:
+            self.queue_incremental_pixmap_updates([s for s in partial_prices if s in self.stocks])
     def on_prices_fetched(self, prices):
         colored_print(f"[TCKR] on_prices_fetched() called - received {len(prices)} prices")
         # Don't re-sort! load_stocks() already returns sorted list
         self.stocks = [s[0] for s in load_stocks()]
+        if self._fresh_snapshot_quotes:
+            # Symbols the first refresh skipped because their snapshot quote was recent
+            prices = {**self._fresh_snapshot_quotes, **prices}
+            self._fresh_snapshot_quotes = {}
+        fetched = prices
+        if self._snapshot_symbols:
+            # Snapshot quotes that were not fetched (recent enough) or failed stay on screen
+            self._mark_live(prices)
+            prices = dict(prices)
+            for tkr in self._snapshot_symbols:
+                if tkr in self.prices and prices.get(tkr, (None, None))[0] is None:
+                    prices[tkr] = self.prices[tkr]
         self.prices = prices
         self.loading = False  # Hide loading screen, show ticker with real data
         self.bloom_cache_valid = False  # Invalidate bloom cache on price update
         import time as time_module
         self.last_api_update_time = time_module.time()  # Record API update time
         colored_print("[TCKR] Loading complete - building ticker display")
-        self.build_ticker_text(reset_scroll=True)
+        # Streamed chunks already started the scroll - keep position and refresh in place
+        streamed = getattr(self, '_initial_prices_streamed', False)
+        self._initial_prices_streamed = False
+        self.build_ticker_text(reset_scroll=not streamed, use_incremental_rebuild=streamed)
 
         # If this is the primary ticker, update all other tickers with the same prices
         if (hasattr(self, 'tray_icon') and self.tray_icon and
@@ -6370,11 +7253,35 @@ class TickerWindow(QtWidgets.QWidget):
                     if getattr(ticker, '_custom_stocks', None) is None:
                         ticker.stocks = [s[0] for s in load_stocks()]
                     ticker.prices = prices.copy()
+                    ticker._mark_live(fetched)
                     ticker.loading = False
                     ticker.bloom_cache_valid = False
                     ticker.last_api_update_time = self.last_api_update_time
                     ticker.build_ticker_text(reset_scroll=False, use_incremental_rebuild=True)
-                    print(f"[PRIMARY UPDATE] Updated secondary ticker with {len(prices)} prices")
+                    colored_print(f"[PRIMARY UPDATE] Updated secondary ticker with {len(prices)} prices")
+
+    @QtCore.pyqtSlot(dict)
+    def _handle_partial_prices(self, partial_prices):
+        """Apply a streamed chunk of coordinated-fetch results to every ticker"""
+        if not hasattr(self, 'tray_icon') or not self.tray_icon:
+            return
+        for ticker in self.tray_icon.ticker_windows:
+            changed = []
+            stocks = getattr(ticker, 'stocks', None) or ()
+            for tkr, (price, prev_close) in partial_prices.items():
+                if price is None or tkr not in stocks:
+                    continue  # Failed fetches keep the old value until the final merge
+                old_price, old_prev_close = ticker.prices.get(tkr, (None, None))
+                if prev_close is None:
+                    prev_close = old_prev_close
+                if (price, prev_close) != (old_price, old_prev_close):
+                    ticker.prices[tkr] = (price, prev_close)
+                    changed.append(tkr)
+            # Unchanged snapshot quotes still need redrawing without the stale fade
+            changed += [tkr for tkr in ticker._mark_live(partial_prices) if tkr not in changed and tkr in stocks]
+            if changed and not getattr(ticker, 'loading', False):
+                ticker.bloom_cache_valid = False
+                ticker.queue_incremental_pixmap_updates(changed)
 
     def _handle_coordinated_prices(self, prices, had_429, now):
         """Handle coordinated price fetching results and distribute to all tickers"""
@@ -6399,6 +7306,7 @@ class TickerWindow(QtWidgets.QWidget):
                     prev_close = old_prev_close
                 merged_prices[tkr] = (price, prev_close)
             ticker.prices = merged_prices  # All tickers get all prices
+            ticker._mark_live(prices)
             ticker.loading = False  # Hide loading screen
             ticker.bloom_cache_valid = False  # Invalidate bloom cache
             ticker.last_api_update_time = now
@@ -6411,11 +7319,15 @@ class TickerWindow(QtWidgets.QWidget):
 
         # Handle backoff if there were 429 errors
         if had_429:
-            import time as time_module
-            # Apply backoff to all tickers
-            backoff_duration = 300  # 5 minutes backoff
-            TickerWindow.backoff_until = now + backoff_duration
-            colored_print(f"[BACKOFF] Applied {backoff_duration}s backoff due to rate limiting")
+            # The key pool already parked each rate-limited key for its Retry-After
+            # period; only hold off the whole fetch cycle while every key is exhausted
+            key_wait = get_quote_engine().get_provider("finnhub").key_pool.seconds_until_available()
+            if key_wait > 0:
+                backoff_duration = min(300, int(key_wait) + 1)  # Never more than 5 minutes
+                TickerWindow.backoff_until = now + backoff_duration
+                colored_print(f"[BACKOFF] Applied {backoff_duration}s backoff - all API keys rate limited")
+            else:
+                colored_print("[BACKOFF] 429 absorbed by API key pool - other keys still have quota")
 
     def cleanup_expired_glow_effects(self):
         """Clean up expired glow effects and trigger pixmap rebuild if needed"""
@@ -6448,8 +7360,8 @@ class TickerWindow(QtWidgets.QWidget):
                 self.recently_expired_effects[symbol] = current_time
             print(f"[GLOW] Marked as recently_expired: {list(self.recently_expired_effects.keys())}")
             
-            # Rebuild pixmaps to remove glow effect from expired items
-            self.build_ticker_pixmaps()  # Call build_ticker_pixmaps directly to avoid re-triggering
+            # Redraw just the expired tiles, a few per tick (a full rebuild stutters)
+            self.queue_incremental_pixmap_updates(expired_effects)
             
         # Debug: Show current active pulse effects (reduced verbosity)
         if self.pulse_effects and len(self.pulse_effects) > 0:
@@ -6506,11 +7418,13 @@ class TickerWindow(QtWidgets.QWidget):
 
         return self.apply_fade_to_color(base_color, self.get_stale_fade_factor(tkr))
 
+    SNAPSHOT_FADE_FACTOR = 0.6  # Startup snapshot quotes, until live data replaces them
+
     def get_stale_fade_factor(self, tkr):
         """Return a dimming factor based on consecutive fetch failures for symbol."""
         fail_count = self.failed_fetch_counts.get(tkr, 0)
         if fail_count <= 1:
-            return 1.0
+            return self.SNAPSHOT_FADE_FACTOR if tkr in self._snapshot_symbols else 1.0
         fade_step = min(10, fail_count - 1)
         return max(0.35, 1.0 - (fade_step * 0.08))
 
@@ -6523,91 +7437,6 @@ class TickerWindow(QtWidgets.QWidget):
         faded_b = max(0, int(color.blue() * fade_factor))
         return QtGui.QColor(faded_r, faded_g, faded_b, color.alpha())
 
-    def draw_rotated_triangle(self, painter, x, y, size, rotation_angle, color):
-        """
-        Draw a right-angle triangle rotated to the specified angle.
-        The right-angle vertex is the directional point.
-        
-        Args:
-            painter: QPainter object
-            x, y: Center position for the triangle
-            size: Size of the triangle
-            rotation_angle: Rotation in degrees (0=up, 90=right, 180=down)
-            color: QColor for the triangle
-        """
-        # Create a right-angle triangle where the right-angle vertex is the directional tip
-        # (pointing up by default before rotation).
-        half_size = size / 2
-        tip_y = -int(half_size)
-        leg_component = max(2, int(half_size * 0.9))
-        triangle = QtGui.QPolygon([
-            QtCore.QPoint(0, tip_y),                                  # Directional right-angle vertex
-            QtCore.QPoint(leg_component, tip_y + leg_component),      # Leg endpoint 1
-            QtCore.QPoint(-leg_component, tip_y + leg_component)      # Leg endpoint 2
-        ])
-        
-        # Apply rotation transform
-        transform = QtGui.QTransform()
-        transform.translate(x, y)
-        transform.rotate(rotation_angle)
-        
-        # Save current painter state
-        painter.save()
-        
-        # Apply transform and draw
-        painter.setTransform(transform, True)
-        painter.setBrush(QtGui.QBrush(color))
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.drawPolygon(triangle)
-        
-        # Restore painter state
-        painter.restore()
-
-    def draw_rotated_arrow(self, painter, x, y, size, rotation_angle, color):
-        """
-        Draw an arrow rotated to the specified angle.
-        
-        Args:
-            painter: QPainter object
-            x, y: Center position for the arrow
-            size: Size of the arrow
-            rotation_angle: Rotation in degrees (0=up, 90=right, 180=down)
-            color: QColor for the arrow
-        """
-        # Create arrow shape (pointing up by default)
-        half_size = size / 2
-        shaft_width = half_size * 0.35
-        head_width = half_size * 0.75
-        
-        arrow = QtGui.QPolygon([
-            # Arrow head (top triangle)
-            QtCore.QPoint(0, -int(half_size)),      # Tip
-            QtCore.QPoint(-int(head_width), -int(half_size * 0.3)),  # Left head
-            QtCore.QPoint(-int(shaft_width), -int(half_size * 0.3)),  # Left shaft start
-            # Arrow shaft (rectangle)
-            QtCore.QPoint(-int(shaft_width), int(half_size * 0.5)),  # Left shaft bottom
-            QtCore.QPoint(int(shaft_width), int(half_size * 0.5)),   # Right shaft bottom
-            QtCore.QPoint(int(shaft_width), -int(half_size * 0.3)),  # Right shaft start
-            QtCore.QPoint(int(head_width), -int(half_size * 0.3)),   # Right head
-        ])
-        
-        # Apply rotation transform
-        transform = QtGui.QTransform()
-        transform.translate(x, y)
-        transform.rotate(rotation_angle)
-        
-        # Save current painter state
-        painter.save()
-        
-        # Apply transform and draw
-        painter.setTransform(transform, True)
-        painter.setBrush(QtGui.QBrush(color))
-        painter.setPen(QtCore.Qt.NoPen)
-        painter.drawPolygon(arrow)
-        
-        # Restore painter state
-        painter.restore()
-
     def draw_text_with_global_glow(self, painter, x, y, text, text_color, glow_color=None, settings=None):
         """
         Draw text with optional global glow effect.
@@ -6627,22 +7456,53 @@ class TickerWindow(QtWidgets.QWidget):
         if glow_color and not settings.get("global_text_glow", True):
             glow_color = None
         
-        # Draw glow halo if we have a glow color
+        # Glow halo and text in one go, from the glow sprite cache (labels barely
+        # change, so their sprites are kept for good)
         if glow_color:
-            painter.setPen(glow_color)
-            if USE_OPT:
-                for dx, dy in opt.get_subtle_glow_offsets():
-                    painter.drawText(x + dx, y + dy, text)
-            else:
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:  # Don't draw at center position
-                            painter.drawText(x + dx, y + dy, text)
-        
+            offsets = opt.get_subtle_glow_offsets() if USE_OPT else self.SUBTLE_GLOW_OFFSETS
+            draw_glow_text(painter, x, y, text, text_color, glow_color, offsets, pin=self._glow_pin_owner())
+            return
+
         # Draw main text
         painter.setPen(text_color)
         painter.drawText(x, y, text)
 
+    SUBTLE_GLOW_OFFSETS = HALO_OFFSETS
+    GLOW_OFFSETS = tuple((dx, dy) for dx in (-2, -1, 0, 1, 2) for dy in (-2, -1, 0, 1, 2) if dx != 0 or dy != 0)
+
+    def _price_slot_key(self):
+        """What a tile depends on besides its prices; a PriceSlot is reusable only while this matches"""
+        return (get_settings_store().version, self.ticker_font.key(), self.ticker_height,
+                self.show_sparklines, getattr(self, 'sparkline_position', 'left'))
+
+    def _patch_price_slot(self, tkr, target_index, layout, spec):
+        """Redraw only the price and change digits of tkr's tile, in place, to show spec.
+
+        Applies while nothing but the digits changes (see patch_tile): the old
+        digits are cleared and the new ones blitted from the glyph atlas into the
+        tile and, under the tile's tint, its ghost copy - the same cells a full
+        rebuild draws. Returns False when the tile must be rebuilt.
+        """
+        slot = self._price_slots.get(tkr)
+        if slot is None or target_index >= len(self.ticker_pixmaps) or self.ticker_pixmaps[target_index] is not slot.pixmap:
+            return False
+        if target_index >= len(self.ticker_ghost_pixmaps) or self.ticker_ghost_pixmaps[target_index] is not slot.ghost:
+            return False
+        if slot.key != layout.key:
+            return False
+        if not spec.change_text:
+            return False
+        if tile_key(spec, layout) == tile_key(slot.spec, layout):
+            return True  # Nothing visible changed
+        if not patch_tile(slot.pixmap, slot.ghost, slot.tint, slot.spec, spec, layout):
+            return False
+
+        self._price_slots[tkr] = slot._replace(spec=spec)
+        self._strip_renderer.invalidate_tile(target_index)
+        self._ghost_renderer.invalidate_tile(target_index)
+        self.invalidate_bloom_layer(target_index)
+        return True
+
     def get_glow_effect(self, symbol, change_percent):
         """Get glow effect for significant price changes"""
         if abs(change_percent) < 5:  # Only glow for changes >= 5%
@@ -6746,7 +7606,7 @@ class TickerWindow(QtWidgets.QWidget):
             self._coord_fetch_count = 0
         self._coord_fetch_count += 1
         if _verbose:
-            print(f"[COORDINATED FETCH] Fetching {len(combined_stocks)} unique stocks for {len(self.tray_icon.ticker_windows)} tickers")
+            colored_print(f"[COORDINATED FETCH] Fetching {len(combined_stocks)} unique stocks for {len(self.tray_icon.ticker_windows)} tickers")
 
         yahoo_tickers = [t for t in combined_stocks if is_yahoo_symbol(t)]
         finnhub_tickers = [t for t in combined_stocks if not is_yahoo_symbol(t)]
@@ -6758,21 +7618,18 @@ class TickerWindow(QtWidgets.QWidget):
 
         if self.websocket_client and market_is_open and not force:
             # During market hours, use websockets for real-time updates
-            if not self.websocket_client.connected:
+            if not self.websocket_client.desired_symbols:
                 colored_print("[WEBSOCKET] 🕐 Market is open - connecting to real-time data")
                 if self.websocket_client.connect():
-                    # Subscribe to all stocks from all tickers
-                    finnhub_symbols = [s for s in combined_stocks if not is_yahoo_symbol(s)]
-                    if finnhub_symbols:
-                        colored_print(f"[WEBSOCKET] Subscribing to {len(finnhub_symbols)} symbols: {finnhub_symbols[:10]}{'...' if len(finnhub_symbols) > 10 else ''}")
-                        self.websocket_client.subscribe_symbols(finnhub_symbols)
-            elif self.websocket_client.connected and not self.websocket_client.subscribed_symbols:
-                # Already connected but not subscribed - subscribe now
-                colored_print("[WEBSOCKET] 🕐 Websocket connected but not subscribed - subscribing to symbols")
-                finnhub_symbols = [s for s in combined_stocks if not is_yahoo_symbol(s)]
-                if finnhub_symbols:
-                    colored_print(f"[WEBSOCKET] Subscribing to {len(finnhub_symbols)} symbols: {finnhub_symbols[:10]}{'...' if len(finnhub_symbols) > 10 else ''}")
-                    self.websocket_client.subscribe_symbols(finnhub_symbols)
+                    # Subscribe to all stocks from all tickers (sharded over the pool)
+                    if finnhub_tickers:
+                        colored_print(f"[WEBSOCKET] Subscribing to {len(finnhub_tickers)} symbols: {finnhub_tickers[:10]}{'...' if len(finnhub_tickers) > 10 else ''}")
+                        self.websocket_client.subscribe_symbols(finnhub_tickers)
+            elif self.websocket_client.desired_symbols != set(finnhub_tickers):
+                # Watchlist changed - the pool diffs each shard's subscriptions
+                self.websocket_client.subscribe_symbols(finnhub_tickers)
+            else:
+                self.websocket_client.rebalance()
 
             # If websockets are connected, skip polling during market hours
             real_time_available = self.websocket_client.is_real_time_available()
@@ -6791,15 +7648,14 @@ class TickerWindow(QtWidgets.QWidget):
                 else:
                     self._last_websocket_status_log = time_module.time()
 
-                # Check cost warning for free tier
-                finnhub_count = len([s for s in combined_stocks if not is_yahoo_symbol(s)])
-                if finnhub_count > 50:
-                    colored_print(f"[WEBSOCKET] ⚠️ WARNING: You have {finnhub_count} Finnhub stocks - free tier supports 50 symbols. "
-                          "Consider upgrading to paid plan to avoid rate limiting.")
-                # Keep polling Yahoo symbols on normal schedule (including always-open crypto)
-                if yahoo_tickers:
-                    tickers_to_fetch = yahoo_tickers
-                else:
+                # Symbols with no websocket slot (over capacity, or their shard is down)
+                # keep being polled alongside Yahoo symbols (including always-open crypto)
+                uncovered = self.websocket_client.uncovered_symbols(finnhub_tickers)
+                if len(finnhub_tickers) > self.websocket_client.capacity:
+                    colored_print(f"[WEBSOCKET] ⚠️ WARNING: You have {len(finnhub_tickers)} Finnhub stocks - websocket capacity is "
+                                  f"{self.websocket_client.capacity}. Add API keys or upgrade to avoid polling the rest.")
+                tickers_to_fetch = yahoo_tickers + uncovered
+                if not tickers_to_fetch:
                     return
             else:
                 tickers_to_fetch = combined_stocks
@@ -6811,11 +7667,12 @@ class TickerWindow(QtWidgets.QWidget):
             if tickers_to_fetch and all(is_yahoo_symbol(t) for t in tickers_to_fetch):
                 colored_print("[UPDATE] In Finnhub backoff, continuing Yahoo-only polling")
             else:
-                print(f"[UPDATE] Skipping fetch - in backoff until {time_module.strftime('%H:%M:%S', time_module.localtime(TickerWindow.backoff_until))}")
+                colored_print(f"[UPDATE] Skipping fetch - in backoff until {time_module.strftime('%H:%M:%S', time_module.localtime(TickerWindow.backoff_until))}")
                 return
 
         # Disconnect websockets after market hours to save costs
-        if self.websocket_client and not market_is_open and self.websocket_client.connected:
+        if self.websocket_client and not market_is_open and (self.websocket_client.connected or
+                                                              self.websocket_client.desired_symbols):
             colored_print("[WEBSOCKET] 🌙 Market closed - disconnecting to save costs")
             _ws = self.websocket_client
             import threading as _thr
@@ -6841,10 +7698,12 @@ class TickerWindow(QtWidgets.QWidget):
         # Get second API key if configured (reuse same cached settings dict)
         api_key_2 = _cs.get("finnhub_api_key_2", "").strip() or None
 
-        # Run fetch in a worker thread to avoid blocking the UI
+        # Run fetch in a worker thread to avoid blocking the UI; chunks are streamed
+        # back through partial_prices_ready so symbols repaint as they arrive
         def fetch_and_handle():
             tickers = tickers_to_fetch
-            prices, had_429 = fetch_all_stock_prices_with_429(tickers, api_key or "", api_key_2, force=force)
+            prices, had_429 = fetch_all_stock_prices_with_429(tickers, api_key or "", api_key_2, force=force,
+                                                              on_partial=self.partial_prices_ready.emit)
             # Use QTimer to call the handler in the main thread
             QtCore.QTimer.singleShot(0, lambda: self._handle_coordinated_prices(prices, had_429, now))
 
@@ -6891,16 +7750,12 @@ class TickerWindow(QtWidgets.QWidget):
                         ticker.bloom_cache_valid = False
                         ticker.last_api_update_time = now
                         QtCore.QTimer.singleShot(0, ticker._process_price_update_deferred)
-                        print(f"[PRIMARY UPDATE] Distributed inplace prices to secondary ticker")
+                        colored_print(f"[PRIMARY UPDATE] Distributed inplace prices to secondary ticker")
                     except Exception:
                         pass
         except Exception:
             pass
 
-        # Run garbage collection during idle time (after price updates) to prevent stutters during rendering
-        import gc
-        gc.collect(generation=0)  # Quick collection of youngest generation only
-
     @QtCore.pyqtSlot(str, float, float)
     def update_price_from_websocket(self, symbol, price, timestamp):
         """Handle real-time price updates from websocket - batched for performance"""
@@ -7019,6 +7874,7 @@ class TickerWindow(QtWidgets.QWidget):
                             prev_close = old_prev_close
                     else:
                         self.failed_fetch_counts[tkr] = 0
+                        self._snapshot_symbols.discard(tkr)
                         if prev_close is None and old_prev_close is not None:
                             prev_close = old_prev_close
                     
@@ -7090,6 +7946,7 @@ class TickerWindow(QtWidgets.QWidget):
                         prev_close = old_prev_close
                 else:
                     self.failed_fetch_counts[tkr] = 0
+                    self._snapshot_symbols.discard(tkr)
                     if prev_close is None and old_prev_close is not None:
                         prev_close = old_prev_close
                 
@@ -7208,7 +8065,7 @@ class TickerWindow(QtWidgets.QWidget):
         """Execute the coalesced pixmap rebuild (called from event loop, never mid-frame)."""
         self._pixmap_rebuild_pending = False
         try:
-            self.build_ticker_pixmaps()
+            self.rebuild_ticker_pixmaps()
             if hasattr(self, 'gl_widget') and self.gl_widget:
                 self.gl_widget.update()
         except Exception as e:
@@ -7326,41 +8183,286 @@ class TickerWindow(QtWidgets.QWidget):
             # is never blocked for a long time (avoids scroll stutter on price refresh)
             self.queue_incremental_pixmap_updates(list(self.stocks))
         else:
-            self.build_ticker_pixmaps()
+            self.rebuild_ticker_pixmaps()
     
     def build_ticker_pixmaps(self):
-        self.ticker_pixmaps = []
-        self.ticker_ghost_pixmaps = []  # Cached tinted versions for ghosting layers
-        self.ticker_pixmap_widths = []
-        self.ticker_area_templates = []
-        
-        # Invalidate bloom cache when ticker content changes
-        self.bloom_cache_valid = False
-        # Clear donate ghost pixmap placeholder
-        self._donate_ghost_pixmap = None
-        
-        # Don't clear ghost_frames here - we're making deep copies so they remain valid
-        
+        """Rebuild every tile now (blocks until done); see rebuild_ticker_pixmaps for the background path"""
         # Get settings once for entire function to avoid disk I/O in tight loop
         settings = self._cached_settings if hasattr(self, '_cached_settings') else get_settings()
+        layout = self._tile_layout(settings)
+
+        # Icons are cached per size (in memory and as processed files on disk), so a
+        # size change just starts hitting other entries; old sizes age out of the LRU
+        if self.current_icon_size != layout.icon_size:
+            print(f"[PERF] Icon size changed from {self.current_icon_size} to {layout.icon_size}")
+            self.current_icon_size = layout.icon_size
+
+        images = {}
+        specs = [self._tile_spec(tkr, layout, images) for tkr in self.stocks]
+        self._tile_images = images  # Drops images of symbols no longer shown
+        self._tile_generation += 1  # A background build still running is now stale
+        tiles = get_tile_render_pool().render(specs, layout, calculate_pixmap_dominant_color)
+        self._install_tiles(tiles, layout, self._price_slot_key(), settings)
+
+    def rebuild_ticker_pixmaps(self):
+        """Rebuild every tile without blocking the GUI thread.
+
+        Tiles are rendered on PixmapRebuildWorker while the current ones keep
+        scrolling - also when the symbol list, font or height changed, in which
+        case the old tiles stay up until the swap (a window with none yet shows
+        nothing until then). The results are converted to pixmaps a slice per
+        frame and swapped in together. Builds synchronously only when
+        background_tile_rendering is off.
+        """
+        settings = self._cached_settings if hasattr(self, '_cached_settings') else get_settings()
+        if not settings.get("background_tile_rendering", True):
+            self.build_ticker_pixmaps()
+            return
+        if self._pixmap_worker is not None or self._tile_install is not None:
+            self._tile_rebuild_requested = True  # Runs again when the current build lands
+            return
 
-        
+        layout = self._tile_layout(settings)
+        images = {}
+        specs = [self._tile_spec(tkr, layout, images) for tkr in self.stocks]
+        self._tile_images = images
+        self._tile_generation += 1
+        self._tiles_touched = set()
+        self._tile_rebuild_requested = False
+        worker = PixmapRebuildWorker(self, self._tile_generation, specs, layout)
+        worker.tiles_ready.connect(self._on_background_tiles_ready)
+        worker.finished.connect(self._on_pixmap_worker_finished)
+        self._pixmap_worker = worker
+        worker.start(QtCore.QThread.LowPriority)
+
+    def build_ticker_pixmaps_background(self, specs, layout):
+        """Render tiles for specs (called on PixmapRebuildWorker's thread)"""
+        return get_tile_render_pool().render(specs, layout, calculate_pixmap_dominant_color)
+
+    # GUI-thread time per slice when turning a background build's QImages into QPixmaps
+    TILE_CONVERT_BUDGET_MS = 2.0
+
+    def _on_background_tiles_ready(self, generation, tiles):
+        """Start converting a finished background build unless something newer replaced it"""
+        if generation != self._tile_generation:
+            log_debug("PIXMAP", "Dropped stale background tiles (generation %d, now %d)", generation, self._tile_generation)
+            if self._pixmap_worker.layout.key != self._price_slot_key():
+                get_glow_sprite_cache().release_pinned(self._pixmap_worker.layout.key)
+            return
+        if [tile.spec.symbol for tile in tiles] != self.stocks:
+            # Error, or the symbol list changed while rendering
+            self._tile_rebuild_requested = True
+            return
+        self._tile_install = (generation, tiles, self._pixmap_worker.layout, [])
+        self._continue_tile_install()
+
+    def _continue_tile_install(self):
+        """Convert the next slice of the pending background build; swap it in once complete.
+
+        QPixmap.fromImage is a full copy per tile, so a large watchlist is converted
+        over several event-loop turns (frames keep painting the old tiles meanwhile).
+        """
+        install = self._tile_install
+        if install is None:
+            return
+        generation, tiles, layout, pixmaps = install
+        if generation != self._tile_generation:
+            self._tile_install = None  # A synchronous build replaced it
+            self._after_tile_install()
+            return
+        deadline = time.perf_counter() + self.TILE_CONVERT_BUDGET_MS / 1000.0
+        while len(pixmaps) < len(tiles):
+            tile = tiles[len(pixmaps)]
+            pixmaps.append((QtGui.QPixmap.fromImage(tile.image), QtGui.QPixmap.fromImage(tile.ghost)))
+            if time.perf_counter() >= deadline:
+                break
+        if len(pixmaps) < len(tiles):
+            QtCore.QTimer.singleShot(0, self._continue_tile_install)
+            return
+
+        self._tile_install = None
+        settings = self._cached_settings if hasattr(self, '_cached_settings') else get_settings()
+        t0 = time.perf_counter()
+        self._install_tiles(tiles, layout, self._price_slot_key(), settings, pixmaps)
+        log_debug("PIXMAP", "Swapped in %d background tiles in %.1f ms", len(tiles), (time.perf_counter() - t0) * 1000.0)
+        # Tiles patched in place while rendering were built from older prices
+        touched, self._tiles_touched = self._tiles_touched, set()
+        if touched:
+            self.queue_incremental_pixmap_updates([tkr for tkr in self.stocks if tkr in touched])
+        if hasattr(self, 'gl_widget') and self.gl_widget:
+            self.gl_widget.update()
+        self._after_tile_install()
+
+    def _after_tile_install(self):
+        if self._tile_rebuild_requested and self._pixmap_worker is None:
+            self._tile_rebuild_requested = False
+            self.rebuild_ticker_pixmaps()
+
+    def _on_pixmap_worker_finished(self):
+        self._pixmap_worker = None
+        if self._tile_install is None:
+            self._after_tile_install()
+
+    def _tile_layout(self, settings):
+        """Per-build tile constants for tile_renderer (fonts, geometry, effect settings)"""
         metrics = QtGui.QFontMetrics(self.ticker_font)
         if USE_OPT:
             icon_size = opt.calculate_icon_size(self.ticker_height, 0.85)
+            icon_y = opt.calculate_icon_y_position(self.ticker_height, icon_size)
+            text_y = opt.calculate_text_position(self.ticker_height, metrics.ascent(), metrics.descent())
         else:
             icon_size = int(self.ticker_height * 0.85)  # Icon a little larger than font size, leaves 15% padding
-        
-        # If icon size changed, clear cache to remove old sizes
-        if self.current_icon_size != icon_size:
-            print(f"[PERF] Icon size changed from {self.current_icon_size} to {icon_size}, clearing cache")
-            self.icon_cache.clear()
-            self.current_icon_size = icon_size
-        
+            icon_y = (self.ticker_height - icon_size) // 2
+            text_y = (self.ticker_height + metrics.ascent() - metrics.descent()) // 2
+
         small_font = QtGui.QFont(self.ticker_font)
         small_font.setPointSize(max(8, int(self.ticker_font.pointSize() * 0.5)))
         small_metrics = QtGui.QFontMetrics(small_font)
-        
+        arrow_font = QtGui.QFont(small_font)
+        arrow_font.setPointSize(int(small_font.pointSize() * 0.7))  # Thin arrows are drawn smaller
+        stacked_top = (self.ticker_height - (small_metrics.height() * 2 + 2)) // 2 + small_metrics.ascent()
+
+        indicator_style = settings.get("price_indicator_style", "triangles")
+        indicator_size = int(self.ticker_height * 0.42)  # ~42% of ticker height
+        sep = "      "
+        ghost_tint_override = None
+        if getattr(self, '_ghost_debug_force_visible', False):
+            ghost_tint_override = getattr(self, '_ghost_debug_force_tint', None)
+        return TileLayout(
+            height=self.ticker_height,
+            font=QtGui.QFont(self.ticker_font),
+            small_font=small_font,
+            arrow_font=arrow_font,
+            number_metrics=get_glyph_metrics(self.ticker_font),
+            small_number_metrics=get_glyph_metrics(small_font),
+            icon_size=icon_size,
+            icon_y=icon_y,
+            text_y=text_y,
+            sep=sep,
+            sep_width=metrics.horizontalAdvance(sep),
+            sparkline_width=max(50, int(self.ticker_height * 0.85)),
+            sparkline_gap=6,
+            sparkline_position=getattr(self, 'sparkline_position', 'left') if self.show_sparklines else None,
+            stacked_top=stacked_top,
+            pct_y=stacked_top + small_metrics.height() + 2,
+            small_ascent=small_metrics.ascent(),
+            arrow_ascent=QtGui.QFontMetrics(arrow_font).ascent(),
+            indicator_style=indicator_style,
+            indicator_size=indicator_size,
+            indicator_width=indicator_width(indicator_style, indicator_size),
+            text_glow=QtGui.QColor(255, 255, 255, 15) if settings.get("global_text_glow", True) else None,
+            subtle_glow_offsets=opt.get_subtle_glow_offsets() if USE_OPT else self.SUBTLE_GLOW_OFFSETS,
+            glow_offsets=opt.get_glow_offsets() if USE_OPT else self.GLOW_OFFSETS,
+            name_color=QtGui.QColor("#00B3FF"),
+            ghost_intensity=settings.get("led_ghost_intensity", 100),
+            ghost_tint_override=ghost_tint_override,
+            key=self._glow_pin_owner(),
+        )
+
+    def _glow_pin_owner(self):
+        """Layout key to pin glow sprites (names, labels) under; see _release_glow_pins"""
+        key = self._price_slot_key()
+        self._glow_pin_owners.add(key)
+        return key
+
+    def _release_glow_pins(self, keep=None):
+        """Drop the glow sprites this window pinned under layout keys other than keep"""
+        cache = get_glow_sprite_cache()
+        for owner in self._glow_pin_owners - {keep}:
+            cache.release_pinned(owner)
+        self._glow_pin_owners &= {keep}
+
+    def _tile_spec(self, tkr, layout, images):
+        """TileSpec for tkr from the current prices, glow effects and icon/sparkline caches"""
+        price, prev = self.prices.get(tkr, (None, None))
+        icon = get_ticker_icon(tkr, layout.icon_size)
+        sparkline = None
+        if layout.sparkline_position:
+            sparkline = self._get_sparkline_pixmap(tkr, layout.sparkline_width, max(12, int(self.ticker_height * 0.34)))
+
+        price_text = f"{price:.2f}" if price is not None else "N/A"
+        change_text = ""
+        pct_text = ""
+        change = 0
+        triangle_rotation = 90  # Default to right-pointing (no change)
+        if price is not None and prev is not None:
+            change = price - prev
+            pct = (change / prev * 100) if prev else 0
+            triangle_rotation = self.get_triangle_rotation(pct)
+            if change > 0:
+                change_text = f"+{abs(change):.2f}"
+                pct_text = f"+{abs(pct):.2f}%"
+            elif change < 0:
+                change_text = f"-{abs(change):.2f}"
+                pct_text = f"-{abs(pct):.2f}%"
+            else:  # change == 0
+                change_text = f"{change:.2f}"
+                pct_text = f"{pct:.2f}%"
+
+        # Check for glow effect on big price changes
+        change_percent = 0
+        if price is not None and prev is not None and prev != 0:
+            if USE_OPT:
+                change_percent = opt.calculate_change_percent(price, prev)
+            else:
+                change_percent = ((price - prev) / prev) * 100
+        glow_color = self.get_glow_effect(tkr, change_percent)
+
+        # Change colour: green for positive, red for negative, white for zero
+        if change > 0:
+            color = QtGui.QColor("#00FF40")
+        elif change < 0:
+            color = QtGui.QColor("#F4444E")
+        else:
+            color = QtGui.QColor("#FFFFFF")
+        if change_text:
+            stale_fade_factor = self.get_stale_fade_factor(tkr)
+            color = self.apply_fade_to_color(color, stale_fade_factor)
+            change_glow_color = self.apply_fade_to_color(glow_color, stale_fade_factor)
+        else:
+            change_glow_color = glow_color
+
+        return TileSpec(
+            symbol=tkr,
+            display_name=ticker_display_name(tkr),
+            icon=self._tile_image(icon, images),
+            sparkline=self._tile_image(sparkline, images),
+            price_text=price_text,
+            price_color=self.get_display_price_color(tkr, price, prev),
+            glow_color=glow_color,
+            change_text=change_text,
+            pct_text=pct_text,
+            change_color=color,
+            change_glow_color=change_glow_color,
+            rotation=triangle_rotation,
+            icon_key=icon.cacheKey(),
+            sparkline_key=sparkline.cacheKey() if sparkline is not None else None,
+        )
+
+    def _tile_image(self, pixmap, images):
+        """QImage of a cached icon or sparkline pixmap (converted once per cacheKey)"""
+        if pixmap is None or pixmap.isNull():
+            return None
+        key = pixmap.cacheKey()
+        image = images.get(key)
+        if image is None:
+            image = self._tile_images.get(key)
+            if image is None:
+                image = pixmap.toImage()
+            images[key] = image
+        return image
+
+    def _install_tiles(self, tiles, layout, slot_key, settings, pixmaps=None):
+        """Turn rendered tiles into the window's tile lists (plus the market status and
+        donate tiles) and swap them in together. pixmaps: (tile, ghost) QPixmaps
+        already converted from the tiles' images, when the caller has them."""
+        ticker_pixmaps = []
+        ticker_ghost_pixmaps = []
+        ticker_pixmap_widths = []
+        ticker_area_templates = []
+        price_slots = {}
+        metrics = QtGui.QFontMetrics(self.ticker_font)
+
         # Create market status pixmap first
         market_text, market_color, status_text, status_color = get_market_status_info()
         market_text_width = metrics.horizontalAdvance(market_text + " ")
@@ -7438,7 +8540,9 @@ class TickerWindow(QtWidgets.QWidget):
         mgp.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
         # Compute subdued tint from the market pixmap's dominant color
         galpha_pct = settings.get("led_ghost_tint_alpha", 45)
-        dominant = calculate_pixmap_dominant_color(market_pixmap)
+        dominant = calculate_pixmap_dominant_color(market_pixmap, cache_key=(
+            "market", market_text, market_color.rgba(), status_text, status_color.rgba(),
+            market_icon.cacheKey() if market_icon else None, slot_key))
         # Amplify color using user-set color strength so ghosts reflect the item color
         color_strength = settings.get("led_ghost_color_strength", 140) / 100.0
         sub_r = int(min(255, dominant.red() * color_strength + 40))
@@ -7481,300 +8585,26 @@ class TickerWindow(QtWidgets.QWidget):
         market_inserted = False
 
         def append_market_status_item():
-            self.ticker_pixmaps.append(market_pixmap)
-            self.ticker_ghost_pixmaps.append(market_ghost)
-            self.ticker_pixmap_widths.append(market_total_width)
-            self.ticker_area_templates.append(market_area_template)
+            ticker_pixmaps.append(market_pixmap)
+            ticker_ghost_pixmaps.append(market_ghost)
+            ticker_pixmap_widths.append(market_total_width)
+            ticker_area_templates.append(market_area_template)
 
-        for tkr in self.stocks:
+        for index, tile in enumerate(tiles):
+            tkr = tile.spec.symbol
             # Insert market status after all crypto ($) tickers, before non-crypto tickers
             if show_market_status and not market_inserted and not is_crypto_symbol(tkr):
                 append_market_status_item()
                 market_inserted = True
-            display_name = ticker_display_name(tkr)
-            
-            price, prev = self.prices.get(tkr, (None, None))
-            icon = get_ticker_icon(tkr, icon_size)
-            tkr_width = metrics.horizontalAdvance(display_name + " ")
-            sparkline_width = max(50, int(self.ticker_height * 0.85)) if self.show_sparklines else 0
-            sparkline_gap = 6 if self.show_sparklines else 0
-            price_text = f"{price:.2f}" if price is not None else "N/A"
-            price_width = metrics.horizontalAdvance(price_text)
-            change_text = ""
-            pct_text = ""
-            change = 0
-            pct = 0
-            triangle_rotation = 90  # Default to right-pointing (no change)
-            if price is not None and prev is not None:
-                change = price - prev
-                pct = (change / prev * 100) if prev else 0
-                
-                # Calculate rotation angle for triangle
-                triangle_rotation = self.get_triangle_rotation(pct)
-                
-                if change > 0:
-                    change_text = f"+{abs(change):.2f}"
-                    pct_text = f"+{abs(pct):.2f}%"
-                elif change < 0:
-                    change_text = f"-{abs(change):.2f}"
-                    pct_text = f"-{abs(pct):.2f}%"
-                else:  # change == 0
-                    change_text = f"{change:.2f}"
-                    pct_text = f"{pct:.2f}%"
-            change_width = max(small_metrics.horizontalAdvance(change_text), small_metrics.horizontalAdvance(pct_text)) if (change_text or pct_text) else 0
-            
-            # Reserve enough horizontal space for the indicator so following content
-            # (e.g., right-side sparklines) never overlaps, regardless of digit count.
-            if change_text or pct_text:
-                indicator_style_for_width = settings.get("price_indicator_style", "triangles")
-                if indicator_style_for_width == "thin_arrows":
-                    triangle_width = 14
-                else:
-                    indicator_size_for_width = int(self.ticker_height * 0.42)
-                    leg_w = max(2, int((indicator_size_for_width / 2) * 0.9))
-                    triangle_width = 2 + 2 * leg_w + 6
-            else:
-                triangle_width = 0
-            sep = "      "
-            sep_width = metrics.horizontalAdvance(sep)
-            total_width = icon_size + 8 + tkr_width + sparkline_gap + sparkline_width + sparkline_gap + price_width + (10 + change_width + triangle_width if change_width else 0) + sep_width + 20
-            
-            # Use memory pool for ticker pixmap if available
-            if USE_MEMORY_POOL:
-                pixmap = get_pooled_pixmap(total_width, self.ticker_height)
-            else:
-                pixmap = QtGui.QPixmap(total_width, self.ticker_height)
-            pixmap.fill(QtCore.Qt.transparent)
-            painter = QtGui.QPainter(pixmap)
-            x = 0
-            # Center icon vertically
-            if USE_OPT:
-                icon_y = opt.calculate_icon_y_position(self.ticker_height, icon_size)
-            else:
-                icon_y = (self.ticker_height - icon_size) // 2
-            painter.drawPixmap(x, icon_y, icon)
-            x += icon_size + 8
-            # Center text vertically
-            if USE_OPT:
-                tkr_y = opt.calculate_text_position(self.ticker_height, metrics.ascent(), metrics.descent())
-            else:
-                tkr_y = (self.ticker_height + metrics.ascent() - metrics.descent()) // 2
-            symbol_rect = QtCore.QRect(x, 0, tkr_width, self.ticker_height)
-            painter.setFont(self.ticker_font)
-            self.draw_text_with_global_glow(painter, x, tkr_y, display_name, QtGui.QColor("#00B3FF"), settings=settings)
-            x += tkr_width
-
-            if self.show_sparklines and getattr(self, 'sparkline_position', 'left') == 'left':
-                sparkline_height = max(12, int(self.ticker_height * 0.34))
-                sparkline = self._get_sparkline_pixmap(tkr, sparkline_width, sparkline_height)
-                sparkline_y = (self.ticker_height - sparkline.height()) // 2
-                painter.drawPixmap(x + sparkline_gap, sparkline_y, sparkline)
-                x += sparkline_gap + sparkline_width + sparkline_gap
-
-            price_y = tkr_y
-            price_color = self.get_display_price_color(tkr, price, prev)
-            
-            # Calculate change percentage for glow effect
-            change_percent = 0
-            if price is not None and prev is not None and prev != 0:
-                if USE_OPT:
-                    change_percent = opt.calculate_change_percent(price, prev)
-                else:
-                    change_percent = ((price - prev) / prev) * 100
-            
-            # Check for glow effect on big price changes
-            glow_color = self.get_glow_effect(tkr, change_percent)
-            
-            price_rect = QtCore.QRect(x, 0, price_width, self.ticker_height)
-            
-            # Draw price text with appropriate glow
-            painter.setFont(self.ticker_font)
-            if glow_color:
-                # Draw 5% glow effect (more intense, colored) - replaces global glow
-                painter.setPen(glow_color)
-                if USE_OPT:
-                    for dx, dy in opt.get_glow_offsets():
-                        painter.drawText(x + dx, price_y + dy, price_text)
-                else:
-                    for dx in [-2, -1, 0, 1, 2]:
-                        for dy in [-2, -1, 0, 1, 2]:
-                            if dx != 0 or dy != 0:
-                                painter.drawText(x + dx, price_y + dy, price_text)
-                # Draw main price text without global glow (5% glow is sufficient)
-                painter.setPen(price_color)
-                painter.drawText(x, price_y, price_text)
+            if pixmaps is not None:
+                pixmap, ghost_pixmap = pixmaps[index]
             else:
-                # No 5% glow, use global glow if enabled
-                self.draw_text_with_global_glow(painter, x, price_y, price_text, price_color, settings=settings)
-            x += price_width
-            change_rect = None  # Initialize change_rect
-            if change_text or pct_text:
-                painter.setFont(small_font)
-                stacked_height = small_metrics.height() * 2 + 2
-                stacked_top = (self.ticker_height - stacked_height) // 2 + small_metrics.ascent()
-                # Determine color: green for positive, red for negative, white for zero
-                if change > 0:
-                    color = QtGui.QColor("#00FF40")  # Green
-                elif change < 0:
-                    color = QtGui.QColor("#F4444E")  # Red
-                else:
-                    color = QtGui.QColor("#FFFFFF")  # White for zero change
-
-                stale_fade_factor = self.get_stale_fade_factor(tkr)
-                color = self.apply_fade_to_color(color, stale_fade_factor)
-                if glow_color:
-                    glow_color = self.apply_fade_to_color(glow_color, stale_fade_factor)
-                
-                # Create rect for change area (for bloom effect) - now includes triangle
-                change_rect = QtCore.QRect(x + 10, 0, change_width + triangle_width, self.ticker_height)
-                
-                painter.setFont(small_font)
-                
-                # Apply glow effect to change text if 5% glow is active
-                # Right-align both rows within change_width so their right edges are flush
-                change_indent = change_width - small_metrics.horizontalAdvance(change_text)
-                pct_indent = change_width - small_metrics.horizontalAdvance(pct_text)
-                if glow_color:
-                    painter.setPen(glow_color)
-                    if USE_OPT:
-                        for dx, dy in opt.get_glow_offsets():
-                            painter.drawText(x + 10 + change_indent + dx, stacked_top + dy, change_text)
-                            painter.drawText(x + 10 + pct_indent + dx, stacked_top + small_metrics.height() + 2 + dy, pct_text)
-                    else:
-                        for dx in [-2, -1, 0, 1, 2]:
-                            for dy in [-2, -1, 0, 1, 2]:
-                                if dx != 0 or dy != 0:
-                                    painter.drawText(x + 10 + change_indent + dx, stacked_top + dy, change_text)
-                                    painter.drawText(x + 10 + pct_indent + dx, stacked_top + small_metrics.height() + 2 + dy, pct_text)
-                    # Draw main text without global glow (5% glow is sufficient)
-                    painter.setPen(color)
-                    painter.drawText(x + 10 + change_indent, stacked_top, change_text)
-                    painter.drawText(x + 10 + pct_indent, stacked_top + small_metrics.height() + 2, pct_text)
-                else:
-                    # No 5% glow, use global glow if enabled
-                    self.draw_text_with_global_glow(painter, x + 10 + change_indent, stacked_top, change_text, color, settings=settings)
-                    self.draw_text_with_global_glow(painter, x + 10 + pct_indent, stacked_top + small_metrics.height() + 2, pct_text, color, settings=settings)
-                
-                # Draw rotated indicator (triangle, arrow, or thin arrow) to the right of the change_text (top line)
-                # Check which indicator style to use
-                indicator_style = settings.get("price_indicator_style", "triangles")
-                
-                # Position indicator 2px past the right edge of the stacked block (consistent for all stocks)
-                # Triangle is drawn CENTERED at indicator_x; its left edge extends leg_component
-                # pixels left of center. Offset by leg_component so left edge = text_right + 2px.
-                indicator_size = int(self.ticker_height * 0.42)  # ~42% of ticker height
-                leg_component = max(2, int((indicator_size / 2) * 0.9))
-                indicator_x = x + 10 + change_width + 2 + leg_component
-                
-                # Position indicator centered on the text line with rotation-based adjustment
-                base_indicator_y = stacked_top - small_metrics.ascent() // 2
-                # Adjust Y position based on rotation to keep visual center aligned
-                if triangle_rotation == 0:  # Up
-                    indicator_y = base_indicator_y + 2  # Move down slightly (top-heavy)
-                elif triangle_rotation == 180:  # Down
-                    indicator_y = base_indicator_y - 2  # Move up slightly (bottom-heavy)
-                elif triangle_rotation in [45, 135]:  # Diagonal
-                    indicator_y = base_indicator_y  # No adjustment needed
-                else:  # 90 (right)
-                    indicator_y = base_indicator_y  # No adjustment needed
-                
-                if indicator_style == "thin_arrows":
-                    # Use Unicode arrow symbols for thin arrows
-                    arrow_map = {
-                        0: "↑",     # Up
-                        45: "↗",    # Up-right
-                        90: "→",    # Right
-                        135: "↘",   # Down-right
-                        180: "↓"    # Down
-                    }
-                    arrow_symbol = arrow_map.get(triangle_rotation, "→")
-                    
-                    # Make arrows smaller
-                    arrow_font = QtGui.QFont(small_font)
-                    arrow_font.setPointSize(int(small_font.pointSize() * 0.7))  # Smaller arrows
-                    
-                    # Position arrows well above baseline to center them with the text height
-                    arrow_metrics = QtGui.QFontMetrics(arrow_font)
-                    arrow_y = stacked_top - arrow_metrics.ascent() // 2
-                    
-                    # Draw thin arrow with glow if 5% effect is active
-                    if glow_color:
-                        painter.setPen(glow_color)
-                        painter.setFont(arrow_font)
-                        for dx in [-1, 0, 1]:
-                            for dy in [-1, 0, 1]:
-                                if dx != 0 or dy != 0:
-                                    painter.drawText(indicator_x + dx, arrow_y + dy, arrow_symbol)
-                        # Draw main thin arrow
-                        painter.setPen(color)
-                        painter.drawText(indicator_x, arrow_y, arrow_symbol)
-                    else:
-                        # No glow, use global glow if enabled
-                        painter.setFont(arrow_font)
-                        painter.setPen(color)
-                        painter.drawText(indicator_x, arrow_y, arrow_symbol)
-                        painter.setFont(small_font)  # Restore small font
-                else:
-                    # Draw indicator with glow if 5% effect is active
-                    if glow_color:
-                        # Draw glow halos for indicator
-                        for dx in [-1, 0, 1]:
-                            for dy in [-1, 0, 1]:
-                                if dx != 0 or dy != 0:
-                                    if indicator_style == "arrows":
-                                        self.draw_rotated_arrow(painter, indicator_x + dx, indicator_y + dy, 
-                                                              indicator_size, triangle_rotation, glow_color)
-                                    else:  # triangles
-                                        self.draw_rotated_triangle(painter, indicator_x + dx, indicator_y + dy, 
-                                                              indicator_size, triangle_rotation, glow_color)
-                    
-                    # Draw main indicator
-                    if indicator_style == "arrows":
-                        self.draw_rotated_arrow(painter, indicator_x, indicator_y, 
-                                              indicator_size, triangle_rotation, color)
-                    else:  # triangles
-                        self.draw_rotated_triangle(painter, indicator_x, indicator_y, 
-                                              indicator_size, triangle_rotation, color)
-                
-                painter.setFont(self.ticker_font)
-                x += 10 + change_width + triangle_width
-
-            if self.show_sparklines and getattr(self, 'sparkline_position', 'left') == 'right':
-                sparkline_height = max(12, int(self.ticker_height * 0.34))
-                sparkline = self._get_sparkline_pixmap(tkr, sparkline_width, sparkline_height)
-                sparkline_y = (self.ticker_height - sparkline.height()) // 2
-                painter.drawPixmap(x + sparkline_gap, sparkline_y, sparkline)
-                x += sparkline_gap + sparkline_width + sparkline_gap
-            painter.setFont(self.ticker_font)
-            self.draw_text_with_global_glow(painter, x, tkr_y, sep, QtGui.QColor("#00B3FF"), settings=settings)
-            painter.end()
-            # Cache ghost (tinted) version for this pixmap for fast ghost rendering
-            ghost_pixmap = QtGui.QPixmap(pixmap.size())
-            ghost_pixmap.fill(QtCore.Qt.transparent)
-            ggp = QtGui.QPainter(ghost_pixmap)
-            ggp.drawPixmap(0, 0, pixmap)
-            ggp.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
-            # Compute ghost color strength and alpha from single intensity setting
-            intensity = settings.get("led_ghost_intensity", 100)
-            galpha_pct = int(intensity * 0.45)
-            color_strength = intensity * 1.4 / 100.0
-            dominant = calculate_pixmap_dominant_color(pixmap)
-            sub_r = int(min(255, dominant.red() * color_strength + 40))
-            sub_g = int(min(255, dominant.green() * color_strength + 40))
-            sub_b = int(min(255, dominant.blue() * color_strength + 40))
-            tint_color = QtGui.QColor(sub_r, sub_g, sub_b)
-            tint_color.setAlpha(int(galpha_pct * 2.55))
-
-            # DEBUG OVERRIDE: force vivid tint if debug mode enabled
-            if getattr(self, '_ghost_debug_force_visible', False):
-                tint_color = getattr(self, '_ghost_debug_force_tint', tint_color)
-
-            ggp.fillRect(ghost_pixmap.rect(), tint_color)
-            ggp.end()
+                pixmap = QtGui.QPixmap.fromImage(tile.image)
+                ghost_pixmap = QtGui.QPixmap.fromImage(tile.ghost)
 
             if getattr(self, '_ghost_debug_logging', False):
                 try:
-                    img = ghost_pixmap.toImage()
+                    img = tile.ghost
                     w = img.width(); h = img.height()
                     cx, cy = w//2, h//2
                     center_alpha = img.pixelColor(cx, cy).alpha()
@@ -7784,25 +8614,16 @@ class TickerWindow(QtWidgets.QWidget):
                             ssum += img.pixelColor(sx, sy).alpha()
                             scount += 1
                     avg_alpha = ssum // scount if scount else 0
-                    print(f"[GHOST BUILD DEBUG] pixmap for {display_name} center_alpha={center_alpha}, avg_center_alpha={avg_alpha}, tint_alpha={tint_color.alpha()}")
+                    print(f"[GHOST BUILD DEBUG] pixmap for {tile.spec.display_name} center_alpha={center_alpha}, avg_center_alpha={avg_alpha}, tint_alpha={tile.tint.alpha()}")
                 except Exception:
                     pass
 
-            self.ticker_pixmaps.append(pixmap)
-            self.ticker_ghost_pixmaps.append(ghost_pixmap)
-            self.ticker_pixmap_widths.append(total_width)
-            # Add change_rect to areas if it exists
-            if change_rect:
-                self.ticker_area_templates.append([
-                    ('symbol', tkr, symbol_rect),
-                    ('price', tkr, price_rect),
-                    ('change', tkr, change_rect)
-                ])
-            else:
-                self.ticker_area_templates.append([
-                    ('symbol', tkr, symbol_rect),
-                    ('price', tkr, price_rect)
-                ])
+            ticker_pixmaps.append(pixmap)
+            ticker_ghost_pixmaps.append(ghost_pixmap)
+            ticker_pixmap_widths.append(tile.width)
+            ticker_area_templates.append(tile.areas)
+            if tile.change_x is not None:
+                price_slots[tkr] = PriceSlot(pixmap, ghost_pixmap, tile.tint, slot_key, tile.spec)
 
         # If market status not yet inserted (all crypto tickers, or empty list), append now
         if show_market_status and not market_inserted:
@@ -7880,7 +8701,7 @@ class TickerWindow(QtWidgets.QWidget):
         intensity = settings.get("led_ghost_intensity", 100)
         galpha_pct = int(intensity * 0.45)
         color_strength = intensity * 1.4 / 100.0
-        dominant = calculate_pixmap_dominant_color(donate_pixmap)
+        dominant = calculate_pixmap_dominant_color(donate_pixmap, cache_key=("donate", slot_key))
         sub_r = int(min(255, dominant.red() * color_strength + 40))
         sub_g = int(min(255, dominant.green() * color_strength + 40))
         sub_b = int(min(255, dominant.blue() * color_strength + 40))
@@ -7893,335 +8714,164 @@ class TickerWindow(QtWidgets.QWidget):
         self._donate_ghost_pixmap = donate_ghost
         self._donate_pixmap_width = donate_pixmap_width
         self._donate_area_template = [('donate', 'DONATE', QtCore.QRect(0, 0, donate_pixmap_width, donate_height))]
+        # Swap the whole set in at once; paint never sees a half-built list
+        self.ticker_pixmaps = ticker_pixmaps
+        self.ticker_ghost_pixmaps = ticker_ghost_pixmaps  # Cached tinted versions for ghosting layers
+        self.ticker_pixmap_widths = ticker_pixmap_widths
+        self.ticker_area_templates = ticker_area_templates
+        self._price_slots = price_slots
+        self._tile_symbols = [tile.spec.symbol for tile in tiles]
+        self._tile_geometry = (layout.font.key(), layout.height)
+        # Names and labels pinned for an older font, height or settings are never drawn again
+        self._release_glow_pins(keep=slot_key)
+        # Invalidate bloom cache when ticker content changes
+        self.bloom_cache_valid = False
+        self._strip_renderer.invalidate()
+        self._ghost_renderer.invalidate()
+        self.invalidate_bloom_layer()
 
     def build_ticker_pixmaps_for_symbols(self, symbols):
         """Incrementally rebuild pixmaps for the given list of symbols.
-        This replaces only the affected pixmaps in-place to minimize stutter.
+        Price ticks that only change digits are patched in place right away; other
+        tiles are rendered on the tile pool and replaced in place when they land
+        (_on_incremental_tiles_ready), so the GUI thread never waits on them.
         """
         if not symbols:
             return
 
-        # Ensure we have existing pixmaps; otherwise fall back to full rebuild
-        if not hasattr(self, 'ticker_pixmaps') or not self.ticker_pixmaps:
-            self.build_ticker_text(reset_scroll=False)
+        # Tiles drawn for another symbol list, font or height are replaced by the full
+        # rebuild (already running, or started here); it picks up these prices too
+        if (not self.ticker_pixmaps or self._tile_symbols != self.stocks
+                or self._tile_geometry != (self.ticker_font.key(), self.ticker_height)):
+            self._tiles_touched.update(symbols)
+            self.rebuild_ticker_pixmaps()
             return
 
         settings = self._cached_settings if hasattr(self, '_cached_settings') else get_settings()
-        metrics = QtGui.QFontMetrics(self.ticker_font)
-        if USE_OPT:
-            icon_size = opt.calculate_icon_size(self.ticker_height, 0.85)
-        else:
-            icon_size = int(self.ticker_height * 0.85)
-
-        small_font = QtGui.QFont(self.ticker_font)
-        small_font.setPointSize(max(8, int(self.ticker_font.pointSize() * 0.5)))
-        small_metrics = QtGui.QFontMetrics(small_font)
-
-        # Invalidate bloom cache when content changes
-        self.bloom_cache_valid = False
+        layout = self._tile_layout(settings)
+        if len(self._tile_images) > 2 * len(self.stocks) + 64:
+            self._tile_images = {}  # Sparklines redrawn since the last full build
 
         updated_any = False
+        specs = []
         for symbol in symbols:
-            if symbol not in self.stocks:
+            target_index = self._tile_index(symbol, settings)
+            if target_index is None:
                 continue
-            try:
-                idx = self.stocks.index(symbol)
-            except ValueError:
+            if self._pixmap_worker is not None or self._tile_install is not None:
+                self._tiles_touched.add(symbol)  # The background build has older prices for it
+
+            # A price tick usually changes only digits: redraw those in place (unless a
+            # render for the symbol is still in flight - it would land over the patch)
+            spec = self._tile_spec(symbol, layout, self._tile_images)
+            if symbol not in self._tile_requests and self._patch_price_slot(symbol, target_index, layout, spec):
+                updated_any = True
                 continue
+            specs.append(spec)
+
+        if specs:
+            request = next(self._tile_request_ids)
+            rendered = [spec.symbol for spec in specs]
+            for symbol in rendered:
+                self._tile_requests[symbol] = request
+            generation = self._tile_generation
+            get_tile_render_pool().submit(
+                specs, layout, calculate_pixmap_dominant_color,
+                lambda tiles: self.incremental_tiles_ready.emit(generation, request, layout.key, rendered, tiles))
+        if updated_any:
+            self._refresh_after_tile_update()
 
-            # Build single stock pixmap (mirrors logic in build_ticker_pixmaps)
-            tkr = symbol
-            display_name = ticker_display_name(tkr)
-            price, prev = self.prices.get(tkr, (None, None))
-            icon = get_ticker_icon(tkr, icon_size)
-            tkr_width = metrics.horizontalAdvance(display_name + " ")
-            sparkline_width = max(50, int(self.ticker_height * 0.85)) if self.show_sparklines else 0
-            sparkline_gap = 6 if self.show_sparklines else 0
-            price_text = f"{price:.2f}" if price is not None else "N/A"
-            price_width = metrics.horizontalAdvance(price_text)
-            change_text = ""
-            pct_text = ""
-            change = 0
-            pct = 0
-            triangle_rotation = 90
-            if price is not None and prev is not None:
-                change = price - prev
-                pct = (change / prev * 100) if prev else 0
-                triangle_rotation = self.get_triangle_rotation(pct)
-                if change > 0:
-                    change_text = f"+{abs(change):.2f}"
-                    pct_text = f"+{abs(pct):.2f}%"
-                elif change < 0:
-                    change_text = f"-{abs(change):.2f}"
-                    pct_text = f"-{abs(pct):.2f}%"
-                else:
-                    change_text = f"{change:.2f}"
-                    pct_text = f"{pct:.2f}%"
-
-            change_width = max(small_metrics.horizontalAdvance(change_text), small_metrics.horizontalAdvance(pct_text)) if (change_text or pct_text) else 0
-            if change_text or pct_text:
-                indicator_style_for_width = settings.get("price_indicator_style", "triangles")
-                if indicator_style_for_width == "thin_arrows":
-                    triangle_width = 14
-                else:
-                    indicator_size_for_width = int(self.ticker_height * 0.42)
-                    leg_w = max(2, int((indicator_size_for_width / 2) * 0.9))
-                    triangle_width = 2 + 2 * leg_w + 6
-            else:
-                triangle_width = 0
-            sep = "      "
-            sep_width = metrics.horizontalAdvance(sep)
-            total_width = icon_size + 8 + tkr_width + sparkline_gap + sparkline_width + sparkline_gap + price_width + (10 + change_width + triangle_width if change_width else 0) + sep_width + 20
-
-            if USE_MEMORY_POOL:
-                pixmap = get_pooled_pixmap(total_width, self.ticker_height)
-            else:
-                pixmap = QtGui.QPixmap(total_width, self.ticker_height)
-            pixmap.fill(QtCore.Qt.transparent)
-            painter = QtGui.QPainter(pixmap)
-            x = 0
-            if USE_OPT:
-                icon_y = opt.calculate_icon_y_position(self.ticker_height, icon_size)
-            else:
-                icon_y = (self.ticker_height - icon_size) // 2
-            painter.drawPixmap(x, icon_y, icon)
-            x += icon_size + 8
-
-            if USE_OPT:
-                tkr_y = opt.calculate_text_position(self.ticker_height, metrics.ascent(), metrics.descent())
-            else:
-                tkr_y = (self.ticker_height + metrics.ascent() - metrics.descent()) // 2
-            symbol_rect = QtCore.QRect(x, 0, tkr_width, self.ticker_height)
-            painter.setFont(self.ticker_font)
-            self.draw_text_with_global_glow(painter, x, tkr_y, display_name, QtGui.QColor("#00B3FF"), settings=settings)
-            x += tkr_width
-
-            if self.show_sparklines and getattr(self, 'sparkline_position', 'left') == 'left':
-                sparkline_height = max(12, int(self.ticker_height * 0.34))
-                sparkline = self._get_sparkline_pixmap(tkr, sparkline_width, sparkline_height)
-                sparkline_y = (self.ticker_height - sparkline.height()) // 2
-                painter.drawPixmap(x + sparkline_gap, sparkline_y, sparkline)
-                x += sparkline_gap + sparkline_width + sparkline_gap
-
-            price_y = tkr_y
-
-            price_color = self.get_display_price_color(tkr, price, prev)
+    def _tile_index(self, symbol, settings):
+        """Index of symbol's tile in ticker_pixmaps (None if it has none).
 
-            change_percent = 0
-            if price is not None and prev is not None and prev != 0:
-                if USE_OPT:
-                    change_percent = opt.calculate_change_percent(price, prev)
-                else:
-                    change_percent = ((price - prev) / prev) * 100
+        market_status is inserted before the first non-crypto ticker (or at the
+        end if all tickers are crypto). Crypto symbols come before the insertion
+        point so they keep their natural 0-based index; non-crypto symbols are
+        shifted right by 1 to account for the market_status slot.
+        """
+        try:
+            index = self._tile_symbols.index(symbol)
+        except ValueError:
+            return None
+        if settings.get("show_market_status", True) and not is_crypto_symbol(symbol):
+            index += 1
+        return index if index < len(self.ticker_pixmaps) else None
 
-            glow_color = self.get_glow_effect(tkr, change_percent)
-            price_rect = QtCore.QRect(x, 0, price_width, self.ticker_height)
+    @QtCore.pyqtSlot(int, int, object, list, list)
+    def _on_incremental_tiles_ready(self, generation, request, layout_key, symbols, tiles):
+        """Replace the tiles rendered for build_ticker_pixmaps_for_symbols in place"""
+        for symbol in symbols:
+            if self._tile_requests.get(symbol) == request:
+                del self._tile_requests[symbol]
+        # Tiles superseded by a newer request for the same symbol are dropped
+        tiles = [tile for tile in tiles if tile.spec.symbol not in self._tile_requests]
+        if not tiles:
+            return
+        if generation != self._tile_generation or layout_key != self._price_slot_key():
+            # A full build or a settings change happened meanwhile; draw them again
+            if layout_key != self._price_slot_key():
+                get_glow_sprite_cache().release_pinned(layout_key)  # Pinned after the install released it
+            self.queue_incremental_pixmap_updates([tile.spec.symbol for tile in tiles])
+            return
 
-            painter.setFont(self.ticker_font)
-            if glow_color:
-                painter.setPen(glow_color)
-                if USE_OPT:
-                    for dx, dy in opt.get_glow_offsets():
-                        painter.drawText(x + dx, price_y + dy, price_text)
-                else:
-                    for dx in [-2, -1, 0, 1, 2]:
-                        for dy in [-2, -1, 0, 1, 2]:
-                            if dx != 0 or dy != 0:
-                                painter.drawText(x + dx, price_y + dy, price_text)
-                painter.setPen(price_color)
-                painter.drawText(x, price_y, price_text)
+        settings = self._cached_settings if hasattr(self, '_cached_settings') else get_settings()
+        updated_any = False
+        for tile in tiles:
+            tkr = tile.spec.symbol
+            target_index = self._tile_index(tkr, settings)
+            if target_index is None:
+                continue
+            # Compensate scroll offset for any width change so segments after this
+            # one don't visually jump left/right when a price gains/loses a digit.
+            # delta > 0 → segment got wider → pull offset left by same amount so
+            # the cycle-start moves left, keeping all higher-index segments in place.
+            old_width = self.ticker_pixmap_widths[target_index]
+            width_delta = tile.width - old_width
+            if width_delta != 0 and hasattr(self, 'offset'):
+                self.offset -= width_delta
+
+            # Replace main pixmap and its tinted ghost version
+            pixmap = QtGui.QPixmap.fromImage(tile.image)
+            ghost_pixmap = QtGui.QPixmap.fromImage(tile.ghost)
+            self.ticker_pixmaps[target_index] = pixmap
+            self.ticker_pixmap_widths[target_index] = tile.width
+            self._strip_renderer.invalidate_tile(target_index, width_changed=width_delta != 0)
+            self._ghost_renderer.invalidate_tile(target_index, width_changed=width_delta != 0)
+            self.invalidate_bloom_layer(target_index, width_changed=width_delta != 0)
+            if target_index < len(self.ticker_ghost_pixmaps):
+                self.ticker_ghost_pixmaps[target_index] = ghost_pixmap
             else:
-                self.draw_text_with_global_glow(painter, x, price_y, price_text, price_color, settings=settings)
-            x += price_width
-
-            change_rect = None
-            if change_text or pct_text:
-                painter.setFont(small_font)
-                stacked_height = small_metrics.height() * 2 + 2
-                stacked_top = (self.ticker_height - stacked_height) // 2 + small_metrics.ascent()
-                if change > 0:
-                    color = QtGui.QColor("#00FF40")
-                elif change < 0:
-                    color = QtGui.QColor("#F4444E")
-                else:
-                    color = QtGui.QColor("#FFFFFF")
-
-                stale_fade_factor = self.get_stale_fade_factor(tkr)
-                color = self.apply_fade_to_color(color, stale_fade_factor)
-                if glow_color:
-                    glow_color = self.apply_fade_to_color(glow_color, stale_fade_factor)
-
-                change_rect = QtCore.QRect(x + 10, 0, change_width + triangle_width, self.ticker_height)
-                painter.setFont(small_font)
-                # Right-align both rows within change_width so their right edges are flush
-                change_indent = change_width - small_metrics.horizontalAdvance(change_text)
-                pct_indent = change_width - small_metrics.horizontalAdvance(pct_text)
-                if glow_color:
-                    painter.setPen(glow_color)
-                    if USE_OPT:
-                        for dx, dy in opt.get_glow_offsets():
-                            painter.drawText(x + 10 + change_indent + dx, stacked_top + dy, change_text)
-                            painter.drawText(x + 10 + pct_indent + dx, stacked_top + small_metrics.height() + 2 + dy, pct_text)
-                    else:
-                        for dx in [-2, -1, 0, 1, 2]:
-                            for dy in [-2, -1, 0, 1, 2]:
-                                if dx != 0 or dy != 0:
-                                    painter.drawText(x + 10 + change_indent + dx, stacked_top + dy, change_text)
-                                    painter.drawText(x + 10 + pct_indent + dx, stacked_top + small_metrics.height() + 2 + dy, pct_text)
-                    painter.setPen(color)
-                    painter.drawText(x + 10 + change_indent, stacked_top, change_text)
-                    painter.drawText(x + 10 + pct_indent, stacked_top + small_metrics.height() + 2, pct_text)
-                else:
-                    self.draw_text_with_global_glow(painter, x + 10 + change_indent, stacked_top, change_text, color, settings=settings)
-                    self.draw_text_with_global_glow(painter, x + 10 + pct_indent, stacked_top + small_metrics.height() + 2, pct_text, color, settings=settings)
-
-                # Draw indicator (simplified positioning reused from main builder)
-                indicator_style = settings.get("price_indicator_style", "triangles")
-                # Triangle is drawn CENTERED at indicator_x; left edge = indicator_x - leg_component.
-                # Offset by leg_component so left edge lands 2px past text right edge.
-                indicator_size = int(self.ticker_height * 0.42)
-                leg_component = max(2, int((indicator_size / 2) * 0.9))
-                indicator_x = x + 10 + change_width + 2 + leg_component
-                base_indicator_y = stacked_top - small_metrics.ascent() // 2
-                if triangle_rotation == 0:
-                    indicator_y = base_indicator_y + 2
-                elif triangle_rotation == 180:
-                    indicator_y = base_indicator_y - 2
-                else:
-                    indicator_y = base_indicator_y
-                if indicator_style == "thin_arrows":
-                    arrow_map = {0: "↑", 45: "↗", 90: "→", 135: "↘", 180: "↓"}
-                    arrow_symbol = arrow_map.get(triangle_rotation, "→")
-                    arrow_font = QtGui.QFont(small_font)
-                    arrow_font.setPointSize(int(small_font.pointSize() * 0.7))
-                    arrow_metrics = QtGui.QFontMetrics(arrow_font)
-                    arrow_y = stacked_top - arrow_metrics.ascent() // 2
-                    if glow_color:
-                        painter.setPen(glow_color)
-                        painter.setFont(arrow_font)
-                        for dx in [-1, 0, 1]:
-                            for dy in [-1, 0, 1]:
-                                if dx != 0 or dy != 0:
-                                    painter.drawText(indicator_x + dx, arrow_y + dy, arrow_symbol)
-                        painter.setPen(color)
-                        painter.drawText(indicator_x, arrow_y, arrow_symbol)
-                    else:
-                        painter.setFont(arrow_font)
-                        painter.setPen(color)
-                        painter.drawText(indicator_x, arrow_y, arrow_symbol)
-                        painter.setFont(small_font)
-                else:
-                    if glow_color:
-                        for dx in [-1, 0, 1]:
-                            for dy in [-1, 0, 1]:
-                                if dx != 0 or dy != 0:
-                                    if indicator_style == "arrows":
-                                        self.draw_rotated_arrow(painter, indicator_x + dx, indicator_y + dy, indicator_size, triangle_rotation, glow_color)
-                                    else:
-                                        self.draw_rotated_triangle(painter, indicator_x + dx, indicator_y + dy, indicator_size, triangle_rotation, glow_color)
-                    if indicator_style == "arrows":
-                        self.draw_rotated_arrow(painter, indicator_x, indicator_y, indicator_size, triangle_rotation, color)
-                    else:
-                        self.draw_rotated_triangle(painter, indicator_x, indicator_y, indicator_size, triangle_rotation, color)
-
-                painter.setFont(self.ticker_font)
-                x += 10 + change_width + triangle_width
-
-            if self.show_sparklines and getattr(self, 'sparkline_position', 'left') == 'right':
-                sparkline_height = max(12, int(self.ticker_height * 0.34))
-                sparkline = self._get_sparkline_pixmap(tkr, sparkline_width, sparkline_height)
-                sparkline_y = (self.ticker_height - sparkline.height()) // 2
-                painter.drawPixmap(x + sparkline_gap, sparkline_y, sparkline)
-                x += sparkline_gap + sparkline_width + sparkline_gap
-
-            painter.setFont(self.ticker_font)
-            self.draw_text_with_global_glow(painter, x, tkr_y, sep, QtGui.QColor("#00B3FF"), settings=settings)
-            painter.end()
-
-            # Compute the correct index in ticker_pixmaps for this symbol.
-            # market_status is inserted before the first non-crypto ticker (or at the
-            # end if all tickers are crypto).  Crypto symbols come before the insertion
-            # point so they keep their natural 0-based index; non-crypto symbols are
-            # shifted right by 1 to account for the market_status slot.
-            show_market_status_flag = settings.get("show_market_status", True)
-            if show_market_status_flag and not is_crypto_symbol(symbol):
-                target_index = idx + 1
+                # Should not happen, but append to keep lists consistent
+                self.ticker_ghost_pixmaps.append(ghost_pixmap)
+            if tile.change_x is not None:
+                self._price_slots[tkr] = PriceSlot(pixmap, ghost_pixmap, tile.tint, layout_key, tile.spec)
             else:
-                target_index = idx
-            # Ensure lists are long enough
-            if target_index < len(self.ticker_pixmaps):
-                    # Compensate scroll offset for any width change so segments after this
-                    # one don't visually jump left/right when a price gains/loses a digit.
-                    # delta > 0 → segment got wider → pull offset left by same amount so
-                    # the cycle-start moves left, keeping all higher-index segments in place.
-                    old_width = self.ticker_pixmap_widths[target_index]
-                    width_delta = total_width - old_width
-                    if width_delta != 0 and hasattr(self, 'offset'):
-                        self.offset -= width_delta
-
-                    # Replace main pixmap
-                    self.ticker_pixmaps[target_index] = pixmap
-                    self.ticker_pixmap_widths[target_index] = total_width
-                    # Create and replace tinted ghost version
-                    ghost_pixmap = QtGui.QPixmap(pixmap.size())
-                    ghost_pixmap.fill(QtCore.Qt.transparent)
-                    ggp = QtGui.QPainter(ghost_pixmap)
-                    ggp.drawPixmap(0, 0, pixmap)
-                    ggp.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
-                    intensity = settings.get("led_ghost_intensity", 100)
-                    galpha_pct = int(intensity * 0.45)
-                    color_strength = intensity * 1.4 / 100.0
-                    dominant = calculate_pixmap_dominant_color(pixmap)
-                    sub_r = int(min(255, dominant.red() * color_strength + 40))
-                    sub_g = int(min(255, dominant.green() * color_strength + 40))
-                    sub_b = int(min(255, dominant.blue() * color_strength + 40))
-                    tint_color = QtGui.QColor(sub_r, sub_g, sub_b)
-                    tint_color.setAlpha(int(galpha_pct * 2.55))
-                    ggp.fillRect(ghost_pixmap.rect(), tint_color)
-                    ggp.end()
-                    if target_index < len(self.ticker_ghost_pixmaps):
-                        self.ticker_ghost_pixmaps[target_index] = ghost_pixmap
-                    else:
-                        # Should not happen, but append to keep lists consistent
-                        self.ticker_ghost_pixmaps.append(ghost_pixmap)
-
-                    if change_rect:
-                        self.ticker_area_templates[target_index] = [
-                            ('symbol', tkr, symbol_rect),
-                            ('price', tkr, price_rect),
-                            ('change', tkr, change_rect)
-                        ]
-                    else:
-                        self.ticker_area_templates[target_index] = [
-                            ('symbol', tkr, symbol_rect),
-                            ('price', tkr, price_rect)
-                        ]
-                    updated_any = True
-        # If we changed any pixmaps, trigger repaint and re-calc cycle width
+                self._price_slots.pop(tkr, None)
+            self.ticker_area_templates[target_index] = tile.areas
+            updated_any = True
         if updated_any:
-            # Recompute cycle width in case widths changed
-            try:
-                self._cycle_width = sum(self.ticker_pixmap_widths)
-            except Exception:
-                pass
-            # Trigger repaint
-            try:
-                if hasattr(self, 'gl_widget') and self.gl_widget:
-                    self.gl_widget.update()
-                else:
-                    self.update()
-            except Exception:
-                pass
+            self._refresh_after_tile_update()
+
+    def _refresh_after_tile_update(self):
+        """Recompute the cycle width (widths may have changed) and repaint"""
+        self.bloom_cache_valid = False
+        try:
+            self._cycle_width = sum(self.ticker_pixmap_widths)
+        except Exception:
+            pass
+        try:
+            if hasattr(self, 'gl_widget') and self.gl_widget:
+                self.gl_widget.update()
+            else:
+                self.update()
+        except Exception:
+            pass
 
     def get_cycle_width(self):
         return sum(self.ticker_pixmap_widths)
 
-    @QtCore.pyqtSlot(str, object, int, int, str)
-    def _on_sparkline_ready(self, symbol, pixmap, width, height, period):
-        key = (symbol.upper(), period, int(width), int(height))
-        self.sparkline_cache[key] = (time.time(), pixmap)
-        with self.sparkline_lock:
-            self.sparkline_inflight.discard(key)
+    @QtCore.pyqtSlot(str, str)
+    def _on_sparkline_history_ready(self, symbol, period):
         if symbol in self.stocks:
             self.queue_incremental_pixmap_updates([symbol])
 
@@ -8230,7 +8880,7 @@ class TickerWindow(QtWidgets.QWidget):
         if not getattr(self, 'show_sparklines', False):
             return
         try:
-            self.build_ticker_pixmaps()
+            self.rebuild_ticker_pixmaps()
             if hasattr(self, 'gl_widget') and self.gl_widget:
                 self.gl_widget.update()
         except Exception:
@@ -8248,21 +8898,20 @@ class TickerWindow(QtWidgets.QWidget):
         return pm
 
     def _build_sparkline_pixmap(self, values, width, height):
+        values = np.asarray(values, dtype=np.float32)
+        if len(values) < 2:
+            return self._sparkline_placeholder(width, height)
         pm = QtGui.QPixmap(width, height)
         pm.fill(QtCore.Qt.transparent)
-        if not values or len(values) < 2:
-            return self._sparkline_placeholder(width, height)
 
-        low = min(values)
-        high = max(values)
+        low = float(values.min())
+        high = float(values.max())
         span = (high - low) if high != low else 1.0
 
-        points = []
         count = len(values)
-        for idx, value in enumerate(values):
-            x = int(idx * (width - 1) / max(1, count - 1))
-            y = int((1.0 - ((value - low) / span)) * (height - 1))
-            points.append(QtCore.QPoint(x, y))
+        xs = (np.arange(count) * ((width - 1) / max(1, count - 1))).astype(np.int32)
+        ys = ((1.0 - (values - low) / span) * (height - 1)).astype(np.int32)
+        polyline = QtGui.QPolygon([QtCore.QPoint(int(x), int(y)) for x, y in zip(xs, ys)])
 
         up = values[-1] >= values[0]
         line_color = QtGui.QColor("#00FF40" if up else "#FF5555")
@@ -8270,108 +8919,67 @@ class TickerWindow(QtWidgets.QWidget):
         painter = QtGui.QPainter(pm)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         painter.setPen(QtGui.QPen(line_color, 1.6))
-        for i in range(1, len(points)):
-            painter.drawLine(points[i - 1], points[i])
+        painter.drawPolyline(polyline)
         painter.end()
         return pm
 
-    def _request_sparkline_async(self, symbol, width, height):
-        period = self.sparkline_period
-        key = (symbol.upper(), period, int(width), int(height))
-
-        with self.sparkline_lock:
-            if key in self.sparkline_inflight:
-                return
-            self.sparkline_inflight.add(key)
-
-        def worker():
-            try:
-                interval = "5m" if period == "1d" else "30m"
-                yahoo_symbol = normalize_yahoo_symbol(symbol)
-                encoded_symbol = url_quote(yahoo_symbol, safe='')
-                url = f"https://query1.finance.yahoo.com/v8/finance/chart/{encoded_symbol}?range={period}&interval={interval}"
-
-                settings = get_settings()
-                proxies = None
-                verify = True
-                proxy_value = normalize_proxy_url(settings.get("proxy", ""))
-                if settings.get("use_proxy") and proxy_value:
-                    proxies = {
-                        "http": proxy_value,
-                        "https": proxy_value
-                    }
-                if settings.get("use_cert") and settings.get("cert_file"):
-                    verify = settings["cert_file"]
-
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-
-                response = get_requests_session().get(
-                    url,
-                    headers=headers,
-                    timeout=10,
-                    proxies=proxies,
-                    verify=verify
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                values = []
-                result = data.get("chart", {}).get("result", [])
-                if result:
-                    indicators = result[0].get("indicators", {})
-                    quote_data = indicators.get("quote", [])
-                    if quote_data:
-                        closes = quote_data[0].get("close", [])
-                        values = [float(v) for v in closes if v is not None]
-
-                        # Fallback to open/high/low if close has insufficient points
-                        if len(values) < 2:
-                            for fallback_field in ("open", "high", "low"):
-                                fallback_vals = [float(v) for v in quote_data[0].get(fallback_field, []) if v is not None]
-                                if len(fallback_vals) >= 2:
-                                    values = fallback_vals
-                                    break
-
-                    # Extra fallback: adjusted close series
-                    if len(values) < 2:
-                        adjclose_data = indicators.get("adjclose", [])
-                        if adjclose_data:
-                            adj_vals = [float(v) for v in adjclose_data[0].get("adjclose", []) if v is not None]
-                            if len(adj_vals) >= 2:
-                                values = adj_vals
-
-                # One-time success diagnostic per symbol/period
-                log_key = (symbol.upper(), period)
-                if len(values) >= 2 and log_key not in self._sparkline_logged_success:
-                    self._sparkline_logged_success.add(log_key)
-                    colored_print(f"[SPARKLINE] {symbol} {period}: fetched {len(values)} points")
-
-                sparkline_pixmap = self._build_sparkline_pixmap(values, width, height)
-                self.sparkline_ready.emit(symbol, sparkline_pixmap, width, height, period)
-            except Exception as e:
-                log_key = (symbol.upper(), period)
-                if log_key not in self._sparkline_logged_failures:
-                    self._sparkline_logged_failures.add(log_key)
-                    colored_print(f"[SPARKLINE] {symbol} {period}: fetch failed ({e})")
-                placeholder = self._sparkline_placeholder(width, height)
-                self.sparkline_ready.emit(symbol, placeholder, width, height, period)
-
-        threading.Thread(target=worker, daemon=True).start()
+    def _sparkline_fetch_priority(self, symbol):
+        """Pixels until `symbol` scrolls into view (0 = visible now); lower fetches first"""
+        try:
+            idx = self.stocks.index(symbol)
+        except ValueError:
+            return float('inf')
+        widths = self.ticker_pixmap_widths
+        if not widths or len(widths) <= len(self.stocks) - 1:
+            return float(idx)  # No layout yet - list order is scroll order
+        if len(widths) > len(self.stocks) and not is_crypto_symbol(symbol):
+            idx += 1  # Market status tile sits before the first non-crypto symbol
+        idx = min(idx, len(widths) - 1)
+        cycle_width = sum(widths) or 1
+        x = (self.offset + sum(widths[:idx])) % cycle_width
+        if x < self.width():
+            return 0.0
+        return float(x - self.width())
+
+    def _request_sparkline_async(self, symbol, since=None):
+        """Queue a history fetch for `symbol` (only the tail after `since` if given);
+        sparkline_history_ready fires once the data is in the history store."""
+        get_history_scheduler().submit(
+            symbol, self.sparkline_period, since,
+            priority=self._sparkline_fetch_priority(symbol),
+            owner=id(self), on_done=self._on_sparkline_fetched)
+
+    def _on_sparkline_fetched(self, symbol, period):
+        """Runs on a scheduler worker thread - hop to the GUI thread"""
+        if (symbol, period) not in self._sparkline_logged_success:
+            self._sparkline_logged_success.add((symbol, period))
+            points = len(get_history_store().closes(symbol, period))
+            if points >= 2:
+                colored_print(f"[SPARKLINE] {symbol} {period}: {points} points in history")
+            else:
+                colored_print(f"[SPARKLINE] {symbol} {period}: no history available")
+        self.sparkline_history_ready.emit(symbol, period)
 
     def _get_sparkline_pixmap(self, symbol, width=50, height=18):
-        key = (symbol.upper(), self.sparkline_period, int(width), int(height))
-        ttl_seconds = 600 if self.sparkline_period == "1d" else 1800
-        cached = self.sparkline_cache.get(key)
+        """Render the sparkline from the history store; fetch history only when stale"""
+        period = self.sparkline_period
+        store = get_history_store()
+        needed, since = store.fetch_plan(symbol, period)
+        if needed:
+            self._request_sparkline_async(symbol, since)
 
-        if cached:
-            timestamp, cached_pixmap = cached
-            if (time.time() - timestamp) < ttl_seconds:
-                return cached_pixmap
+        key = (symbol.upper(), period, int(width), int(height))
+        version = store.version(symbol, period)
+        cached = self.sparkline_cache.get(key)
+        if cached and version is not None and cached[0] == version:
+            return cached[1]
 
-        self._request_sparkline_async(symbol, width, height)
-        return self._sparkline_placeholder(width, height)
+        values = store.closes(symbol, period)
+        if len(values) < 2:
+            return self._sparkline_placeholder(width, height)
+        pixmap = self._build_sparkline_pixmap(values, width, height)
+        self.sparkline_cache[key] = (version, pixmap)
+        return pixmap
 
     def queue_incremental_pixmap_updates(self, symbols):
         """Queue symbols for throttled incremental pixmap rebuilds.
@@ -8523,108 +9131,111 @@ class TickerWindow(QtWidgets.QWidget):
             scan_color = QtGui.QColor(255, 255, 255, 8)
             painter.fillRect(0, scan_y, width, 2, scan_color)
 
+    def _strip_tile(self, tile_index):
+        """Tile source for the content strip renderer (-1 = donate message)"""
+        return self._donate_pixmap if tile_index < 0 else self.ticker_pixmaps[tile_index]
+
+    def _ghost_tile(self, tile_index):
+        """Tile source for the ghost strip renderer (-1 = donate message)"""
+        if tile_index < 0:
+            return getattr(self, '_donate_ghost_pixmap', None)
+        return self.ticker_ghost_pixmaps[tile_index] if tile_index < len(self.ticker_ghost_pixmaps) else None
+
+    def bloom_color_for_area(self, area_type, tkr, bloom_intensity):
+        """Halo centre colour for one ticker element (None = no halo)"""
+        if area_type == 'icon':
+            return None
+        if area_type == 'price' or area_type == 'change':
+            price, prev = self.prices.get(tkr, (None, None))
+            if price is not None and prev is not None:
+                if price > prev:
+                    return QtGui.QColor(0, 255, 64, int(60 * bloom_intensity))
+                if price < prev:
+                    return QtGui.QColor(255, 85, 85, int(60 * bloom_intensity))
+                return QtGui.QColor(255, 255, 255, int(45 * bloom_intensity))
+            return QtGui.QColor(255, 215, 0, int(45 * bloom_intensity))
+        if area_type == 'symbol' or area_type == 'market_label':
+            return QtGui.QColor(0, 179, 255, int(55 * bloom_intensity))
+        if area_type == 'market_status':
+            if tkr == 'OPEN':
+                return QtGui.QColor(0, 255, 64, int(60 * bloom_intensity))
+            return QtGui.QColor(255, 85, 85, int(60 * bloom_intensity))
+        if area_type == 'donate':
+            return QtGui.QColor(255, 200, 255, int(55 * bloom_intensity))
+        return QtGui.QColor(200, 220, 255, int(30 * bloom_intensity))
+
+    def invalidate_bloom_layer(self, tile_index=None, width_changed=False):
+        """Drop baked bloom halos: one tile (after it was redrawn) or all of them"""
+        if tile_index is None or width_changed:
+            self._bloom_tiles.clear()
+            self._bloom_renderer.invalidate()
+            self._bloom_renderer.set_tile_padding(self._bloom_padding())
+        else:
+            self._bloom_tiles.pop(tile_index, None)
+            self._bloom_renderer.invalidate_tile(tile_index)
+
+    def _bloom_padding(self):
+        """How far a halo may spill past its tile. A halo has radius 0.6 * max(w, h)
+        around the centre of a w x h area inside the tile, so it reaches at most
+        0.6 * h past a narrow area and 0.1 * w past a wide one."""
+        widest = max(self.ticker_pixmap_widths + [getattr(self, '_donate_pixmap_width', 0) or 0])
+        return int(max(0.6 * self.ticker_height, 0.1 * widest)) + 2  # +2 for rounding and antialiasing
+
+    def _bloom_tile(self, tile_index):
+        """Halo pixmap for one tile, padded on both sides (rendered on first use)"""
+        pixmap = self._bloom_tiles.get(tile_index)
+        if pixmap is not None:
+            return pixmap
+        if tile_index < 0:
+            tile_width, area_tpls = self._donate_pixmap_width, self._donate_area_template
+        else:
+            tile_width, area_tpls = self.ticker_pixmap_widths[tile_index], self.ticker_area_templates[tile_index]
+        pad = self._bloom_renderer.tile_padding
+        pixmap = QtGui.QPixmap(max(1, tile_width + 2 * pad), max(1, self.ticker_height))
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Plus)
+        painter.setPen(QtCore.Qt.NoPen)
+        for area_type, tkr, rect in area_tpls:
+            color = self.bloom_color_for_area(area_type, tkr, self._bloom_tiles_intensity)
+            if color is None:
+                continue
+            bloom_radius = max(rect.width(), rect.height()) * 0.6
+            center_x = rect.center().x() + pad
+            center_y = rect.center().y()
+            gradient = QtGui.QRadialGradient(center_x, center_y, bloom_radius)
+            gradient.setColorAt(0, color)
+            gradient.setColorAt(1, QtGui.QColor(0, 0, 0, 0))
+            painter.setBrush(QtGui.QBrush(gradient))
+            painter.drawEllipse(int(center_x - bloom_radius), int(center_y - bloom_radius),
+                                int(bloom_radius * 2), int(bloom_radius * 2))
+        painter.end()
+        self._bloom_tiles[tile_index] = pixmap
+        return pixmap
+
     def apply_bloom_effect(self, painter, width, height, settings):
         """
         Apply bloom/glow effect around bright colors.
-        DIRECT RENDERING: No caching to avoid rebuild flashing.
-        Draws bloom halos directly each frame.
+        Halos are baked once per tile into a bloom strip that scrolls with the
+        content (see _bloom_tile); each frame only blits that strip additively.
+        Tiles are re-baked when their pixmap is rebuilt, and the previous strip
+        stays on screen until the new one is ready, so rebuilds never flash.
         """
         # Check if bloom effect is enabled
         if not settings.get("led_bloom_effect", True):
             return
+        if not self.ticker_pixmap_widths:
+            return
         
         # Compute nonlinear bloom intensity factor from user setting (0-100)
         bloom_intensity_pct = settings.get("led_bloom_intensity", 100)
         bloom_intensity = calculate_bloom_factor(bloom_intensity_pct)
-        
-        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Plus)
-        painter.setPen(QtCore.Qt.NoPen)
-        
-        # If ticker_click_areas is empty (e.g., effects called before main draw), estimate positions
-        if not self.ticker_click_areas:
-            try:
-                base_cycle_width = self.get_cycle_width()
-                donate_cycle_width = self._donate_pixmap_width + base_cycle_width
-                if USE_OPT:
-                    cycle_positions_array = opt.calculate_cycle_positions(self.offset, width, base_cycle_width, donate_cycle_width, 20)
-                    cycle_iter = ((float(cycle_positions_array[i, 0]), cycle_positions_array[i, 1] == 1)
-                                  for i in range(cycle_positions_array.shape[0]))
-                else:
-                    cycle_iter = []
-                    x = self.offset
-                    est_cycles = (width // min(base_cycle_width, donate_cycle_width)) + 6
-                    for i in range(est_cycles):
-                        if i % 3 == 0:
-                            cycle_iter.append((float(x), True))
-                            x += donate_cycle_width
-                        else:
-                            cycle_iter.append((float(x), False))
-                            x += base_cycle_width
-                # Build temporary click area list
-                tmp_clicks = []
-                for x_pos, is_donate in cycle_iter:
-                    draw_x = x_pos
-                    for pixmap_widths, area_tpls in zip(self.ticker_pixmap_widths, self.ticker_area_templates):
-                        # iterate through areas, translating rects
-                        for area_type, tkr, rect in area_tpls:
-                            offset_rect = QtCore.QRect(rect)
-                            offset_rect.translate(int(draw_x), 0)
-                            tmp_clicks.append((area_type, tkr, offset_rect))
-                        draw_x += pixmap_widths
-                    if is_donate:
-                        for area_type, tkr, rect in self._donate_area_template:
-                            offset_rect = QtCore.QRect(rect)
-                            offset_rect.translate(int(draw_x), 0)
-                            tmp_clicks.append((area_type, tkr, offset_rect))
-                self.ticker_click_areas = tmp_clicks
-            except Exception:
-                # If estimation fails, proceed (no bloom will be drawn)
-                pass
+        if bloom_intensity != self._bloom_tiles_intensity:
+            self._bloom_tiles_intensity = bloom_intensity
+            self.invalidate_bloom_layer()
 
-        # Draw bloom halos directly for each visible element
-        for area_type, tkr, rect in self.ticker_click_areas:
-            if area_type == 'icon':
-                continue
-            
-            # Only draw bloom for elements visible on screen
-            if rect.right() < 0 or rect.left() > width:
-                continue
-            
-            bloom_radius = max(rect.width(), rect.height()) * 0.6
-            center_x = rect.center().x()
-            center_y = rect.center().y()
-            
-            gradient = QtGui.QRadialGradient(center_x, center_y, bloom_radius)
-            
-            # Set bloom color based on area type (increased alpha for stronger bloom)
-            if area_type == 'price' or area_type == 'change':
-                price, prev = self.prices.get(tkr, (None, None))
-                if price is not None and prev is not None:
-                    if price > prev:
-                        gradient.setColorAt(0, QtGui.QColor(0, 255, 64, int(60 * bloom_intensity)))
-                    elif price < prev:
-                        gradient.setColorAt(0, QtGui.QColor(255, 85, 85, int(60 * bloom_intensity)))
-                    else:
-                        gradient.setColorAt(0, QtGui.QColor(255, 255, 255, int(45 * bloom_intensity)))
-                else:
-                    gradient.setColorAt(0, QtGui.QColor(255, 215, 0, int(45 * bloom_intensity)))
-            elif area_type == 'symbol' or area_type == 'market_label':
-                gradient.setColorAt(0, QtGui.QColor(0, 179, 255, int(55 * bloom_intensity)))
-            elif area_type == 'market_status':
-                if tkr == 'OPEN':
-                    gradient.setColorAt(0, QtGui.QColor(0, 255, 64, int(60 * bloom_intensity)))
-                else:
-                    gradient.setColorAt(0, QtGui.QColor(255, 85, 85, int(60 * bloom_intensity)))
-            elif area_type == 'donate':
-                gradient.setColorAt(0, QtGui.QColor(255, 200, 255, int(55 * bloom_intensity)))
-            else:
-                gradient.setColorAt(0, QtGui.QColor(200, 220, 255, int(30 * bloom_intensity)))
-            
-            gradient.setColorAt(1, QtGui.QColor(0, 0, 0, 0))
-            painter.setBrush(QtGui.QBrush(gradient))
-            painter.drawEllipse(int(center_x - bloom_radius), int(center_y - bloom_radius), 
-                               int(bloom_radius * 2), int(bloom_radius * 2))
-        
+        self._bloom_renderer.draw(painter, self.offset, width, self._bloom_tile, self.ticker_pixmap_widths,
+                                  self._donate_pixmap_width, height)
         painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
 
     def apply_bloom_to_rect(self, painter, rect, width, height, settings=None, bloom_color=None):
@@ -8684,6 +9295,9 @@ class TickerWindow(QtWidgets.QWidget):
         # Check if ghosting effect is enabled (using cached settings)
         if not settings.get("led_ghosting_effect", True):
             return
+        if settings.get("led_ghost_engine", "layers") == "accumulation":
+            self.apply_ghost_trail(painter, width, height, settings)
+            return
 
         if getattr(self, '_ghost_debug_logging', False):
             try:
@@ -8695,7 +9309,7 @@ class TickerWindow(QtWidgets.QWidget):
                     ghost_count = len(getattr(self, 'ticker_ghost_pixmaps', [])) if hasattr(self, 'ticker_ghost_pixmaps') else 0
                     last_scroll = getattr(self, '_last_actual_scroll', None)
                     intensity = settings.get('led_ghost_intensity', None)
-                    print(f"[GHOST DEBUG] enabled=True, ghost_count={ghost_count}, intensity={intensity}, last_scroll={last_scroll}")
+                    log_debug("GHOST DEBUG", "enabled=True, ghost_count=%s, intensity=%s, last_scroll=%s", ghost_count, intensity, last_scroll)
             except Exception:
                 pass
 
@@ -8759,7 +9373,7 @@ class TickerWindow(QtWidgets.QWidget):
                                 sample_alpha = img.pixelColor(1, 1).alpha()
                             except Exception:
                                 sample_alpha = None
-                        print(f"[GHOST OPACITY DEBUG] layer_idx={layer_idx}, opacity={opacity:.3f}, sample_pixmap_alpha={sample_alpha}")
+                        log_debug("GHOST OPACITY DEBUG", "layer_idx=%s, opacity=%.3f, sample_pixmap_alpha=%s", layer_idx, opacity, sample_alpha)
                 except Exception:
                     pass
 
@@ -8801,7 +9415,7 @@ class TickerWindow(QtWidgets.QWidget):
                     last = getattr(self, '_ghost_draw_log_last', 0)
                     if now - last > 1.0:
                         self._ghost_draw_log_last = now
-                        print(f"[GHOST DRAW DEBUG] layer_idx={layer_idx}, draws_this_layer={draws_this_layer}")
+                        log_debug("GHOST DRAW DEBUG", "layer_idx=%s, draws_this_layer=%s", layer_idx, draws_this_layer)
                 except Exception:
                     pass
 
@@ -8812,7 +9426,7 @@ class TickerWindow(QtWidgets.QWidget):
                 last = getattr(self, '_ghost_draw_summary_last', 0)
                 if now - last > 1.0:
                     self._ghost_draw_summary_last = now
-                    print(f"[GHOST DRAW SUMMARY] total_draws={total_draws_this_pass}")
+                    log_debug("GHOST DRAW SUMMARY", "total_draws=%s", total_draws_this_pass)
                     if total_draws_this_pass > 0 and getattr(self, '_ghost_debug_visual', False):
                         painter.setOpacity(0.9)
                         painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
@@ -8824,6 +9438,31 @@ class TickerWindow(QtWidgets.QWidget):
         painter.setOpacity(1.0)
 
 
+    GHOST_TRAIL_DECAY = 0.6  # Opacity the trail keeps per frame (like the old far/near layer ratio)
+
+    def apply_ghost_trail(self, painter, width, height, settings):
+        """
+        Accumulation ghosting: fade and shift the trail buffer once, lay the current
+        ghost strip over it, and blit the result. Offsets and opacity follow the
+        layered engine (nearest ghost 0.6 frames of scroll + bias behind, 90% of
+        intensity); the tint comes from the same ghost pixmaps.
+        """
+        if not self.ticker_pixmap_widths:
+            return
+        intensity = settings.get("led_ghost_intensity", 100) / 100.0
+        last_scroll = getattr(self, '_last_actual_scroll', None)
+        if last_scroll is None or last_scroll <= 0:
+            last_scroll = 1.0
+        bias = max(0.6, min(2.0, last_scroll * 0.12))
+        lead = max(1.0, min(40.0, last_scroll * 0.6 + bias))
+
+        def draw_layer(trail_painter):
+            self._ghost_renderer.draw(trail_painter, self.offset, width, self._ghost_tile, self.ticker_pixmap_widths,
+                                      self._donate_pixmap_width, height)
+
+        self._ghost_trail.update(width, height, draw_layer, self.GHOST_TRAIL_DECAY, shift=bias, lead=lead)
+        self._ghost_trail.draw(painter, 0.9 * intensity)
+
     def apply_glass_glare_effect(self, painter, width, height, settings):
         """
         Apply glass cover with reflections and glare effect.
@@ -8935,7 +9574,7 @@ class TickerWindow(QtWidgets.QWidget):
             cp.end()
             self._glass_glare_cache = cache
             self._glass_glare_cache_key = cache_key
-            print(f"[PERF] Glass glare cache built ({width}x{height})")
+            colored_print(f"[PERF] Glass glare cache built ({width}x{height})")
 
         # Single blit per frame — replaces ~20 painter operations with one drawPixmap call
         painter.setCompositionMode(QtGui.QPainter.CompositionMode_Plus)
@@ -8948,6 +9587,11 @@ class TickerWindow(QtWidgets.QWidget):
         if not self.isVisible() or self.isMinimized():
             return
 
+        # Frame profiler: a single attribute check per frame while not recording
+        prof = _FRAME_PROFILER if _FRAME_PROFILER.enabled else None
+        if prof is not None:
+            prof.begin_frame(self._profiler_track)
+
         # Phase 2: Frame timing and scroll update moved to TOP of paint_ticker() — before
         # QPainter is created.  Every frame now draws at the position stepped to from THIS
         # VSync timestamp rather than last frame’s, eliminating the 1-frame positional lag.
@@ -8956,6 +9600,7 @@ class TickerWindow(QtWidgets.QWidget):
         # queue, widget2 would read T_N+1 and compute delta = 2 frames → double-jump scroll.
         _vq = getattr(self.gl_widget, '_vsync_queue', None)
         _vsync_time = _vq.popleft() if _vq else None
+        self._frame_vsync_time = _vsync_time
 
         if _vsync_time is not None:
             # VSync-triggered paint: advance timing from the VBlank timestamp.
@@ -8986,7 +9631,7 @@ class TickerWindow(QtWidgets.QWidget):
                 self._current_fps = fps
                 self._current_frame_time = (elapsed / self._fps_counter) * 1000
                 if not self.show_fps_overlay:
-                    print(f"[FPS] Current: {fps:.1f} FPS | Frame time: {self._current_frame_time:.1f}ms avg")
+                    log_debug("FPS", "Current: %.1f FPS | Frame time: %.1fms avg", fps, self._current_frame_time)
 
                 # Jitter stats from the samples collected this second.
                 # stddev: ideal = 0 ms; <0.5 ms imperceptible; 1-2 ms slight; >3 ms obvious judder.
@@ -8998,10 +9643,8 @@ class TickerWindow(QtWidgets.QWidget):
                     _range = max(_s) - min(_s)
                     self._current_jitter_stddev = _stddev
                     self._current_jitter_range = _range
-                    print(
-                        f"[JUDDER] StdDev={_stddev:.2f}ms  Range={_range:.2f}ms"
-                        f"  Mean={_mean:.2f}ms  Samples={len(_s)}"
-                    )
+                    log_debug("JUDDER", "StdDev=%.2fms  Range=%.2fms  Mean=%.2fms  Samples=%d",
+                              _stddev, _range, _mean, len(_s))
 
             self._fps_last_calc = current_time
             self._fps_counter = 0
@@ -9046,12 +9689,11 @@ class TickerWindow(QtWidgets.QWidget):
                 if self.offset <= -_scw:
                     self.offset += _scw
 
-        # PERF ENHANCEMENT 2: Use cached settings to avoid repeated file I/O
-        cached_settings = self.get_cached_settings()
-        bloom_enabled = cached_settings.get('show_bloom', True)
-        
-        # Update click areas when bloom is enabled (needed for bloom positioning)
-        update_click_areas = bloom_enabled or self.gl_widget.underMouse()
+        if prof is not None:
+            prof.mark('scroll')
+
+        # Click areas are only needed for hover/click handling (bloom uses its own baked strip)
+        update_click_areas = self.gl_widget.underMouse()
         
         if update_click_areas:
             self.ticker_click_areas = []
@@ -9099,10 +9741,12 @@ class TickerWindow(QtWidgets.QWidget):
                 bg_painter.fillRect(x, 0, 1, height, pixel_grid_color)
             
             bg_painter.end()
-            print(f"[PERF] Cached background pixmap created ({width}x{height})")
+            colored_print(f"[PERF] Cached background pixmap created ({width}x{height})")
         
         # Draw cached background - single fast blit operation instead of hundreds of fillRect calls
         painter.drawPixmap(0, 0, self._cached_background_pixmap)
+        if prof is not None:
+            prof.mark('background')
 
         # --- Early ghosting pass: draw ghost layers BETWEEN background and main content ---
         # This ensures tinted ghost pixmaps are visible behind main pixmaps but above the background
@@ -9122,6 +9766,8 @@ class TickerWindow(QtWidgets.QWidget):
         except Exception:
             # Be conservative: ignore any issues in this non-critical early effects pass
             pass
+        if prof is not None:
+            prof.mark('ghosting')
         
         if getattr(self, 'loading', False):
             painter.setFont(self.ticker_font)
@@ -9161,16 +9807,33 @@ class TickerWindow(QtWidgets.QWidget):
                     self.apply_glass_glare_effect(painter, width, height, cached_settings)
             
             painter.end()
+            if prof is not None:
+                prof.mark('overlay')
+                prof.end_frame(self.target_frame_interval)
             return
         if not self.ticker_pixmaps:
             painter.end()
+            if prof is not None:
+                prof.end_frame(self.target_frame_interval)
             return
 
         base_cycle_width = self.get_cycle_width()
         donate_cycle_width = self._donate_pixmap_width + base_cycle_width
 
+        if self.use_strip_renderer:
+            # Blit the one or two pre-composited strips under the window; click areas
+            # are generated only for the tiles actually on screen
+            self._strip_renderer.draw(painter, self.offset, width, self._strip_tile, self.ticker_pixmap_widths,
+                                      self._donate_pixmap_width, height)
+            if update_click_areas:
+                for draw_x, tile_index in self._strip_renderer.visible_tiles(self.offset, width):
+                    area_tpls = self._donate_area_template if tile_index < 0 else self.ticker_area_templates[tile_index]
+                    for area_type, tkr, rect in area_tpls:
+                        offset_rect = QtCore.QRect(rect)
+                        offset_rect.translate(int(draw_x), 0)
+                        self.ticker_click_areas.append((area_type, tkr, offset_rect))
         # Use optimized cycle position calculation for main rendering
-        if USE_OPT:
+        elif USE_OPT:
             # Numba path — Python list is not built (was previously built then discarded)
             cycle_positions_array = opt.calculate_cycle_positions(
                 self.offset, width, base_cycle_width, donate_cycle_width, 20
@@ -9237,6 +9900,8 @@ class TickerWindow(QtWidgets.QWidget):
                             offset_rect.translate(int(draw_x), 0)
                             self.ticker_click_areas.append((area_type, tkr, offset_rect))
                     draw_x += self._donate_pixmap_width
+        if prof is not None:
+            prof.mark('content')
 
         # Apply visual effects if enabled (user can toggle with Effects button)
         # Check if any effects are actually enabled to avoid unnecessary function calls and settings lookups
@@ -9252,8 +9917,8 @@ class TickerWindow(QtWidgets.QWidget):
                     'glass': settings.get("led_glass_glare", True)
                 }
                 self._cached_settings = settings  # Also initialize _cached_settings immediately
-                print(f"[EFFECTS INIT] Cache initialized - bloom={self._cached_effect_settings['bloom']}, "
-                      f"ghosting={self._cached_effect_settings['ghosting']}, glass={self._cached_effect_settings['glass']}")
+                colored_print(f"[EFFECTS INIT] Cache initialized - bloom={self._cached_effect_settings['bloom']}, "
+                              f"ghosting={self._cached_effect_settings['ghosting']}, glass={self._cached_effect_settings['glass']}")
             
             # REMOVED: Periodic settings refresh - causes 5-second glitch
             # Settings are now only loaded on startup and when explicitly changed via settings dialog
@@ -9268,12 +9933,14 @@ class TickerWindow(QtWidgets.QWidget):
             glass_enabled = self._cached_effect_settings.get('glass', True)
             if not hasattr(self, '_effects_debug_logged'):
                 self._effects_debug_logged = True
-                print(f"[EFFECTS] Applying effects - bloom={bloom_enabled}, ghosting={ghosting_enabled}, glass={glass_enabled}")
+                colored_print(f"[EFFECTS] Applying effects - bloom={bloom_enabled}, ghosting={ghosting_enabled}, glass={glass_enabled}")
             
             # Only call effect functions if their individual settings are enabled
             if bloom_enabled:
                 # Apply bloom/glow effect (light bleeding from bright LEDs)
                 self.apply_bloom_effect(painter, width, height, cached_settings)
+            if prof is not None:
+                prof.mark('bloom')
             
             if ghosting_enabled:
                 # Ghosting is applied earlier (between background and main content)
@@ -9283,13 +9950,15 @@ class TickerWindow(QtWidgets.QWidget):
             if glass_enabled:
                 # Apply glass cover with reflections/glare (final layer on top of everything)
                 self.apply_glass_glare_effect(painter, width, height, cached_settings)
+            if prof is not None:
+                prof.mark('glass')
         else:
             # Debug why effects are disabled
             if not hasattr(self, '_effects_disabled_logged'):
                 self._effects_disabled_logged = True
                 has_gl = self.gl_widget is not None
                 enabled = self.gl_widget.effects_enabled if has_gl else False
-                print(f"[EFFECTS] NOT applying - gl_widget exists={has_gl}, effects_enabled={enabled}")
+                colored_print(f"[EFFECTS] NOT applying - gl_widget exists={has_gl}, effects_enabled={enabled}")
         
         # Draw FPS overlay if enabled
         if self.show_fps_overlay and hasattr(self, '_current_fps'):
@@ -9394,6 +10063,9 @@ class TickerWindow(QtWidgets.QWidget):
             painter.drawText(overlay_x + 10, overlay_y + 28, interval_text)
         
         painter.end()
+        if prof is not None:
+            prof.mark('overlay')
+            prof.end_frame(self.target_frame_interval)
     def ticker_mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
             pos = event.pos()
@@ -9440,9 +10112,30 @@ class TickerWindow(QtWidgets.QWidget):
             self.market_status_timer.stop()
         if hasattr(self, 'position_check_timer') and self.position_check_timer.isActive():
             self.position_check_timer.stop()
+        if hasattr(self, 'housekeeping_idle_timer'):
+            self.housekeeping_idle_timer.stop()
+            housekeeping = get_housekeeping_scheduler()
+            for task in self._housekeeping_tasks:
+                housekeeping.remove_task(task)
+            self._release_glow_pins()
+            housekeeping.remove_track(self._profiler_track)
         
         # Clear any pending API fetch tasks in the thread pool
         QtCore.QThreadPool.globalInstance().clear()
+        # Let a background tile build finish; Qt aborts if a running QThread is destroyed
+        if self._pixmap_worker is not None:
+            self._pixmap_worker.wait(2000)
+
+        # Persist sparkline history so the next start shows sparklines immediately
+        try:
+            get_history_store().save()
+        except Exception as e:
+            print(f"[SPARKLINE] Could not save history cache: {e}")
+        # ...and the last known quotes, so it shows prices immediately too
+        try:
+            get_quote_snapshot().save()
+        except Exception as e:
+            print(f"[SNAPSHOT] Could not save quote snapshot: {e}")
         
         # Restore Windows timer resolution
         if sys.platform == "win32" and hasattr(self, '_timer_period_set') and self._timer_period_set:
@@ -10047,6 +10740,16 @@ def parse_args():
     parser.add_argument("-b", "--backup-settings", action="store_true", help="Restore settings from backup and save as current")
     parser.add_argument("-n", "--no-splash", dest="no_splash", action="store_true", help="Disable splash screen on startup")
     parser.add_argument("--minimized", action="store_true", help=argparse.SUPPRESS)  # Used by Windows Startup registry entry
+    parser.add_argument("--record-market", dest="record_market", type=str, metavar="FILE",
+                        help="Capture quote responses and WebSocket frames to FILE (.jsonl.gz)")
+    parser.add_argument("--replay-market", dest="replay_market", type=str, metavar="FILE",
+                        help="Replay a capture instead of using the network")
+    parser.add_argument("--replay-speed", dest="replay_speed", type=float, default=1.0,
+                        help="Replay speed multiplier (default 1.0 = real time)")
+    parser.add_argument("--log-level", dest="log_level", type=str, metavar="LEVEL",
+                        help="Console log level for this run: DEBUG, INFO, WARNING or ERROR")
+    parser.add_argument("--log-json", dest="log_json", type=str, metavar="FILE",
+                        help="Also write log records to FILE as JSON lines")
     
     return parser.parse_args()
 
@@ -10081,6 +10784,64 @@ def backup_stocks_file():
         backup_file = STOCKS_FILE + ".backup"
         shutil.copy2(STOCKS_FILE, backup_file)
 
+def _apply_log_settings(settings, changed_keys=None):
+    """Settings store listener: apply log_level / log_tag_levels / log_jsonl"""
+    if changed_keys is not None and not changed_keys & {"log_level", "log_tag_levels", "log_jsonl"}:
+        return
+    pipeline = get_log_pipeline()
+    if not getattr(_apply_log_settings, 'level_override', False):
+        pipeline.configure(level=settings.get("log_level", "INFO"))
+    tag_levels = settings.get("log_tag_levels") or {}
+    pipeline.configure(tag_levels=tag_levels if isinstance(tag_levels, dict) else {})
+    if not getattr(_apply_log_settings, 'jsonl_override', False):
+        jsonl_path = os.path.join(APPDATA_DIR, "TCKR.Log.jsonl") if settings.get("log_jsonl") else None
+        if jsonl_path != pipeline.jsonl_path:
+            try:
+                os.makedirs(APPDATA_DIR, exist_ok=True)
+                pipeline.set_jsonl(jsonl_path)
+            except OSError as e:
+                colored_print(f"[LOG] ❌ Cannot write {jsonl_path}: {e}")
+
+def configure_logging(args):
+    """Log level and sinks from settings, overridden for this run by --log-level / --log-json"""
+    pipeline = get_log_pipeline()
+    if getattr(args, "log_level", None):
+        pipeline.configure(level=args.log_level)
+        _apply_log_settings.level_override = True
+    if getattr(args, "log_json", None):
+        try:
+            pipeline.set_jsonl(args.log_json)
+            _apply_log_settings.jsonl_override = True
+        except OSError as e:
+            colored_print(f"[LOG] ❌ Cannot write {args.log_json}: {e}")
+    store = get_settings_store()
+    _apply_log_settings(store.snapshot())
+    store.subscribe(_apply_log_settings)
+    stats = pipeline.get_stats()
+    colored_print(f"[LOG] Level {stats['level']}"
+                  f"{', JSON lines to ' + stats['jsonl_path'] if stats['jsonl_path'] else ''}")
+
+def configure_market_capture(args):
+    """Set up --record-market / --replay-market (replay wins if both are given)"""
+    global _MARKET_RECORDER, _MARKET_REPLAYER
+    if getattr(args, "replay_market", None):
+        try:
+            _MARKET_REPLAYER = MarketDataReplayer(args.replay_market, speed=args.replay_speed)
+        except (OSError, ValueError) as e:
+            colored_print(f"[REPLAY] ❌ Cannot replay {args.replay_market}: {e}")
+            return
+        stats = _MARKET_REPLAYER.get_stats()
+        colored_print(f"[REPLAY] ▶ Replaying {args.replay_market} at {args.replay_speed:g}x: "
+                      f"{stats['urls']} URLs, {stats['frames']} frames, {stats['duration']:.0f}s recorded")
+    elif getattr(args, "record_market", None):
+        try:
+            _MARKET_RECORDER = MarketDataRecorder(args.record_market)
+        except OSError as e:
+            colored_print(f"[REPLAY] ❌ Cannot record to {args.record_market}: {e}")
+            return
+        atexit.register(_MARKET_RECORDER.close)
+        colored_print(f"[REPLAY] ⏺ Recording market data to {args.record_market}")
+
 def apply_command_line_settings(args):
     if getattr(args, "backup_settings", False):
         restored = restore_settings_from_backup()
@@ -10152,6 +10913,15 @@ Options:
   -b, --backup-settings
       Restore settings from backup file
 
+  --record-market FILE
+      Capture quote responses and WebSocket frames to FILE
+
+  --replay-market FILE [--replay-speed N]
+      Replay a capture (no network) at N x real time
+
+  --log-level LEVEL, --log-json FILE
+      Log level (DEBUG, INFO, WARNING, ERROR); JSON-lines log file
+
 Examples:
   TCKR.exe -a your_api_key_here
   TCKR.exe -t AAPL,MSFT,GOOGL -s 2
@@ -10177,6 +10947,8 @@ Examples:
     # Parse arguments early so command-line options can affect startup
     args = parse_args()
     apply_command_line_settings(args)
+    configure_logging(args)
+    configure_market_capture(args)
 
     # Show splash screen IMMEDIATELY before any other initialization (unless disabled)
     splash = None
@@ -10210,10 +10982,10 @@ Examples:
     # (args already parsed above)
     
     # Tune Python garbage collector to prevent periodic stutters
-    # Disable automatic GC and run it manually during idle periods
+    # Disable automatic GC; the housekeeping scheduler collects in frame slack instead
     import gc
     gc.disable()  # Disable automatic collection
-    gc.set_threshold(5000, 10, 10)  # Much higher thresholds for gen0, gen1, gen2
+    gc.set_threshold(5000, 10, 10)  # When the scheduler collects gen0, gen1, gen2
     colored_print(f"[PERF] Python GC tuned for smooth rendering (disabled automatic collection)")
     
     splash_start_time = time.time()
@@ -10284,7 +11056,6 @@ Examples:
                     colored_print(f"[SECOND TICKER] Using same stocks as main ticker ({len(second_ticker_window.stocks)} stocks)")
 
                 # Build ticker display
-                second_ticker_window.build_ticker_pixmaps()
                 second_ticker_window.build_ticker_text(reset_scroll=True)
 
                 # Apply main ticker settings (except speed which is customized)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Frame Profiler for TCKR
+Times each stage of a ticker frame (scroll update, background blit, ghosting,
+main content, bloom, glass glare, overlays) into fixed-size NumPy ring buffers.
+Stage boundaries are laps of a single perf_counter, so a recording frame costs a
+handful of clock reads; when recording is off paint_ticker skips the profiler
+entirely. Recordings export as Chrome trace JSON (chrome://tracing, Perfetto) or
+JSON lines; toolsx/analyze_frame_profile.py summarises either format.
+"""
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+
+FRAME_STAGES = ("scroll", "background", "ghosting", "content", "bloom", "glass", "overlay")
+
+
+class FrameProfiler:
+    """Ring buffer of per-stage frame timings shared by every ticker window.
+
+    Usage per frame: begin_frame(track) -> mark(stage) after each stage -> end_frame().
+    mark() charges the time since the previous mark (or begin_frame) to `stage`.
+    """
+
+    def __init__(self, capacity=4096):
+        self.capacity = int(capacity)
+        self.enabled = False
+        self._stage_index = {name: i for i, name in enumerate(FRAME_STAGES)}
+        self._starts = np.zeros(self.capacity, dtype=np.float64)  # perf_counter seconds
+        self._stages = np.zeros((self.capacity, len(FRAME_STAGES)), dtype=np.float32)  # ms
+        self._totals = np.zeros(self.capacity, dtype=np.float32)  # ms
+        self._budgets = np.zeros(self.capacity, dtype=np.float32)  # ms (0 = unknown)
+        self._tracks = np.zeros(self.capacity, dtype=np.int16)
+        self._track_names = []
+        self._count = 0  # frames recorded since start() (may exceed capacity)
+        self._lock = threading.Lock()
+        # In-flight frame (paint_ticker runs on the GUI thread only)
+        self._frame_start = 0.0
+        self._lap = 0.0
+        self._row = None
+        self._track = 0
+        self._wall_start = time.time()
+        self._perf_start = time.perf_counter()
+
+    # ---- recording ------------------------------------------------------
+
+    def start(self):
+        """Clear the buffers and start recording"""
+        with self._lock:
+            self._count = 0
+            self._stages.fill(0.0)
+            self._wall_start = time.time()
+            self._perf_start = time.perf_counter()
+            self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def track_id(self, name):
+        """Small integer id for a window / thread label (one trace row per track)"""
+        with self._lock:
+            if name not in self._track_names:
+                self._track_names.append(name)
+            return self._track_names.index(name)
+
+    def begin_frame(self, track=0):
+        now = time.perf_counter()
+        self._frame_start = self._lap = now
+        self._track = track
+        self._row = [0.0] * len(FRAME_STAGES)
+
+    def mark(self, stage):
+        """Charge the time since the previous mark to `stage`"""
+        row = self._row
+        if row is None:
+            return
+        now = time.perf_counter()
+        row[self._stage_index[stage]] += (now - self._lap) * 1000.0
+        self._lap = now
+
+    def end_frame(self, budget_seconds=0.0):
+        """Commit the in-flight frame; budget_seconds is the frame interval it had to fit in"""
+        row = self._row
+        if row is None:
+            return
+        self._row = None
+        total = (time.perf_counter() - self._frame_start) * 1000.0
+        with self._lock:
+            if not self.enabled:
+                return
+            slot = self._count % self.capacity
+            self._starts[slot] = self._frame_start
+            self._stages[slot] = row
+            self._totals[slot] = total
+            self._budgets[slot] = budget_seconds * 1000.0
+            self._tracks[slot] = self._track
+            self._count += 1
+
+    # ---- reading --------------------------------------------------------
+
+    def _snapshot(self):
+        """Recorded frames in chronological order"""
+        with self._lock:
+            n = min(self._count, self.capacity)
+            if self._count > self.capacity:
+                order = np.roll(np.arange(self.capacity), -(self._count % self.capacity))
+            else:
+                order = np.arange(n)
+            return (self._starts[order].copy(), self._stages[order].copy(), self._totals[order].copy(),
+                    self._budgets[order].copy(), self._tracks[order].copy(), list(self._track_names),
+                    self._wall_start, self._perf_start)
+
+    def get_stats(self):
+        """Per-stage mean / p95 / max (ms) plus over-budget frame count"""
+        starts, stages, totals, budgets, _tracks, _names, _, _ = self._snapshot()
+        stats = {'frames': len(totals), 'recording': self.enabled}
+        if not len(totals):
+            return stats
+        stats['total_mean_ms'] = float(totals.mean())
+        stats['total_p95_ms'] = float(np.percentile(totals, 95))
+        stats['total_max_ms'] = float(totals.max())
+        over = (budgets > 0) & (totals > budgets)
+        stats['over_budget'] = int(over.sum())
+        stats['stages'] = {
+            name: {
+                'mean_ms': float(stages[:, i].mean()),
+                'p95_ms': float(np.percentile(stages[:, i], 95)),
+                'max_ms': float(stages[:, i].max()),
+            }
+            for i, name in enumerate(FRAME_STAGES)
+        }
+        if over.any():
+            # Which stage was the largest share of each over-budget frame
+            culprits = np.argmax(stages[over], axis=1)
+            stats['over_budget_by_stage'] = {
+                FRAME_STAGES[i]: int(c) for i, c in enumerate(np.bincount(culprits, minlength=len(FRAME_STAGES))) if c
+            }
+        return stats
+
+    # ---- export ---------------------------------------------------------
+
+    def export_jsonl(self, path):
+        """One JSON object per frame: ts (epoch s), track, total_ms, budget_ms, stages"""
+        starts, stages, totals, budgets, tracks, names, wall_start, perf_start = self._snapshot()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for i in range(len(totals)):
+                record = {
+                    'ts': round(wall_start + (starts[i] - perf_start), 6),
+                    'track': names[tracks[i]] if tracks[i] < len(names) else str(tracks[i]),
+                    'total_ms': round(float(totals[i]), 3),
+                    'budget_ms': round(float(budgets[i]), 3),
+                    'stages': {name: round(float(stages[i, j]), 3) for j, name in enumerate(FRAME_STAGES)},
+                }
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, path)
+        return len(totals)
+
+    def export_chrome_trace(self, path):
+        """Chrome trace-event JSON: one complete ("X") event per frame and per stage"""
+        starts, stages, totals, budgets, tracks, names, _, perf_start = self._snapshot()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': int(tid), 'args': {'name': name}}
+                  for tid, name in enumerate(names)]
+        for i in range(len(totals)):
+            tid = int(tracks[i])
+            ts = (starts[i] - perf_start) * 1e6
+            events.append({'name': 'frame', 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': tid,
+                           'ts': round(ts, 1), 'dur': round(float(totals[i]) * 1000.0, 1),
+                           'args': {'budget_ms': round(float(budgets[i]), 3)}})
+            # Stages ran in FRAME_STAGES order; lay them out back to back inside the frame
+            for j, name in enumerate(FRAME_STAGES):
+                dur = float(stages[i, j]) * 1000.0
+                if dur <= 0.0:
+                    continue
+                events.append({'name': name, 'cat': 'stage', 'ph': 'X', 'pid': 1, 'tid': tid,
+                               'ts': round(ts, 1), 'dur': round(dur, 1)})
+                ts += dur
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        os.replace(tmp_path, path)
+        return len(totals)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Ghost Trail for TCKR
+Accumulation engine for the motion blur/ghosting effect. Instead of drawing the
+tinted ghost tiles several times per frame at different offsets and opacities,
+one window-sized history image is kept: every frame it is faded and shifted a
+little to the right, the current ghost layer is laid over it, and the result is
+drawn in a single blit. Content that scrolled away stays behind in the history,
+so the trail follows the real motion; the cost per frame is a few window-sized
+image operations, whatever the watchlist size or trail length.
+"""
+
+import time
+
+from PyQt5 import QtCore, QtGui
+
+
+class GhostTrail:
+    """Persistent, fading history of a ticker window's ghost layer.
+
+    max_age: seconds without an update after which the history is discarded
+    (window hidden, effect toggled, loading screen) instead of resurfacing.
+    """
+
+    def __init__(self, max_age=0.25):
+        self.max_age = float(max_age)
+        self._front = None  # History shown this frame
+        self._back = None  # Next frame is composed here, then the two swap
+        self._last_update = 0.0
+        self._shift_remainder = 0.0
+        self._stats = {'updates': 0, 'resets': 0}
+
+    def reset(self):
+        """Forget the trail (the next update starts from the current layer only)"""
+        if self._front is not None:
+            self._front.fill(QtCore.Qt.transparent)
+        self._last_update = 0.0
+        self._shift_remainder = 0.0
+        self._stats['resets'] += 1
+
+    def update(self, width, height, draw_layer, decay, shift=0.0, lead=0.0):
+        """Advance the trail by one frame.
+
+        The previous history is drawn at `decay` opacity, moved `shift` pixels to
+        the right (fractions carry over to later frames), then draw_layer(painter)
+        lays the current ghost layer on top, offset `lead` pixels to the right.
+        """
+        width, height = max(1, int(width)), max(1, int(height))
+        now = time.monotonic()
+        if self._front is None or self._front.width() != width or self._front.height() != height:
+            self._front = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+            self._back = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+            self._front.fill(QtCore.Qt.transparent)
+            self._last_update = 0.0
+        elif now - self._last_update > self.max_age:
+            self.reset()
+
+        self._back.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(self._back)
+        if self._last_update:
+            self._shift_remainder += shift
+            step = int(self._shift_remainder)
+            self._shift_remainder -= step
+            painter.setOpacity(decay)
+            painter.drawImage(step, 0, self._front)
+            painter.setOpacity(1.0)
+        painter.translate(lead, 0.0)
+        draw_layer(painter)
+        painter.end()
+        self._front, self._back = self._back, self._front
+        self._last_update = now
+        self._stats['updates'] += 1
+
+    def draw(self, painter, opacity):
+        """Blit the current trail at `opacity`"""
+        if self._front is None or not self._last_update:
+            return
+        painter.save()
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        painter.setOpacity(opacity)
+        painter.drawImage(0, 0, self._front)
+        painter.restore()
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats['size'] = (self._front.width(), self._front.height()) if self._front is not None else None
+        return stats
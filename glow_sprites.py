@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Glow Sprites for TCKR
+Text with its glow halo pre-rendered into one image. A glowing string used to be
+drawn 9 times (8 subtle halo offsets plus the text) or 25 times for the 5% move
+glow; here the text is rasterized once as a coverage mask and the halo is built
+from that mask by a kernel that composites the glow colour at every offset - the
+same result as the stacked drawText passes - so drawing it again is one image copy.
+Sprites are QImages (safe on tile render threads), cached per (text, font, colour,
+glow colour, offsets); names and labels are pinned under their tile layout key so
+they don't age out while that layout is shown, and are released with it.
+"""
+
+import collections
+import threading
+
+import numpy as np
+from PyQt5 import QtCore, QtGui
+
+
+GlowSprite = collections.namedtuple("GlowSprite", ["image", "left", "top"])  # left/top: from the pen origin
+
+
+def render_glow_sprite(text, font, color, glow_color, glow_offsets, dpi=(96, 96)):
+    """GlowSprite of text drawn in color over a glow_color halo at glow_offsets"""
+    fm = QtGui.QFontMetrics(font)
+    reach = max((max(abs(dx), abs(dy)) for dx, dy in glow_offsets), default=0) + 2
+    bounds = fm.boundingRect(text)
+    left = min(0, bounds.left()) - reach
+    top = min(-fm.ascent(), bounds.top()) - reach
+    right = max(fm.horizontalAdvance(text), bounds.right() + 1) + reach
+    bottom = max(fm.descent(), bounds.bottom() + 1) + reach
+    width, height = right - left, bottom - top
+
+    # Coverage mask: the text once, opaque white, at the device's resolution
+    mask = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    mask.setDotsPerMeterX(int(round(dpi[0] / 0.0254)))
+    mask.setDotsPerMeterY(int(round(dpi[1] / 0.0254)))
+    mask.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(mask)
+    painter.setFont(font)
+    painter.setPen(QtGui.QColor(255, 255, 255))
+    painter.drawText(-left, -top, text)
+    painter.end()
+    bits = mask.constBits()
+    bits.setsize(mask.bytesPerLine() * height)
+    pixels = np.ndarray((height, width), dtype=np.uint32, buffer=bits, strides=(mask.bytesPerLine(), 4))
+    coverage = (pixels >> 24).astype(np.float32) / 255.0
+
+    # Halo: glow_color laid over itself at each offset (source-over) gives
+    # alpha = 1 - prod(1 - glow_alpha * shifted coverage); summed as logs over
+    # shifted views (the padding keeps every offset's ink inside the sprite)
+    glow_alpha = min(glow_color.alphaF(), 0.999)
+    layer = np.log1p(-glow_alpha * coverage)
+    total = np.zeros_like(coverage)
+    for dx, dy in glow_offsets:
+        total[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] += \
+            layer[max(-dy, 0):height - max(dy, 0), max(-dx, 0):width - max(dx, 0)]
+    clear = np.exp(total)
+    halo = 1.0 - clear
+    ink = color.alphaF() * coverage
+    under = halo * (1.0 - ink)
+    alpha = ink + under
+
+    out = np.empty((height, width), dtype=np.uint32)
+    out[:] = np.rint(alpha * 255.0).astype(np.uint32) << 24
+    for shift, text_channel, glow_channel in ((16, color.red(), glow_color.red()),
+                                              (8, color.green(), glow_color.green()),
+                                              (0, color.blue(), glow_color.blue())):
+        out |= np.rint(text_channel * ink + glow_channel * under).astype(np.uint32) << shift
+    image = QtGui.QImage(out.tobytes(), width, height, width * 4, QtGui.QImage.Format_ARGB32_Premultiplied).copy()
+    return GlowSprite(image, left, top)
+
+
+class GlowSpriteCache:
+    """Thread-safe GlowSprite cache: an LRU for changing text plus a pinned tier
+    for strings drawn on every rebuild (symbol names, labels, separators).
+
+    Pinned sprites are grouped by owner - the pin argument, normally the tile
+    layout key they were drawn for - and release_pinned(owner) drops a group
+    once that layout is gone (new font, height or settings).
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = int(max_entries)
+        self._entries = collections.OrderedDict()
+        self._pinned = {}  # owner -> {key: GlowSprite}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def sprite(self, text, font, color, glow_color, glow_offsets, dpi=(96, 96), pin=False):
+        color = QtGui.QColor(color)
+        glow_color = QtGui.QColor(glow_color)
+        glow_offsets = tuple(glow_offsets)
+        key = (text, font.key(), dpi, color.rgba(), glow_color.rgba(), glow_offsets)
+        with self._lock:
+            sprite = self._pinned[pin].get(key) if pin and pin in self._pinned else None
+            if sprite is None:
+                sprite = self._entries.get(key)
+                if sprite is not None:
+                    self._entries.move_to_end(key)
+            if sprite is not None:
+                self.hits += 1
+                return sprite
+        sprite = render_glow_sprite(text, font, color, glow_color, glow_offsets, dpi)
+        with self._lock:
+            self.misses += 1
+            if pin:
+                self._pinned.setdefault(pin, {})[key] = sprite
+            else:
+                self._entries[key] = sprite
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return sprite
+
+    def draw(self, painter, x, y, text, color, glow_color, glow_offsets, pin=False):
+        """Draw text with its halo at pen origin (x, y) in the painter's font.
+
+        Returns False (nothing drawn) where a 1:1 sprite would not match drawText:
+        scaled painters, high-DPI devices, or if no sprite could be made.
+        """
+        device = painter.device()
+        if (device is None or device.devicePixelRatioF() != 1.0
+                or painter.transform().type() > QtGui.QTransform.TxTranslate):
+            return False
+        dpi = (device.logicalDpiX(), device.logicalDpiY())
+        try:
+            sprite = self.sprite(text, painter.font(), color, glow_color, glow_offsets, dpi, pin)
+        except Exception:
+            return False
+        painter.drawImage(x + sprite.left, y + sprite.top, sprite.image)
+        return True
+
+    def release_pinned(self, owner):
+        """Drop the sprites pinned under owner"""
+        with self._lock:
+            self._pinned.pop(owner, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+
+    def get_stats(self):
+        with self._lock:
+            pinned = sum(len(group) for group in self._pinned.values())
+        return {'entries': len(self._entries), 'pinned': pinned, 'pinned_layouts': len(self._pinned),
+                'hits': self.hits, 'misses': self.misses}
+
+
+_CACHE = GlowSpriteCache()
+
+
+def get_glow_sprite_cache():
+    return _CACHE
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Glyph Atlas for TCKR
+Pre-rendered digits, signs, '.', '%' and "N/A" for one font and colour, glow halo
+included, so price and change text is drawn by copying small cells instead of
+laying text out with QPainter.drawText. Advances come from a per-font table
+measured once, which lets the tile builders and the in-place price update agree
+on every width without a QFontMetrics call per tick. Cells are QImages, so tile
+render worker threads draw from the same atlases as the GUI thread.
+"""
+
+import collections
+import threading
+
+from PyQt5 import QtCore, QtGui
+
+
+CHARSET = "0123456789+-.%NA/"
+
+
+class GlyphMetrics:
+    """Per-character advances and ink extents for one font.
+
+    advance(text) is the sum of the character advances; text drawn by
+    GlyphAtlas.draw lands exactly on those positions, so a width measured here
+    always matches what was painted.
+    """
+
+    def __init__(self, font):
+        self.font = QtGui.QFont(font)
+        self._fm = QtGui.QFontMetrics(self.font)
+        self.ascent = self._fm.ascent()
+        self.descent = self._fm.descent()
+        self.advances = {}
+        self.ink = {}  # char -> (left, top, right, bottom) relative to the pen origin
+        self.overhang = 0  # widest ink spill past a character's advance box
+        for ch in CHARSET:
+            self._measure(ch)
+
+    def _measure(self, ch):
+        fm = self._fm
+        advance = fm.horizontalAdvance(ch)
+        rect = fm.boundingRect(ch)
+        left = min(0, rect.left())
+        right = max(advance, rect.right() + 1)
+        self.advances[ch] = advance
+        self.ink[ch] = (left, min(-self.ascent, rect.top()), right, max(self.descent, rect.bottom() + 1))
+        self.overhang = max(self.overhang, -left, right - advance)
+        return advance
+
+    def advance(self, text):
+        advances = self.advances
+        total = 0
+        for ch in text:
+            width = advances.get(ch)
+            if width is None:
+                width = self._measure(ch)
+            total += width
+        return total
+
+
+# One character's pre-rendered pixels; halo is None without a glow colour
+GlyphCell = collections.namedtuple("GlyphCell", ["ink", "halo", "left", "top"])
+
+
+class GlyphAtlas:
+    """Glyph cells for one (font, colour, glow) combination.
+
+    Each cell holds a character's ink and, separately, its glow halo (the glow
+    colour at every glow offset). draw() lays all halos of a string before its
+    ink, the way draw_glow_text draws a whole string, so neighbouring halos never
+    dim a character. bounds() is the exact box the cells of a string cover -
+    what an in-place redraw has to clear.
+    """
+
+    def __init__(self, metrics, color, glow_color=None, glow_offsets=()):
+        self.metrics = metrics
+        self.color = QtGui.QColor(color)
+        self.glow_color = QtGui.QColor(glow_color) if glow_color is not None else None
+        self.glow_offsets = tuple(glow_offsets) if glow_color is not None else ()
+        self.glow_reach = max((max(abs(dx), abs(dy)) for dx, dy in self.glow_offsets), default=0)
+        self._cells = {}  # char -> GlyphCell
+        for ch in CHARSET:
+            self._cell(ch)
+
+    def _render(self, ch, color, offsets, left, top, width, height):
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(image)
+        painter.setFont(self.metrics.font)
+        painter.setPen(color)
+        for dx, dy in offsets:
+            painter.drawText(-left + dx, -top + dy, ch)
+        painter.end()
+        return image
+
+    def _cell(self, ch):
+        cell = self._cells.get(ch)
+        if cell is not None:
+            return cell
+        metrics = self.metrics
+        metrics.advance(ch)  # Measures characters outside CHARSET on first use
+        left, top, right, bottom = metrics.ink[ch]
+        margin = self.glow_reach + 1  # +1 for antialiased edges
+        left -= margin
+        top -= margin
+        width = max(1, right + margin - left)
+        height = max(1, bottom + margin - top)
+        ink = self._render(ch, self.color, ((0, 0),), left, top, width, height)
+        halo = None
+        if self.glow_color is not None:
+            halo = self._render(ch, self.glow_color, self.glow_offsets, left, top, width, height)
+        cell = self._cells[ch] = GlyphCell(ink, halo, left, top)
+        return cell
+
+    def draw(self, painter, x, baseline, text):
+        """Draw `text` with its pen origin at (x, baseline); returns the advance"""
+        advances = self.metrics.advances
+        cells = [self._cells.get(ch) or self._cell(ch) for ch in text]
+        if self.glow_color is not None:
+            pen = x
+            for ch, cell in zip(text, cells):
+                painter.drawImage(pen + cell.left, baseline + cell.top, cell.halo)
+                pen += advances[ch]
+        start = x
+        for ch, cell in zip(text, cells):
+            painter.drawImage(x + cell.left, baseline + cell.top, cell.ink)
+            x += advances[ch]
+        return x - start
+
+    def bounds(self, x, baseline, text):
+        """QRect covering every cell draw(painter, x, baseline, text) paints"""
+        advances = self.metrics.advances
+        rect = QtCore.QRect()
+        for ch in text:
+            cell = self._cells.get(ch) or self._cell(ch)
+            rect = rect.united(QtCore.QRect(x + cell.left, baseline + cell.top, cell.ink.width(), cell.ink.height()))
+            x += advances[ch]
+        return rect
+
+
+_METRICS = {}
+_ATLASES = collections.OrderedDict()
+_LOCK = threading.Lock()
+MAX_ATLASES = 64
+
+
+def get_glyph_metrics(font):
+    """Shared GlyphMetrics for `font` (keyed by QFont.key())"""
+    key = font.key()
+    metrics = _METRICS.get(key)
+    if metrics is None:
+        with _LOCK:
+            metrics = _METRICS.get(key)
+            if metrics is None:
+                metrics = _METRICS[key] = GlyphMetrics(font)
+    return metrics
+
+
+def get_glyph_atlas(font, color, glow_color=None, glow_offsets=()):
+    """Shared GlyphAtlas for (font, colour, glow); least recently used ones are dropped"""
+    key = (font.key(), color.rgba(), glow_color.rgba() if glow_color is not None else None,
+           tuple(glow_offsets) if glow_color is not None else ())
+    with _LOCK:
+        atlas = _ATLASES.get(key)
+        if atlas is not None:
+            _ATLASES.move_to_end(key)
+            return atlas
+    atlas = GlyphAtlas(get_glyph_metrics(font), color, glow_color, glow_offsets)
+    with _LOCK:
+        atlas = _ATLASES.setdefault(key, atlas)  # Another thread may have built it meanwhile
+        while len(_ATLASES) > MAX_ATLASES:
+            _ATLASES.popitem(last=False)
+    return atlas
+
+
+def clear_glyph_atlases():
+    with _LOCK:
+        _METRICS.clear()
+        _ATLASES.clear()
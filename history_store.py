@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Price History Store for TCKR
+Keeps a per-symbol close-price series for each sparkline period in NumPy arrays,
+with each bucket's high, low and traded volume alongside. Series are seeded from
+Yahoo chart data once, then extended from WebSocket trade bars and polling results; only the missing tail is re-fetched when a series goes stale.
+Sparklines of any size are rendered from the store without touching the network,
+and the store is persisted to disk so sparklines are available right at startup.
+HistoryFetchScheduler feeds the store from a small fixed worker pool.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+
+import numpy as np
+
+
+# period -> Yahoo interval, bucket width (s), how much history to keep (s), refresh TTL (s)
+HISTORY_PERIODS = {
+    "1d": {"interval": "5m", "bucket": 300, "max_age": 86400, "refresh": 600},
+    "5d": {"interval": "30m", "bucket": 1800, "max_age": 7 * 86400, "refresh": 1800},
+}
+
+
+class PriceSeries:
+    """Growable (timestamp, close, high, low, volume) columns: float64 epoch seconds,
+    float32 prices and float64 volumes. Fetched points carry closes only (high and
+    low equal the close, volume 0); live appends widen the bucket's range and add
+    their volume."""
+
+    __slots__ = ("times", "closes", "highs", "lows", "volumes", "size", "version", "last_fetch")
+    COLUMNS = ("times", "closes", "highs", "lows", "volumes")
+
+    def __init__(self, capacity=64):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.closes = np.empty(capacity, dtype=np.float32)
+        self.highs = np.empty(capacity, dtype=np.float32)
+        self.lows = np.empty(capacity, dtype=np.float32)
+        self.volumes = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+        self.version = 0
+        self.last_fetch = 0.0  # wall time of the last network fetch (0 = never)
+
+    def _reserve(self, needed):
+        capacity = len(self.times)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            column = np.empty(capacity, dtype=old.dtype)
+            column[:self.size] = old[:self.size]
+            setattr(self, name, column)
+
+    def append(self, timestamp, close, bucket, high=None, low=None, volume=0.0):
+        """Add a live point; a point inside the last bucket replaces that bucket's close,
+        widens its high/low and adds its volume"""
+        high = close if high is None else max(high, close)
+        low = close if low is None else min(low, close)
+        if self.size and timestamp < self.times[self.size - 1] + bucket:
+            if timestamp < self.times[self.size - 1]:
+                return False  # Older than what we already have
+            last = self.size - 1
+            self.closes[last] = close
+            self.highs[last] = max(self.highs[last], high)
+            self.lows[last] = min(self.lows[last], low)
+            self.volumes[last] += volume
+        else:
+            self._reserve(self.size + 1)
+            self.times[self.size] = timestamp - (timestamp % bucket)
+            self.closes[self.size] = close
+            self.highs[self.size] = high
+            self.lows[self.size] = low
+            self.volumes[self.size] = volume
+            self.size += 1
+        self.version += 1
+        return True
+
+    def merge(self, times, closes, highs=None, lows=None, volumes=None):
+        """Replace everything from times[0] onward with the fetched points"""
+        if len(times):
+            keep = int(np.searchsorted(self.times[:self.size], times[0], side="left"))
+            end = keep + len(times)
+            self._reserve(end)
+            self.times[keep:end] = times
+            self.closes[keep:end] = closes
+            self.highs[keep:end] = closes if highs is None else highs
+            self.lows[keep:end] = closes if lows is None else lows
+            self.volumes[keep:end] = 0.0 if volumes is None else volumes
+            self.size = end
+        self.version += 1
+
+    def trim(self, oldest):
+        """Drop points older than `oldest`"""
+        cut = int(np.searchsorted(self.times[:self.size], oldest, side="left"))
+        if cut:
+            remaining = self.size - cut
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[:remaining] = column[cut:self.size]
+            self.size = remaining
+            self.version += 1
+
+    def last_time(self):
+        return float(self.times[self.size - 1]) if self.size else None
+
+
+class HistoryStore:
+    """Thread-safe {(symbol, period): PriceSeries} with .npz persistence"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._series = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.time()
+
+    @staticmethod
+    def period_config(period):
+        return HISTORY_PERIODS.get(period, HISTORY_PERIODS["1d"])
+
+    def fetch_plan(self, symbol, period, now=None):
+        """Decide whether `symbol` needs network data for `period`.
+
+        Returns (needed, since): since is None for a full-range fetch, otherwise the
+        epoch second to fetch the tail from.
+        """
+        now = time.time() if now is None else now
+        config = self.period_config(period)
+        with self._lock:
+            series = self._series.get((symbol, period))
+            if series is None or series.size < 2:
+                if series is not None and now - series.last_fetch < config["refresh"]:
+                    return False, None  # Recent fetch returned nothing - wait for the TTL
+                return True, None
+            if now - series.last_fetch < config["refresh"]:
+                return False, None
+            last_time = series.last_time()
+            if now - last_time >= config["max_age"]:
+                return True, None
+            # Re-fetch from the last bucket so a partially-filled bucket gets its final close
+            return True, last_time
+
+    def merge_fetched(self, symbol, period, times, closes, now=None):
+        """Store points fetched from the network (full range or tail)"""
+        now = time.time() if now is None else now
+        config = self.period_config(period)
+        times = np.asarray(times, dtype=np.float64)
+        closes = np.asarray(closes, dtype=np.float32)
+        with self._lock:
+            series = self._series.get((symbol, period))
+            if series is None:
+                series = PriceSeries(max(64, len(times) * 2))
+                self._series[(symbol, period)] = series
+            series.merge(times, closes)
+            series.trim(now - config["max_age"])
+            series.last_fetch = now
+            self._dirty = True
+
+    def mark_fetch_failed(self, symbol, period, now=None):
+        """Record a failed fetch so it is not retried before the refresh TTL"""
+        now = time.time() if now is None else now
+        with self._lock:
+            series = self._series.get((symbol, period))
+            if series is None:
+                series = PriceSeries()
+                self._series[(symbol, period)] = series
+            series.last_fetch = now
+
+    def append(self, symbol, price, timestamp=None, high=None, low=None, volume=0.0):
+        """Extend every seeded series of `symbol` with a live price (and, for a trade
+        bar, its high, low and volume)"""
+        if price is None or price <= 0:
+            return
+        timestamp = time.time() if timestamp is None else float(timestamp)
+        with self._lock:
+            for period, config in HISTORY_PERIODS.items():
+                series = self._series.get((symbol, period))
+                if series is not None and series.size and series.append(timestamp, price, config["bucket"],
+                                                                         high, low, volume):
+                    self._dirty = True
+
+    def append_quotes(self, prices, timestamp=None):
+        """Extend series from a polling result {symbol: (price, prev_close)}"""
+        timestamp = time.time() if timestamp is None else timestamp
+        for symbol, quote in prices.items():
+            if quote and quote[0] is not None:
+                self.append(symbol, quote[0], timestamp)
+
+    def closes(self, symbol, period):
+        """Copy of the close series for rendering (empty array if unknown)"""
+        with self._lock:
+            series = self._series.get((symbol, period))
+            if series is None:
+                return np.empty(0, dtype=np.float32)
+            return series.closes[:series.size].copy()
+
+    def ohlcv(self, symbol, period):
+        """Copies of (times, closes, highs, lows, volumes); empty arrays if unknown"""
+        with self._lock:
+            series = self._series.get((symbol, period))
+            if series is None:
+                series = PriceSeries(0)
+            return tuple(getattr(series, name)[:series.size].copy() for name in PriceSeries.COLUMNS)
+
+    def version(self, symbol, period):
+        """Changes whenever the series changes; use it to key rendered pixmaps"""
+        with self._lock:
+            series = self._series.get((symbol, period))
+            return (series.version, series.size) if series is not None else None
+
+    def save(self, path=None):
+        """Write every series to one .npz file (atomic replace)"""
+        path = path or self.path
+        if not path:
+            return False
+        with self._lock:
+            items = [(key, s) for key, s in self._series.items() if s.size]
+            keys = np.array([f"{symbol}|{period}" for (symbol, period), _ in items], dtype=np.str_)
+            sizes = np.array([s.size for _, s in items], dtype=np.int64)
+            last_fetch = np.array([s.last_fetch for _, s in items], dtype=np.float64)
+            columns = {}
+            for name in PriceSeries.COLUMNS:
+                if items:
+                    columns[name] = np.concatenate([getattr(s, name)[:s.size] for _, s in items])
+                else:
+                    columns[name] = np.empty(0, dtype=getattr(PriceSeries(0), name).dtype)
+            self._dirty = False
+            self._last_save = time.time()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, keys=keys, sizes=sizes, last_fetch=last_fetch, **columns)
+        os.replace(tmp_path, path)
+        return True
+
+    def save_if_dirty(self, min_interval=300.0):
+        """Save at most every `min_interval` seconds, and only after changes"""
+        if self._dirty and time.time() - self._last_save >= min_interval:
+            return self.save()
+        return False
+
+    def load(self, path=None):
+        """Load series saved by save(); returns the number of series loaded"""
+        path = path or self.path
+        if not path or not os.path.exists(path):
+            return 0
+        now = time.time()
+        with np.load(path, allow_pickle=False) as data:
+            keys, sizes = data["keys"], data["sizes"]
+            last_fetch, times, closes = data["last_fetch"], data["times"], data["closes"]
+            # Files written before high/low/volume were kept hold closes only
+            highs = data["highs"] if "highs" in data.files else None
+            lows = data["lows"] if "lows" in data.files else None
+            volumes = data["volumes"] if "volumes" in data.files else None
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        loaded = 0
+        with self._lock:
+            for index, key in enumerate(keys):
+                symbol, _, period = str(key).rpartition("|")
+                if period not in HISTORY_PERIODS:
+                    continue
+                start, end = int(offsets[index]), int(offsets[index + 1])
+                series = PriceSeries(max(64, (end - start) * 2))
+                series.merge(times[start:end], closes[start:end],
+                             highs[start:end] if highs is not None else None,
+                             lows[start:end] if lows is not None else None,
+                             volumes[start:end] if volumes is not None else None)
+                series.trim(now - HISTORY_PERIODS[period]["max_age"])
+                series.last_fetch = float(last_fetch[index])
+                self._series[(symbol, period)] = series
+                loaded += 1
+        return loaded
+
+
+class HistoryFetchScheduler:
+    """Fixed-size worker pool that fills the HistoryStore in priority order.
+
+    Requests are keyed by (symbol, period): a request for a key that is already
+    queued only raises its priority, and one that is already in flight is merged
+    into it, so every ticker window and sparkline size shares a single download.
+    fetch_fn(symbol, period, since) returns (timestamps, closes) or raises.
+    """
+
+    def __init__(self, store, fetch_fn, max_workers=4):
+        self.store = store
+        self.fetch_fn = fetch_fn
+        self.max_workers = max(1, int(max_workers))
+        self._heap = []  # (priority, seq, key) - stale entries are skipped lazily
+        self._pending = {}  # key -> [priority, since, submitted_at]
+        self._inflight = set()
+        self._listeners = {}  # key -> {owner: callback}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._workers = []
+        self._running = True
+        self._stats = {
+            'submitted': 0,
+            'coalesced': 0,
+            'completed': 0,
+            'failed': 0,
+            'peak_queue_depth': 0,
+            'total_wait_seconds': 0.0,
+            'max_wait_seconds': 0.0,
+            'total_fetch_seconds': 0.0,
+            'max_fetch_seconds': 0.0,
+        }
+
+    def _ensure_workers(self):
+        self._workers = [w for w in self._workers if w.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._run, name=f"HistoryFetch-{len(self._workers)}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, symbol, period, since=None, priority=0.0, owner=None, on_done=None):
+        """Queue a fetch; lower priority values run first. on_done(symbol, period)
+        is called once per owner when the data has landed in the store."""
+        key = (symbol, period)
+        with self._cond:
+            if not self._running:
+                return False
+            if on_done is not None:
+                self._listeners.setdefault(key, {})[owner] = on_done
+            if key in self._inflight:
+                self._stats['coalesced'] += 1
+                return True
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._stats['coalesced'] += 1
+                if since is None:
+                    pending[1] = None  # A full fetch covers any tail request
+                if priority < pending[0]:
+                    pending[0] = priority
+                    heapq.heappush(self._heap, (priority, next(self._seq), key))
+                    self._cond.notify()
+                return True
+            self._pending[key] = [priority, since, time.monotonic()]
+            heapq.heappush(self._heap, (priority, next(self._seq), key))
+            self._stats['submitted'] += 1
+            self._stats['peak_queue_depth'] = max(self._stats['peak_queue_depth'], len(self._pending))
+            self._ensure_workers()
+            self._cond.notify()
+            return True
+
+    def _next_job(self):
+        with self._cond:
+            while self._running:
+                while self._heap:
+                    priority, _seq, key = heapq.heappop(self._heap)
+                    pending = self._pending.get(key)
+                    if pending is None or pending[0] != priority:
+                        continue  # Superseded by a higher-priority resubmit
+                    del self._pending[key]
+                    self._inflight.add(key)
+                    wait = time.monotonic() - pending[2]
+                    self._stats['total_wait_seconds'] += wait
+                    self._stats['max_wait_seconds'] = max(self._stats['max_wait_seconds'], wait)
+                    return key, pending[1]
+                self._cond.wait()
+            return None
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            (symbol, period), since = job
+            started = time.monotonic()
+            ok = True
+            try:
+                timestamps, closes = self.fetch_fn(symbol, period, since)
+                self.store.merge_fetched(symbol, period, timestamps, closes)
+            except Exception:
+                ok = False
+                self.store.mark_fetch_failed(symbol, period)
+            elapsed = time.monotonic() - started
+            with self._cond:
+                self._inflight.discard((symbol, period))
+                listeners = self._listeners.pop((symbol, period), {})
+                self._stats['completed' if ok else 'failed'] += 1
+                self._stats['total_fetch_seconds'] += elapsed
+                self._stats['max_fetch_seconds'] = max(self._stats['max_fetch_seconds'], elapsed)
+            for callback in listeners.values():
+                try:
+                    callback(symbol, period)
+                except Exception:
+                    pass
+
+    def get_stats(self):
+        """Queue depth, in-flight count and wait/fetch latency counters"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['queue_depth'] = len(self._pending)
+            stats['inflight'] = len(self._inflight)
+            stats['workers'] = self.max_workers
+        started = stats['completed'] + stats['failed'] + stats['inflight']
+        finished = stats['completed'] + stats['failed']
+        stats['avg_wait_ms'] = stats['total_wait_seconds'] * 1000.0 / started if started else 0.0
+        stats['avg_fetch_ms'] = stats['total_fetch_seconds'] * 1000.0 / finished if finished else 0.0
+        return stats
+
+    def clear(self):
+        """Drop queued (not in-flight) requests, e.g. after the sparkline period changes"""
+        with self._cond:
+            self._heap.clear()
+            for key in self._pending:
+                self._listeners.pop(key, None)
+            self._pending.clear()
+
+    def shutdown(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Housekeeping for TCKR
+Runs garbage collection and cache upkeep in the slack left inside frame budgets.
+The app keeps Python's automatic collector disabled because a collection landing
+mid-frame drops frames; instead, after every VSync paint the ticker windows report
+when the frame started and how long painting took, and the scheduler spends what
+is left before the next VBlank (minus a safety margin and the time other windows
+still need for the same VBlank) on young-generation collections and small, bounded
+slices of registered tasks (glow expiry, icon trimming, cache eviction). Each step
+only runs if its measured cost fits the remaining slack. While no frames are
+painted (hidden window) the same work runs from an idle timer instead.
+"""
+
+import gc
+import threading
+import time
+
+from log_pipeline import WARNING
+
+
+def _print_log(level, tag, text, *args):
+    print(f"[{tag}] {text % args if args else text}")
+
+
+_log = _print_log  # The app routes this through its log pipeline (set_logger)
+
+
+def set_logger(log):
+    """Send this module's messages to log(level, tag, text, *args), e.g.
+    LogPipeline.log; None restores plain print()"""
+    global _log
+    _log = log or _print_log
+
+
+class HousekeepingTask:
+    """One registered housekeeping job; func() does a bounded slice of work and
+    returns True while more is pending (it then runs again at the next chance)"""
+
+    __slots__ = ("name", "func", "interval", "next_run", "cost_ms", "runs", "errors")
+
+    def __init__(self, name, func, interval, cost_ms=1.0):
+        self.name = name
+        self.func = func
+        self.interval = float(interval)
+        self.next_run = time.perf_counter() + self.interval
+        self.cost_ms = float(cost_ms)  # Running estimate, replaced by measurements
+        self.runs = 0
+        self.errors = 0
+
+
+class HousekeepingScheduler:
+    """Frame-slack scheduler shared by every ticker window (GUI thread only).
+
+    Collection triggers follow gc.get_threshold(), so the thresholds main() sets
+    keep their meaning with automatic collection disabled. A young generation
+    due for longer than max_defer seconds runs in any slack at all rather than
+    waiting for one its cost estimate fits, and after 4 * max_defer even in a
+    frame with none, so memory cannot creep up on a machine that never has slack.
+    """
+
+    def __init__(self, safety_ms=2.0, idle_after=0.5, max_defer=5.0, max_steps_per_frame=4):
+        self.safety_ms = float(safety_ms)
+        self.idle_after = float(idle_after)
+        self.max_defer = float(max_defer)
+        self.max_steps_per_frame = int(max_steps_per_frame)
+        self._tasks = []
+        self._tracks = {}  # track -> [paint cost EMA (ms), VSync time of its last paint]
+        self._last_frame = 0.0
+        self._gc_cost_ms = [0.5, 2.0, 8.0]  # Per-generation estimates until measured
+        self._gc_due_since = [None, None, None]
+        self._frozen = False
+        self._lock = threading.Lock()
+        self._stats = {'frames': 0, 'slack_ms': 0.0, 'collections': [0, 0, 0], 'collected': 0,
+                       'task_runs': 0, 'idle_runs': 0, 'overruns': 0}
+
+    # ---- registration ---------------------------------------------------
+
+    def add_task(self, name, func, interval, cost_ms=1.0):
+        """Run func() about every `interval` seconds in frame slack; returns the task"""
+        task = HousekeepingTask(name, func, interval, cost_ms)
+        with self._lock:
+            self._tasks.append(task)
+        return task
+
+    def remove_task(self, task):
+        with self._lock:
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+    def remove_track(self, track):
+        """Forget a window that stopped painting (its paint time no longer reserved)"""
+        self._tracks.pop(track, None)
+
+    # ---- frame slack ----------------------------------------------------
+
+    def frame_done(self, track, vsync_time, frame_interval, paint_start):
+        """Report a finished VSync paint and spend the rest of its frame budget.
+
+        vsync_time: perf_counter() at the VBlank the paint was for; paint_start:
+        perf_counter() when the paint began; frame_interval in seconds.
+        """
+        now = time.perf_counter()
+        paint_ms = (now - paint_start) * 1000.0
+        entry = self._tracks.get(track)
+        if entry is None:
+            entry = self._tracks[track] = [paint_ms, vsync_time]
+        else:
+            # Rise fast, decay slowly: reserve for the expensive frames, not the average one
+            weight = 0.5 if paint_ms > entry[0] else 0.05
+            entry[0] += (paint_ms - entry[0]) * weight
+            entry[1] = vsync_time
+        self._last_frame = now
+
+        # Windows that still have to paint for this VBlank (seen within the last second)
+        reserved_ms = self.safety_ms
+        for other, (cost, last_vsync) in self._tracks.items():
+            if other != track and last_vsync < vsync_time and vsync_time - last_vsync < 1.0:
+                reserved_ms += cost
+        deadline = vsync_time + frame_interval - reserved_ms / 1000.0
+        self._stats['frames'] += 1
+        slack_ms = (deadline - now) * 1000.0
+        self._stats['slack_ms'] += (max(slack_ms, 0.0) - self._stats['slack_ms']) * 0.05
+        if slack_ms > 0.0:
+            self._run_until(deadline)
+        else:
+            self._collect_step(0.0)
+
+    def idle(self, budget_ms=8.0):
+        """Run pending work from a timer while no frames are being painted"""
+        now = time.perf_counter()
+        if now - self._last_frame < self.idle_after:
+            return
+        self._stats['idle_runs'] += 1
+        self._run_until(now + budget_ms / 1000.0)
+
+    def _run_until(self, deadline):
+        for _ in range(self.max_steps_per_frame):
+            slack_ms = (deadline - time.perf_counter()) * 1000.0
+            if slack_ms <= 0.0:
+                break
+            if not (self._collect_step(slack_ms) or self._task_step(slack_ms)):
+                break
+        if time.perf_counter() > deadline:
+            self._stats['overruns'] += 1
+
+    def _collect_step(self, slack_ms):
+        """Run the oldest due generation that fits (or is overdue); True if one ran"""
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        now = time.perf_counter()
+        for generation in (2, 1, 0):
+            if not thresholds[generation] or counts[generation] < thresholds[generation]:
+                self._gc_due_since[generation] = None
+                continue
+            if self._gc_due_since[generation] is None:
+                self._gc_due_since[generation] = now
+            waited = now - self._gc_due_since[generation]
+            if generation == 2 or waited <= self.max_defer:
+                fits = self._gc_cost_ms[generation] <= slack_ms
+            else:
+                fits = slack_ms > 0.0 or waited > 4 * self.max_defer
+            if not fits:
+                continue
+            start = time.perf_counter()
+            self._stats['collected'] += gc.collect(generation)
+            cost = (time.perf_counter() - start) * 1000.0
+            self._gc_cost_ms[generation] += (cost - self._gc_cost_ms[generation]) * 0.3
+            self._stats['collections'][generation] += 1
+            self._gc_due_since[generation] = None
+            return True
+        return False
+
+    def _task_step(self, slack_ms):
+        """Run the most overdue task whose cost fits; True if one ran"""
+        now = time.perf_counter()
+        with self._lock:
+            due = [task for task in self._tasks if task.next_run <= now and task.cost_ms <= slack_ms]
+        if not due:
+            return False
+        task = min(due, key=lambda t: t.next_run)
+        start = time.perf_counter()
+        try:
+            more = task.func()
+        except Exception as e:
+            task.errors += 1
+            more = False
+            if task.errors <= 3:
+                _log(WARNING, "HOUSEKEEPING", "Task %s failed: %s", task.name, e)
+        end = time.perf_counter()
+        task.cost_ms += ((end - start) * 1000.0 - task.cost_ms) * 0.3
+        task.runs += 1
+        task.next_run = end if more else end + task.interval
+        self._stats['task_runs'] += 1
+        return True
+
+    # ---- startup --------------------------------------------------------
+
+    def freeze_after_startup(self):
+        """Collect once, then move everything alive into the permanent generation
+        (gc.freeze) so later full collections skip the startup heap; returns the
+        number of frozen objects (0 if already done or unsupported)"""
+        if self._frozen or not hasattr(gc, 'freeze'):
+            return 0
+        self._frozen = True
+        gc.collect()
+        gc.freeze()
+        return gc.get_freeze_count()
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats['collections'] = list(stats['collections'])
+        stats['gc_cost_ms'] = [round(cost, 3) for cost in self._gc_cost_ms]
+        stats['gc_count'] = gc.get_count()
+        stats['frozen'] = gc.get_freeze_count() if hasattr(gc, 'get_freeze_count') else 0
+        with self._lock:
+            stats['tasks'] = {task.name: {'runs': task.runs, 'cost_ms': round(task.cost_ms, 3), 'errors': task.errors}
+                              for task in self._tasks}
+        return stats
+
+
+_SCHEDULER = HousekeepingScheduler()
+
+
+def get_housekeeping_scheduler():
+    return _SCHEDULER
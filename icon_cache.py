@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Icon Cache for TCKR
+Two tiers for processed (scaled, pixelated, scanlined) ticker icons:
+an in-memory LRU keyed by (symbol, size, led_icon_matrix), and processed PNGs on
+disk under TCKR.images/processed. Processed files are named after a digest of
+the source image, so symbols that share an icon share their processed variants.
+The index also keeps each source's mtime and size; a source edited on disk no
+longer matches them, so its stale variants are skipped and it is digested again.
+icon_index.json records which source file each symbol resolved to and which
+processed variants exist, so lookups never have to probe the directory.
+Symbols with no icon anywhere are remembered for a while (TCKR.IconMisses.json,
+next to TCKR.images) so they are not probed again on every start.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class IconCache:
+    """In-memory LRU + on-disk processed icons with a JSON index"""
+
+    INDEX_VERSION = 1
+
+    def __init__(self, images_dir, memory_limit=100, miss_ttl=3 * 86400, revalidate_after=7 * 86400):
+        self.images_dir = images_dir
+        self.processed_dir = os.path.join(images_dir, "processed")
+        self.index_path = os.path.join(images_dir, "icon_index.json")
+        self.misses_path = os.path.join(os.path.dirname(images_dir), "TCKR.IconMisses.json")
+        self.memory_limit = int(memory_limit)
+        self.miss_ttl = float(miss_ttl)
+        self.revalidate_after = float(revalidate_after)
+        self._memory = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._sources = {}  # symbol -> {"file", "digest", "stat", and for downloads "url", "etag", "last_modified", "checked"}
+        self._misses = {}  # symbol -> wall time the symbol was found to have no icon
+        self._processed = set()  # processed file names known to exist
+        self._index_dirty = False
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evicted': 0,
+            'known_missing_skips': 0,
+        }
+        self._load_index()
+        self._load_misses()
+
+    # ---- memory tier ----------------------------------------------------
+
+    def get_memory(self, key):
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+            return value
+
+    def put_memory(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_limit:
+                # Drop the oldest 20% in one go instead of one entry per insert
+                self.evict_memory(len(self._memory) - int(self.memory_limit * 0.8))
+
+    def evict_memory(self, count):
+        """Drop the `count` least recently used in-memory icons"""
+        with self._lock:
+            count = min(count, len(self._memory))
+            for _ in range(count):
+                self._memory.popitem(last=False)
+            self._stats['evicted'] += count
+            return count
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+    def evict_symbol(self, symbol):
+        """Drop every in-memory size/variant of `symbol` (e.g. after its icon changed)"""
+        with self._lock:
+            for key in [k for k in self._memory if k[0] == symbol]:
+                del self._memory[key]
+
+    def __len__(self):
+        return len(self._memory)
+
+    # ---- source images --------------------------------------------------
+
+    def source_path(self, symbol):
+        """Path of the raw icon recorded for `symbol`, or None if not indexed yet"""
+        with self._lock:
+            entry = self._sources.get(symbol)
+        if not entry:
+            return None
+        return os.path.join(self.images_dir, entry["file"])
+
+    def record_source(self, symbol, file_name, data, url=None, headers=None):
+        """Remember that `symbol` resolved to `file_name` with content `data`.
+        For downloads, pass the URL and response headers to keep ETag/Last-Modified."""
+        entry = {"file": file_name, "digest": hashlib.sha1(data).hexdigest(), "stat": self._source_stat(file_name)}
+        if url:
+            headers = headers or {}
+            entry.update({
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "checked": time.time(),
+            })
+        with self._lock:
+            if self._sources.get(symbol) != entry:
+                self._sources[symbol] = entry
+                self._index_dirty = True
+            if self._misses.pop(symbol, None) is not None:
+                self._save_misses_locked()
+        return entry["digest"]
+
+    def refresh_source(self, symbol, data):
+        """Digest `symbol`'s indexed file again if it changed on disk since it was
+        recorded (`data` is its current content); download validators are kept.
+        Returns True if it had changed."""
+        with self._lock:
+            entry = self._sources.get(symbol)
+            if not entry:
+                return False
+            stat = self._source_stat(entry["file"])
+            if entry.get("stat") == stat:
+                return False
+            self._sources[symbol] = dict(entry, digest=hashlib.sha1(data).hexdigest(), stat=stat)
+            self._index_dirty = True
+        self.evict_symbol(symbol)
+        return True
+
+    def _source_stat(self, file_name):
+        """[mtime_ns, size] of a source file, or None if it cannot be read"""
+        try:
+            st = os.stat(os.path.join(self.images_dir, file_name))
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def source_url(self, symbol):
+        """URL the indexed icon of `symbol` was downloaded from (None for local-only files)"""
+        with self._lock:
+            entry = self._sources.get(symbol)
+            return entry.get("url") if entry else None
+
+    def validators(self, url):
+        """Conditional-request headers for a URL we downloaded before"""
+        with self._lock:
+            for entry in self._sources.values():
+                if entry.get("url") == url:
+                    headers = {}
+                    if entry.get("etag"):
+                        headers["If-None-Match"] = entry["etag"]
+                    if entry.get("last_modified"):
+                        headers["If-Modified-Since"] = entry["last_modified"]
+                    return headers
+        return {}
+
+    def needs_revalidation(self, symbol, now=None):
+        """True if `symbol`'s downloaded icon has not been checked upstream for a while"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._sources.get(symbol)
+            return bool(entry and entry.get("url") and now - entry.get("checked", 0) >= self.revalidate_after)
+
+    def mark_checked(self, symbol, now=None):
+        """Upstream confirmed the icon is unchanged (304)"""
+        with self._lock:
+            entry = self._sources.get(symbol)
+            if entry:
+                entry["checked"] = time.time() if now is None else now
+                self._index_dirty = True
+
+    # ---- negative cache -------------------------------------------------
+
+    def is_known_missing(self, symbol, now=None):
+        """True if `symbol` had no icon on any source within the last miss_ttl seconds"""
+        now = time.time() if now is None else now
+        with self._lock:
+            missed_at = self._misses.get(symbol)
+            if missed_at is None:
+                return False
+            if now - missed_at >= self.miss_ttl:
+                del self._misses[symbol]
+                return False
+            self._stats['known_missing_skips'] += 1
+            return True
+
+    def record_missing(self, symbol, now=None):
+        with self._lock:
+            self._misses[symbol] = time.time() if now is None else now
+            self._save_misses_locked()
+
+    def _load_misses(self):
+        try:
+            with open(self.misses_path, "r", encoding="utf-8") as f:
+                misses = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(misses, dict):
+            now = time.time()
+            self._misses = {k: float(v) for k, v in misses.items()
+                            if isinstance(v, (int, float)) and now - v < self.miss_ttl}
+
+    def _save_misses_locked(self):
+        try:
+            tmp_path = self.misses_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._misses, f)
+            os.replace(tmp_path, self.misses_path)
+        except OSError:
+            pass
+
+    def forget_source(self, symbol):
+        with self._lock:
+            if self._sources.pop(symbol, None) is not None:
+                self._index_dirty = True
+
+    # ---- processed tier -------------------------------------------------
+
+    def _processed_name(self, symbol, size, led_matrix):
+        entry = self._sources.get(symbol)
+        if not entry:
+            return None
+        return f"{entry['digest'][:20]}_{int(size)}{'_m' if led_matrix else ''}.png"
+
+    def processed_path(self, symbol, size, led_matrix):
+        """Path of an already-processed icon on disk, or None (also when the source
+        changed since it was digested - see refresh_source)"""
+        with self._lock:
+            name = self._processed_name(symbol, size, led_matrix)
+            if name is None or name not in self._processed:
+                return None
+            entry = self._sources[symbol]
+            if entry.get("stat") != self._source_stat(entry["file"]):
+                return None
+        self._stats['disk_hits'] += 1
+        return os.path.join(self.processed_dir, name)
+
+    def processed_target(self, symbol, size, led_matrix):
+        """Where to write a freshly processed icon (None if the source is unknown)"""
+        with self._lock:
+            name = self._processed_name(symbol, size, led_matrix)
+        if name is None:
+            return None
+        os.makedirs(self.processed_dir, exist_ok=True)
+        return os.path.join(self.processed_dir, name)
+
+    def record_processed(self, path):
+        with self._lock:
+            self._processed.add(os.path.basename(path))
+            self._index_dirty = True
+
+    def forget_processed(self, path):
+        """Drop a processed entry whose file turned out to be missing or unreadable"""
+        with self._lock:
+            self._processed.discard(os.path.basename(path))
+            self._index_dirty = True
+
+    def record_miss(self):
+        self._stats['misses'] += 1
+
+    # ---- index persistence ----------------------------------------------
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(index, dict) or index.get("version") != self.INDEX_VERSION:
+            return
+        sources = index.get("sources", {})
+        if isinstance(sources, dict):
+            self._sources = {k: v for k, v in sources.items()
+                             if isinstance(v, dict) and "file" in v and "digest" in v}
+        self._processed = set(index.get("processed", []))
+
+    def save_index(self):
+        """Write icon_index.json (atomic replace) if anything changed"""
+        with self._lock:
+            if not self._index_dirty:
+                return False
+            index = {
+                "version": self.INDEX_VERSION,
+                "sources": dict(self._sources),
+                "processed": sorted(self._processed),
+            }
+            self._index_dirty = False
+        os.makedirs(self.images_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+        return True
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_items'] = len(self._memory)
+            stats['memory_limit'] = self.memory_limit
+            stats['indexed_sources'] = len(self._sources)
+            stats['processed_files'] = len(self._processed)
+            stats['known_missing'] = len(self._misses)
+        return stats
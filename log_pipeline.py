@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Log Pipeline for TCKR
+Leveled, tag-filtered logging that never formats or writes on the calling thread.
+log() checks the message's level against a per-tag threshold (one dict lookup)
+and, if it passes, appends the unformatted record to a bounded deque; a background
+writer thread formats, colours and writes whole batches, flushing the console once
+per batch. Filtered-out calls cost a lookup and a comparison, and a full queue drops
+the oldest records (counted) instead of blocking the GUI thread.
+An optional JSON-lines sink receives every record written to the console.
+"""
+
+import collections
+import json
+import re
+import sys
+import threading
+import time
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+
+TAG_PATTERN = re.compile(r'\[([^\]]+)\]')
+
+
+def parse_level(value, default=INFO):
+    """Level number from a name ("debug", "WARNING") or number"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        name = value.strip().upper()
+        for level, level_name in LEVEL_NAMES.items():
+            if name == level_name:
+                return level
+        if name.isdigit():
+            return int(name)
+    return default
+
+
+def enable_windows_ansi():
+    """Turn on ANSI colour handling for the Windows console (no-op elsewhere)"""
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        console_handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        kernel32.GetConsoleMode(console_handle, ctypes.byref(mode))
+        mode.value |= 0x0004  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(console_handle, mode)
+    except Exception:
+        pass
+
+
+class LogPipeline:
+    """Bounded queue of log records drained by one writer thread.
+
+    Records are (time, level, tag, text, args, thread, prefixed): text is a
+    %-format string applied to args on the writer thread; prefixed records
+    already start with their "[TAG]".
+    tag_levels maps a tag ("API DATA") or its first word ("API") to the minimum
+    level written for it; everything else uses `level`.
+    """
+
+    def __init__(self, tag_colors=None, reset_color='\033[0m', max_queue=10000, flush_interval=0.05):
+        self.tag_colors = tag_colors or {}
+        self.reset_color = reset_color
+        self.max_queue = int(max_queue)
+        self.flush_interval = float(flush_interval)
+        self.level = INFO
+        self.tag_levels = {}
+        self.console = True
+        self._thresholds = {}  # tag -> minimum level (resolved tag_levels)
+        self._implied_levels = {}  # tag -> level of a pre-formatted "[TAG] ..." line
+        self._queue = collections.deque(maxlen=self.max_queue)
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._running = True
+        self._jsonl = None
+        self.jsonl_path = None
+        # Counters (producer side is approximate under contention; good enough for stats)
+        self.records_queued = 0
+        self.records_dropped = 0
+        self.records_filtered = 0
+        self.records_written = 0
+        self.batches = 0
+
+    # ---- configuration --------------------------------------------------
+
+    def configure(self, level=None, tag_levels=None, console=None):
+        if level is not None:
+            self.level = parse_level(level, self.level)
+        if tag_levels is not None:
+            self.tag_levels = {str(tag): parse_level(value) for tag, value in dict(tag_levels).items()}
+        if console is not None:
+            self.console = bool(console)
+        self._thresholds = {}  # Replace, never mutate: producers read it without a lock
+
+    def set_jsonl(self, path):
+        """Also write records to `path` as JSON lines (None to stop)"""
+        with self._write_lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+            self.jsonl_path = path
+            if path:
+                self._jsonl = open(path, "a", encoding="utf-8")
+
+    def _threshold(self, tag):
+        thresholds = self._thresholds
+        threshold = thresholds.get(tag)
+        if threshold is None:
+            tag_levels = self.tag_levels
+            threshold = tag_levels.get(tag)
+            if threshold is None and tag:
+                threshold = tag_levels.get(tag.split(' ', 1)[0].split('-', 1)[0])
+            if threshold is None:
+                threshold = self.level
+            thresholds[tag] = threshold
+        return threshold
+
+    def enabled(self, tag, level):
+        """Would a `level` record for `tag` be written? (guard for costly arguments)"""
+        return level >= self._threshold(tag)
+
+    # ---- producers (any thread) -----------------------------------------
+
+    def log(self, level, tag, text, *args):
+        """Queue "[tag] text % args"; formatting happens on the writer thread"""
+        if level < self._threshold(tag):
+            self.records_filtered += 1
+            return
+        self._enqueue((time.time(), level, tag, text, args, threading.current_thread().name, False))
+        if level >= ERROR:
+            self._wake.set()
+
+    def debug(self, tag, text, *args):
+        # Inlined level check: debug() is the call hot paths make and usually filter out
+        threshold = self._thresholds.get(tag)
+        if threshold is None:
+            threshold = self._threshold(tag)
+        if DEBUG < threshold:
+            self.records_filtered += 1
+            return
+        self._enqueue((time.time(), DEBUG, tag, text, args, threading.current_thread().name, False))
+
+    def info(self, tag, text, *args):
+        self.log(INFO, tag, text, *args)
+
+    def warning(self, tag, text, *args):
+        self.log(WARNING, tag, text, *args)
+
+    def error(self, tag, text, *args):
+        self.log(ERROR, tag, text, *args)
+
+    def write(self, message, level=None):
+        """Queue a pre-formatted "[TAG] message" line. Its level comes from the tag
+        (ERROR / WARNING in the tag, otherwise INFO) unless given."""
+        tag = None
+        if message[:1] == '[':
+            end = message.find(']')
+            if end > 0:
+                tag = message[1:end]
+        if level is None:
+            level = self._implied_levels.get(tag)
+            if level is None:
+                upper = (tag or "").upper()
+                level = ERROR if "ERROR" in upper else WARNING if "WARNING" in upper else INFO
+                self._implied_levels[tag] = level
+        if level < self._threshold(tag):
+            self.records_filtered += 1
+            return
+        self._enqueue((time.time(), level, tag, message, (), threading.current_thread().name, True))
+        if level >= ERROR:
+            self._wake.set()
+
+    def _enqueue(self, record):
+        queue = self._queue
+        if len(queue) >= self.max_queue:
+            self.records_dropped += 1  # deque(maxlen) evicts the oldest
+        queue.append(record)
+        self.records_queued += 1
+        if self._thread is None:
+            self._start()
+
+    # ---- writer thread --------------------------------------------------
+
+    def _start(self):
+        with self._write_lock:
+            if self._thread is None and self._running:
+                self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        enable_windows_ansi()
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _format(self, record):
+        created, level, tag, text, args, thread, prefixed = record
+        if args:
+            try:
+                text = text % args
+            except Exception as e:
+                text = f"{text} {args!r} (format error: {e})"
+        if not prefixed and tag:
+            text = f"[{tag}] {text}"
+        return text
+
+    def _color(self, line):
+        tag_colors = self.tag_colors
+        default = tag_colors.get('DEFAULT', '')
+        reset = self.reset_color
+        return TAG_PATTERN.sub(lambda m: f"{tag_colors.get(m.group(1), default)}[{m.group(1)}]{reset}", line)
+
+    def flush(self):
+        """Write everything queued so far (writer thread, or directly at shutdown)"""
+        with self._write_lock:
+            queue = self._queue
+            records = []
+            popleft = queue.popleft
+            while queue:
+                records.append(popleft())
+            if not records:
+                return 0
+            lines = [self._format(record) for record in records]
+            stream = sys.stdout
+            if self.console and stream is not None:  # No console in windowed builds
+                try:
+                    stream.write("".join(self._color(line) + "\n" for line in lines))
+                    stream.flush()
+                except Exception:
+                    pass
+            if self._jsonl is not None:
+                try:
+                    self._jsonl.write("".join(
+                        json.dumps({'ts': round(record[0], 6), 'level': LEVEL_NAMES.get(record[1], record[1]),
+                                    'tag': record[2], 'thread': record[5], 'msg': line}, ensure_ascii=False) + "\n"
+                        for record, line in zip(records, lines)))
+                    self._jsonl.flush()
+                except Exception:
+                    pass
+            self.records_written += len(records)
+            self.batches += 1
+            return len(records)
+
+    def close(self):
+        """Stop the writer thread and write what is still queued"""
+        self._running = False
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self.flush()
+        self.set_jsonl(None)
+
+    def get_stats(self):
+        return {
+            'level': LEVEL_NAMES.get(self.level, self.level),
+            'tag_levels': {tag: LEVEL_NAMES.get(level, level) for tag, level in self.tag_levels.items()},
+            'queued': self.records_queued,
+            'pending': len(self._queue),
+            'dropped': self.records_dropped,
+            'filtered': self.records_filtered,
+            'written': self.records_written,
+            'batches': self.batches,
+            'jsonl_path': self.jsonl_path,
+        }
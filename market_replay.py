@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Market Data Capture/Replay for TCKR
+MarketDataRecorder writes every quote HTTP response (Finnhub quote, Yahoo chart and
+spark) and every raw Finnhub WebSocket frame to a gzip-compressed JSON-lines log,
+each entry stamped with its offset from the start of the capture. API tokens are
+stripped from recorded URLs.
+MarketDataReplayer feeds such a log back through the same fetch and WebSocket code
+paths without touching the network, in real time or at N x speed: HTTP requests are
+answered with the latest recorded response for the same URL, and ReplaySocket stands
+in for websocket.WebSocketApp, delivering frames on the recorded schedule.
+"""
+
+import bisect
+import collections
+import gzip
+import json
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+
+LOG_FORMAT = "tckr-market"
+LOG_VERSION = 1
+
+# Response headers the fetch code reads (rate limiting); everything else is dropped
+RECORDED_HEADERS = ("retry-after", "x-ratelimit-limit", "x-ratelimit-remaining", "x-ratelimit-reset", "content-type")
+
+
+def replay_key(url):
+    """URL with the API token removed - both what is written and what is looked up"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "token"]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+class MarketDataRecorder:
+    """Appends HTTP responses and WebSocket frames to a capture log (thread-safe).
+
+    Log lines after the header are JSON arrays:
+      [t, "http", source, url, status, {header: value}, body]
+      [t, "ws", connection, raw_frame]
+    """
+
+    def __init__(self, path, flush_interval=2.0):
+        self.path = path
+        self.flush_interval = float(flush_interval)
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last_flush = self._start
+        self.events = 0
+        self._file.write(json.dumps({"format": LOG_FORMAT, "version": LOG_VERSION, "started": time.time()}) + "\n")
+
+    def _write(self, event):
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.events += 1
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()  # A crash loses at most one flush interval
+                self._last_flush = now
+
+    def record_http(self, source, url, status_code, headers, body):
+        headers = {k.lower(): v for k, v in (headers or {}).items() if k.lower() in RECORDED_HEADERS}
+        self._write([round(time.monotonic() - self._start, 4), "http", source, replay_key(url),
+                     status_code, headers, body])
+
+    def record_frame(self, connection, message):
+        self._write([round(time.monotonic() - self._start, 4), "ws", connection, message])
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ReplayResponse:
+    """The parts of requests.Response the quote fetchers use"""
+
+    def __init__(self, url, status_code, headers, body):
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.text = body or ""
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error (replayed) for url: {self.url}",
+                                                response=self)
+
+
+class MarketDataReplayer:
+    """Serves a capture log back on a shared clock running at `speed` x real time"""
+
+    def __init__(self, path, speed=1.0):
+        if speed <= 0:
+            raise ValueError("replay speed must be positive")
+        self.path = path
+        self.speed = float(speed)
+        self._http = {}  # (source, url) -> ([t, ...], [(status, headers, body), ...])
+        self.frames = []  # [(t, raw_frame), ...] in recorded order
+        self.frame_times = []
+        self.duration = 0.0
+        self._start = None
+        self._stats = collections.Counter()
+        self._load(path)
+
+    def _load(self, path):
+        events = []
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("format") != LOG_FORMAT:
+                    raise ValueError(f"{path} is not a TCKR market capture")
+                for line in f:
+                    events.append(json.loads(line))
+        except (EOFError, json.JSONDecodeError):
+            pass  # Capture cut short (crash / kill) - keep everything before the damage
+        for event in events:
+            t = event[0]
+            if event[1] == "http":
+                _, _, source, url, status, headers, body = event
+                times, responses = self._http.setdefault((source, url), ([], []))
+                times.append(t)
+                responses.append((status, headers, body))
+            elif event[1] == "ws":
+                self.frames.append((t, event[3]))
+                self.frame_times.append(t)
+            self.duration = max(self.duration, t)
+
+    def start(self):
+        """Start the replay clock (the first request or socket starts it implicitly)"""
+        if self._start is None:
+            self._start = time.monotonic()
+
+    def position(self):
+        """Current offset into the capture, in recorded seconds"""
+        self.start()
+        return (time.monotonic() - self._start) * self.speed
+
+    def http_response(self, source, url):
+        """Latest response recorded for this URL by the current replay position
+        (the first one if the clock has not reached it yet); 404 if never recorded"""
+        key = replay_key(url)
+        entry = self._http.get((source, key))
+        if entry is None:
+            self._stats['http_misses'] += 1
+            return ReplayResponse(key, 404, {}, '{"error": "not in capture"}')
+        times, responses = entry
+        index = max(0, bisect.bisect_right(times, self.position()) - 1)
+        self._stats['http_hits'] += 1
+        return ReplayResponse(key, *responses[index])
+
+    def socket(self, on_message=None, on_open=None, on_close=None, on_error=None):
+        """A ReplaySocket that plays this capture's frames (WebSocketApp-compatible)"""
+        return ReplaySocket(self, on_message, on_open, on_close)
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats.update({
+            'urls': len(self._http),
+            'frames': len(self.frames),
+            'duration': self.duration,
+            'position': self.position() if self._start is not None else 0.0,
+            'speed': self.speed,
+        })
+        return stats
+
+
+class ReplaySocket:
+    """Stands in for websocket.WebSocketApp during replay.
+
+    run_forever() opens, then delivers recorded frames when the replay clock reaches
+    them, limited to trades for symbols subscribed through send() - so every pooled
+    connection gets only its own symbols. After the last frame it stays open (quiet
+    market) until close().
+    """
+
+    def __init__(self, replayer, on_message, on_open, on_close):
+        self.replayer = replayer
+        self.on_message = on_message
+        self.on_open = on_open
+        self.on_close = on_close
+        self.subscribed = set()
+        self._closed = threading.Event()
+
+    def send(self, data):
+        message = json.loads(data)
+        if message.get('type') == 'subscribe':
+            self.subscribed.add(message.get('symbol'))
+        elif message.get('type') == 'unsubscribe':
+            self.subscribed.discard(message.get('symbol'))
+
+    def close(self):
+        self._closed.set()
+
+    def _filtered(self, raw):
+        message = json.loads(raw)
+        if message.get('type') != 'trade':
+            return raw
+        trades = [trade for trade in message.get('data', []) if trade.get('s') in self.subscribed]
+        if not trades:
+            return None
+        message['data'] = trades
+        return json.dumps(message, separators=(",", ":"))
+
+    def run_forever(self, **_kwargs):
+        replayer = self.replayer
+        if self.on_open:
+            self.on_open(self)
+        # Frames recorded before this socket opened were missed, as they would be live
+        index = bisect.bisect_left(replayer.frame_times, replayer.position())
+        while index < len(replayer.frames) and not self._closed.is_set():
+            t, raw = replayer.frames[index]
+            wait = (t - replayer.position()) / replayer.speed
+            if wait > 0 and self._closed.wait(wait):
+                break
+            raw = self._filtered(raw)
+            if raw is not None and self.on_message:
+                self.on_message(self, raw)
+            index += 1
+        self._closed.wait()
+        if self.on_close:
+            self.on_close(self, 1000, "replay closed")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Pixel Stats for TCKR
+Colour statistics of tile images, read straight from the QImage's pixel buffer as a
+NumPy view - no per-pixel Python calls and, for 32-bit ARGB images, no copy. The
+dominant colour and alpha coverage of a tile come out of one pass over a sampling
+grid, and results can be cached under a key describing what the tile shows, so a
+tile redrawn with the same content is never sampled again.
+A compiled kernel (ticker_utils_cython / ticker_utils_numba) replaces the NumPy one
+when available.
+"""
+
+import collections
+import threading
+
+import numpy as np
+from PyQt5 import QtGui
+
+
+PREMULTIPLIED = {
+    QtGui.QImage.Format_ARGB32: False,
+    QtGui.QImage.Format_RGB32: False,
+    QtGui.QImage.Format_ARGB32_Premultiplied: True,
+}
+
+
+def image_array(image):
+    """(height, width) uint32 view of a 32-bit ARGB QImage's pixels (0xAARRGGBB).
+
+    Returns (array, premultiplied). For 32-bit formats the array shares the
+    image's memory: keep the image alive while using it. Other formats are
+    converted to ARGB32 and the array owns a copy of the converted pixels (a view
+    would outlive the temporary image it points into).
+    """
+    premultiplied = PREMULTIPLIED.get(image.format())
+    if premultiplied is None:
+        converted = image.convertToFormat(QtGui.QImage.Format_ARGB32)
+        pixels, _ = image_array(converted)
+        return pixels.copy(), False
+    height, width = image.height(), image.width()
+    if not height or not width:
+        return np.zeros((0, 0), dtype=np.uint32), premultiplied
+    bits = image.constBits()  # constBits never detaches the image
+    bits.setsize(image.bytesPerLine() * height)
+    pixels = np.ndarray((height, width), dtype=np.uint32, buffer=bits, strides=(image.bytesPerLine(), 4))
+    return pixels, premultiplied
+
+
+def sample_sums(pixels, step, alpha_threshold, premultiplied):
+    """(red_sum, green_sum, blue_sum, opaque_count, sample_count) over every step-th
+    pixel of every step-th row. Colours are un-premultiplied the way QImage's ARGB32
+    conversion does it (to within 1); opaque_count counts alpha > alpha_threshold"""
+    grid = pixels[::step, ::step].astype(np.int64)  # Only the samples are copied
+    alpha = grid >> 24
+    red = (grid >> 16) & 0xFF
+    green = (grid >> 8) & 0xFF
+    blue = grid & 0xFF
+    if premultiplied:
+        # Round half down: c * 255 / a (a == 0 means c == 0)
+        divisor = np.maximum(alpha, 1)
+        red = (red * 510 + divisor - 1) // (2 * divisor)
+        green = (green * 510 + divisor - 1) // (2 * divisor)
+        blue = (blue * 510 + divisor - 1) // (2 * divisor)
+    opaque = int(np.count_nonzero(alpha > alpha_threshold))
+    return int(red.sum()), int(green.sum()), int(blue.sum()), opaque, int(grid.size)
+
+
+_kernel = sample_sums
+
+
+def set_sampling_kernel(kernel):
+    """Use a compiled sample_sums (same signature and result); None restores NumPy"""
+    global _kernel
+    _kernel = kernel or sample_sums
+
+
+def dominant_color(image, sample_step=6, alpha_threshold=16):
+    """((r, g, b) or None, coverage) of a QImage in one pass over a sampling grid.
+
+    The colour is the mean of all samples, transparent ones counting as black -
+    what the per-pixel loop this replaces computed (its alpha test never fired,
+    QColor(QRgb) being opaque), which the ghost tints are tuned to. Coverage is
+    the fraction of samples more opaque than alpha_threshold. None for an empty
+    image.
+    """
+    pixels, premultiplied = image_array(image)
+    if not pixels.size:
+        return None, 0.0
+    rsum, gsum, bsum, count, samples = _kernel(pixels, sample_step, alpha_threshold, premultiplied)
+    if not samples:
+        return None, 0.0
+    return (rsum // samples, gsum // samples, bsum // samples), count / samples
+
+
+class PixelStatsCache:
+    """Thread-safe LRU of dominant_color results keyed by tile content"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = int(max_entries)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def dominant_color(self, image, key=None, sample_step=6, alpha_threshold=16):
+        """dominant_color(image), reusing the result stored under `key` (None = no caching)"""
+        if key is None:
+            return dominant_color(image, sample_step, alpha_threshold)
+        key = (key, sample_step, alpha_threshold)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+        result = dominant_color(image, sample_step, alpha_threshold)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_CACHE = PixelStatsCache()
+
+
+def get_pixel_stats_cache():
+    return _CACHE
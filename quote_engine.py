@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Async Quote Fetch Engine for TCKR
+Pipelines quote requests for every provider through one persistent asyncio loop.
+Requests are paced by token buckets instead of fixed batches + sleeps, and results
+are streamed back as they complete so the ticker can repaint symbols immediately.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from log_pipeline import DEBUG, INFO, WARNING
+
+
+def _print_log(level, tag, text, *args):
+    print(f"[{tag}] {text % args if args else text}")
+
+
+_log = _print_log  # The app routes this through its log pipeline (set_logger)
+
+
+def set_logger(log):
+    """Send this module's messages to log(level, tag, text, *args), e.g.
+    LogPipeline.log; None restores plain print()"""
+    global _log
+    _log = log or _print_log
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills at `rate` tokens/second up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = max(0.001, float(rate))
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def reserve(self, tokens=1.0):
+        """Take tokens if available. Returns 0.0 on success, otherwise seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens=1.0):
+        """Wait (without blocking the loop) until tokens are available, then take them"""
+        while True:
+            wait = self.reserve(tokens)
+            if wait <= 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds):
+        """Stop handing out tokens for `seconds` and drain the bucket (e.g. after a 429)"""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + max(0.0, float(seconds)))
+            self._tokens = 0.0
+            self._last_refill = self._paused_until
+
+    def available(self):
+        """Current token count (approximate, for diagnostics)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class QuoteProvider:
+    """Base class for a pluggable quote source.
+
+    Subclasses implement handles() and fetch_quote(). fetch_quote() runs on the
+    engine's worker pool, so it may block on HTTP. acquire() runs on the engine
+    loop before each request; whatever it returns (e.g. the API key to use) is
+    passed to fetch_quote() and on_rate_limited() as `lease`.
+
+    Providers with batch_size > 1 also implement fetch_batch(); the engine then
+    sends symbols in groups and falls back to fetch_quote() for any symbol the
+    batch response did not answer.
+    """
+
+    name = "provider"
+    max_concurrency = 5
+    batch_size = 1
+    rate_limit_pause = 1.0  # Seconds to pause the bucket after a 429
+
+    def __init__(self, rate_limiter=None):
+        self.rate_limiter = rate_limiter
+
+    def handles(self, symbol):
+        """Return True if this provider serves `symbol`"""
+        raise NotImplementedError
+
+    async def acquire(self):
+        """Wait for permission to send one request"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        return None
+
+    def fetch_quote(self, symbol, lease=None):
+        """Fetch one quote. Returns (price, prev_close, status_code)."""
+        raise NotImplementedError
+
+    def fetch_batch(self, symbols, lease=None):
+        """Fetch many quotes in one request. Returns {symbol: (price, prev_close, status_code)}
+        for the symbols that were answered; missing symbols are retried one by one."""
+        raise NotImplementedError
+
+    def on_rate_limited(self, symbol, lease=None):
+        """Called by the engine when fetch_quote() reported a 429"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.pause(self.rate_limit_pause)
+
+
+class QuoteFetchEngine:
+    """Fetches quotes from a set of providers on one long-lived asyncio loop.
+
+    The loop and the worker pool are created once and reused for every refresh
+    cycle, so there is no per-cycle ThreadPoolExecutor setup/teardown.
+    """
+
+    def __init__(self, providers, max_workers=16):
+        self.providers = list(providers)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="QuoteFetch")
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'cycles': 0,
+            'requests': 0,
+            'failures': 0,
+            'rate_limited': 0,
+            'last_cycle_seconds': 0.0,
+        }
+
+    def _ensure_loop(self):
+        with self._loop_lock:
+            if self._loop is None or not self._loop_thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=run_loop, name="QuoteEngineLoop", daemon=True)
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._loop_thread = thread
+            return self._loop
+
+    def get_provider(self, name):
+        for provider in self.providers:
+            if provider.name == name:
+                return provider
+        return None
+
+    def provider_for(self, symbol):
+        for provider in self.providers:
+            if provider.handles(symbol):
+                return provider
+        return None
+
+    async def stream(self, symbols, timeout=None):
+        """Async generator yielding (symbol, (price, prev_close), status_code) as each quote completes.
+
+        Every symbol is yielded exactly once: a request task that fails in any way
+        reports its symbols as (None, None), and symbols still outstanding after
+        `timeout` seconds are yielded as (None, None) and their requests cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        results = asyncio.Queue()
+        semaphores = {}
+        tasks = []
+
+        def spawn(coro):
+            tasks.append(asyncio.ensure_future(coro))
+
+        async def fetch_one(provider, symbol):
+            quote, status_code = (None, None), None
+            try:
+                async with semaphores[provider.name]:
+                    lease = await provider.acquire()
+                    try:
+                        price, prev_close, status_code = await loop.run_in_executor(
+                            self._executor, provider.fetch_quote, symbol, lease)
+                        quote = (price, prev_close)
+                    except Exception:
+                        pass
+                if status_code == 429:
+                    provider.on_rate_limited(symbol, lease)
+            except Exception as e:
+                _log(DEBUG, "API", "%s request for %s failed: %s", provider.name, symbol, e)
+            finally:
+                results.put_nowait((symbol, quote, status_code))
+
+        async def fetch_batch(provider, batch):
+            owned = dict.fromkeys(batch)  # Symbols this task still has to report
+            try:
+                async with semaphores[provider.name]:
+                    lease = await provider.acquire()
+                    try:
+                        answered = await loop.run_in_executor(
+                            self._executor, provider.fetch_batch, batch, lease)
+                    except Exception:
+                        answered = {}
+                for symbol in batch:
+                    quote = answered.get(symbol)
+                    if quote is None or quote[0] is None:
+                        del owned[symbol]
+                        spawn(fetch_one(provider, symbol))  # Per-symbol fallback
+                    else:
+                        result = (symbol, (quote[0], quote[1]), quote[2])
+                        del owned[symbol]
+                        results.put_nowait(result)
+            except Exception as e:
+                _log(DEBUG, "API", "%s batch request failed: %s", provider.name, e)
+            finally:
+                for symbol in owned:
+                    results.put_nowait((symbol, (None, None), None))
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        by_provider = {}
+        for symbol in unique_symbols:
+            provider = self.provider_for(symbol)
+            if provider is None:
+                results.put_nowait((symbol, (None, None), None))
+                continue
+            if provider.name not in semaphores:
+                semaphores[provider.name] = asyncio.Semaphore(max(1, provider.max_concurrency))
+                by_provider[provider.name] = (provider, [])
+            by_provider[provider.name][1].append(symbol)
+
+        for provider, provider_symbols in by_provider.values():
+            if provider.batch_size > 1 and len(provider_symbols) > 1:
+                for i in range(0, len(provider_symbols), provider.batch_size):
+                    spawn(fetch_batch(provider, provider_symbols[i:i + provider.batch_size]))
+            else:
+                for symbol in provider_symbols:
+                    spawn(fetch_one(provider, symbol))
+
+        deadline = None if timeout is None else loop.time() + timeout
+        outstanding = dict.fromkeys(unique_symbols)
+        try:
+            while outstanding:
+                try:
+                    if deadline is None:
+                        result = await results.get()
+                    else:
+                        result = await asyncio.wait_for(results.get(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    _log(WARNING, "API", "Quote fetch timed out after %.0fs; %d symbols unanswered", timeout, len(outstanding))
+                    for symbol in list(outstanding):
+                        del outstanding[symbol]
+                        yield symbol, (None, None), None
+                    break
+                if result[0] in outstanding:
+                    del outstanding[result[0]]
+                    yield result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _collect(self, symbols, on_partial, partial_interval, timeout):
+        prices = {}
+        had_429 = False
+        chunk = {}
+        last_flush = time.monotonic()
+        started = last_flush
+        failures = rate_limited = 0
+
+        async for symbol, quote, status_code in self.stream(symbols, timeout):
+            prices[symbol] = quote
+            if quote[0] is None:
+                failures += 1
+            if status_code == 429:
+                had_429 = True
+                rate_limited += 1
+            if on_partial is not None:
+                chunk[symbol] = quote
+                now = time.monotonic()
+                if now - last_flush >= partial_interval:
+                    self._emit_partial(on_partial, chunk)
+                    chunk = {}
+                    last_flush = now
+
+        if on_partial is not None and chunk:
+            self._emit_partial(on_partial, chunk)
+
+        with self._stats_lock:
+            self._stats['cycles'] += 1
+            self._stats['requests'] += len(prices)
+            self._stats['failures'] += failures
+            self._stats['rate_limited'] += rate_limited
+            self._stats['last_cycle_seconds'] = time.monotonic() - started
+        if failures:
+            # One line per cycle; the individual failures are logged at DEBUG
+            _log(INFO, "API", "%d of %d quotes failed this cycle (%d rate limited)", failures, len(prices), rate_limited)
+        return prices, had_429
+
+    @staticmethod
+    def _emit_partial(on_partial, chunk):
+        try:
+            on_partial(chunk)
+        except Exception as e:
+            _log(WARNING, "API", "Partial result callback failed: %s", e)
+
+    def fetch(self, symbols, on_partial=None, partial_interval=0.25, timeout=300.0):
+        """Fetch quotes for `symbols`, blocking the calling thread until all complete.
+
+        Returns (prices, had_429). If `on_partial` is given it is called with dicts of
+        {symbol: (price, prev_close)} as results arrive (at most every `partial_interval`
+        seconds). It runs on the engine loop thread, so it should only hand off work,
+        e.g. emit a Qt signal. Symbols not answered within `timeout` seconds come back
+        as (None, None); the calling thread is never blocked much longer than that.
+        """
+        if not symbols:
+            return {}, False
+        symbols = list(symbols)
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._collect(symbols, on_partial, partial_interval, timeout), loop)
+        try:
+            return future.result(None if timeout is None else timeout + 5.0)
+        except concurrent.futures.TimeoutError:
+            # The loop itself is stuck (a callback that never returns): give up on this cycle
+            future.cancel()
+            _log(WARNING, "API", "Quote engine did not finish within %.0fs; returning no prices", timeout)
+            return {symbol: (None, None) for symbol in symbols}, False
+
+    def get_stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self):
+        """Stop the loop thread and worker pool"""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+                self._loop_thread = None
+        self._executor.shutdown(wait=False)
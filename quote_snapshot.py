@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Quote Snapshot for TCKR
+Last known quote per symbol - price, previous close, when it was seen and where it
+came from - kept in memory and persisted to one compact JSON file. At startup the
+ticker renders straight from the snapshot instead of showing "Loading", and the first
+refresh only fetches the symbols whose snapshot quote is too old.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class QuoteSnapshot:
+    """Thread-safe {symbol: (price, prev_close, timestamp, source)} with JSON persistence"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = path
+        self._quotes = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.time()
+
+    def update(self, prices, source="poll", timestamp=None):
+        """Record {symbol: (price, prev_close)}; quotes without a price are skipped.
+        source is a name, or a function of the symbol returning one."""
+        timestamp = time.time() if timestamp is None else float(timestamp)
+        with self._lock:
+            for symbol, (price, prev_close) in prices.items():
+                if price is None:
+                    continue
+                if prev_close is None:
+                    old = self._quotes.get(symbol)
+                    prev_close = old[1] if old else None
+                name = source(symbol) if callable(source) else source
+                self._quotes[symbol] = (float(price), None if prev_close is None else float(prev_close), timestamp, name)
+                self._dirty = True
+
+    def get(self, symbol):
+        """(price, prev_close, timestamp, source) or None"""
+        return self._quotes.get(symbol)
+
+    def prices(self, symbols=None):
+        """{symbol: (price, prev_close)} for `symbols` (default: every symbol)"""
+        quotes = self._quotes
+        if symbols is None:
+            symbols = list(quotes)
+        return {symbol: quotes[symbol][:2] for symbol in symbols if symbol in quotes}
+
+    def fresh_symbols(self, symbols, max_age, now=None):
+        """The subset of `symbols` whose quote is at most `max_age` seconds old"""
+        if max_age <= 0:
+            return set()
+        now = time.time() if now is None else now
+        quotes = self._quotes
+        return {symbol for symbol in symbols if symbol in quotes and now - quotes[symbol][2] <= max_age}
+
+    def __len__(self):
+        return len(self._quotes)
+
+    def save(self, path=None):
+        """Write the snapshot (atomic replace)"""
+        path = path or self.path
+        if not path:
+            return False
+        with self._lock:
+            data = {
+                "version": self.FORMAT_VERSION,
+                "saved": time.time(),
+                "quotes": {symbol: list(quote) for symbol, quote in self._quotes.items()},
+            }
+            self._dirty = False
+            self._last_save = time.time()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return True
+
+    def save_if_dirty(self, min_interval=60.0):
+        """Save at most every `min_interval` seconds, and only after changes"""
+        if self._dirty and time.time() - self._last_save >= min_interval:
+            return self.save()
+        return False
+
+    def load(self, path=None, max_age=7 * 86400):
+        """Load quotes saved by save(), skipping ones older than `max_age` seconds;
+        returns the number loaded"""
+        path = path or self.path
+        if not path or not os.path.exists(path):
+            return 0
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != self.FORMAT_VERSION:
+            return 0
+        oldest = time.time() - max_age
+        loaded = {}
+        for symbol, quote in (data.get("quotes") or {}).items():
+            try:
+                price, prev_close, timestamp, source = quote
+                if price is None or float(timestamp) < oldest:
+                    continue
+                loaded[symbol] = (float(price), None if prev_close is None else float(prev_close), float(timestamp), source)
+            except (TypeError, ValueError):
+                continue
+        with self._lock:
+            for symbol, quote in loaded.items():
+                current = self._quotes.get(symbol)
+                if current is None or current[2] < quote[2]:
+                    self._quotes[symbol] = quote
+        return len(loaded)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+API Key Rate Limiter for TCKR
+Keeps a sliding-window call budget per API key, picks the key with the most
+remaining budget for each request and honours the server's rate-limit headers
+(X-Ratelimit-Remaining / X-Ratelimit-Reset / Retry-After).
+"""
+
+import asyncio
+import collections
+import email.utils
+import threading
+import time
+
+
+def parse_retry_after(value, now=None):
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds from now"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+def mask_api_key(api_key):
+    """Short, non-secret label for an API key (e.g. '…a1b2')"""
+    if not api_key:
+        return "(none)"
+    return f"…{api_key[-4:]}"
+
+
+class KeyBudget:
+    """Sliding-window call accounting for one API key"""
+
+    def __init__(self, api_key, calls_per_window, window_seconds):
+        self.api_key = api_key
+        self.calls_per_window = int(calls_per_window)
+        self.window_seconds = float(window_seconds)
+        self.calls = collections.deque()  # monotonic timestamps of calls inside the window
+        self.blocked_until = 0.0  # monotonic; set from Retry-After / 429
+        self.server_remaining = None  # last X-Ratelimit-Remaining seen
+        self.server_remaining_until = 0.0  # monotonic time the server figure stays valid
+        self.total_calls = 0
+        self.total_429 = 0
+
+    def _expire(self, now):
+        horizon = now - self.window_seconds
+        calls = self.calls
+        while calls and calls[0] <= horizon:
+            calls.popleft()
+
+    def remaining(self, now):
+        """Calls still allowed right now (0 while blocked)"""
+        self._expire(now)
+        if now < self.blocked_until:
+            return 0
+        local = self.calls_per_window - len(self.calls)
+        if self.server_remaining is not None and now < self.server_remaining_until:
+            local = min(local, self.server_remaining)
+        return max(0, local)
+
+    def seconds_until_available(self, now):
+        """Seconds until this key can make another call"""
+        self._expire(now)
+        wait = max(0.0, self.blocked_until - now)
+        if len(self.calls) >= self.calls_per_window and self.calls:
+            wait = max(wait, self.calls[0] + self.window_seconds - now)
+        if self.server_remaining is not None and self.server_remaining <= 0 and now < self.server_remaining_until:
+            wait = max(wait, self.server_remaining_until - now)
+        return wait
+
+    def record_call(self, now):
+        self.calls.append(now)
+        self.total_calls += 1
+        if self.server_remaining is not None:
+            self.server_remaining -= 1
+
+
+class ApiKeyPool:
+    """Sliding-window budgets for N API keys.
+
+    acquire() returns the key with the most remaining budget and records the call
+    against it. record_response() feeds back status codes and rate-limit headers.
+    """
+
+    def __init__(self, api_keys=(), calls_per_window=60, window_seconds=60.0, default_retry_after=60.0):
+        self.calls_per_window = int(calls_per_window)
+        self.window_seconds = float(window_seconds)
+        self.default_retry_after = float(default_retry_after)
+        self._budgets = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.set_keys(api_keys)
+
+    def set_keys(self, api_keys):
+        """Replace the key list, keeping the accounting of keys that stay configured"""
+        keys = [k for k in dict.fromkeys(api_keys) if k]
+        with self._lock:
+            budgets = collections.OrderedDict()
+            for key in keys:
+                budget = self._budgets.get(key)
+                if budget is None:
+                    budget = KeyBudget(key, self.calls_per_window, self.window_seconds)
+                budgets[key] = budget
+            self._budgets = budgets
+
+    @property
+    def keys(self):
+        with self._lock:
+            return list(self._budgets)
+
+    def try_acquire(self):
+        """Reserve one call. Returns (api_key, 0.0) on success or (None, wait_seconds)."""
+        with self._lock:
+            if not self._budgets:
+                return None, 0.0
+            now = time.monotonic()
+            best = None
+            best_remaining = 0
+            for budget in self._budgets.values():
+                remaining = budget.remaining(now)
+                if remaining > best_remaining:
+                    best, best_remaining = budget, remaining
+            if best is not None:
+                best.record_call(now)
+                return best.api_key, 0.0
+            wait = min(b.seconds_until_available(now) for b in self._budgets.values())
+            return None, max(0.05, wait)
+
+    def acquire(self, timeout=None):
+        """Blocking acquire; returns an API key or None if no key is configured or timeout expires"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            key, wait = self.try_acquire()
+            if key is not None or wait <= 0.0:
+                return key
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return None
+                wait = min(wait, left)
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """asyncio variant of acquire() - waits without blocking the event loop"""
+        while True:
+            key, wait = self.try_acquire()
+            if key is not None or wait <= 0.0:
+                return key
+            await asyncio.sleep(wait)
+
+    def record_response(self, api_key, status_code, headers=None):
+        """Feed back the outcome of a call made with `api_key`"""
+        headers = headers or {}
+        with self._lock:
+            budget = self._budgets.get(api_key)
+            if budget is None:
+                return
+            now = time.monotonic()
+            remaining = _header_int(headers, 'X-Ratelimit-Remaining')
+            reset_at = _header_float(headers, 'X-Ratelimit-Reset')
+            reset_in = None
+            if reset_at is not None:
+                # Finnhub sends an epoch timestamp; small values are treated as seconds
+                reset_in = reset_at - time.time() if reset_at > 1e9 else reset_at
+                reset_in = max(0.0, reset_in)
+            if remaining is not None:
+                budget.server_remaining = remaining
+                budget.server_remaining_until = now + (reset_in if reset_in is not None else self.window_seconds)
+            if status_code == 429:
+                budget.total_429 += 1
+                retry_after = parse_retry_after(_header(headers, 'Retry-After'))
+                if retry_after is None:
+                    retry_after = reset_in if reset_in is not None else self.default_retry_after
+                budget.blocked_until = max(budget.blocked_until, now + retry_after)
+
+    def seconds_until_available(self):
+        """Seconds until any key can make a call (0.0 if one can now)"""
+        with self._lock:
+            if not self._budgets:
+                return 0.0
+            now = time.monotonic()
+            return min(b.seconds_until_available(now) for b in self._budgets.values())
+
+    def get_quota_status(self):
+        """Per-key quota snapshot for status displays"""
+        with self._lock:
+            now = time.monotonic()
+            status = []
+            for index, budget in enumerate(self._budgets.values(), start=1):
+                status.append({
+                    'label': f"Key {index} ({mask_api_key(budget.api_key)})",
+                    'remaining': budget.remaining(now),
+                    'limit': budget.calls_per_window,
+                    'window_seconds': budget.window_seconds,
+                    'calls_in_window': len(budget.calls),
+                    'server_remaining': budget.server_remaining if now < budget.server_remaining_until else None,
+                    'blocked_for': max(0.0, budget.blocked_until - now),
+                    'total_calls': budget.total_calls,
+                    'total_429': budget.total_429,
+                })
+            return status
+
+
+def _header(headers, name):
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if value is None:
+        # Plain dicts are case-sensitive; requests' CaseInsensitiveDict is not
+        lowered = name.lower()
+        for key, val in headers.items():
+            if str(key).lower() == lowered:
+                return val
+    return value
+
+
+def _header_int(headers, name):
+    value = _header(headers, name)
+    try:
+        return int(float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_float(headers, name):
+    value = _header(headers, name)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
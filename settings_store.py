@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Settings Store for TCKR
+Holds TCKR.Settings.json in memory so readers never touch the disk: the file is
+parsed once, and save() writes it and swaps in the new settings in one step.
+Readers get either a private copy (get(), safe to modify and save) or the shared
+read-only snapshot (snapshot(), no copy - for hot paths). Values derived from the
+settings (e.g. network configuration) are computed once per change, and listeners
+are told which keys changed so they can drop their own caches.
+"""
+
+import json
+import os
+import threading
+import types
+import weakref
+
+from log_pipeline import WARNING
+
+
+def _print_log(level, tag, text, *args):
+    print(f"[{tag}] {text % args if args else text}")
+
+
+_log = _print_log  # The app routes this through its log pipeline (set_logger)
+
+
+def set_logger(log):
+    """Send this module's messages to log(level, tag, text, *args), e.g.
+    LogPipeline.log; None restores plain print()"""
+    global _log
+    _log = log or _print_log
+
+
+class SettingsStore:
+    """Process-wide settings: load once, save atomically, notify on change.
+
+    defaults() returns the settings used while no settings file exists (or it
+    cannot be parsed). Listeners are called as listener(snapshot, changed_keys)
+    on the thread that saved; bound methods are held weakly so a closed window
+    does not linger.
+    """
+
+    def __init__(self, path, defaults):
+        self.path = path
+        self._defaults = defaults
+        self._settings = None  # read-only mapping, replaced (never mutated) on change
+        self._version = 0
+        self._derivers = {}  # name -> fn(snapshot)
+        self._derived = {}  # name -> (version, value)
+        self._listeners = []  # weakref (or strong stand-in) per listener
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.saves = 0
+
+    # ---- reading --------------------------------------------------------
+
+    def _read_file(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    settings = json.load(f)
+                if isinstance(settings, dict):
+                    return settings
+            except Exception:
+                pass
+        return self._defaults()
+
+    def snapshot(self):
+        """Current settings as a read-only mapping (shared, no copy)"""
+        settings = self._settings
+        if settings is None:
+            with self._lock:
+                if self._settings is None:
+                    self._settings = types.MappingProxyType(self._read_file())
+                    self.loads += 1
+                settings = self._settings
+        return settings
+
+    def get(self):
+        """A private copy of the settings; lists and dicts inside are copied too"""
+        return {key: (value.copy() if isinstance(value, (list, dict)) else value)
+                for key, value in self.snapshot().items()}
+
+    @property
+    def version(self):
+        """Increases on every change; cheap staleness check for callers' own caches"""
+        return self._version
+
+    # ---- writing --------------------------------------------------------
+
+    def save(self, settings):
+        """Write `settings` to disk and make them current (atomic on both sides)"""
+        settings = dict(settings)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(settings, f, indent=4, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.saves += 1
+            self._replace(settings)
+
+    def reload(self):
+        """Re-read the settings file (e.g. after it was restored from a backup)"""
+        with self._lock:
+            self._replace(self._read_file())
+            self.loads += 1
+
+    def _replace(self, settings):
+        old = self._settings or {}
+        changed = {key for key in set(old) | set(settings) if old.get(key) != settings.get(key)}
+        self._settings = types.MappingProxyType(settings)
+        self._version += 1
+        if changed:
+            self._notify(self._settings, frozenset(changed))
+
+    # ---- derived values -------------------------------------------------
+
+    def register_derived(self, name, fn):
+        """Compute fn(snapshot) at most once per settings change; read with derived(name)"""
+        with self._lock:
+            self._derivers[name] = fn
+            self._derived.pop(name, None)
+
+    def derived(self, name):
+        settings = self.snapshot()
+        version = self._version
+        cached = self._derived.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        value = self._derivers[name](settings)
+        self._derived[name] = (version, value)
+        return value
+
+    # ---- change notification --------------------------------------------
+
+    def subscribe(self, listener):
+        """Call listener(snapshot, changed_keys) after every change"""
+        if hasattr(listener, "__self__"):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = lambda listener=listener: listener
+        with self._lock:
+            self._listeners = self._listeners + [ref]
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            self._listeners = [ref for ref in self._listeners if ref() is not None and ref() != listener]
+
+    def _notify(self, settings, changed):
+        dead = False
+        for ref in self._listeners:
+            listener = ref()
+            if listener is None:
+                dead = True
+                continue
+            try:
+                listener(settings, changed)
+            except Exception as e:
+                _log(WARNING, "SETTINGS", "Listener %r failed: %s", listener, e)
+        if dead:
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+
+    def get_stats(self):
+        return {
+            'version': self._version,
+            'loads': self.loads,
+            'saves': self.saves,
+            'listeners': len(self._listeners),
+            'derived': sorted(self._derivers),
+        }
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Strip Renderer for TCKR
+Pre-composites the scrolling supercycle (ticker tiles + donate message, repeated
+as the paint loop lays it out) into a handful of wide strip pixmaps. Each frame
+then blits only the one or two strips that intersect the window, so per-frame
+cost no longer grows with the number of symbols in the watchlist.
+Strips are built lazily and invalidated per tile when a symbol is redrawn.
+The same machinery carries derived layers such as the bloom halos: tiles may
+be padded (halos spill past the tile edges) and composited additively. A padded
+tile is drawn whole into the chunk its slot starts in, and chunks carry the same
+padding, so no halo is cut at a chunk edge or where the supercycle wraps.
+"""
+
+import bisect
+import collections
+
+from PyQt5 import QtCore, QtGui
+
+
+class TickerStripRenderer:
+    """Chunked strip cache for one ticker window's supercycle.
+
+    The supercycle is [tiles..., donate] + [tiles...] + [tiles...], matching the
+    cycle order used by paint_ticker (every third cycle carries the donate message).
+    It is cut into fixed-width chunks; a chunk pixmap holds, whole, every tile whose
+    slot starts inside it, plus tile_padding on each side, and chunks are blitted at
+    their chunk position minus the padding. Each tile is drawn exactly once, so
+    overlapping chunks composite the same as one wide strip would.
+
+    tile_padding: pixels a tile pixmap extends past its slot on each side (see
+    set_tile_padding).
+    composition_mode: used both inside chunks and when blitting them (None = SourceOver).
+    max_builds_per_frame: when set, a chunk invalidated by a tile update keeps being
+    drawn from its previous version until it is rebuilt, so work per frame is bounded
+    and the layer never blinks out (double-buffering).
+    """
+
+    CYCLES_PER_SUPERCYCLE = 3
+
+    def __init__(self, chunk_width=2048, max_chunks=32, tile_padding=0, composition_mode=None,
+                 max_builds_per_frame=None):
+        self.chunk_width = int(chunk_width)
+        self.max_chunks = int(max_chunks)
+        self.tile_padding = int(tile_padding)
+        self.composition_mode = composition_mode
+        self.max_builds_per_frame = max_builds_per_frame
+        self._chunks = collections.OrderedDict()  # chunk index -> QPixmap (LRU)
+        self._stale_chunks = {}  # chunk index -> previous QPixmap, drawn while a rebuild is pending
+        self._entries = []  # (x, width, tile_index) sorted by x; tile_index -1 = donate
+        self._starts = []  # x of each entry, for bisect
+        self._tile_entries = {}  # tile_index -> [entry index, ...]
+        self._supercycle_width = 0
+        self._height = 0
+        self._layout_valid = False
+        self._stats = {'chunk_builds': 0, 'invalidations': 0}
+
+    # ---- invalidation ---------------------------------------------------
+
+    def invalidate(self):
+        """Drop the layout and every strip (tile list, widths or donate pixmap changed)"""
+        self._layout_valid = False
+        self._chunks.clear()
+        self._stale_chunks.clear()
+        self._stats['invalidations'] += 1
+
+    def invalidate_tile(self, tile_index, width_changed=False):
+        """Re-render only the strips that contain `tile_index`"""
+        if not self._layout_valid:
+            return
+        if width_changed or tile_index not in self._tile_entries:
+            self.invalidate()  # Every later tile moved
+            return
+        for entry_index in self._tile_entries[tile_index]:
+            chunk = int(self._entries[entry_index][0] // self.chunk_width)
+            pixmap = self._chunks.pop(chunk, None)
+            if pixmap is not None and self.max_builds_per_frame is not None:
+                self._stale_chunks[chunk] = pixmap
+
+    def set_tile_padding(self, tile_padding):
+        """Change how far tiles extend past their slots (drops every strip if it changed)"""
+        tile_padding = int(tile_padding)
+        if tile_padding != self.tile_padding:
+            self.tile_padding = tile_padding
+            self.invalidate()
+
+    # ---- layout ---------------------------------------------------------
+
+    def _build_layout(self, widths, donate_width, height):
+        entries = []
+        x = 0
+        for cycle in range(self.CYCLES_PER_SUPERCYCLE):
+            for index, w in enumerate(widths):
+                entries.append((x, w, index))
+                x += w
+            if cycle == 0 and donate_width:
+                entries.append((x, donate_width, -1))
+                x += donate_width
+        self._entries = entries
+        self._starts = [e[0] for e in entries]
+        self._tile_entries = {}
+        for entry_index, (_, _, tile_index) in enumerate(entries):
+            self._tile_entries.setdefault(tile_index, []).append(entry_index)
+        self._supercycle_width = x
+        self._height = height
+        self._chunks.clear()
+        self._stale_chunks.clear()
+        self._layout_valid = True
+
+    def _chunk_entries(self, chunk_index):
+        """Slice bounds of the entries whose slots start inside chunk_index"""
+        left = chunk_index * self.chunk_width
+        return (bisect.bisect_left(self._starts, left),
+                bisect.bisect_left(self._starts, left + self.chunk_width))
+
+    def _chunk_reach(self, chunk_index):
+        """Right end of the slots drawn into chunk_index, padding excluded"""
+        left = chunk_index * self.chunk_width
+        right = min(left + self.chunk_width, self._supercycle_width)
+        first, end = self._chunk_entries(chunk_index)
+        if end > first:
+            x, w, _ = self._entries[end - 1]
+            right = max(right, x + w)
+        return right
+
+    def _build_chunk(self, chunk_index, tile_at):
+        left = chunk_index * self.chunk_width
+        pad = self.tile_padding
+        pixmap = QtGui.QPixmap(max(1, self._chunk_reach(chunk_index) - left + 2 * pad), max(1, self._height))
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        if self.composition_mode is not None:
+            painter.setCompositionMode(self.composition_mode)
+        first, end = self._chunk_entries(chunk_index)
+        for x, w, tile_index in self._entries[first:end]:
+            tile = tile_at(tile_index)
+            if tile is not None:
+                painter.drawPixmap(x - left, 0, tile)  # Tile and chunk share the padding
+        painter.end()
+        self._stats['chunk_builds'] += 1
+        return pixmap
+
+    def _chunk(self, chunk_index, tile_at, budget):
+        pixmap = self._chunks.get(chunk_index)
+        if pixmap is not None:
+            self._chunks.move_to_end(chunk_index)
+            return pixmap
+        stale = self._stale_chunks.get(chunk_index)
+        if stale is not None and budget[0] <= 0:
+            return stale  # Out of build budget this frame - keep showing the old strip
+
+        pixmap = self._build_chunk(chunk_index, tile_at)
+        budget[0] -= 1
+        self._stale_chunks.pop(chunk_index, None)
+        self._chunks[chunk_index] = pixmap
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return pixmap
+
+    # ---- drawing --------------------------------------------------------
+
+    def draw(self, painter, offset, view_width, tile_at, widths, donate_width, height):
+        """Draw the scrolling layer for scroll position `offset`.
+        tile_at(tile_index) returns the pixmap for a tile (-1 = donate message).
+        Returns False if there is nothing to draw."""
+        if (not self._layout_valid or self._height != height or
+                len(self._tile_entries) != len(widths) + (1 if donate_width else 0)):
+            self._build_layout(widths, donate_width, height)
+        scw = self._supercycle_width
+        if scw <= 0:
+            return False
+
+        if self.composition_mode is not None:
+            painter.setCompositionMode(self.composition_mode)
+        budget = [self.max_builds_per_frame if self.max_builds_per_frame is not None else float('inf')]
+        # Content repeats every scw from `offset`; nothing precedes it while it is
+        # still scrolling in (offset > 0), afterwards the previous supercycle's
+        # padding may spill past the seam
+        pad = self.tile_padding
+        origin = offset if offset > 0 else offset - scw
+        n_chunks = (scw + self.chunk_width - 1) // self.chunk_width
+        u = -origin - pad  # Leftmost visible supercycle position, padding included
+        if u >= scw:
+            chunk_index = n_chunks
+        else:
+            # Start at the chunk holding the slot under the left edge (wide tiles start earlier)
+            first = max(0, bisect.bisect_right(self._starts, u) - 1)
+            chunk_index = int(self._entries[first][0] // self.chunk_width)
+        x = origin + chunk_index * self.chunk_width
+        while x - pad < view_width:
+            if chunk_index >= n_chunks:
+                origin += scw
+                chunk_index = 0
+                x = origin
+                continue
+            if origin + self._chunk_reach(chunk_index) + pad > 0:
+                strip = self._chunk(chunk_index, tile_at, budget)
+                painter.drawPixmap(QtCore.QPointF(x - pad, 0.0), strip)
+            x += min(self.chunk_width, scw - chunk_index * self.chunk_width)
+            chunk_index += 1
+        if self.composition_mode is not None:
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        return True
+
+    def visible_tiles(self, offset, view_width):
+        """Yield (screen_x, tile_index) for every tile intersecting the view (-1 = donate)"""
+        scw = self._supercycle_width
+        if not self._layout_valid or scw <= 0:
+            return
+        origin = offset
+        u = max(0.0, -origin)
+        first = max(0, bisect.bisect_right(self._starts, u) - 1)
+        while origin < view_width:
+            for x, w, tile_index in self._entries[first:]:
+                screen_x = origin + x
+                if screen_x >= view_width:
+                    return
+                if screen_x + w > 0:
+                    yield screen_x, tile_index
+            origin += scw
+            first = 0
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats['cached_chunks'] = len(self._chunks)
+        stats['supercycle_width'] = self._supercycle_width
+        return stats
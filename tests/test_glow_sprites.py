@@ -0,0 +1,21 @@
+from PyQt5 import QtGui
+
+from glow_sprites import GlowSpriteCache
+from tile_renderer import HALO_OFFSETS
+
+
+def test_pinned_sprites_are_released_with_their_layout(qapp):
+    cache = GlowSpriteCache(max_entries=1)
+    font = QtGui.QFont("DejaVu Sans", 22)
+    white, glow = QtGui.QColor(255, 255, 255), QtGui.QColor(255, 255, 255, 15)
+
+    name = cache.sprite("AAPL", font, white, glow, HALO_OFFSETS, pin="layout-1")
+    cache.sprite("MSFT", font, white, glow, HALO_OFFSETS, pin="layout-2")
+    for text in ("1.00", "2.00"):  # Push everything unpinned out of the LRU
+        cache.sprite(text, font, white, glow, HALO_OFFSETS)
+    assert cache.sprite("AAPL", font, white, glow, HALO_OFFSETS, pin="layout-1") is name
+    assert cache.get_stats()['pinned'] == 2
+
+    cache.release_pinned("layout-1")
+    assert cache.get_stats()['pinned'] == 1
+    assert cache.sprite("AAPL", font, white, glow, HALO_OFFSETS, pin="layout-1") is not name
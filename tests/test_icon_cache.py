@@ -0,0 +1,48 @@
+import os
+
+from icon_cache import IconCache
+
+
+def write(path, data, mtime):
+    with open(path, "wb") as f:
+        f.write(data)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_source_edited_on_disk_skips_stale_variants(tmp_path):
+    images_dir = tmp_path / "TCKR.images"
+    images_dir.mkdir()
+    source = images_dir / "AAPL.png"
+    write(source, b"old icon", 1_000_000_000)
+    cache = IconCache(str(images_dir))
+    cache.record_source("AAPL", "AAPL.png", b"old icon", url="https://example.invalid/AAPL.png",
+                        headers={"ETag": '"v1"'})
+    old_target = cache.processed_target("AAPL", 40, True)
+    cache.record_processed(old_target)
+    assert cache.processed_path("AAPL", 40, True) == old_target
+
+    write(source, b"new icon!", 2_000_000_000)
+    assert cache.processed_path("AAPL", 40, True) is None
+    assert cache.refresh_source("AAPL", b"new icon!")
+    assert not cache.refresh_source("AAPL", b"new icon!")
+    new_target = cache.processed_target("AAPL", 40, True)
+    assert new_target != old_target
+    assert cache.processed_path("AAPL", 40, True) is None  # Not processed yet
+    cache.record_processed(new_target)
+    assert cache.processed_path("AAPL", 40, True) == new_target
+    assert cache.validators("https://example.invalid/AAPL.png") == {"If-None-Match": '"v1"'}
+
+
+def test_stat_survives_the_index(tmp_path):
+    images_dir = tmp_path / "TCKR.images"
+    images_dir.mkdir()
+    write(images_dir / "MSFT.png", b"icon", 1_000_000_000)
+    cache = IconCache(str(images_dir))
+    cache.record_source("MSFT", "MSFT.png", b"icon")
+    target = cache.processed_target("MSFT", 40, False)
+    cache.record_processed(target)
+    assert cache.save_index()
+
+    reloaded = IconCache(str(images_dir))
+    assert reloaded.processed_path("MSFT", 40, False) == target
+    assert not reloaded.refresh_source("MSFT", b"icon")
@@ -0,0 +1,50 @@
+import gc
+
+import numpy as np
+import pytest
+from PyQt5 import QtGui
+
+import pixel_stats
+
+
+def solid(fmt, color, width=48, height=20):
+    image = QtGui.QImage(width, height, fmt)
+    image.fill(color)
+    return image
+
+
+def churn():
+    """Allocate and free images so freed pixel buffers get reused"""
+    for _ in range(20):
+        solid(QtGui.QImage.Format_ARGB32, QtGui.QColor(1, 2, 3)).bits()
+    gc.collect()
+
+
+@pytest.mark.parametrize("fmt", [QtGui.QImage.Format_RGB888, QtGui.QImage.Format_RGB16, QtGui.QImage.Format_Grayscale8])
+def test_converted_formats_own_their_pixels(fmt):
+    image = solid(fmt, QtGui.QColor(255, 255, 255))
+    pixels, premultiplied = pixel_stats.image_array(image)
+    churn()
+    assert not premultiplied
+    assert pixels.shape == (20, 48)
+    assert (pixels == 0xFFFFFFFF).all()
+
+
+def test_32bit_formats_are_zero_copy_views():
+    image = solid(QtGui.QImage.Format_ARGB32, QtGui.QColor(10, 200, 30))
+    pixels, premultiplied = pixel_stats.image_array(image)
+    assert not premultiplied and not pixels.flags.owndata
+    assert (pixels == 0xFF0AC81E).all()
+
+
+def test_dominant_color_of_converted_image():
+    image = solid(QtGui.QImage.Format_RGB888, QtGui.QColor(10, 200, 30))
+    assert pixel_stats.dominant_color(image) == ((10, 200, 30), 1.0)
+
+
+def test_dominant_color_matches_across_formats():
+    color = QtGui.QColor(120, 40, 200, 128)
+    argb = pixel_stats.dominant_color(solid(QtGui.QImage.Format_ARGB32, color))
+    premultiplied = pixel_stats.dominant_color(solid(QtGui.QImage.Format_ARGB32_Premultiplied, color))
+    assert argb[1] == premultiplied[1] == 1.0
+    assert np.abs(np.subtract(argb[0], premultiplied[0])).max() <= 1
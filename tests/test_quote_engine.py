@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+import quote_engine
+from log_pipeline import DEBUG, INFO
+from quote_engine import QuoteFetchEngine, QuoteProvider
+
+
+class StubProvider(QuoteProvider):
+    name = "stub"
+
+    def __init__(self, quote=(1.0, 0.9, 200), batch=None, acquire_error=None, rate_error=None, block=None):
+        super().__init__()
+        self.quote = quote
+        self.batch = batch
+        self.batch_size = 1 if batch is None else 10
+        self.acquire_error = acquire_error
+        self.rate_error = rate_error
+        self.block = block
+
+    def handles(self, symbol):
+        return True
+
+    async def acquire(self):
+        if self.acquire_error is not None:
+            raise self.acquire_error
+        return "lease"
+
+    def fetch_quote(self, symbol, lease=None):
+        if self.block is not None:
+            self.block.wait()
+        return self.quote
+
+    def fetch_batch(self, symbols, lease=None):
+        return self.batch(symbols)
+
+    def on_rate_limited(self, symbol, lease=None):
+        if self.rate_error is not None:
+            raise self.rate_error
+
+
+@pytest.fixture
+def make_engine():
+    engines = []
+
+    def make(provider):
+        engine = QuoteFetchEngine([provider], max_workers=4)
+        engines.append(engine)
+        return engine
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+def test_every_symbol_answered(make_engine):
+    prices, had_429 = make_engine(StubProvider()).fetch(SYMBOLS, timeout=5)
+    assert prices == {symbol: (1.0, 0.9) for symbol in SYMBOLS} and not had_429
+
+
+def test_acquire_failure_reports_symbols(make_engine):
+    prices, _ = make_engine(StubProvider(acquire_error=RuntimeError("no key"))).fetch(SYMBOLS, timeout=5)
+    assert prices == {symbol: (None, None) for symbol in SYMBOLS}
+
+
+def test_rate_limit_hook_failure_keeps_result(make_engine):
+    provider = StubProvider(quote=(None, None, 429), rate_error=RuntimeError("pool broken"))
+    prices, had_429 = make_engine(provider).fetch(SYMBOLS, timeout=5)
+    assert prices == {symbol: (None, None) for symbol in SYMBOLS} and had_429
+
+
+@pytest.mark.parametrize("answer", [
+    lambda symbols: None,  # Not a dict
+    lambda symbols: {symbol: (2.0,) for symbol in symbols},  # Short tuples
+])
+def test_malformed_batch_reports_symbols(make_engine, answer):
+    prices, _ = make_engine(StubProvider(batch=answer)).fetch(SYMBOLS, timeout=5)
+    assert set(prices) == set(SYMBOLS)
+
+
+def test_malformed_batch_entry_falls_back_per_symbol(make_engine):
+    provider = StubProvider(batch=lambda symbols: {"AAA": (2.0, 1.9, 200), "BBB": (None, None, 200)})
+    prices, _ = make_engine(provider).fetch(SYMBOLS, timeout=5)
+    assert prices == {"AAA": (2.0, 1.9), "BBB": (1.0, 0.9), "CCC": (1.0, 0.9)}
+
+
+def test_timeout_returns_unanswered_symbols(make_engine):
+    release = threading.Event()
+    try:
+        prices, _ = make_engine(StubProvider(block=release)).fetch(SYMBOLS, timeout=0.2)
+    finally:
+        release.set()
+    assert prices == {symbol: (None, None) for symbol in SYMBOLS}
+
+
+def test_failures_go_to_the_logger_with_one_summary_per_cycle(make_engine):
+    records = []
+    quote_engine.set_logger(lambda level, tag, text, *args: records.append((level, tag, text % args)))
+    try:
+        make_engine(StubProvider(acquire_error=RuntimeError("no key"))).fetch(SYMBOLS, timeout=5)
+    finally:
+        quote_engine.set_logger(None)
+    assert [level for level, _tag, _text in records].count(DEBUG) == len(SYMBOLS)
+    assert [record for record in records if record[0] != DEBUG] == [
+        (INFO, "API", f"{len(SYMBOLS)} of {len(SYMBOLS)} quotes failed this cycle (0 rate limited)")]
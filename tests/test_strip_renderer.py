@@ -0,0 +1,80 @@
+import pytest
+from PyQt5 import QtCore, QtGui
+
+from strip_renderer import TickerStripRenderer
+
+
+HEIGHT = 12
+VIEW = 400
+PAD = 30
+WIDTHS = [70, 130, 40, 250, 90]
+DONATE = 110
+
+
+def halo(width, index):
+    """Padded tile: a soft blob reaching the pixmap edges on both sides"""
+    pixmap = QtGui.QPixmap(width + 2 * PAD, HEIGHT)
+    pixmap.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(pixmap)
+    gradient = QtGui.QLinearGradient(0, 0, width + 2 * PAD, 0)
+    gradient.setColorAt(0, QtGui.QColor(40 + 30 * index, 0, 0, 40))
+    gradient.setColorAt(0.5, QtGui.QColor(0, 60, 20 * index, 90))
+    gradient.setColorAt(1, QtGui.QColor(0, 0, 80, 40))
+    painter.fillRect(pixmap.rect(), gradient)
+    painter.end()
+    return pixmap
+
+
+def expected(tiles, offset):
+    """Every padded tile drawn at its own position, one supercycle after another"""
+    order = []
+    for cycle in range(TickerStripRenderer.CYCLES_PER_SUPERCYCLE):
+        order += list(range(len(WIDTHS)))
+        if cycle == 0:
+            order.append(-1)
+    scw = sum(WIDTHS) * TickerStripRenderer.CYCLES_PER_SUPERCYCLE + DONATE
+    image = QtGui.QImage(VIEW, HEIGHT, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Plus)
+    origin = offset if offset > 0 else offset - scw
+    while origin - PAD < VIEW:
+        x = origin
+        for index in order:
+            painter.drawPixmap(x - PAD, 0, tiles[index])
+            x += DONATE if index < 0 else WIDTHS[index]
+        origin += scw
+    painter.end()
+    return image
+
+
+def drawn(renderer, tiles, offset):
+    image = QtGui.QImage(VIEW, HEIGHT, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    renderer.draw(painter, offset, VIEW, tiles.get, WIDTHS, DONATE, HEIGHT)
+    painter.end()
+    return image
+
+
+SCW = sum(WIDTHS) * 3 + DONATE
+
+
+@pytest.mark.parametrize("offset", [150, 10, 0, -5, -100, -250, -257, -600, -SCW + 300, -SCW + 20, -SCW + 1])
+def test_padded_tiles_cross_chunk_edges_and_the_wrap(qapp, offset):
+    tiles = {index: halo(width, index) for index, width in enumerate(WIDTHS)}
+    tiles[-1] = halo(DONATE, 5)
+    renderer = TickerStripRenderer(chunk_width=256, tile_padding=PAD,
+                                   composition_mode=QtGui.QPainter.CompositionMode_Plus)
+    assert drawn(renderer, tiles, offset) == expected(tiles, offset)
+
+
+def test_tile_update_rebuilds_its_chunk(qapp):
+    tiles = {index: halo(width, index) for index, width in enumerate(WIDTHS)}
+    tiles[-1] = halo(DONATE, 5)
+    renderer = TickerStripRenderer(chunk_width=256, tile_padding=PAD,
+                                   composition_mode=QtGui.QPainter.CompositionMode_Plus)
+    drawn(renderer, tiles, -20)
+    tiles[3] = halo(WIDTHS[3], 0)
+    renderer.invalidate_tile(3)
+    assert drawn(renderer, tiles, -20) == expected(tiles, -20)
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+from PyQt5 import QtGui
+
+from glyph_atlas import get_glyph_metrics
+import tile_renderer
+from tile_renderer import HALO_OFFSETS, TileLayout, TileSpec
+
+
+GLOW_OFFSETS = tuple((dx, dy) for dx in (-2, -1, 0, 1, 2) for dy in (-2, -1, 0, 1, 2) if dx != 0 or dy != 0)
+
+
+def grey(image, cache_key=None):
+    return QtGui.QColor(120, 160, 200)
+
+
+def make_layout(glow=True, indicator_style="triangles"):
+    height = 60
+    font = QtGui.QFont("DejaVu Sans", 22)
+    small_font = QtGui.QFont("DejaVu Sans", 11)
+    arrow_font = QtGui.QFont("DejaVu Sans", 14)
+    metrics = QtGui.QFontMetrics(font)
+    small_metrics = QtGui.QFontMetrics(small_font)
+    stacked_top = height // 2 - 2
+    return TileLayout(
+        height=height, font=font, small_font=small_font, arrow_font=arrow_font,
+        number_metrics=get_glyph_metrics(font), small_number_metrics=get_glyph_metrics(small_font),
+        icon_size=40, icon_y=10, text_y=(height + metrics.ascent() - metrics.descent()) // 2,
+        sep=" | ", sep_width=metrics.horizontalAdvance(" | "),
+        sparkline_width=51, sparkline_gap=6, sparkline_position='left',
+        stacked_top=stacked_top, pct_y=stacked_top + small_metrics.height() + 2,
+        small_ascent=small_metrics.ascent(), arrow_ascent=QtGui.QFontMetrics(arrow_font).ascent(),
+        indicator_style=indicator_style, indicator_size=12,
+        indicator_width=tile_renderer.indicator_width(indicator_style, 12),
+        text_glow=QtGui.QColor(255, 255, 255, 15) if glow else None,
+        subtle_glow_offsets=HALO_OFFSETS, glow_offsets=GLOW_OFFSETS,
+        name_color=QtGui.QColor("#00B3FF"), ghost_intensity=100, ghost_tint_override=None,
+        key=("test", glow, indicator_style),
+    )
+
+
+def make_spec(price, prev, glow_color=None):
+    icon = QtGui.QImage(40, 40, QtGui.QImage.Format_ARGB32_Premultiplied)
+    icon.fill(QtGui.QColor(200, 40, 40))
+    sparkline = QtGui.QImage(51, 20, QtGui.QImage.Format_ARGB32_Premultiplied)
+    sparkline.fill(QtGui.QColor(40, 200, 40, 128))
+    change = price - prev
+    pct = change / prev * 100
+    return TileSpec(
+        symbol="AAPL", display_name="AAPL", icon=icon, sparkline=sparkline,
+        price_text=f"{price:.2f}", price_color=QtGui.QColor("#FFFFFF"), glow_color=glow_color,
+        change_text=f"+{change:.2f}", pct_text=f"+{pct:.2f}%", change_color=QtGui.QColor("#00FF40"),
+        change_glow_color=glow_color, rotation=0, icon_key=1, sparkline_key=2,
+    )
+
+
+def pixels(device):
+    image = device.toImage() if isinstance(device, QtGui.QPixmap) else device
+    image = image.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+    return [[image.pixel(x, y) for x in range(image.width())] for y in range(image.height())]
+
+
+@pytest.mark.parametrize("glow", [True, False])
+@pytest.mark.parametrize("move_glow", [None, QtGui.QColor(0, 255, 64, 90)])
+@pytest.mark.parametrize("price", [123.47, 124.56, 129.99])
+@pytest.mark.parametrize("indicator_style", ["triangles", "arrows", "thin_arrows"])
+def test_patched_tile_matches_rebuilt_tile(qapp, glow, move_glow, price, indicator_style):
+    layout = make_layout(glow, indicator_style)
+    old_spec = make_spec(123.45, 110.00, move_glow)
+    spec = make_spec(price, 110.00, move_glow)
+    old = tile_renderer.render_tile(old_spec, layout, grey)
+    pixmap = QtGui.QPixmap.fromImage(old.image)
+    ghost = QtGui.QPixmap.fromImage(old.ghost)
+
+    assert tile_renderer.patch_tile(pixmap, ghost, old.tint, old_spec, spec, layout)
+    rebuilt = tile_renderer.render_tile(spec, layout, grey)
+    assert pixels(pixmap) == pixels(rebuilt.image)
+    assert pixels(ghost) == pixels(rebuilt.ghost)
+
+
+def test_patch_refuses_layout_changes(qapp):
+    layout = make_layout()
+    old_spec = make_spec(123.45, 120.00)
+    old = tile_renderer.render_tile(old_spec, layout, grey)
+    image = old.image
+    before = pixels(image)
+
+    wider = make_spec(1234.56, 1200.00)  # Gains a digit
+    assert not tile_renderer.patch_tile(image, old.ghost, old.tint, old_spec, wider, layout)
+    recolored = make_spec(123.47, 120.00)._replace(change_color=QtGui.QColor("#F4444E"))
+    assert not tile_renderer.patch_tile(image, old.ghost, old.tint, old_spec, recolored, layout)
+    assert pixels(image) == before
+
+
+def test_submitted_tiles_match_blocking_render(qapp):
+    layout = make_layout()
+    specs = [make_spec(123.45 + i, 110.00)._replace(symbol=f"S{i}") for i in range(5)]
+    pool = tile_renderer.TileRenderPool(max_workers=2)
+    done = []
+    landed = threading.Event()
+
+    def on_done(tiles):
+        done.append(tiles)
+        landed.set()
+
+    pool.submit(specs, layout, grey, on_done)
+    assert landed.wait(10)
+    expected = pool.render(specs, layout, grey)
+    pool.shutdown()
+
+    assert len(done) == 1
+    assert [tile.spec.symbol for tile in done[0]] == [spec.symbol for spec in specs]
+    assert [pixels(tile.image) for tile in done[0]] == [pixels(tile.image) for tile in expected]
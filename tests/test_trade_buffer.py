@@ -0,0 +1,57 @@
+import pytest
+
+from trade_buffer import TradeIngestBuffer
+
+
+def test_drain_aggregates_columnar_messages_across_lanes():
+    buffer = TradeIngestBuffer()
+    second = buffer.lane()
+    buffer.push(["AAPL", "MSFT", "AAPL"], [10.0, 20.0, 12.0], [1_000, 1_500, 2_000], [1.0, 5.0, 3.0])
+    second.push(["MSFT"], [22.0], [3_000], [5.0])
+    buffer.push([], [], [], [])  # Messages without trades are not queued
+
+    bars = buffer.drain()
+    assert sorted(bars) == ["AAPL", "MSFT"]
+    aapl = bars["AAPL"]
+    assert (aapl.last, aapl.timestamp, aapl.volume, aapl.high, aapl.low, aapl.trades) == (12.0, 2.0, 4.0, 12.0, 10.0, 2)
+    assert aapl.vwap == pytest.approx((10.0 * 1.0 + 12.0 * 3.0) / 4.0)
+    assert bars["MSFT"].last == 22.0 and bars["MSFT"].vwap == pytest.approx(21.0)
+    assert buffer.drain() == {}
+
+    stats = buffer.get_stats()
+    assert (stats['trades_received'], stats['trades_drained'], stats['trades_coalesced']) == (4, 4, 2)
+
+
+def test_trades_without_volume_use_the_last_price():
+    buffer = TradeIngestBuffer()
+    buffer.push(["BINANCE:BTCUSDT", "BINANCE:BTCUSDT"], [100.0, 101.5], [1_000, 1_001], [0.0, 0.0])
+    bar = buffer.drain()["BINANCE:BTCUSDT"]
+    assert bar.vwap == bar.last == 101.5
+
+
+def test_full_lane_drops_and_counts_the_oldest_message():
+    buffer = TradeIngestBuffer(max_messages=2)
+    buffer.push(["A", "A"], [1.0, 2.0], [1, 2], [1.0, 1.0])
+    buffer.push(["B"], [3.0], [3], [1.0])
+    buffer.push(["C"], [4.0], [4], [1.0])
+    assert sorted(buffer.drain()) == ["B", "C"]
+    assert buffer.get_stats()['trades_dropped'] == 2
+
+
+def test_session_totals_accumulate_across_drains_and_reset():
+    buffer = TradeIngestBuffer()
+    buffer.push(["AAPL", "AAPL"], [10.0, 12.0], [1_000, 2_000], [1.0, 3.0])
+    buffer.drain()
+    buffer.push(["AAPL"], [8.0], [3_000], [4.0])
+    bar = buffer.drain()["AAPL"]
+    assert (bar.volume, bar.high, bar.low) == (4.0, 8.0, 8.0)
+    assert (bar.session_volume, bar.session_high, bar.session_low) == (8.0, 12.0, 8.0)
+    assert bar.session_vwap == pytest.approx((10.0 + 36.0 + 32.0) / 8.0)
+    assert buffer.aggregator.top_sessions() == [("AAPL", bar.session_vwap, 8.0, 12.0, 8.0)]
+
+    buffer.push(["AAPL"], [9.0], [86_400_000 + 1_000], [2.0])  # Next UTC day
+    assert buffer.drain()["AAPL"].session_volume == 2.0
+    buffer.aggregator.reset()
+    assert buffer.aggregator.top_sessions() == []
+    buffer.push(["AAPL"], [9.5], [86_400_000 + 2_000], [1.0])
+    assert buffer.drain()["AAPL"].session_volume == 1.0
@@ -552,6 +552,35 @@ def fast_luminance_calculation(np.ndarray[np.int32_t, ndim=2] rgb_array):
     return luminance
 
 
+def dominant_color_argb32(const np.uint32_t[:, :] pixels, int step, int alpha_threshold, bint premultiplied):
+    """Colour sums over every step-th pixel of an ARGB32 array for pixel_stats:
+    (red_sum, green_sum, blue_sum, opaque_count, sample_count), un-premultiplied if needed."""
+    cdef Py_ssize_t height = pixels.shape[0], width = pixels.shape[1], x, y
+    cdef np.uint32_t p
+    cdef long long red_sum = 0, green_sum = 0, blue_sum = 0
+    cdef long opaque = 0, samples = 0
+    cdef unsigned int a, r, g, b
+    for y in range(0, height, step):
+        for x in range(0, width, step):
+            p = pixels[y, x]
+            a = (p >> 24) & 0xFF
+            r = (p >> 16) & 0xFF
+            g = (p >> 8) & 0xFF
+            b = p & 0xFF
+            if premultiplied and a > 0:
+                # Round half down: c * 255 / a
+                r = (r * 510 + a - 1) // (2 * a)
+                g = (g * 510 + a - 1) // (2 * a)
+                b = (b * 510 + a - 1) // (2 * a)
+            red_sum += r
+            green_sum += g
+            blue_sum += b
+            if a > <unsigned int>alpha_threshold:
+                opaque += 1
+            samples += 1
+    return red_sum, green_sum, blue_sum, opaque, samples
+
+
 # ---------------------------------------------------------------------------
 # Pure-Python helpers (unchanged from numba version)
 # ---------------------------------------------------------------------------
@@ -749,6 +749,37 @@ def fast_luminance_calculation(rgb_array):
     return luminance
 
 
+@jit(nopython=True, cache=True)
+def dominant_color_argb32(pixels, step, alpha_threshold, premultiplied):
+    """Colour sums over every step-th pixel of a (height, width) ARGB32 array for pixel_stats:
+    (red_sum, green_sum, blue_sum, opaque_count, sample_count), un-premultiplied if needed."""
+    height, width = pixels.shape
+    red_sum = 0
+    green_sum = 0
+    blue_sum = 0
+    opaque = 0
+    samples = 0
+    for y in range(0, height, step):
+        for x in range(0, width, step):
+            p = np.int64(pixels[y, x])
+            a = (p >> 24) & 0xFF
+            r = (p >> 16) & 0xFF
+            g = (p >> 8) & 0xFF
+            b = p & 0xFF
+            if premultiplied and a > 0:
+                # Round half down: c * 255 / a
+                r = (r * 510 + a - 1) // (2 * a)
+                g = (g * 510 + a - 1) // (2 * a)
+                b = (b * 510 + a - 1) // (2 * a)
+            red_sum += r
+            green_sum += g
+            blue_sum += b
+            if a > alpha_threshold:
+                opaque += 1
+            samples += 1
+    return red_sum, green_sum, blue_sum, opaque, samples
+
+
 # Pre-compile functions on import (warms up the JIT cache)
 if __name__ != '__main__':
     # Warm up the JIT compiler with dummy calls
@@ -808,5 +839,6 @@ if __name__ != '__main__':
     dummy_blends = np.array([0.5, 0.3], dtype=np.float32)
     _ = vectorized_color_interpolation(dummy_colors1, dummy_colors2, dummy_blends)
     _ = fast_luminance_calculation(dummy_colors1)
+    _ = dominant_color_argb32(np.zeros((6, 6), dtype=np.uint32), 6, 16, True)
 
 print("[NUMBA] Advanced JIT-compiled utilities loaded and ready (25+ optimized functions)")
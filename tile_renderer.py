@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Tile Renderer for TCKR
+Draws symbol tiles (icon, name, sparkline, price, change, indicator and the tinted
+ghost copy) into QImages, which unlike QPixmaps may be painted on any thread.
+Everything a tile needs is captured up front on the GUI thread - a TileLayout of
+per-build constants and one TileSpec per symbol - so render_tile touches no window
+state and a TileRenderPool can draw a whole watchlist on worker threads while the
+GUI thread keeps scrolling the previous tiles.
+"""
+
+import collections
+import concurrent.futures
+import os
+import threading
+
+from PyQt5 import QtCore, QtGui
+
+from glow_sprites import get_glow_sprite_cache
+from glyph_atlas import get_glyph_atlas
+
+
+# Per-build constants shared by every tile (fonts, geometry, effect settings)
+TileLayout = collections.namedtuple("TileLayout", [
+    "height", "font", "small_font", "arrow_font", "number_metrics", "small_number_metrics",
+    "icon_size", "icon_y", "text_y", "sep", "sep_width",
+    "sparkline_width", "sparkline_gap", "sparkline_position",  # position None when sparklines are off
+    "stacked_top", "pct_y", "small_ascent", "arrow_ascent",
+    "indicator_style", "indicator_size", "indicator_width",
+    "text_glow", "subtle_glow_offsets", "glow_offsets",
+    "name_color", "ghost_intensity", "ghost_tint_override",
+    "key",  # Identifies the above (settings version, font, height, sparklines)
+])
+
+# What one symbol's tile shows, resolved on the GUI thread
+TileSpec = collections.namedtuple("TileSpec", [
+    "symbol", "display_name", "icon", "sparkline",
+    "price_text", "price_color", "glow_color",  # glow_color: 5% move glow, None when inactive
+    "change_text", "pct_text", "change_color", "change_glow_color", "rotation",
+    "icon_key", "sparkline_key",
+])
+
+# A drawn tile; price_x / change_x / change_width locate the digits for in-place updates
+RenderedTile = collections.namedtuple("RenderedTile", [
+    "spec", "image", "ghost", "width", "areas", "tint", "price_x", "change_x", "change_width",
+])
+
+ARROW_SYMBOLS = {0: "↑", 45: "↗", 90: "→", 135: "↘", 180: "↓"}
+HALO_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx != 0 or dy != 0)
+
+
+def indicator_width(style, indicator_size):
+    """Horizontal space reserved for the change indicator"""
+    if style == "thin_arrows":
+        return 14
+    leg = max(2, int((indicator_size / 2) * 0.9))
+    return 2 + 2 * leg + 6
+
+
+def draw_rotated_triangle(painter, x, y, size, rotation_angle, color):
+    """Right-angle triangle centred on (x, y); the right-angle vertex points
+    along rotation_angle (0=up, 90=right, 180=down)"""
+    half_size = size / 2
+    tip_y = -int(half_size)
+    leg_component = max(2, int(half_size * 0.9))
+    triangle = QtGui.QPolygon([
+        QtCore.QPoint(0, tip_y),                                  # Directional right-angle vertex
+        QtCore.QPoint(leg_component, tip_y + leg_component),      # Leg endpoint 1
+        QtCore.QPoint(-leg_component, tip_y + leg_component)      # Leg endpoint 2
+    ])
+    _fill_rotated(painter, triangle, x, y, rotation_angle, color)
+
+
+def draw_rotated_arrow(painter, x, y, size, rotation_angle, color):
+    """Block arrow centred on (x, y) pointing along rotation_angle (0=up, 90=right, 180=down)"""
+    half_size = size / 2
+    shaft_width = half_size * 0.35
+    head_width = half_size * 0.75
+    arrow = QtGui.QPolygon([
+        QtCore.QPoint(0, -int(half_size)),                        # Tip
+        QtCore.QPoint(-int(head_width), -int(half_size * 0.3)),   # Left head
+        QtCore.QPoint(-int(shaft_width), -int(half_size * 0.3)),  # Left shaft start
+        QtCore.QPoint(-int(shaft_width), int(half_size * 0.5)),   # Left shaft bottom
+        QtCore.QPoint(int(shaft_width), int(half_size * 0.5)),    # Right shaft bottom
+        QtCore.QPoint(int(shaft_width), -int(half_size * 0.3)),   # Right shaft start
+        QtCore.QPoint(int(head_width), -int(half_size * 0.3)),    # Right head
+    ])
+    _fill_rotated(painter, arrow, x, y, rotation_angle, color)
+
+
+def _fill_rotated(painter, polygon, x, y, rotation_angle, color):
+    transform = QtGui.QTransform()
+    transform.translate(x, y)
+    transform.rotate(rotation_angle)
+    painter.save()
+    painter.setTransform(transform, True)
+    painter.setBrush(QtGui.QBrush(color))
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.drawPolygon(polygon)
+    painter.restore()
+
+
+def draw_glow_text(painter, x, y, text, color, glow_color=None, glow_offsets=HALO_OFFSETS, pin=False):
+    """drawText with a halo: glow_color at every offset, then the text on top.
+
+    Glowing text comes from the glow sprite cache (pin: the layout key to keep
+    it under, for names and labels); the multi-pass drawing is the fallback.
+    """
+    if glow_color is not None and get_glow_sprite_cache().draw(painter, x, y, text, color, glow_color, glow_offsets, pin):
+        return
+    if glow_color is not None:
+        painter.setPen(glow_color)
+        for dx, dy in glow_offsets:
+            painter.drawText(x + dx, y + dy, text)
+    painter.setPen(color)
+    painter.drawText(x, y, text)
+
+
+def _rgba(color):
+    return color.rgba() if color is not None else None
+
+
+def tile_key(spec, layout):
+    """Everything that decides a tile's pixels (for caching its colour statistics)"""
+    return (layout.key, spec.display_name, spec.icon_key, spec.sparkline_key,
+            spec.price_text, _rgba(spec.price_color), _rgba(spec.glow_color),
+            spec.change_text, spec.pct_text, _rgba(spec.change_color), _rgba(spec.change_glow_color),
+            spec.rotation)
+
+
+# Where a tile's parts go; equal geometries mean two specs draw at the same positions
+TileGeometry = collections.namedtuple("TileGeometry", [
+    "width", "name_width", "price_x", "price_width", "change_x", "change_width", "triangle_width",
+])
+
+
+def tile_geometry(spec, layout):
+    """TileGeometry of spec's tile (change_x None when it shows no change)"""
+    name_width = QtGui.QFontMetrics(layout.font).horizontalAdvance(spec.display_name + " ")
+    price_width = layout.number_metrics.advance(spec.price_text)
+    has_change = bool(spec.change_text or spec.pct_text)
+    small_metrics = layout.small_number_metrics
+    change_width = max(small_metrics.advance(spec.change_text), small_metrics.advance(spec.pct_text)) if has_change else 0
+    triangle_width = layout.indicator_width if has_change else 0
+    sparkline_width = layout.sparkline_width if layout.sparkline_position else 0
+    sparkline_gap = layout.sparkline_gap if layout.sparkline_position else 0
+    price_x = layout.icon_size + 8 + name_width
+    if layout.sparkline_position == 'left':
+        price_x += sparkline_gap + sparkline_width + sparkline_gap
+    total_width = (layout.icon_size + 8 + name_width + sparkline_gap + sparkline_width + sparkline_gap + price_width
+                   + (10 + change_width + triangle_width if change_width else 0) + layout.sep_width + 20)
+    change_x = price_x + price_width + 10 if has_change else None
+    return TileGeometry(total_width, name_width, price_x, price_width, change_x, change_width, triangle_width)
+
+
+def digit_runs(spec, layout, geometry):
+    """(atlas, x, baseline, text) of the price, change and percent text, in drawing order"""
+    if spec.glow_color is not None:
+        # 5% move glow replaces the global glow
+        price_atlas = get_glyph_atlas(layout.font, spec.price_color, spec.glow_color, layout.glow_offsets)
+    else:
+        price_atlas = get_glyph_atlas(layout.font, spec.price_color, layout.text_glow, layout.subtle_glow_offsets)
+    runs = [(price_atlas, geometry.price_x, layout.text_y, spec.price_text)]
+
+    change_x = geometry.change_x
+    if change_x is not None:
+        if spec.change_glow_color is not None:
+            atlas = get_glyph_atlas(layout.small_font, spec.change_color, spec.change_glow_color, layout.glow_offsets)
+        else:
+            atlas = get_glyph_atlas(layout.small_font, spec.change_color, layout.text_glow, layout.subtle_glow_offsets)
+        # Right-align both rows within change_width so their right edges are flush
+        right = change_x + geometry.change_width
+        small_metrics = layout.small_number_metrics
+        runs.append((atlas, right - small_metrics.advance(spec.change_text), layout.stacked_top, spec.change_text))
+        runs.append((atlas, right - small_metrics.advance(spec.pct_text), layout.pct_y, spec.pct_text))
+    return runs
+
+
+def paint_indicator(painter, spec, layout, geometry):
+    """Draw the change indicator just right of the stacked change text"""
+    color = spec.change_color
+    glow_color = spec.change_glow_color
+    # Indicator is centred on indicator_x; offset by the leg so its left edge
+    # lands 2px past the right edge of the stacked block
+    rotation = spec.rotation
+    indicator_size = layout.indicator_size
+    leg_component = max(2, int((indicator_size / 2) * 0.9))
+    indicator_x = geometry.change_x + geometry.change_width + 2 + leg_component
+    indicator_y = layout.stacked_top - layout.small_ascent // 2
+    if rotation == 0:
+        indicator_y += 2  # Up: top-heavy
+    elif rotation == 180:
+        indicator_y -= 2  # Down: bottom-heavy
+    if layout.indicator_style == "thin_arrows":
+        arrow_y = layout.stacked_top - layout.arrow_ascent // 2
+        painter.setFont(layout.arrow_font)
+        draw_glow_text(painter, indicator_x, arrow_y, ARROW_SYMBOLS.get(rotation, "→"), color, glow_color,
+                       pin=layout.key)
+    else:
+        draw_shape = draw_rotated_arrow if layout.indicator_style == "arrows" else draw_rotated_triangle
+        if glow_color is not None:
+            for dx, dy in HALO_OFFSETS:
+                draw_shape(painter, indicator_x + dx, indicator_y + dy, indicator_size, rotation, glow_color)
+        draw_shape(painter, indicator_x, indicator_y, indicator_size, rotation, color)
+
+
+def paint_tile(painter, spec, layout, geometry):
+    """Draw spec's tile (everything but the ghost) at the painter's origin"""
+    height = layout.height
+    sparkline_gap = layout.sparkline_gap if layout.sparkline_position else 0
+    sparkline_width = layout.sparkline_width if layout.sparkline_position else 0
+    x = 0
+    if spec.icon is not None:
+        painter.drawImage(x, layout.icon_y, spec.icon)
+    x += layout.icon_size + 8
+
+    text_y = layout.text_y
+    painter.setFont(layout.font)
+    draw_glow_text(painter, x, text_y, spec.display_name, layout.name_color, layout.text_glow, layout.subtle_glow_offsets,
+                   pin=layout.key)
+    x += geometry.name_width
+
+    def draw_sparkline(x):
+        if spec.sparkline is not None:
+            painter.drawImage(x + sparkline_gap, (height - spec.sparkline.height()) // 2, spec.sparkline)
+        return x + sparkline_gap + sparkline_width + sparkline_gap
+
+    if layout.sparkline_position == 'left':
+        x = draw_sparkline(x)
+
+    for atlas, run_x, baseline, text in digit_runs(spec, layout, geometry):
+        atlas.draw(painter, run_x, baseline, text)
+    x += geometry.price_width
+    if geometry.change_x is not None:
+        paint_indicator(painter, spec, layout, geometry)
+        x += 10 + geometry.change_width + geometry.triangle_width
+
+    if layout.sparkline_position == 'right':
+        x = draw_sparkline(x)
+
+    painter.setFont(layout.font)
+    draw_glow_text(painter, x, text_y, layout.sep, layout.name_color, layout.text_glow, layout.subtle_glow_offsets,
+                   pin=layout.key)
+
+
+def ghost_tint(image, spec, layout, dominant_color):
+    """Tint of the tile's ghost copy, from its dominant colour (QImage of the tile)"""
+    intensity = layout.ghost_intensity
+    tint = layout.ghost_tint_override
+    if tint is None:
+        color_strength = intensity * 1.4 / 100.0
+        dominant = dominant_color(image, cache_key=tile_key(spec, layout))
+        tint = QtGui.QColor(int(min(255, dominant.red() * color_strength + 40)),
+                            int(min(255, dominant.green() * color_strength + 40)),
+                            int(min(255, dominant.blue() * color_strength + 40)))
+        tint.setAlpha(int(int(intensity * 0.45) * 2.55))
+    return tint
+
+
+def paint_ghost(device, source, tint):
+    """Replace device's pixels with the tile `source` (QImage or QPixmap) tinted by tint"""
+    painter = QtGui.QPainter(device)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+    painter.fillRect(0, 0, device.width(), device.height(), QtCore.Qt.transparent)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+    if isinstance(source, QtGui.QImage):
+        painter.drawImage(0, 0, source)
+    else:
+        painter.drawPixmap(0, 0, source)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
+    painter.fillRect(0, 0, device.width(), device.height(), tint)
+    painter.end()
+
+
+def render_tile(spec, layout, dominant_color):
+    """Draw one symbol tile and its ghost copy. Safe on any thread.
+
+    dominant_color(QImage, cache_key=...) -> QColor picks the ghost tint; the key
+    is tile_key(spec, layout), so an unchanged tile is not sampled again.
+    """
+    geometry = tile_geometry(spec, layout)
+    image = QtGui.QImage(geometry.width, layout.height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(image)
+    paint_tile(painter, spec, layout, geometry)
+    painter.end()
+
+    # Tinted ghost copy for the ghosting layers, tinted from the tile's dominant colour
+    tint = ghost_tint(image, spec, layout, dominant_color)
+    ghost = QtGui.QImage(image.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    paint_ghost(ghost, image, tint)
+
+    height = layout.height
+    symbol_rect = QtCore.QRect(layout.icon_size + 8, 0, geometry.name_width, height)
+    price_rect = QtCore.QRect(geometry.price_x, 0, geometry.price_width, height)
+    areas = [('symbol', spec.symbol, symbol_rect), ('price', spec.symbol, price_rect)]
+    if geometry.change_x is not None:
+        areas.append(('change', spec.symbol, QtCore.QRect(geometry.change_x, 0, geometry.change_width + geometry.triangle_width,
+                                                          height)))
+    return RenderedTile(spec, image, ghost, geometry.width, areas, tint, geometry.price_x, geometry.change_x,
+                        geometry.change_width)
+
+
+def patch_tile(device, ghost, tint, old_spec, spec, layout):
+    """Redraw the price and change digits of a tile drawn for old_spec so it shows spec.
+
+    Only when nothing but the three texts differ and every position stays put:
+    the cells of the old and new digits are cleared and the new ones blitted
+    from the glyph atlases render_tile draws them from (the indicator, whose
+    halo reaches into the change column, is drawn again inside that area), so
+    the result is pixel for pixel what render_tile(spec) draws. The same area
+    of the ghost copy is refreshed from the tile under its existing tint.
+    device / ghost are the tile's QImages or QPixmaps (ghost may be None).
+    Returns False (nothing drawn) when the tile must be rendered anew.
+    """
+    texts = dict(price_text=old_spec.price_text, change_text=old_spec.change_text, pct_text=old_spec.pct_text)
+    if tile_key(spec._replace(**texts), layout) != tile_key(old_spec, layout):
+        return False
+    geometry = tile_geometry(spec, layout)
+    if geometry != tile_geometry(old_spec, layout):
+        return False
+
+    runs = digit_runs(spec, layout, geometry)
+    region = QtGui.QRegion()
+    for atlas, x, baseline, text in digit_runs(old_spec, layout, geometry) + runs:
+        region = region.united(atlas.bounds(x, baseline, text))
+
+    painter = QtGui.QPainter(device)
+    painter.setClipRegion(region)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+    painter.fillRect(region.boundingRect(), QtCore.Qt.transparent)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+    for atlas, x, baseline, text in runs:
+        atlas.draw(painter, x, baseline, text)
+    if geometry.change_x is not None:
+        paint_indicator(painter, spec, layout, geometry)
+    painter.end()
+
+    if ghost is not None:
+        rect = region.boundingRect()
+        painter = QtGui.QPainter(ghost)
+        painter.setClipRegion(region)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.fillRect(rect, QtCore.Qt.transparent)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        if isinstance(device, QtGui.QImage):
+            painter.drawImage(rect, device, rect)
+        else:
+            painter.drawPixmap(rect, device, rect)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
+        painter.fillRect(rect, tint)
+        painter.end()
+    return True
+
+
+class TileRenderPool:
+    """Worker threads rendering tiles in parallel (PyQt releases the GIL inside Qt calls)"""
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = min(4, max(2, (os.cpu_count() or 2) // 2))
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix="TileRender")
+
+    def render(self, specs, layout, dominant_color):
+        """Render every spec; returns RenderedTiles in spec order (blocks until done)"""
+        if len(specs) <= 1:
+            return [render_tile(spec, layout, dominant_color) for spec in specs]
+        return list(self._executor.map(lambda spec: render_tile(spec, layout, dominant_color), specs))
+
+    def submit(self, specs, layout, dominant_color, on_done):
+        """Render every spec without waiting; on_done(tiles) is called once, on a
+        worker thread, with the RenderedTiles in spec order ([] if any failed)"""
+        if not specs:
+            on_done([])
+            return
+        futures = [self._executor.submit(render_tile, spec, layout, dominant_color) for spec in specs]
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def finished(_future):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                tiles = [future.result() for future in futures]
+            except Exception:
+                tiles = []
+            try:
+                on_done(tiles)
+            except Exception:
+                pass  # e.g. the receiving window is gone
+
+        for future in futures:
+            future.add_done_callback(finished)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_POOL = None
+
+
+def get_tile_render_pool():
+    """Shared TileRenderPool (created on first use)"""
+    global _POOL
+    if _POOL is None:
+        _POOL = TileRenderPool()
+    return _POOL
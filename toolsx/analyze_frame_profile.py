@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Analyzer for TCKR frame profiles (tckr_frames-*.jsonl or tckr_frames-*.trace.json).
+Usage: python toolsx/analyze_frame_profile.py [path/to/tckr_frames-....jsonl|.trace.json]
+Without a path the newest profile next to TCKR is used.
+Prints per-stage timing percentiles and, for frames that missed their budget,
+which stage took the largest share - i.e. which effect caused the dropped frame.
+"""
+import sys, json, glob, os, collections
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+if len(sys.argv) > 1:
+    PATH = sys.argv[1]
+else:
+    candidates = glob.glob(os.path.join(ROOT, 'tckr_frames-*.jsonl')) + glob.glob(os.path.join(ROOT, 'tckr_frames-*.trace.json'))
+    if not candidates:
+        print("No tckr_frames-* profile found (use 'Record Frame Profile' in the tray menu)")
+        sys.exit(1)
+    PATH = max(candidates, key=os.path.getmtime)
+
+
+def load_jsonl(path):
+    frames = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                frames.append(json.loads(line))
+            except Exception:
+                continue
+    return frames
+
+
+def load_chrome_trace(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        trace = json.load(f)
+    names = {}
+    frames = []
+    current = {}
+    for ev in trace.get('traceEvents', []):
+        if ev.get('ph') == 'M' and ev.get('name') == 'thread_name':
+            names[ev.get('tid')] = (ev.get('args') or {}).get('name')
+        elif ev.get('ph') == 'X' and ev.get('cat') == 'frame':
+            frame = {'ts': ev['ts'] / 1e6, 'track': names.get(ev.get('tid'), str(ev.get('tid'))),
+                     'total_ms': ev['dur'] / 1000.0, 'budget_ms': (ev.get('args') or {}).get('budget_ms', 0.0),
+                     'stages': {}}
+            frames.append(frame)
+            current[ev.get('tid')] = frame
+        elif ev.get('ph') == 'X' and ev.get('cat') == 'stage' and ev.get('tid') in current:
+            current[ev['tid']]['stages'][ev['name']] = ev['dur'] / 1000.0
+    return frames
+
+
+def pct(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, int(round(p / 100.0 * (len(values) - 1)))))
+    return values[k]
+
+
+frames = load_chrome_trace(PATH) if PATH.endswith('.json') else load_jsonl(PATH)
+print(f"Frame profile analysis: {PATH}")
+if not frames:
+    print("  no frames")
+    sys.exit(0)
+
+stages = []
+for fr in frames:
+    for name in fr['stages']:
+        if name not in stages:
+            stages.append(name)
+
+totals = [fr['total_ms'] for fr in frames]
+print(f"  frames: {len(frames)}  tracks: {sorted(set(fr['track'] for fr in frames))}")
+print(f"  frame time: mean {sum(totals) / len(totals):.2f}ms  p50 {pct(totals, 50):.2f}ms  "
+      f"p95 {pct(totals, 95):.2f}ms  p99 {pct(totals, 99):.2f}ms  max {max(totals):.2f}ms")
+
+print("Per-stage timings (ms):")
+print(f"  {'stage':<12}{'mean':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'share':>8}")
+grand = sum(totals) or 1.0
+for name in stages:
+    vals = [fr['stages'].get(name, 0.0) for fr in frames]
+    print(f"  {name:<12}{sum(vals) / len(vals):8.3f}{pct(vals, 50):8.3f}{pct(vals, 95):8.3f}"
+          f"{pct(vals, 99):8.3f}{max(vals):8.3f}{100.0 * sum(vals) / grand:7.1f}%")
+
+over = [fr for fr in frames if fr.get('budget_ms') and fr['total_ms'] > fr['budget_ms']]
+print(f"\nOver-budget frames: {len(over)} of {len(frames)}")
+if over:
+    culprits = collections.Counter(max(fr['stages'].items(), key=lambda kv: kv[1])[0] for fr in over if fr['stages'])
+    print(f"  largest stage in those frames: {dict(culprits.most_common())}")
+    print("  worst frames:")
+    for fr in sorted(over, key=lambda fr: fr['total_ms'], reverse=True)[:10]:
+        top = ', '.join(f"{k}={v:.2f}" for k, v in sorted(fr['stages'].items(), key=lambda kv: -kv[1])[:3])
+        print(f"    {fr['track']} @ {fr['ts']:.3f}: {fr['total_ms']:.2f}ms (budget {fr['budget_ms']:.2f}ms) - {top}")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""End-to-end fetch throughput benchmark against toolsx/mock_market_server.py.
+Usage: python toolsx/benchmark_fetch.py [--symbols 10,100,500] [--refreshes 3] [--keys 4] [--json out.json]
+
+Starts a mock server in-process, points TCKR at it through the TCKR_* base-URL
+environment variables, loads the main script as a module with a throwaway APPDATA
+directory (settings, icon cache and history store), then drives the real code paths
+for each watchlist size:
+  quotes      fetch_all_stock_prices_with_429 (quote engine, key pool, 429 handling)
+  sparklines  the shared HistoryFetchScheduler / fetch_sparkline_history
+  icons       get_ticker_icon, cold (network) and warm (memory cache) passes
+  websocket   FinnhubWebSocketPool with one trade drain per --drain-ms
+Reports requests/s, p50/p99 latency and the server-side 429 rate.
+"""
+import argparse, importlib.util, json, os, sys, tempfile, threading, time, types
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, '..'))
+SCRIPT = os.path.join(ROOT, 'TCKR-v1.1.5.py')
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+from mock_market_server import MockMarketServer
+
+
+def percentiles(samples):
+    if not samples:
+        return 0.0, 0.0
+    p50, p99 = np.percentile(np.asarray(samples) * 1000.0, [50, 99])
+    return float(p50), float(p99)
+
+
+def watchlist(size, tier):
+    """`size` symbols, ~10% Yahoo indices; distinct per tier so caches never carry over"""
+    yahoo = max(1, size // 10)
+    return ([f"^T{tier}I{i}" for i in range(yahoo)] +
+            [f"T{tier}S{i}" for i in range(size - yahoo)])
+
+
+def load_app(server, args):
+    appdata = tempfile.mkdtemp(prefix="tckr-bench-")
+    os.environ["APPDATA"] = appdata
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.update(server.environment())
+
+    spec = importlib.util.spec_from_file_location("tckr_app", SCRIPT)
+    app = importlib.util.module_from_spec(spec)
+    sys.modules["tckr_app"] = app
+    spec.loader.exec_module(app)
+
+    keys = [f"bench-key-{i}" for i in range(args.keys)]
+    settings = app.get_settings()
+    settings.update({
+        "finnhub_api_key": keys[0],
+        "finnhub_api_key_2": keys[1] if len(keys) > 1 else "",
+        "finnhub_extra_api_keys": keys[2:],
+        "finnhub_calls_per_minute": args.calls_per_minute,
+        "websocket_symbols_per_connection": args.ws_symbol_limit,
+        "sparkline_fetch_workers": args.sparkline_workers,
+    })
+    app.save_settings(settings)
+    return app, keys, appdata
+
+
+def bench_quotes(app, server, keys, symbols, refreshes):
+    server.market.reset_stats()
+    latencies, fetched = [], 0
+    started = time.perf_counter()
+    for _ in range(refreshes):
+        t0 = time.perf_counter()
+        prices, _had_429 = app.fetch_all_stock_prices_with_429(symbols, keys[0], keys[1] if len(keys) > 1 else None, force=True)
+        latencies.append(time.perf_counter() - t0)
+        fetched += len(prices)
+    elapsed = time.perf_counter() - started
+    stats = server.market.get_stats()
+    requests = stats.get("finnhub", 0) + stats.get("yahoo_chart", 0) + stats.get("yahoo_spark", 0)
+    p50, p99 = percentiles(latencies)
+    return {
+        "requests": requests,
+        "requests_per_s": requests / elapsed if elapsed else 0.0,
+        "refresh_p50_ms": p50,
+        "refresh_p99_ms": p99,
+        "coverage": fetched / (len(symbols) * refreshes),
+        "rate_429": stats.get("status_429", 0) / requests if requests else 0.0,
+    }
+
+
+def bench_sparklines(app, server, symbols, period="1d", timeout=120.0):
+    server.market.reset_stats()
+    scheduler = app.get_history_scheduler()
+    submitted, done = {}, {}
+    lock = threading.Lock()
+    finished = threading.Event()
+
+    def on_done(symbol, _period):
+        with lock:
+            done[symbol] = time.perf_counter() - submitted[symbol]
+            if len(done) == len(symbols):
+                finished.set()
+
+    started = time.perf_counter()
+    for priority, symbol in enumerate(symbols):
+        submitted[symbol] = time.perf_counter()
+        scheduler.submit(symbol, period, None, priority=float(priority), owner="bench", on_done=on_done)
+    finished.wait(timeout)
+    elapsed = time.perf_counter() - started
+    p50, p99 = percentiles(list(done.values()))
+    stats = server.market.get_stats()
+    return {
+        "requests": stats.get("yahoo_chart", 0),
+        "requests_per_s": stats.get("yahoo_chart", 0) / elapsed if elapsed else 0.0,
+        "fetch_p50_ms": p50,
+        "fetch_p99_ms": p99,
+        "completed": len(done),
+    }
+
+
+def bench_icons(app, server, symbols):
+    server.market.reset_stats()
+    results = {}
+    for phase in ("cold", "warm"):
+        latencies = []
+        for symbol in symbols:
+            t0 = time.perf_counter()
+            app.get_ticker_icon(symbol, 32)
+            latencies.append(time.perf_counter() - t0)
+        p50, p99 = percentiles(latencies)
+        results[f"{phase}_p50_ms"] = p50
+        results[f"{phase}_p99_ms"] = p99
+    stats = server.market.get_stats()
+    results["requests"] = stats.get("icon", 0)
+    results["not_found"] = stats.get("status_404", 0)
+    return results
+
+
+def bench_websocket(app, server, keys, symbols, seconds, drain_ms):
+    server.market.reset_stats()
+    # Just enough of a window for process_buffered_updates to apply prices to
+    ticker = types.SimpleNamespace(stocks=list(symbols), prices={})
+    window = types.SimpleNamespace(tray_icon=types.SimpleNamespace(ticker_windows=[ticker]))
+    pool = app.FinnhubWebSocketPool(keys, window)
+    pool.connect()
+    pool.subscribe_symbols(symbols)
+    drains = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        time.sleep(drain_ms / 1000.0)
+        pool.rebalance()
+        t0 = time.perf_counter()
+        pool.process_buffered_updates()
+        drains.append(time.perf_counter() - t0)
+    buffer_stats = pool.trade_buffer.get_stats()
+    uncovered = len(pool.uncovered_symbols())
+    pool.disconnect()
+    p50, p99 = percentiles(drains)
+    return {
+        "connections": server.market.get_stats().get("ws_connections", 0),
+        "trades_per_s": buffer_stats["trades_received"] / seconds,
+        "trades_dropped": buffer_stats["trades_dropped"],
+        "drain_p50_ms": p50,
+        "drain_p99_ms": p99,
+        "avg_delivery_ms": buffer_stats["avg_drain_latency_ms"],
+        "uncovered": uncovered,
+        "symbols_priced": len(ticker.prices),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="TCKR fetch throughput benchmark (mock server)")
+    ap.add_argument('--symbols', default='10,100,500', help='Comma-separated watchlist sizes')
+    ap.add_argument('--refreshes', type=int, default=3, help='Quote refresh cycles per size')
+    ap.add_argument('--keys', type=int, default=4, help='Finnhub API keys to configure')
+    ap.add_argument('--rate-limit', type=int, default=300, help='Mock per-key calls per minute')
+    ap.add_argument('--calls-per-minute', type=int, default=300, help='Quota TCKR is told each key has')
+    ap.add_argument('--latency-ms', type=float, default=50.0)
+    ap.add_argument('--jitter-ms', type=float, default=20.0)
+    ap.add_argument('--error-rate', type=float, default=0.01, help='Extra random 429 probability')
+    ap.add_argument('--ws-symbol-limit', type=int, default=50)
+    ap.add_argument('--ws-seconds', type=float, default=5.0, help='WebSocket run time per size (0 = skip)')
+    ap.add_argument('--drain-ms', type=float, default=100.0, help='Interval between trade drains')
+    ap.add_argument('--sparkline-workers', type=int, default=4)
+    ap.add_argument('--skip', default='', help='Comma-separated stages to skip: quotes,sparklines,icons,websocket')
+    ap.add_argument('--json', help='Also write the results to this file')
+    args = ap.parse_args()
+    args.keys = max(1, args.keys)
+    skip = {s.strip() for s in args.skip.split(',') if s.strip()}
+
+    server = MockMarketServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_limit=args.rate_limit,
+                              error_rate=args.error_rate, ws_symbol_limit=args.ws_symbol_limit).start()
+    app, keys, appdata = load_app(server, args)
+    from PyQt5 import QtWidgets
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+    results = {'config': vars(args), 'sizes': {}}
+    for tier, size in enumerate(int(s) for s in args.symbols.split(',')):
+        symbols = watchlist(size, tier)
+        row = results['sizes'][size] = {}
+        print(f"\n== {size} symbols ==")
+        if 'quotes' not in skip:
+            row['quotes'] = r = bench_quotes(app, server, keys, symbols, args.refreshes)
+            print(f"  quotes      {r['requests_per_s']:8.1f} req/s  refresh p50 {r['refresh_p50_ms']:8.1f} ms"
+                  f"  p99 {r['refresh_p99_ms']:8.1f} ms  coverage {r['coverage']:.0%}  429 {r['rate_429']:.1%}")
+        if 'sparklines' not in skip:
+            row['sparklines'] = r = bench_sparklines(app, server, symbols)
+            print(f"  sparklines  {r['requests_per_s']:8.1f} req/s  fetch p50 {r['fetch_p50_ms']:8.1f} ms"
+                  f"  p99 {r['fetch_p99_ms']:8.1f} ms  completed {r['completed']}/{size}")
+        if 'icons' not in skip:
+            row['icons'] = r = bench_icons(app, server, symbols)
+            print(f"  icons       cold p50 {r['cold_p50_ms']:7.2f} ms  p99 {r['cold_p99_ms']:7.2f} ms"
+                  f"  warm p50 {r['warm_p50_ms']:6.3f} ms  p99 {r['warm_p99_ms']:6.3f} ms  404 {r['not_found']}")
+        if 'websocket' not in skip and args.ws_seconds > 0:
+            ws_symbols = [s for s in symbols if not s.startswith('^')]
+            row['websocket'] = r = bench_websocket(app, server, keys, ws_symbols, args.ws_seconds, args.drain_ms)
+            print(f"  websocket   {r['trades_per_s']:8.1f} trades/s  drain p50 {r['drain_p50_ms']:6.2f} ms"
+                  f"  p99 {r['drain_p99_ms']:6.2f} ms  delivery {r['avg_delivery_ms']:6.1f} ms"
+                  f"  connections {r['connections']}  uncovered {r['uncovered']}  dropped {r['trades_dropped']}")
+        qt_app.processEvents()
+
+    server.stop()
+    print(f"\nScratch APPDATA: {appdata}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
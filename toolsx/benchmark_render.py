@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Headless render benchmark for TickerWindow pixmap building and painting.
+Usage: python toolsx/benchmark_render.py [--sizes 10,100,1000] [--combos all] [--frames 120]
+       python toolsx/benchmark_render.py --save-baseline        (record toolsx/render_baseline.json)
+       python toolsx/benchmark_render.py --check                (exit 1 on regression vs the baseline)
+
+Runs under Qt's offscreen platform with a scratch APPDATA directory. Icons and any
+stray quote/WebSocket traffic go to an in-process toolsx/mock_market_server.py, and
+sparkline history is seeded synthetically, so nothing touches the network.
+For each watchlist size and effect combination (bloom, ghosting, glass, sparklines,
+second ticker) it reports:
+  build   ms per full build_ticker_pixmaps()
+  incr    GUI-thread ms per build_ticker_pixmaps_for_symbols() of --incremental
+          symbols (re-rendered tiles are drawn on the tile pool and land later)
+  frame   ms per painted frame (both windows when the second ticker is on), with
+          the frame profiler's per-stage means
+--ghost-engine accumulation measures the trail-buffer ghosting engine (cases are
+keyed "<size>/<combo>/accumulation"). Timings are medians. --check compares against the stored baseline and fails when a
+metric is slower by more than --tolerance (relative) and --slack-ms (absolute).
+"""
+import argparse, importlib.util, itertools, json, os, random, statistics, sys, tempfile, time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, '..'))
+SCRIPT = os.path.join(ROOT, 'TCKR-v1.1.5.py')
+BASELINE = os.path.join(HERE, 'render_baseline.json')
+sys.path.insert(0, HERE)
+sys.path.insert(0, ROOT)
+
+from mock_market_server import MockMarketServer
+
+EFFECTS = ("bloom", "ghosting", "glass", "sparklines", "dual")
+EFFECT_SETTINGS = {"bloom": "led_bloom_effect", "ghosting": "led_ghosting_effect",
+                   "glass": "led_glass_glare", "sparklines": "show_sparklines", "dual": "enable_second_ticker"}
+METRICS = ("build_ms", "incremental_ms", "frame_ms")
+
+
+def combo_name(flags):
+    return "+".join(name for name, on in zip(EFFECTS, flags) if on) or "plain"
+
+
+def all_combos(selection):
+    combos = [combo_name(flags) for flags in itertools.product((False, True), repeat=len(EFFECTS))]
+    if selection == 'all':
+        return combos
+    if selection == 'minimal':
+        return ["plain", "bloom", "ghosting", "glass", "sparklines", "dual", "bloom+ghosting+glass+sparklines+dual"]
+    wanted = [c.strip() for c in selection.split(',') if c.strip()]
+    unknown = [c for c in wanted if c not in combos]
+    if unknown:
+        raise SystemExit(f"Unknown combo(s) {unknown}; names join {'+'.join(EFFECTS)} in that order, or 'plain'")
+    return wanted
+
+
+def watchlist(size):
+    yahoo = max(1, size // 10)
+    return [f"^R{i}" for i in range(yahoo)] + [f"R{i}" for i in range(size - yahoo)]
+
+
+def load_app(server):
+    os.environ["APPDATA"] = tempfile.mkdtemp(prefix="tckr-render-")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.update(server.environment())
+
+    spec = importlib.util.spec_from_file_location("tckr_app", SCRIPT)
+    app = importlib.util.module_from_spec(spec)
+    sys.modules["tckr_app"] = app
+    spec.loader.exec_module(app)
+
+    settings = app.get_settings()
+    settings.update({
+        "finnhub_api_key": "bench-key",  # Skips the API key dialog
+        "update_interval": 86400,
+        "log_level": "WARNING",
+    })
+    app.save_settings(settings)
+    app.get_log_pipeline().configure(level="WARNING")
+    return app
+
+
+def seed_history(app, symbols, period, rng):
+    """Synthetic sparkline history so the sparkline path never waits on a fetch"""
+    store = app.get_history_store()
+    now = time.time()
+    interval = app.HistoryStore.period_config(period)["interval"]
+    step = {'1m': 60, '2m': 120, '5m': 300, '15m': 900, '30m': 1800, '60m': 3600, '1h': 3600}.get(interval, 300)
+    times = [now - (77 - i) * step for i in range(78)]
+    for symbol in symbols:
+        price = rng.uniform(20, 500)
+        closes = []
+        for _ in times:
+            price *= 1.0 + rng.gauss(0.0, 0.002)
+            closes.append(price)
+        store.merge_fetched(symbol, period, times, closes)
+
+
+def make_window(app, qt_app, second=False):
+    window = app.TickerWindow()
+    window.is_second_ticker = second
+    for timer_name in ("update_timer", "market_status_timer", "websocket_visual_timer"):
+        timer = getattr(window, timer_name, None)
+        if timer is not None:
+            timer.stop()
+    window.show()
+    qt_app.processEvents()
+    return window
+
+
+def apply_combo(app, windows, combo, ghost_engine="layers"):
+    enabled = set(combo.split("+")) if combo != "plain" else set()
+    settings = app.get_settings()
+    for effect in EFFECTS:
+        settings[EFFECT_SETTINGS[effect]] = effect in enabled
+    settings["led_ghost_engine"] = ghost_engine
+    app.save_settings(settings)  # Windows refresh their cached settings from the store
+    for window in windows:
+        window.show_sparklines = "sparklines" in enabled
+        window.sparkline_cache.clear()
+        window.bloom_cache_valid = False
+        window.gl_widget.effects_enabled = True
+    return windows if "dual" in enabled else windows[:1]
+
+
+def median_ms(samples):
+    return statistics.median(samples) * 1000.0 if samples else 0.0
+
+
+def wait_for_tiles(qt_app, windows, timeout=10.0):
+    """Process events until every incremental tile render has landed"""
+    deadline = time.perf_counter() + timeout
+    while any(window._tile_requests for window in windows) and time.perf_counter() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.001)
+
+
+def run_case(app, qt_app, windows, symbols, prices, args, rng):
+    for window in windows:
+        window.stocks = list(symbols)
+        window.prices = dict(prices)
+        window.loading = False
+        window.build_ticker_pixmaps()  # Warm-up: icons, fonts, ghost/bloom caches
+        window.build_ticker_text(reset_scroll=True)
+    qt_app.processEvents()
+
+    builds = []
+    for _ in range(args.builds):
+        t0 = time.perf_counter()
+        for window in windows:
+            window.build_ticker_pixmaps()
+        builds.append(time.perf_counter() - t0)
+
+    incrementals = []
+    streamable = [s for s in symbols if not s.startswith('^')] or list(symbols)
+    for _ in range(args.builds):
+        changed = rng.sample(streamable, min(args.incremental, len(streamable)))
+        for symbol in changed:
+            price, prev_close = prices[symbol]
+            prices[symbol] = (price * rng.uniform(0.99, 1.01), prev_close)
+            for window in windows:
+                window.prices[symbol] = prices[symbol]
+        t0 = time.perf_counter()
+        for window in windows:
+            window.build_ticker_pixmaps_for_symbols(changed)
+        incrementals.append(time.perf_counter() - t0)
+        wait_for_tiles(qt_app, windows)
+
+    profiler = app.get_frame_profiler()
+    frames = []
+    for i in range(args.warmup + args.frames):
+        if i == args.warmup:
+            profiler.start()
+        t0 = time.perf_counter()
+        for window in windows:
+            # A VSync timestamp makes paint_ticker advance the scroll like a real frame
+            window.gl_widget._vsync_queue.append(time.perf_counter())
+            window.gl_widget.repaint()
+        if i >= args.warmup:
+            frames.append(time.perf_counter() - t0)
+    stats = profiler.get_stats()
+    profiler.stop()
+    qt_app.processEvents()
+
+    return {
+        "build_ms": median_ms(builds),
+        "incremental_ms": median_ms(incrementals),
+        "frame_ms": median_ms(frames),
+        "frame_p95_ms": float(sorted(frames)[int(len(frames) * 0.95) - 1] * 1000.0) if frames else 0.0,
+        "stages_ms": {name: round(stage['mean_ms'], 3) for name, stage in stats.get('stages', {}).items()},
+    }
+
+
+def compare(results, baseline, tolerance, slack_ms):
+    regressions = []
+    for key, row in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), row.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1.0 + tolerance) and new - old > slack_ms:
+                regressions.append(f"{key} {metric}: {old:.2f} -> {new:.2f} ms (+{(new / old - 1.0) * 100.0 if old else 0.0:.0f}%)")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Headless TickerWindow render benchmark")
+    ap.add_argument('--sizes', default='10,100,1000', help='Comma-separated watchlist sizes')
+    ap.add_argument('--combos', default='all', help="'all', 'minimal', or names like bloom+glass,plain")
+    ap.add_argument('--frames', type=int, default=120, help='Measured frames per case')
+    ap.add_argument('--warmup', type=int, default=10, help='Unmeasured frames before each case')
+    ap.add_argument('--builds', type=int, default=5, help='Full / incremental builds per case')
+    ap.add_argument('--incremental', type=int, default=5, help='Symbols per incremental rebuild')
+    ap.add_argument('--ghost-engine', default='layers', choices=('layers', 'accumulation'),
+                    help='Ghosting engine for cases with ghosting')
+    ap.add_argument('--seed', type=int, default=7)
+    ap.add_argument('--baseline', default=BASELINE, help='Baseline JSON file')
+    ap.add_argument('--save-baseline', action='store_true', help='Write the results as the new baseline')
+    ap.add_argument('--check', action='store_true', help='Exit 1 if any metric regressed past the baseline')
+    ap.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown (0.25 = 25%%)')
+    ap.add_argument('--slack-ms', type=float, default=0.5, help='Slowdowns below this many ms never fail')
+    ap.add_argument('--json', help='Also write the results to this file')
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    combos = all_combos(args.combos)
+
+    server = MockMarketServer(latency_ms=0, jitter_ms=0).start()
+    app = load_app(server)
+    from PyQt5 import QtWidgets
+    qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    windows = [make_window(app, qt_app), make_window(app, qt_app, second=True)]
+
+    results = {}
+    print(f"{'case':<52} {'build':>9} {'incr':>8} {'frame':>8} {'p95':>8}")
+    for size in sizes:
+        symbols = watchlist(size)
+        prices = {symbol: (p, p * rng.uniform(0.97, 1.03)) for symbol in symbols for p in [rng.uniform(5, 900)]}
+        seed_history(app, symbols, windows[0].sparkline_period, rng)
+        for combo in combos:
+            active = apply_combo(app, windows, combo, args.ghost_engine)
+            key = f"{size}/{combo}" if args.ghost_engine == "layers" else f"{size}/{combo}/{args.ghost_engine}"
+            row = results[key] = run_case(app, qt_app, active, symbols, dict(prices), args, rng)
+            print(f"{size:>5} {combo:<46} {row['build_ms']:8.2f}ms {row['incremental_ms']:7.2f}ms "
+                  f"{row['frame_ms']:7.2f}ms {row['frame_p95_ms']:7.2f}ms")
+
+    server.stop()
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.json}")
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update({key: {metric: round(row[metric], 3) for metric in METRICS} for key, row in results.items()})
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Saved baseline for {len(results)} cases to {args.baseline}")
+    elif args.check:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; record one with --save-baseline")
+            sys.exit(2)
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.slack_ms)
+        missing = [key for key in results if key not in baseline]
+        if missing:
+            print(f"{len(missing)} case(s) have no baseline yet (not checked)")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} / {args.slack_ms} ms:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline")
+
+
+if __name__ == '__main__':
+    main()
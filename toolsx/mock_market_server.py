@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Local stand-in for the market data services TCKR talks to.
+Usage: python toolsx/mock_market_server.py [--port 8765] [--latency-ms 80] [--rate-limit 60] ...
+
+One port serves:
+  /api/v1/quote?symbol=X&token=K       Finnhub quote (per-token minute quota -> 429 + Retry-After)
+  /v8/finance/chart/<symbol>           Yahoo chart (range=/interval= or period1=/period2=)
+  /v8/finance/spark?symbols=A,B        Yahoo spark batch
+  /icons/.../<symbol>.png              Icon CDN (ETag / If-None-Match -> 304, some symbols 404)
+  ws://host:port/ws?token=K            Finnhub trades WebSocket (subscribe/unsubscribe, trade bursts)
+
+Every HTTP response is delayed by --latency-ms (+/- --jitter-ms). --error-rate adds random
+429s on top of the quota. Point TCKR at it with the printed TCKR_* environment variables,
+or the matching *_base_url settings. toolsx/benchmark_fetch.py starts one in-process.
+Standard library only.
+"""
+import argparse, base64, collections, hashlib, json, random, socket, struct, threading, time, zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+INTERVAL_SECONDS = {'1m': 60, '2m': 120, '5m': 300, '15m': 900, '30m': 1800, '60m': 3600, '1h': 3600,
+                    '1d': 86400, '5d': 5 * 86400, '1wk': 7 * 86400, '1mo': 30 * 86400}
+RANGE_SECONDS = {'1d': 86400, '5d': 5 * 86400, '1mo': 30 * 86400, '3mo': 91 * 86400, '6mo': 182 * 86400,
+                 '1y': 365 * 86400, '2y': 730 * 86400, '5y': 1826 * 86400, 'ytd': 365 * 86400, 'max': 3650 * 86400}
+
+
+def _png(size, rgb):
+    """Solid-colour RGB PNG"""
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    row = b"\x00" + bytes(rgb) * size
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(row * size)) + chunk(b"IEND", b""))
+
+
+class MockMarket:
+    """Price state, quotas and counters shared by every request handler"""
+
+    def __init__(self, latency_ms=50.0, jitter_ms=20.0, rate_limit=60, error_rate=0.0,
+                 trade_interval_ms=100, trade_burst=20, burst_chance=0.02, ws_symbol_limit=50,
+                 missing_icon_ratio=0.1, seed=1):
+        self.latency_ms = float(latency_ms)
+        self.jitter_ms = float(jitter_ms)
+        self.rate_limit = int(rate_limit)
+        self.error_rate = float(error_rate)
+        self.trade_interval = trade_interval_ms / 1000.0
+        self.trade_burst = int(trade_burst)
+        self.burst_chance = float(burst_chance)
+        self.ws_symbol_limit = int(ws_symbol_limit)
+        self.missing_icon_ratio = float(missing_icon_ratio)
+        self._random = random.Random(seed)
+        self._prices = {}  # symbol -> [price, prev_close]
+        self._calls = collections.defaultdict(collections.deque)  # token -> call times in the last minute
+        self._lock = threading.Lock()
+        self.stats = collections.Counter()
+
+    # ---- state ------------------------------------------------------------
+
+    def quote(self, symbol, step=True):
+        with self._lock:
+            state = self._prices.get(symbol)
+            if state is None:
+                base = 20.0 + (zlib.crc32(symbol.encode()) % 48000) / 100.0
+                state = self._prices[symbol] = [base, base]
+            if step:
+                state[0] = max(0.01, state[0] * (1.0 + self._random.gauss(0.0, 0.0008)))
+            return state[0], state[1]
+
+    def delay(self):
+        with self._lock:
+            ms = self._random.gauss(self.latency_ms, self.jitter_ms) if self.jitter_ms else self.latency_ms
+        if ms > 0:
+            time.sleep(ms / 1000.0)
+
+    def admit(self, token):
+        """(allowed, remaining, retry_after) for one Finnhub call by `token`"""
+        now = time.monotonic()
+        with self._lock:
+            calls = self._calls[token]
+            while calls and now - calls[0] >= 60.0:
+                calls.popleft()
+            if self.error_rate and self._random.random() < self.error_rate:
+                return False, max(0, self.rate_limit - len(calls)), 1
+            if len(calls) >= self.rate_limit:
+                return False, 0, max(1, int(60.0 - (now - calls[0])) + 1)
+            calls.append(now)
+            return True, self.rate_limit - len(calls), 0
+
+    def count(self, *keys):
+        with self._lock:
+            for key in keys:
+                self.stats[key] += 1
+
+    def add(self, key, amount):
+        with self._lock:
+            self.stats[key] += amount
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    market = None  # set by MockMarketServer
+
+    def log_message(self, *_args):
+        pass
+
+    # ---- HTTP -------------------------------------------------------------
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+        self.market.count(f"status_{status}")
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            return self._websocket()
+        market = self.market
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        path = parts.path
+        market.delay()
+        if path.endswith("/quote"):
+            return self._finnhub_quote(query)
+        if "/v8/finance/chart/" in path:
+            return self._yahoo_chart(unquote(path.rsplit("/", 1)[-1]), query)
+        if path.endswith("/v8/finance/spark"):
+            return self._yahoo_spark(query)
+        if path.endswith(".png"):
+            return self._icon(unquote(path.rsplit("/", 1)[-1])[:-4])
+        self._send(404, {"error": "unknown endpoint"})
+
+    def _finnhub_quote(self, query):
+        market = self.market
+        market.count("finnhub")
+        token = query.get("token")
+        if not token:
+            return self._send(401, {"error": "Please use an API key."})
+        allowed, remaining, retry_after = market.admit(token)
+        headers = {"X-Ratelimit-Limit": market.rate_limit, "X-Ratelimit-Remaining": remaining,
+                   "X-Ratelimit-Reset": int(time.time()) + 60}
+        if not allowed:
+            headers["Retry-After"] = retry_after
+            return self._send(429, {"error": "API limit reached. Please try again later."}, headers=headers)
+        price, prev_close = market.quote(query.get("symbol", ""))
+        self._send(200, {"c": round(price, 2), "d": round(price - prev_close, 2),
+                         "dp": round((price / prev_close - 1.0) * 100.0, 4), "h": round(price * 1.01, 2),
+                         "l": round(price * 0.99, 2), "o": round(prev_close, 2), "pc": round(prev_close, 2),
+                         "t": int(time.time())}, headers=headers)
+
+    def _meta(self, symbol):
+        price, prev_close = self.market.quote(symbol)
+        return {"symbol": symbol, "currency": "USD", "regularMarketPrice": round(price, 2),
+                "previousClose": round(prev_close, 2), "chartPreviousClose": round(prev_close, 2)}
+
+    def _yahoo_chart(self, symbol, query):
+        self.market.count("yahoo_chart")
+        interval = INTERVAL_SECONDS.get(query.get("interval", "5m"), 300)
+        now = int(time.time())
+        if "period1" in query:
+            start = int(query["period1"])
+            end = int(query.get("period2", now))
+        else:
+            end = now
+            start = end - RANGE_SECONDS.get(query.get("range", "1d"), 86400)
+        points = max(2, min(2000, (end - start) // interval))
+        meta = self._meta(symbol)
+        price, prev_close = meta["regularMarketPrice"], meta["previousClose"]
+        timestamps = [end - (points - 1 - i) * interval for i in range(points)]
+        closes = [round(prev_close + (price - prev_close) * i / (points - 1), 4) for i in range(points)]
+        self._send(200, {"chart": {"result": [{"meta": meta, "timestamp": timestamps,
+                                               "indicators": {"quote": [{"close": closes}]}}], "error": None}})
+
+    def _yahoo_spark(self, query):
+        self.market.count("yahoo_spark")
+        symbols = [s for s in query.get("symbols", "").split(",") if s]
+        self._send(200, {"spark": {"result": [{"symbol": s, "response": [{"meta": self._meta(s)}]}
+                                              for s in symbols], "error": None}})
+
+    def _icon(self, name):
+        market = self.market
+        market.count("icon")
+        digest = zlib.crc32(name.encode())
+        if (digest % 1000) / 1000.0 < market.missing_icon_ratio:
+            return self._send(404, b"404: Not Found", "text/plain")
+        body = _png(64, ((digest >> 16) & 0xFF, (digest >> 8) & 0xFF, digest & 0xFF))
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            market.count("status_304")
+            return
+        self._send(200, body, "image/png", {"ETag": etag})
+
+    # ---- WebSocket --------------------------------------------------------
+
+    def _websocket(self):
+        market = self.market
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.close_connection = True
+        market.count("ws_connections")
+
+        subscribed = set()
+        send_lock = threading.Lock()
+        closed = threading.Event()
+
+        def send(opcode, payload):
+            header = bytes([0x80 | opcode])
+            n = len(payload)
+            if n < 126:
+                header += bytes([n])
+            elif n < 65536:
+                header += bytes([126]) + struct.pack(">H", n)
+            else:
+                header += bytes([127]) + struct.pack(">Q", n)
+            with send_lock:
+                self.connection.sendall(header + payload)
+
+        def reader():
+            try:
+                while not closed.is_set():
+                    head = self.rfile.read(2)
+                    if len(head) < 2:
+                        break
+                    opcode, length = head[0] & 0x0F, head[1] & 0x7F
+                    if length == 126:
+                        length = struct.unpack(">H", self.rfile.read(2))[0]
+                    elif length == 127:
+                        length = struct.unpack(">Q", self.rfile.read(8))[0]
+                    mask = self.rfile.read(4) if head[1] & 0x80 else b"\x00" * 4
+                    payload = bytes(b ^ mask[i % 4] for i, b in enumerate(self.rfile.read(length)))
+                    if opcode == 0x8:
+                        break
+                    if opcode == 0x9:
+                        send(0xA, payload)
+                    elif opcode == 0x1:
+                        message = json.loads(payload.decode())
+                        symbol = message.get("symbol")
+                        if message.get("type") == "subscribe" and symbol:
+                            if len(subscribed) < market.ws_symbol_limit:
+                                subscribed.add(symbol)
+                        elif message.get("type") == "unsubscribe":
+                            subscribed.discard(symbol)
+            except (OSError, ValueError):
+                pass
+            closed.set()
+
+        threading.Thread(target=reader, daemon=True).start()
+        rng = random.Random()
+        try:
+            while not closed.wait(market.trade_interval):
+                symbols = list(subscribed)
+                if not symbols:
+                    continue
+                burst = market.trade_burst * (10 if rng.random() < market.burst_chance else 1)
+                now_ms = int(time.time() * 1000)
+                trades = []
+                for _ in range(burst):
+                    symbol = rng.choice(symbols)
+                    price, _prev = market.quote(symbol)
+                    trades.append({"s": symbol, "p": round(price, 4), "t": now_ms, "v": rng.randint(1, 500), "c": None})
+                send(0x1, json.dumps({"type": "trade", "data": trades}).encode())
+                market.count("ws_messages")
+                market.add("ws_trades", len(trades))
+        except OSError:
+            pass
+        closed.set()
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class MockMarketServer:
+    """Runs MockMarket over HTTP + WebSocket on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, **market_options):
+        self.market = MockMarket(**market_options)
+        handler = type("BoundMockHandler", (MockHandler,), {"market": self.market})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.host, self.port = self.httpd.server_address[:2]
+        self._thread = None
+
+    @property
+    def base_urls(self):
+        root = f"http://{self.host}:{self.port}"
+        return {
+            "finnhub_base_url": f"{root}/api/v1",
+            "finnhub_websocket_url": f"ws://{self.host}:{self.port}/ws",
+            "yahoo_base_url": root,
+            "icon_base_url": f"{root}/icons",
+        }
+
+    def environment(self):
+        """TCKR_* variables that point the app at this server"""
+        return {f"TCKR_{name.upper()}": url for name, url in self.base_urls.items()}
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description="Local mock of the Finnhub/Yahoo/icon services")
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8765)
+    ap.add_argument('--latency-ms', type=float, default=50.0)
+    ap.add_argument('--jitter-ms', type=float, default=20.0)
+    ap.add_argument('--rate-limit', type=int, default=60, help='Finnhub calls per minute per token')
+    ap.add_argument('--error-rate', type=float, default=0.0, help='Extra random 429 probability')
+    ap.add_argument('--trade-interval-ms', type=float, default=100.0)
+    ap.add_argument('--trade-burst', type=int, default=20, help='Trades per WebSocket message')
+    ap.add_argument('--burst-chance', type=float, default=0.02, help='Chance of a 10x trade burst')
+    ap.add_argument('--ws-symbol-limit', type=int, default=50, help='Symbols per WebSocket connection')
+    ap.add_argument('--missing-icon-ratio', type=float, default=0.1)
+    args = ap.parse_args()
+
+    server = MockMarketServer(args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                              rate_limit=args.rate_limit, error_rate=args.error_rate,
+                              trade_interval_ms=args.trade_interval_ms, trade_burst=args.trade_burst,
+                              burst_chance=args.burst_chance, ws_symbol_limit=args.ws_symbol_limit,
+                              missing_icon_ratio=args.missing_icon_ratio).start()
+    print(f"Mock market server on {server.host}:{server.port}. Point TCKR at it with:")
+    for name, value in server.environment().items():
+        print(f"  set {name}={value}")
+    try:
+        while True:
+            time.sleep(10)
+            print(f"  {server.market.get_stats()}")
+    except KeyboardInterrupt:
+        server.stop()
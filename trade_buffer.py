@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Trade Ingest Buffer for TCKR
+Hands WebSocket trades from the socket thread to the Qt main thread without a lock.
+The socket thread appends one entry per message to a bounded deque (append is
+atomic in CPython); the main thread takes the whole deque in O(1) by swapping in a
+fresh one, so neither side ever waits on the other. An append that raced the swap
+lands in the retired deque and is picked up by the next drain, never lost.
+With several WebSocket connections each socket thread writes to its own lane.
+Each message is stored as columnar NumPy arrays, so a drain concatenates one
+array per message and TradeAggregator reduces the window in one vectorised pass
+to last / VWAP / volume / high / low per symbol, and keeps session totals in
+compact arrays indexed by symbol.
+"""
+
+import collections
+import time
+
+import numpy as np
+
+
+# One symbol's trades within a drain window, plus its running session totals
+TradeBar = collections.namedtuple(
+    "TradeBar", "last timestamp vwap volume high low trades session_vwap session_volume session_high session_low")
+
+
+def aggregate_trades(symbols, prices, timestamps, volumes):
+    """Reduce one window of trades (parallel arrays, arrival order) to per-symbol arrays.
+
+    Returns (unique symbols, last, last timestamp, price * volume, volume, high,
+    low, trade count), one entry per distinct symbol.
+    """
+    n = len(prices)
+    unique, group = np.unique(symbols, return_inverse=True)
+    k = len(unique)
+
+    volume = np.bincount(group, weights=volumes, minlength=k)
+    pv = np.bincount(group, weights=prices * volumes, minlength=k)
+    count = np.bincount(group, minlength=k)
+    high = np.full(k, -np.inf)
+    low = np.full(k, np.inf)
+    np.maximum.at(high, group, prices)
+    np.minimum.at(low, group, prices)
+    last_pos = np.zeros(k, dtype=np.int64)
+    np.maximum.at(last_pos, group, np.arange(n))
+    return unique, prices[last_pos], timestamps[last_pos], pv, volume, high, low, count
+
+
+def _vwap(pv, volume, fallback):
+    # Trades without volume (e.g. some crypto feeds) fall back to the last price
+    return np.where(volume > 0, pv / np.where(volume > 0, volume, 1.0), fallback)
+
+
+class TradeAggregator:
+    """Per-symbol trade statistics in arrays keyed by symbol index.
+
+    aggregate() takes the trades of one drain window as parallel arrays and
+    returns {symbol: TradeBar}. Python-level work is per distinct symbol, not
+    per trade. Session totals (cumulative volume, VWAP, high and low) restart
+    when a symbol's trades move to a new UTC day, and on reset().
+    """
+
+    def __init__(self, capacity=64):
+        self._index = {}  # symbol -> row
+        self._symbols = []  # row -> symbol
+        self._session_volume = np.zeros(capacity, dtype=np.float64)
+        self._session_pv = np.zeros(capacity, dtype=np.float64)  # sum(price * volume)
+        self._session_high = np.full(capacity, -np.inf)
+        self._session_low = np.full(capacity, np.inf)
+        self._session_last = np.zeros(capacity, dtype=np.float64)
+        self._session_day = np.full(capacity, -1, dtype=np.int64)
+
+    def _rows(self, symbols):
+        rows = np.empty(len(symbols), dtype=np.int64)
+        for i, symbol in enumerate(symbols):
+            row = self._index.get(symbol)
+            if row is None:
+                row = self._index[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+            rows[i] = row
+        needed = len(self._symbols)
+        capacity = len(self._session_day)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            grown = len(self._session_day)
+            for name, fill in (("_session_volume", 0.0), ("_session_pv", 0.0), ("_session_high", -np.inf),
+                               ("_session_low", np.inf), ("_session_last", 0.0), ("_session_day", -1)):
+                old = getattr(self, name)
+                array = np.full(capacity, fill, dtype=old.dtype)
+                array[:grown] = old
+                setattr(self, name, array)
+        return rows
+
+    def aggregate(self, symbols, prices, timestamps, volumes):
+        """Reduce one window of trades (arrival order) to {symbol: TradeBar}"""
+        if not len(prices):
+            return {}
+        unique, last, last_time, pv, volume, high, low, count = aggregate_trades(symbols, prices, timestamps, volumes)
+        vwap = _vwap(pv, volume, last)
+
+        rows = self._rows(unique.tolist())
+        day = (last_time // 86400).astype(np.int64)
+        new_session = self._session_day[rows] != day
+        session_volume = np.where(new_session, 0.0, self._session_volume[rows]) + volume
+        session_pv = np.where(new_session, 0.0, self._session_pv[rows]) + pv
+        session_high = np.maximum(np.where(new_session, -np.inf, self._session_high[rows]), high)
+        session_low = np.minimum(np.where(new_session, np.inf, self._session_low[rows]), low)
+        self._session_volume[rows] = session_volume
+        self._session_pv[rows] = session_pv
+        self._session_high[rows] = session_high
+        self._session_low[rows] = session_low
+        self._session_last[rows] = last
+        self._session_day[rows] = day
+        session_vwap = _vwap(session_pv, session_volume, vwap)
+
+        return {
+            symbol: TradeBar(*values)
+            for symbol, *values in zip(unique.tolist(), last.tolist(), last_time.tolist(), vwap.tolist(),
+                                       volume.tolist(), high.tolist(), low.tolist(), count.tolist(),
+                                       session_vwap.tolist(), session_volume.tolist(),
+                                       session_high.tolist(), session_low.tolist())
+        }
+
+    def top_sessions(self, limit=5):
+        """[(symbol, session_vwap, session_volume, session_high, session_low)] by session volume, largest first"""
+        size = len(self._symbols)
+        if not size:
+            return []
+        volume = self._session_volume[:size]
+        vwap = _vwap(self._session_pv[:size], volume, self._session_last[:size])
+        active = np.flatnonzero(self._session_day[:size] >= 0)
+        rows = active[np.argsort(-volume[active], kind="stable")[:limit]]
+        return [(self._symbols[row], float(vwap[row]), float(volume[row]), float(self._session_high[row]),
+                 float(self._session_low[row])) for row in rows.tolist()]
+
+    def reset(self):
+        """Start a new session for every symbol"""
+        self._session_volume.fill(0.0)
+        self._session_pv.fill(0.0)
+        self._session_high.fill(-np.inf)
+        self._session_low.fill(np.inf)
+        self._session_last.fill(0.0)
+        self._session_day.fill(-1)
+
+
+class TradeLane:
+    """One producer thread's side of a TradeIngestBuffer (one per WebSocket connection)"""
+
+    def __init__(self, max_messages):
+        self.max_messages = int(max_messages)
+        self._active = collections.deque(maxlen=self.max_messages)
+        self._retired = collections.deque()
+        # Written by the producer thread only
+        self.trades_received = 0
+        self.trades_dropped = 0
+
+    def push(self, symbols, prices, timestamps_ms, volumes):
+        """Queue the trades of one message as parallel sequences (producer thread)"""
+        if not len(symbols):
+            return
+        active = self._active
+        if len(active) >= self.max_messages:
+            try:
+                self.trades_dropped += len(active[0][1])  # deque(maxlen) evicts the oldest
+            except IndexError:
+                pass
+        active.append((time.monotonic(), np.asarray(symbols), np.asarray(prices, dtype=np.float64),
+                       np.asarray(timestamps_ms, dtype=np.float64), np.asarray(volumes, dtype=np.float64)))
+        self.trades_received += len(symbols)
+
+    def __len__(self):
+        return len(self._active) + len(self._retired)
+
+    def take(self):
+        """Take ownership of every pending message (O(1) swap), oldest first"""
+        batch = self._active
+        self._active = collections.deque(maxlen=self.max_messages)
+        retired, self._retired = self._retired, batch
+        messages = []
+        popleft = retired.popleft
+        while retired:  # stragglers that raced the previous swap
+            messages.append(popleft())
+        popleft = batch.popleft
+        while batch:
+            messages.append(popleft())
+        return messages
+
+
+class TradeIngestBuffer:
+    """Swap-on-drain double buffer of trade messages.
+
+    push() runs on the socket thread, drain() on the main thread. Each message is
+    (received_at, symbols, prices, timestamps_ms, volumes), one array per column,
+    timestamps in epoch milliseconds as the feeds send them. When more than
+    max_messages are pending, the oldest messages are dropped (and counted).
+    Several socket threads can feed one buffer: each takes its own lane().
+    """
+
+    def __init__(self, max_messages=4096):
+        self.max_messages = int(max_messages)
+        self._lanes = [TradeLane(self.max_messages)]
+        # Main-thread counters
+        self.trades_drained = 0
+        self.trades_coalesced = 0  # folded into the same symbol's bar for a drain
+        self.drains = 0
+        self.aggregator = TradeAggregator()
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+
+    def lane(self):
+        """A separate producer lane, for a second socket thread feeding this buffer"""
+        lane = TradeLane(self.max_messages)
+        self._lanes = self._lanes + [lane]  # Replace, never mutate: drain() may be iterating
+        return lane
+
+    # ---- socket thread --------------------------------------------------
+
+    def push(self, symbols, prices, timestamps_ms, volumes):
+        """Queue the trades of one message on the default lane"""
+        self._lanes[0].push(symbols, prices, timestamps_ms, volumes)
+
+    # ---- main thread ----------------------------------------------------
+
+    def __bool__(self):
+        return any(len(lane) for lane in self._lanes)
+
+    def __len__(self):
+        return sum(len(lane) for lane in self._lanes)
+
+    def _take(self):
+        lanes = self._lanes
+        if len(lanes) == 1:
+            return lanes[0].take()
+        messages = [message for lane in lanes for message in lane.take()]
+        messages.sort(key=lambda message: message[0])  # Arrival order across connections
+        return messages
+
+    def drain(self):
+        """{symbol: TradeBar} aggregated over everything received since the last drain"""
+        messages = self._take()
+        if not messages:
+            return {}
+        _received_at, symbols, prices, timestamps_ms, volumes = zip(*messages)  # Per message, not per trade
+        prices = np.concatenate(prices)
+        bars = self.aggregator.aggregate(np.concatenate(symbols), prices, np.concatenate(timestamps_ms) / 1000.0,
+                                         np.concatenate(volumes))
+        latency = time.monotonic() - messages[0][0]
+        self.trades_drained += len(prices)
+        self.trades_coalesced += len(prices) - len(bars)
+        self.drains += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_latency = latency
+        return bars
+
+    def clear(self):
+        self._take()
+
+    def get_stats(self):
+        lanes = self._lanes
+        return {
+            'pending_messages': len(self),
+            'trades_received': sum(lane.trades_received for lane in lanes),
+            'trades_drained': self.trades_drained,
+            'trades_coalesced': self.trades_coalesced,
+            'trades_dropped': sum(lane.trades_dropped for lane in lanes),
+            'drains': self.drains,
+            'avg_drain_latency_ms': self.total_latency * 1000.0 / self.drains if self.drains else 0.0,
+            'max_drain_latency_ms': self.max_latency * 1000.0,
+            'last_drain_latency_ms': self.last_latency * 1000.0,
+        }